@@ -19,6 +19,9 @@ class Settings(BaseSettings):
     # Cache Configuration
     cache_dir: Path = Field(default=Path("./.cache"), env="CACHE_DIR")
     cache_ttl_seconds: int = Field(default=3600, env="CACHE_TTL_SECONDS")
+    # Persistent cache tier: "sqlite" (default), "file", or "redis" for several instances
+    cache_backend: str = Field(default="sqlite", env="CACHE_BACKEND")
+    cache_redis_url: Optional[str] = Field(default=None, env="CACHE_REDIS_URL")
 
     # API Rate Limiting
     yahoo_api_rate_limit: int = Field(default=100, env="YAHOO_API_RATE_LIMIT")
@@ -4,7 +4,6 @@ Fantasy Football MCP Server - Multi-League Support
 """
 
 import asyncio
-import json
 import os
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
@@ -16,13 +15,23 @@ from mcp.types import TextContent, Tool
 # Import extracted modules
 from src.api import get_access_token, refresh_yahoo_token, set_access_token, yahoo_api_call
 from src.parsers import parse_team_roster, parse_yahoo_free_agent_players
-from src.services import analyze_reddit_sentiment
+from src.services import analyze_reddit_sentiment, cache_warmer, user_team_index
+from src.services.prewarm import (
+    prewarm_enabled,
+    prewarm_timeout,
+    reference_data_steps,
+    startup_prewarm,
+)
+from src.services.draft_room import draft_rooms, score_ranked_player
+from src.services.reddit_ingest import reddit_ingest_enabled, reddit_ingestor
 
 # Import rate limiting and caching utilities
 from src.api.yahoo_utils import rate_limiter, response_cache
 
 # Import bye week utilities
 from src.utils.bye_weeks import get_bye_week_with_fallback
+from src.utils.json_encoder import dumps as json_dumps
+from src.utils.lazy_imports import start_import_warmup
 
 # Import all handlers from the handlers module
 from src.handlers import (
@@ -37,6 +46,7 @@ from src.handlers import (
     handle_ff_get_draft_results,
     handle_ff_get_league_info,
     handle_ff_get_leagues,
+    handle_ff_get_live_scores,
     handle_ff_get_matchup,
     handle_ff_get_players,
     handle_ff_get_roster,
@@ -142,13 +152,25 @@ async def discover_leagues() -> dict[str, dict[str, Any]]:
 
 
 async def get_user_team_info(league_key: Optional[str]) -> Optional[dict]:
-    if not league_key:
-        return None
     """Get the user's team details in a league.
 
-    Normalizes manager entries and `is_owned_by_current_login` flags so the
-    caller can reliably identify which team belongs to the authenticated user.
+    Served from the persistent user team index, which resolves every league in
+    one request. Falls back to parsing ``league/{key}/teams``, normalizing
+    manager entries and `is_owned_by_current_login` flags so the caller can
+    reliably identify which team belongs to the authenticated user.
     """
+    if not league_key:
+        return None
+
+    indexed = await user_team_index.get(league_key)
+    if indexed:
+        return {
+            "team_key": indexed.get("team_key"),
+            "team_name": indexed.get("team_name"),
+            "draft_grade": indexed.get("draft_grade"),
+            "draft_position": indexed.get("draft_position"),
+        }
+
     try:
         data = await yahoo_api_call(f"league/{league_key}/teams")
 
@@ -216,12 +238,14 @@ async def get_user_team_info(league_key: Optional[str]) -> Optional[dict]:
                                                     is_users_team = True
 
                                 if is_users_team and team_key:
-                                    return {
+                                    team_info = {
                                         "team_key": team_key,
                                         "team_name": team_name,
                                         "draft_grade": draft_grade,
                                         "draft_position": draft_position,
                                     }
+                                    user_team_index.record(league_key, team_info)
+                                    return team_info
 
         return None
     except Exception:
@@ -589,6 +613,20 @@ async def list_tools() -> list[Tool]:
                         "description": "Include Sleeper data, trending, and matchups",
                         "default": True,
                     },
+                    "fields": {
+                        "anyOf": [
+                            {"type": "array", "items": {"type": "string"}},
+                            {"type": "null"},
+                        ],
+                        "description": "Player fields to return (e.g. ['name', 'position', 'yahoo_projection']); "
+                        "enrichment is skipped when only basic Yahoo fields are requested",
+                    },
+                    "output_format": {
+                        "type": "string",
+                        "description": "'records' (list of dicts) or 'table' (columns + rows, more compact)",
+                        "enum": ["records", "table"],
+                        "default": "records",
+                    },
                 },
                 "required": ["league_key"],
             },
@@ -611,6 +649,23 @@ async def list_tools() -> list[Tool]:
                 "required": ["league_key"],
             },
         ),
+        Tool(
+            name="ff_get_live_scores",
+            description=(
+                "Get the live scoreboard for a league: points, projections and projected "
+                "final scores for every matchup, shared across callers"
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "league_key": {
+                        "type": "string",
+                        "description": "League key (e.g., 'nfl.l.XXXXXX')",
+                    },
+                },
+                "required": ["league_key"],
+            },
+        ),
         Tool(
             name="ff_get_players",
             description="Get available free agent players in a league",
@@ -660,6 +715,20 @@ async def list_tools() -> list[Tool]:
                         "description": "Include Sleeper data, trending, and matchups",
                         "default": True,
                     },
+                    "fields": {
+                        "anyOf": [
+                            {"type": "array", "items": {"type": "string"}},
+                            {"type": "null"},
+                        ],
+                        "description": "Player fields to return (e.g. ['name', 'position', 'yahoo_projection']); "
+                        "enrichment is skipped when only basic Yahoo fields are requested",
+                    },
+                    "output_format": {
+                        "type": "string",
+                        "description": "'records' (list of dicts) or 'table' (columns + rows, more compact)",
+                        "enum": ["records", "table"],
+                        "default": "records",
+                    },
                 },
                 "required": ["league_key"],
             },
@@ -785,6 +854,20 @@ async def list_tools() -> list[Tool]:
                         "description": "Include Sleeper data, trending, and matchups",
                         "default": True,
                     },
+                    "fields": {
+                        "anyOf": [
+                            {"type": "array", "items": {"type": "string"}},
+                            {"type": "null"},
+                        ],
+                        "description": "Player fields to return (e.g. ['name', 'position', 'yahoo_projection']); "
+                        "enrichment is skipped when only basic Yahoo fields are requested",
+                    },
+                    "output_format": {
+                        "type": "string",
+                        "description": "'records' (list of dicts) or 'table' (columns + rows, more compact)",
+                        "enum": ["records", "table"],
+                        "default": "records",
+                    },
                 },
                 "required": ["league_key"],
             },
@@ -922,6 +1005,7 @@ TOOL_HANDLERS: dict[str, Callable[[dict], Awaitable[dict]]] = {
     "ff_get_roster": handle_ff_get_roster,
     "ff_get_roster_with_projections": handle_ff_get_roster,
     "ff_get_matchup": handle_ff_get_matchup,
+    "ff_get_live_scores": handle_ff_get_live_scores,
     "ff_get_players": handle_ff_get_players,
     "ff_compare_teams": handle_ff_compare_teams,
     "ff_build_lineup": handle_ff_build_lineup,
@@ -937,9 +1021,12 @@ TOOL_HANDLERS: dict[str, Callable[[dict], Awaitable[dict]]] = {
 }
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[TextContent]:
-    """Execute a fantasy football tool via modular handlers."""
+async def dispatch_tool(name: str, arguments: dict) -> dict:
+    """Execute a fantasy football tool via modular handlers and return the native result.
+
+    Shared by the stdio ``call_tool`` endpoint and the FastMCP tools, which
+    return the dict directly instead of round-tripping it through JSON text.
+    """
     original_arguments = dict(arguments)
     handler_args = {k: v for k, v in original_arguments.items() if k != "debug"}
     debug_flag = original_arguments.get("debug") is True
@@ -979,21 +1066,36 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
                 "arguments": safe_args,
             }
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return result
     except Exception as exc:  # pragma: no cover - defensive catch
-        error_result = {
+        return {
             "error": str(exc),
             "tool": name,
             "arguments": original_arguments,
         }
-        return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+    """Execute a fantasy football tool and encode the result for the stdio transport."""
+    result = await dispatch_tool(name, arguments)
+    try:
+        text = json_dumps(result)
+    except Exception as exc:  # pragma: no cover - defensive catch
+        text = json_dumps({"error": str(exc), "tool": name, "arguments": dict(arguments)})
+    return [TextContent(type="text", text=text)]
 
 
 async def get_draft_recommendation_simple(
     league_key: str, strategy: str, num_recommendations: int, current_pick: Optional[int] = None
 ) -> dict:
-    """Simplified draft recommendation using available data."""
+    """Draft recommendations, from the live draft room while a draft is in progress."""
     try:
+        # During a live draft the draft room answers from its precomputed board
+        live = await draft_rooms.recommend(league_key, strategy, num_recommendations)
+        if live is not None:
+            return live
+
         # Get available players using existing waiver wire function
         available_players = await get_waiver_wire_players(league_key, count=100)
         draft_rankings = await get_draft_rankings(league_key, count=50)
@@ -1001,37 +1103,16 @@ async def get_draft_recommendation_simple(
         # Simple scoring based on rankings and availability
         recommendations = []
 
-        # Create a quick lookup for available players
-        available_names = {p.get("name", "").lower() for p in available_players}
+        # Create a quick lookup for available players and their ownership
+        owned_by_name = {
+            p.get("name", "").lower(): p.get("owned_pct", 50) for p in available_players
+        }
 
         for player in draft_rankings:
             player_name = player.get("name", "").lower()
-            if player_name in available_names:
-                # Simple scoring based on strategy
+            if player_name in owned_by_name:
                 rank = player.get("rank", 999)
-                base_score = max(0, 100 - rank)
-
-                if strategy == "conservative":
-                    # Prefer higher-ranked (safer) picks
-                    score = base_score + (10 if rank <= 24 else 0)
-                    reasoning = f"Rank #{rank}, conservative choice (proven player)"
-                elif strategy == "aggressive":
-                    # Prefer potential breakouts (lower owned %)
-                    owned_pct = next(
-                        (
-                            p.get("owned_pct", 50)
-                            for p in available_players
-                            if p.get("name", "").lower() == player_name
-                        ),
-                        50,
-                    )
-                    upside_bonus = max(0, 20 - (owned_pct / 5))  # Bonus for lower ownership
-                    score = base_score + upside_bonus
-                    reasoning = f"Rank #{rank}, high upside potential ({owned_pct}% owned)"
-                else:  # balanced
-                    score = base_score + (5 if rank <= 50 else 0)
-                    reasoning = f"Rank #{rank}, balanced value pick"
-
+                score, reasoning = score_ranked_player(rank, strategy, owned_by_name[player_name])
                 recommendations.append({"player": player, "score": score, "reasoning": reasoning})
 
         # Sort by score and take top N
@@ -1172,9 +1253,23 @@ inject_draft_dependencies(
 
 async def main():
     """Run the MCP server."""
+    cache_warmer.attach()
+    warmup = None
+    if prewarm_enabled():
+        steps = reference_data_steps(discover_leagues)
+        warmup = asyncio.create_task(startup_prewarm.run(steps, prewarm_timeout()))
     # Use stdio transport
     async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+        start_import_warmup()
+        if reddit_ingest_enabled():
+            reddit_ingestor.start()
+        try:
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+        finally:
+            if warmup is not None:
+                warmup.cancel()
+            reddit_ingestor.stop()
+            draft_rooms.stop()
 
 
 if __name__ == "__main__":
@@ -7,25 +7,62 @@ This module wraps the existing Yahoo Fantasy Football tooling defined in
 ``@server.tool`` decorator so it can be deployed on fastmcp.cloud.
 """
 
+import asyncio
 import json
 import os
-from collections.abc import Iterable
-from dataclasses import asdict, is_dataclass
-from typing import Any, Awaitable, Callable, Dict, Literal, Optional, Sequence, Union
+import weakref
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from fastmcp import Context, FastMCP
-from mcp.types import ContentBlock, TextContent
+from pydantic import AnyUrl
+from starlette.requests import Request
+from starlette.responses import JSONResponse
 
 import fantasy_football_multi_league
+from src.services.cache_warming import cache_warmer
+from src.services.live_scoring import live_scores
+from src.services.prewarm import (
+    prewarm_enabled,
+    prewarm_timeout,
+    reference_data_steps,
+    startup_prewarm,
+)
+from src.services.reddit_ingest import reddit_ingest_enabled, reddit_ingestor
+from src.utils.field_selection import to_table
+from src.utils.lazy_imports import start_import_warmup
 
 # REMOVED: enhanced_mcp_tools imports - no longer using wrapper tools
 
 # Remove explicit typing to avoid type conflicts with evolving MCP types
-_legacy_call_tool = fantasy_football_multi_league.call_tool
+_dispatch_tool = fantasy_football_multi_league.dispatch_tool
 _legacy_refresh_token = fantasy_football_multi_league.refresh_yahoo_token
 
+
+@asynccontextmanager
+async def _lifespan(_: FastMCP) -> AsyncIterator[None]:
+    # Server is up: load the handlers' heavy modules before the first tool call needs them
+    start_import_warmup()
+    if reddit_ingest_enabled():
+        # Runs on the server's event loop; only the first session starts it
+        reddit_ingestor.start()
+    yield
+
+
 server = FastMCP(
     name="fantasy-football",
+    lifespan=_lifespan,
     instructions=(
         "Yahoo Fantasy Football operations including league discovery, roster "
         "analysis, waiver insights, draft tools, and Reddit sentiment checks. "
@@ -56,6 +93,14 @@ _TOOL_PROMPTS: Dict[str, str] = {
         "🆚 Get weekly matchup for your team. "
         "Parameters: league_key (required), week (optional). Returns opponent and projections."
     ),
+    "ff_get_live_scores": (
+        "Live scoreboard for a league during games: points, projections and projected "
+        "final scores for every matchup. Parameters: league_key."
+    ),
+    "ff_watch_live_scores": (
+        "Subscribe this session to live score pushes for a league. Changed matchups "
+        "arrive as resource update notifications for live:// resources."
+    ),
     "ff_get_players": (
         "Research free agents or player pools for waiver pickups by filtering "
         "Yahoo players by position and limiting the result count. Accepts optional "
@@ -112,92 +157,35 @@ def _tool_meta(name: str) -> Dict[str, str]:
     return {"prompt": _TOOL_PROMPTS[name]}
 
 
-async def _call_legacy_tool(
+async def _call_tool(
     name: str,
     *,
     ctx: Context | None = None,
     **arguments: Any,
 ) -> Dict[str, Any]:
-    """Delegate to the legacy MCP tool implementation and parse its JSON payload."""
+    """Dispatch directly to the handler layer and return its native dict.
+
+    FastMCP serializes the returned dict itself, so the result is never
+    encoded to JSON text and parsed back on the way out.
+    """
 
     filtered_args = {key: value for key, value in arguments.items() if value is not None}
 
     if ctx is not None:
-        await ctx.info(f"Calling legacy Yahoo tool: {name}")
-
-    raw_blocks = await _legacy_call_tool(name=name, arguments=filtered_args)
-    if raw_blocks is None:
-        blocks: Sequence[Any] = []
-    elif isinstance(raw_blocks, Iterable) and not isinstance(raw_blocks, (str, bytes, TextContent)):
-        blocks = list(raw_blocks)
-    else:
-        blocks = [raw_blocks]
-    if not blocks:
-        return {
-            "status": "error",
-            "message": "Legacy tool returned no response",
-            "tool": name,
-            "arguments": filtered_args,
-        }
+        await ctx.info(f"Calling Yahoo tool: {name}")
 
-    def _coerce_text(block: Any) -> TextContent:
-        if isinstance(block, TextContent):
-            return block
-        if hasattr(block, "text") and isinstance(getattr(block, "text"), str):
-            return TextContent(type="text", text=getattr(block, "text"))
-        if is_dataclass(block) and not isinstance(block, type):
-            return TextContent(type="text", text=json.dumps(asdict(block)))
-        if hasattr(block, "data"):
-            data = getattr(block, "data")
-            if isinstance(data, bytes):
-                try:
-                    data = data.decode("utf-8")
-                except Exception:
-                    data = repr(data)
-            if isinstance(data, str):
-                return TextContent(type="text", text=data)
-        try:
-            return TextContent(type="text", text=json.dumps(block, default=str))
-        except Exception:
-            return TextContent(type="text", text=str(block))
-
-    responses = [_coerce_text(block) for block in blocks]
-
-    first = responses[0]
-    payload = getattr(first, "text", "")
-
-    # Instrumentation: detect raw '0' / suspiciously tiny payloads that break higher layers
-    if payload.strip() == "0":
-        diag = {
-            "status": "error",
-            "message": "Legacy tool returned sentinel '0' string instead of JSON",
-            "tool": name,
-            "arguments": filtered_args,
-            "raw": payload,
-            "stage": "_call_legacy_tool:raw_payload_zero",
-        }
-        if ctx is not None:
-            await ctx.info(f"[diagnostic] Detected raw '0' payload from legacy tool: {name}")
-        return diag
+    result = await _dispatch_tool(name, filtered_args)
 
-    if not payload:
+    if result is None:
         return {
             "status": "error",
-            "message": "Legacy tool returned an empty payload",
+            "message": "Tool returned no response",
             "tool": name,
             "arguments": filtered_args,
         }
-
-    try:
-        return json.loads(payload)
-    except json.JSONDecodeError:
-        return {
-            "status": "error",
-            "message": "Could not parse legacy response as JSON",
-            "tool": name,
-            "arguments": filtered_args,
-            "raw": payload,
-        }
+    if not isinstance(result, dict):
+        return {"content": result}
+    return result
 
 
 @server.tool(
@@ -226,7 +214,7 @@ async def ff_get_leagues(ctx: Context) -> Dict[str, Any]:
     Returns:
         Dict with total_leagues count and list of league summaries
     """
-    return await _call_legacy_tool("ff_get_leagues", ctx=ctx)
+    return await _call_tool("ff_get_leagues", ctx=ctx)
 
 
 @server.tool(
@@ -251,7 +239,7 @@ async def ff_get_league_info(
     Returns:
         Dict with league settings, scoring type, and your team info
     """
-    return await _call_legacy_tool(
+    return await _call_tool(
         "ff_get_league_info",
         ctx=ctx,
         league_key=league_key,
@@ -263,7 +251,7 @@ async def ff_get_league_info(
     description=(
         "⚠️ Get YOUR TEAM'S current roster (YOUR players only). "
         "DO NOT use this to search for available players! "
-        "Parameters: league_key, team_key, week, data_level, include_projections, include_external_data, include_analysis. "
+        "Parameters: league_key, team_key, week, data_level, include_projections, include_external_data, include_analysis, fields, output_format. "
         "For available players use ff_get_players or ff_get_waiver_wire."
     ),
     meta=_tool_meta("ff_get_roster"),
@@ -277,6 +265,8 @@ async def ff_get_roster(
     include_external_data: bool = True,
     include_analysis: bool = True,
     data_level: Optional[Literal["basic", "standard", "full"]] = None,
+    fields: Optional[List[str]] = None,
+    output_format: Literal["records", "table"] = "records",
 ) -> Dict[str, Any]:
     """
     Get YOUR TEAM'S roster with configurable detail levels.
@@ -295,6 +285,9 @@ async def ff_get_roster(
         include_external_data: Include Sleeper rankings, matchup analysis, trending data
         include_analysis: Include enhanced player analysis and recommendations
         data_level: "basic" (roster only), "standard" (+ projections), "full" (everything)
+        fields: Player fields to return (e.g. ["name", "position", "yahoo_projection"]);
+            enrichment is skipped when only basic Yahoo fields are requested
+        output_format: "records" (list of dicts) or "table" (columns + rows, more compact)
     """
 
     # Ensure we have a valid data_level
@@ -334,7 +327,7 @@ async def ff_get_roster(
             )
 
     try:
-        result = await _call_legacy_tool(
+        result = await _call_tool(
             "ff_get_roster",
             ctx=ctx,
             league_key=league_key,
@@ -344,6 +337,8 @@ async def ff_get_roster(
             include_external_data=effective_external,
             include_analysis=effective_analysis,
             data_level=data_level,
+            fields=fields,
+            output_format=output_format,
         )
         return result
     except Exception as exc:
@@ -376,7 +371,7 @@ async def ff_get_standings(
     Returns:
         Dict with sorted standings showing ranks, records, and points
     """
-    return await _call_legacy_tool("ff_get_standings", ctx=ctx, league_key=league_key)
+    return await _call_tool("ff_get_standings", ctx=ctx, league_key=league_key)
 
 
 @server.tool(
@@ -403,7 +398,7 @@ async def ff_get_matchup(
     Returns:
         Dict with matchup data including opponent and projections
     """
-    return await _call_legacy_tool(
+    return await _call_tool(
         "ff_get_matchup",
         ctx=ctx,
         league_key=league_key,
@@ -411,12 +406,137 @@ async def ff_get_matchup(
     )
 
 
+@server.tool(
+    name="ff_get_live_scores",
+    description=(
+        "📡 Live scoreboard for a league. Parameters: league_key (required). "
+        "Returns every matchup's points, projections and projected final scores."
+    ),
+    meta=_tool_meta("ff_get_live_scores"),
+)
+async def ff_get_live_scores(
+    ctx: Context,
+    league_key: str,
+) -> Dict[str, Any]:
+    """
+    Return the shared live scoreboard snapshot for a league.
+
+    Args:
+        league_key: League identifier (required)
+
+    Returns:
+        Dict with matchups, team points and projected finals
+    """
+    return await _call_tool("ff_get_live_scores", ctx=ctx, league_key=league_key)
+
+
+# session -> {league_key: live scoring subscription token}. Sessions are held
+# weakly and their watches end when they close, so a new session can never
+# inherit a dead one's entry.
+_LIVE_WATCHES: weakref.WeakKeyDictionary[Any, Dict[str, int]] = weakref.WeakKeyDictionary()
+
+
+def _end_live_watches(watches: Dict[str, int]) -> None:
+    for token in watches.values():
+        live_scores.unsubscribe(token)
+    watches.clear()
+
+
+def _session_live_watches(session: Any) -> Dict[str, int]:
+    """A session's live score watches, unsubscribed when the session closes."""
+    watches = _LIVE_WATCHES.get(session)
+    if watches is None:
+        watches = _LIVE_WATCHES[session] = {}
+        # The MCP session's exit stack unwinds on disconnect; the finalizer
+        # covers sessions without one
+        exit_stack = getattr(session, "_exit_stack", None)
+        if exit_stack is not None:
+            exit_stack.callback(_end_live_watches, watches)
+        weakref.finalize(session, _end_live_watches, watches)
+    return watches
+
+
+def _live_scoreboard_uri(league_key: str) -> str:
+    return f"live://{league_key}/scoreboard"
+
+
+def _live_matchup_uri(league_key: str, matchup_id: str) -> str:
+    return f"live://{league_key}/matchups/{matchup_id}"
+
+
+@server.tool(
+    name="ff_watch_live_scores",
+    description=(
+        "📡 Watch a league's live scores. Parameters: league_key (required), "
+        "watch (optional, false to stop). Changed matchups are pushed as resource "
+        "updates for live://{league_key}/scoreboard and live://{league_key}/matchups/{id}."
+    ),
+    meta=_tool_meta("ff_watch_live_scores"),
+)
+async def ff_watch_live_scores(
+    ctx: Context,
+    league_key: str,
+    watch: bool = True,
+) -> Dict[str, Any]:
+    """
+    Subscribe (or unsubscribe) this MCP session to live score updates.
+
+    Every session watching the same league shares one poller, so upstream
+    requests do not grow with the number of watchers.
+
+    Args:
+        league_key: League identifier (required)
+        watch: False to stop watching
+
+    Returns:
+        Dict with the subscription state and resource URIs
+    """
+    watches = _session_live_watches(ctx.session)
+
+    if not watch:
+        token = watches.pop(league_key, None)
+        if token is not None:
+            live_scores.unsubscribe(token)
+        return {"status": "success", "league_key": league_key, "watching": False}
+
+    if league_key not in watches:
+        # The poller keeps the listener; it must not keep a closed session alive
+        session_ref = weakref.ref(ctx.session)
+
+        async def push(changed_league: str, changed: List[Dict[str, Any]]) -> None:
+            try:
+                session = session_ref()
+                if session is None:
+                    raise RuntimeError("session closed")
+                await session.send_resource_updated(AnyUrl(_live_scoreboard_uri(changed_league)))
+                for matchup in changed:
+                    await session.send_resource_updated(
+                        AnyUrl(_live_matchup_uri(changed_league, matchup["matchup_id"]))
+                    )
+            except Exception:
+                watches.pop(league_key, None)
+                raise
+
+        watches[league_key] = live_scores.subscribe(league_key, push)
+
+    return {
+        "status": "success",
+        "league_key": league_key,
+        "watching": True,
+        "resources": {
+            "scoreboard": _live_scoreboard_uri(league_key),
+            "matchup": _live_matchup_uri(league_key, "{matchup_id}"),
+        },
+        "poll_interval_seconds": live_scores.interval,
+    }
+
+
 @server.tool(
     name="ff_get_players",
     description=(
         "🔍 Search AVAILABLE players by position with count limit. "
         "Use this to find free agents by position (QB, RB, WR, TE). "
-        "Parameters: league_key, position, count, week. "
+        "Parameters: league_key, position, count, week, fields, output_format. "
         "For YOUR roster use ff_get_roster. For waiver analysis use ff_get_waiver_wire."
     ),
     meta=_tool_meta("ff_get_players"),
@@ -432,6 +552,8 @@ async def ff_get_players(
     include_analysis: Optional[bool] = None,
     include_projections: Optional[bool] = None,
     include_external_data: Optional[bool] = None,
+    fields: Optional[List[str]] = None,
+    output_format: Literal["records", "table"] = "records",
 ) -> Dict[str, Any]:
     """
     Enhanced player search with expert analysis and Sleeper integration.
@@ -445,6 +567,9 @@ async def ff_get_players(
         include_analysis: Include expert tiers and recommendations
         include_projections: Include projection data
         include_external_data: Include Sleeper rankings and trending data
+        fields: Player fields to return (e.g. ["name", "position", "yahoo_projection"]);
+            enrichment is skipped when only basic Yahoo fields are requested
+        output_format: "records" (list of dicts) or "table" (columns + rows, more compact)
     """
 
     # Default to enhanced mode for better player analysis
@@ -455,7 +580,7 @@ async def ff_get_players(
     if include_external_data is None:
         include_external_data = True
 
-    return await _call_legacy_tool(
+    return await _call_tool(
         "ff_get_players",
         ctx=ctx,
         league_key=league_key,
@@ -467,6 +592,8 @@ async def ff_get_players(
         include_analysis=include_analysis,
         include_projections=include_projections,
         include_external_data=include_external_data,
+        fields=fields,
+        output_format=output_format,
     )
 
 
@@ -484,7 +611,7 @@ async def ff_compare_teams(
     team_key_a: str,
     team_key_b: str,
 ) -> Dict[str, Any]:
-    return await _call_legacy_tool(
+    return await _call_tool(
         "ff_compare_teams",
         ctx=ctx,
         league_key=league_key,
@@ -508,7 +635,7 @@ async def ff_build_lineup(
     strategy: Literal["conservative", "aggressive", "balanced"] = "balanced",
     debug: bool = False,
 ) -> Dict[str, Any]:
-    return await _call_legacy_tool(
+    return await _call_tool(
         "ff_build_lineup",
         ctx=ctx,
         league_key=league_key,
@@ -559,7 +686,7 @@ async def ff_get_api_status(ctx: Context) -> Dict[str, Any]:
     Returns:
         Dict with API status, rate limits, and cache metrics
     """
-    return await _call_legacy_tool("ff_get_api_status", ctx=ctx)
+    return await _call_tool("ff_get_api_status", ctx=ctx)
 
 
 @server.tool(
@@ -574,7 +701,7 @@ async def ff_clear_cache(
     ctx: Context,
     pattern: Optional[str] = None,
 ) -> Dict[str, Any]:
-    return await _call_legacy_tool("ff_clear_cache", ctx=ctx, pattern=pattern)
+    return await _call_tool("ff_clear_cache", ctx=ctx, pattern=pattern)
 
 
 @server.tool(
@@ -586,7 +713,30 @@ async def ff_clear_cache(
     meta=_tool_meta("ff_get_draft_results"),
 )
 async def ff_get_draft_results(ctx: Context, league_key: str) -> Dict[str, Any]:
-    return await _call_legacy_tool("ff_get_draft_results", ctx=ctx, league_key=league_key)
+    return await _call_tool("ff_get_draft_results", ctx=ctx, league_key=league_key)
+
+
+def _rank_waiver_players(players: Any, sort: str) -> Any:
+    """Order enhanced waiver players for ``sort``; accepts records or a table dict."""
+    if isinstance(players, dict):  # output_format="table"
+        columns = players.get("columns", [])
+        records = [dict(zip(columns, row)) for row in players.get("rows", [])]
+        return to_table(_rank_waiver_players(records, sort), columns)
+    if not isinstance(players, list) or not players:
+        return players
+
+    if sort == "rank":
+        # Sort by waiver_priority if available, else expert_confidence
+        if "waiver_priority" in players[0]:
+            players.sort(key=lambda x: x.get("waiver_priority") or 0, reverse=True)
+        else:
+            players.sort(key=lambda x: x.get("expert_confidence") or 0, reverse=True)
+    elif sort == "trending":
+        players.sort(
+            key=lambda x: 50 if x.get("trending_score") is None else x["trending_score"],
+            reverse=True,
+        )
+    return players
 
 
 @server.tool(
@@ -594,7 +744,7 @@ async def ff_get_draft_results(ctx: Context, league_key: str) -> Dict[str, Any]:
     description=(
         "📊 Get waiver wire pickups with RANKINGS, SORTING, and expert analysis. "
         "Use this for waiver priority decisions with sort options (rank/points/owned/trending). "
-        "Parameters: league_key, position, sort, count, include_expert_analysis. "
+        "Parameters: league_key, position, sort, count, include_expert_analysis, fields, output_format. "
         "For YOUR roster use ff_get_roster. For simple player search use ff_get_players."
     ),
     meta=_tool_meta("ff_get_waiver_wire"),
@@ -609,6 +759,8 @@ async def ff_get_waiver_wire(
     team_key: Optional[str] = None,
     include_expert_analysis: bool = True,
     data_level: Optional[Literal["basic", "standard", "full"]] = None,
+    fields: Optional[List[str]] = None,
+    output_format: Literal["records", "table"] = "records",
 ) -> Dict[str, Any]:
     """
     Enhanced waiver wire analysis with expert recommendations.
@@ -622,6 +774,9 @@ async def ff_get_waiver_wire(
         team_key: Team key for context (optional)
         include_expert_analysis: Include tiers, recommendations, and confidence scores
         data_level: Data detail level ("basic", "standard", "full")
+        fields: Player fields to return (e.g. ["name", "position", "yahoo_projection"]);
+            enrichment is skipped when only basic Yahoo fields are requested
+        output_format: "records" (list of dicts) or "table" (columns + rows, more compact)
     """
 
     # Default to enhanced mode for better waiver analysis, but basic mode if expert analysis disabled
@@ -647,7 +802,7 @@ async def ff_get_waiver_wire(
             include_external_data = True
             include_analysis = include_expert_analysis
 
-        result = await _call_legacy_tool(
+        result = await _call_tool(
             "ff_get_waiver_wire",
             ctx=ctx,
             league_key=league_key,
@@ -659,6 +814,8 @@ async def ff_get_waiver_wire(
             include_projections=include_projections,
             include_external_data=include_external_data,
             include_analysis=include_analysis,
+            fields=fields,
+            output_format=output_format,
         )
 
         # Check if main server provided enhanced players
@@ -670,17 +827,8 @@ async def ff_get_waiver_wire(
             # Replace basic players with enhanced players for better data
             result["players"] = result["enhanced_players"]
 
-            # Ensure proper sorting based on request
-            if sort == "rank" and result["players"]:
-                # Sort by waiver_priority if available, else expert_confidence
-                if "waiver_priority" in result["players"][0]:
-                    result["players"].sort(key=lambda x: x.get("waiver_priority", 0), reverse=True)
-                else:
-                    result["players"].sort(
-                        key=lambda x: x.get("expert_confidence", 0), reverse=True
-                    )
-            elif sort == "trending":
-                result["players"].sort(key=lambda x: x.get("trending_score", 50), reverse=True)
+            # Ensure proper sorting based on request, in either output format
+            result["players"] = _rank_waiver_players(result["players"], sort)
         elif include_expert_analysis and ctx:
             await ctx.info("Expert analysis requested but not available from main server")
 
@@ -708,7 +856,7 @@ async def ff_get_draft_rankings(
     position: Optional[str] = "all",
     count: int = 50,
 ) -> Dict[str, Any]:
-    return await _call_legacy_tool(
+    return await _call_tool(
         "ff_get_draft_rankings",
         ctx=ctx,
         league_key=league_key,
@@ -732,7 +880,7 @@ async def ff_get_draft_recommendation(
     num_recommendations: int = 10,
     current_pick: Optional[int] = None,
 ) -> Dict[str, Any]:
-    return await _call_legacy_tool(
+    return await _call_tool(
         "ff_get_draft_recommendation",
         ctx=ctx,
         league_key=league_key,
@@ -755,7 +903,7 @@ async def ff_analyze_draft_state(
     league_key: str,
     strategy: Literal["conservative", "aggressive", "balanced"] = "balanced",
 ) -> Dict[str, Any]:
-    return await _call_legacy_tool(
+    return await _call_tool(
         "ff_analyze_draft_state",
         ctx=ctx,
         league_key=league_key,
@@ -776,7 +924,7 @@ async def ff_analyze_reddit_sentiment(
     players: Sequence[str],
     time_window_hours: int = 48,
 ) -> Dict[str, Any]:
-    return await _call_legacy_tool(
+    return await _call_tool(
         "ff_analyze_reddit_sentiment",
         ctx=ctx,
         players=list(players),
@@ -1665,19 +1813,54 @@ KEY DIFFERENCES VS REDRAFT:
 
 
 def run_http_server(
-    host: Optional[str] = None, port: Optional[int] = None, *, show_banner: bool = True
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    *,
+    show_banner: bool = True,
+    prewarm: Optional[bool] = None,
+    prewarm_timeout_seconds: Optional[float] = None,
 ) -> None:
-    """Start the FastMCP server using the HTTP transport."""
+    """Start the FastMCP server using the HTTP transport.
+
+    With ``prewarm`` (default: the ``PREWARM_ON_START`` environment variable)
+    reference data is loaded concurrently while the server starts, and
+    ``/health`` reports not-ready until that finishes.
+    """
 
     resolved_host = host or os.getenv("HOST", "0.0.0.0")
     resolved_port = port or int(os.getenv("PORT", "8000"))
+    # Learn request patterns and prefetch ahead of recurring weekly workflows
+    cache_warmer.attach()
+
+    if prewarm is None:
+        prewarm = prewarm_enabled()
+    if not prewarm:
+        server.run(
+            "http",
+            host=resolved_host,
+            port=resolved_port,
+            show_banner=show_banner,
+        )
+        return
 
-    server.run(
-        "http",
-        host=resolved_host,
-        port=resolved_port,
-        show_banner=show_banner,
-    )
+    timeout = prewarm_timeout_seconds if prewarm_timeout_seconds is not None else prewarm_timeout()
+    asyncio.run(_serve_with_prewarm(resolved_host, resolved_port, show_banner, timeout))
+
+
+async def _serve_with_prewarm(host: str, port: int, show_banner: bool, timeout: float) -> None:
+    # Same event loop as the server, so the warmed caches and their locks are shared
+    steps = reference_data_steps(fantasy_football_multi_league.discover_leagues)
+    warmup = asyncio.create_task(startup_prewarm.run(steps, timeout))
+    try:
+        await server.run_http_async(transport="http", host=host, port=port, show_banner=show_banner)
+    finally:
+        warmup.cancel()
+
+
+@server.custom_route("/health", methods=["GET"])
+async def health(request: Request) -> JSONResponse:
+    """Liveness plus readiness: 503 while the start-up warm-up is still running."""
+    return JSONResponse(startup_prewarm.status(), status_code=200 if startup_prewarm.ready else 503)
 
 
 def main() -> None:
@@ -1696,6 +1879,8 @@ __all__ = [
     "ff_get_standings",
     "ff_get_roster",
     "ff_get_matchup",
+    "ff_get_live_scores",
+    "ff_watch_live_scores",
     "ff_get_players",
     "ff_compare_teams",
     "ff_build_lineup",
@@ -1840,6 +2025,24 @@ def get_tool_selection_guide() -> str:
     )
 
 
+@server.resource("live://{league_key}/scoreboard")
+async def get_live_scoreboard(league_key: str) -> str:
+    """Latest live scoreboard for a league."""
+    return json.dumps(await live_scores.scoreboard(league_key))
+
+
+@server.resource("live://{league_key}/matchups/{matchup_id}")
+async def get_live_matchup(league_key: str, matchup_id: str) -> str:
+    """One matchup from the latest live scoreboard."""
+    scoreboard = await live_scores.scoreboard(league_key)
+    matchup = next(
+        (m for m in scoreboard["matchups"] if m.get("matchup_id") == matchup_id), None
+    )
+    if matchup is None:
+        return json.dumps({"error": f"Unknown matchup {matchup_id} in {league_key}"})
+    return json.dumps(matchup)
+
+
 @server.resource("meta://version")
 def get_version() -> str:  # pragma: no cover - simple accessor
     return json.dumps({"commit": _COMMIT_SHA})
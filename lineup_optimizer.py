@@ -10,7 +10,10 @@ results based purely on the roster data already returned by the legacy layer.
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.api.yahoo_utils import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +46,57 @@ MATCH_CONFIDENCE = {
 # Penalty factors for mismatches
 MISMATCH_PENALTY = 0.5
 
+# External enrichment stages and the stages each one depends on
+ENRICHMENT_STAGES: Dict[str, Tuple[str, ...]] = {
+    "sleeper_id": (),
+    "projection": ("sleeper_id",),
+    "expert_advice": ("sleeper_id",),
+    "trending": ("sleeper_id",),
+    "recent_stats": ("sleeper_id", "projection"),
+}
+
+# How long (seconds) a stage result is reused across requests
+STAGE_TTLS = {
+    "sleeper_id": 86400,  # 24 hours - matches the Sleeper player pool cache
+    "projection": 3600,  # 1 hour
+    "expert_advice": 1800,  # 30 minutes - includes trending momentum
+    "trending": 1800,  # 30 minutes
+    "recent_stats": 3600,  # 1 hour - completed weeks do not change
+}
+
+# Cap on cached stage results; expired ones are purged first once it is reached
+STAGE_CACHE_MAX_ENTRIES = 20000
+
+# Serialized player fields and the stages needed to produce them. Fields not
+# listed here come from Yahoo or are computed locally.
+FIELD_STAGES: Dict[str, Tuple[str, ...]] = {
+    "sleeper_id": ("sleeper_id",),
+    "sleeper_match_method": ("sleeper_id",),
+    "sleeper_projection": ("projection",),
+    "composite_score": ("projection",),
+    "floor_projection": ("projection",),
+    "ceiling_projection": ("projection",),
+    "free_agent_value": ("projection",),
+    "waiver_priority": ("projection",),
+    "pickup_urgency": ("projection",),
+    "expert_tier": ("expert_advice",),
+    "expert_recommendation": ("expert_advice",),
+    "expert_confidence": ("expert_advice",),
+    "expert_advice": ("expert_advice",),
+    "search_rank": ("expert_advice",),
+    "matchup_score": ("expert_advice",),
+    "matchup_description": ("expert_advice",),
+    "risk_level": ("expert_advice",),
+    "trending_score": ("trending",),
+    "bye_week": ("recent_stats",),
+    "on_bye": ("recent_stats",),
+    "performance_flags": ("recent_stats",),
+    "enhancement_context": ("recent_stats",),
+    "adjusted_projection": ("recent_stats",),
+    "analysis": ("projection", "recent_stats"),
+    "roster_analysis": ("projection", "recent_stats"),
+}
+
 
 @dataclass
 class MatchAnalytics:
@@ -200,6 +254,57 @@ def _calculate_dynamic_weights(
     }
 
 
+def resolve_enrichment_stages(stages: Optional[Iterable[str]] = None) -> List[str]:
+    """Expand ``stages`` with their dependencies, in execution order.
+
+    ``None`` selects every stage.
+    """
+    if stages is None:
+        stages = ENRICHMENT_STAGES
+
+    ordered: List[str] = []
+
+    def visit(name: str) -> None:
+        if name not in ENRICHMENT_STAGES:
+            raise ValueError(f"Unknown enrichment stage: {name}")
+        if name in ordered:
+            return
+        for dependency in ENRICHMENT_STAGES[name]:
+            visit(dependency)
+        ordered.append(name)
+
+    for name in sorted(stages, key=list(ENRICHMENT_STAGES).index):
+        visit(name)
+    return ordered
+
+
+def enrichment_stages_for(
+    *,
+    include_projections: bool,
+    include_external_data: bool,
+    include_analysis: bool,
+    fields: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """Pick the enrichment stages a tool request actually needs.
+
+    The include_* flags set the upper bound; when ``fields`` is given only the
+    stages producing those fields are kept.
+    """
+    selected = set()
+    if include_projections:
+        selected.add("projection")
+    if include_external_data:
+        selected.update(ENRICHMENT_STAGES)
+    if include_analysis:
+        selected.update(("projection", "recent_stats"))
+
+    if fields is not None:
+        wanted = {stage for name in fields for stage in FIELD_STAGES.get(name, ())}
+        selected &= wanted
+
+    return resolve_enrichment_stages(selected)
+
+
 @dataclass
 class Player:
     """Simple player model that mirrors the attributes used by our callers."""
@@ -267,7 +372,8 @@ class LineupOptimizer:
     """Best-effort lineup helper that works entirely offline."""
 
     def __init__(self) -> None:
-        pass
+        # Per-stage enrichment results shared across requests
+        self.stage_cache = ResponseCache(max_entries=STAGE_CACHE_MAX_ENTRIES)
 
     async def parse_yahoo_roster(self, roster_payload: Dict[str, Any]) -> List[Player]:
         """Convert a roster payload into Player objects.
@@ -359,11 +465,18 @@ class LineupOptimizer:
         players: Sequence[Player],
         *,
         week: Optional[int] = None,
+        stages: Optional[Iterable[str]] = None,
     ) -> List[Player]:
-        """Enhance players with Sleeper data including rankings, advice, and matchup analysis."""
+        """Enhance players with Sleeper data including rankings, advice, and matchup analysis.
+
+        ``stages`` limits the external lookups to the named enrichment stages
+        (plus their dependencies); ``None`` runs all of them. Stage results are
+        memoized per player and week in ``stage_cache``.
+        """
 
         enhanced: List[Player] = []
         match_analytics = MatchAnalytics()
+        stage_order = resolve_enrichment_stages(stages)
 
         try:
             from sleeper_api import sleeper_client
@@ -374,6 +487,8 @@ class LineupOptimizer:
             current_season = await get_current_season()
             current_week = await get_current_week()
 
+            use_week = week or current_week
+            roster: List[Player] = []
             for player in players:
                 # Create a copy to avoid modifying the original
                 enhanced_player = Player(
@@ -423,7 +538,6 @@ class LineupOptimizer:
                     adjusted_projection=player.adjusted_projection,
                 )
 
-                use_week = week or current_week
                 logger.debug(
                     "enhance_with_external_data: player=%s original_bye=%r requested_week=%s api_current_week=%s use_week=%s",
                     player.name,
@@ -432,163 +546,43 @@ class LineupOptimizer:
                     current_week,
                     use_week,
                 )
+                roster.append(enhanced_player)
 
+            # Recent stats need every player's Sleeper ID first, then one lookup for the roster
+            per_player_stages = [stage for stage in stage_order if stage != "recent_stats"]
+            matched: List[Player] = []
+            for enhanced_player in roster:
                 try:
-                    # Get Sleeper player mapping and basic data
-                    sleeper_id = await sleeper_client.map_yahoo_to_sleeper(
-                        player.name, position=player.position, team=player.team
+                    await self._run_enrichment_stages(
+                        enhanced_player,
+                        per_player_stages,
+                        season=current_season,
+                        week=use_week,
+                        sleeper_client=sleeper_client,
                     )
+                    matched.append(enhanced_player)
+                except Exception:
+                    # If Sleeper lookup fails, keep original data
+                    enhanced_player.sleeper_match_method = "failed"
 
-                    if sleeper_id:
-                        enhanced_player.sleeper_id = sleeper_id
-                        enhanced_player.sleeper_match_method = "api"
-                        enhanced_player.bye = player.bye
-
-                        # Fetch projections for this player
-                        try:
-                            projections = await sleeper_client.get_projections(
-                                current_season, use_week
-                            )
-                            if sleeper_id in projections:
-                                proj_data = projections[sleeper_id]
-                                # Sleeper projections typically have 'projected_stats' with 'pts' or position-specific
-                                stats = proj_data.get("projected_stats", {})
-                                if isinstance(stats, list):
-                                    # Sum pts from list of stats if present
-                                    enhanced_player.sleeper_projection = sum(
-                                        _coerce_float(s.get("pts", 0)) for s in stats
-                                    )
-                                    enhanced_player.sleeper_projection_std = sum(
-                                        _coerce_float(s.get("pts_std", 0)) for s in stats
-                                    )
-                                    enhanced_player.sleeper_projection_ppr = sum(
-                                        _coerce_float(s.get("pts_ppr", 0)) for s in stats
-                                    )
-                                    enhanced_player.sleeper_projection_half_ppr = sum(
-                                        _coerce_float(s.get("pts_half_ppr", 0)) for s in stats
-                                    )
-                                else:
-                                    # Dict or direct pts
-                                    enhanced_player.sleeper_projection = _coerce_float(
-                                        stats.get("pts") or proj_data.get("pts", 0)
-                                    )
-                                    enhanced_player.sleeper_projection_std = _coerce_float(
-                                        stats.get("pts_std") or proj_data.get("pts_std", 0)
-                                    )
-                                    enhanced_player.sleeper_projection_ppr = _coerce_float(
-                                        stats.get("pts_ppr")
-                                        or proj_data.get(
-                                            "pts_ppr", enhanced_player.sleeper_projection
-                                        )
-                                    )
-                                    enhanced_player.sleeper_projection_half_ppr = _coerce_float(
-                                        stats.get("pts_half_ppr")
-                                        or proj_data.get(
-                                            "pts_half_ppr", enhanced_player.sleeper_projection
-                                        )
-                                    )
-                        except Exception:
-                            enhanced_player.sleeper_projection = 0.0  # Fallback if projections fail
-
-                        # Get expert advice for this player
-                        advice = await sleeper_client.get_expert_advice(player.name, week=use_week)
-                        if advice and advice.get("confidence", 0) > 0:
-                            enhanced_player.expert_tier = advice.get("tier", "starter")
-                            enhanced_player.expert_recommendation = advice.get(
-                                "recommendation", "Start"
-                            )
-                            enhanced_player.expert_confidence = advice.get("confidence", 50)
-                            enhanced_player.expert_advice = advice.get(
-                                "advice", "No advice available"
-                            )
-                            enhanced_player.search_rank = advice.get("search_rank", 500)
-                            enhanced_player.matchup_description = advice.get(
-                                "advice", "No advice available"
-                            )
-
-                            # Convert confidence to matchup score (0-100 -> 0-100)
-                            enhanced_player.matchup_score = advice.get("confidence", 50)
-
-                            # Set risk level based on tier and confidence
-                            confidence = advice.get("confidence", 50)
-                            if confidence >= 70:
-                                enhanced_player.risk_level = "low"
-                            elif confidence >= 50:
-                                enhanced_player.risk_level = "medium"
-                            else:
-                                enhanced_player.risk_level = "high"
-
-                        # Try to get trending data
-                        try:
-                            trending_adds = await sleeper_client.get_trending_players(
-                                "nfl", "add", hours=24
-                            )
-                            trending_drops = await sleeper_client.get_trending_players(
-                                "nfl", "drop", hours=24
-                            )
-
-                            # Check if this player is trending
-                            trending_add_ids = [p.get("player_id") for p in trending_adds]
-                            trending_drop_ids = [p.get("player_id") for p in trending_drops]
-
-                            if sleeper_id in trending_add_ids:
-                                enhanced_player.trending_score = 75  # Trending up
-                            elif sleeper_id in trending_drop_ids:
-                                enhanced_player.trending_score = 25  # Trending down
-                            else:
-                                enhanced_player.trending_score = 50  # Neutral
-                        except Exception:
-                            enhanced_player.trending_score = 50  # Default if trending fails
-
-                    # ===== ENHANCEMENT LAYER: Bye weeks & recent stats context =====
+            if "recent_stats" in stage_order:
+                recent_stats = await self._prefetch_recent_stats(
+                    matched, season=current_season, week=use_week, sleeper_client=sleeper_client
+                )
+                for enhanced_player in matched:
                     try:
-                        from src.services.player_enhancement import enhance_player_with_context
-
-                        enhancement = await enhance_player_with_context(
+                        await self._run_enrichment_stages(
                             enhanced_player,
-                            current_week=use_week,
+                            ["recent_stats"],
                             season=current_season,
-                            sleeper_api=sleeper_client,
+                            week=use_week,
+                            sleeper_client=sleeper_client,
+                            recent_stats=recent_stats,
                         )
-
-                        # Apply bye week override
-                        if enhancement.on_bye:
-                            enhanced_player.sleeper_projection = 0.0
-                            enhanced_player.yahoo_projection = 0.0
-                            enhanced_player.sleeper_projection_ppr = 0.0
-                            enhanced_player.sleeper_projection_std = 0.0
-                            enhanced_player.sleeper_projection_half_ppr = 0.0
-                            enhanced_player.expert_recommendation = (
-                                enhancement.recommendation_override
-                            )
-                            enhanced_player.risk_level = "n/a"
-                            enhanced_player.player_tier = "bye"
-
-                        # Store enhancement data on player
-                        enhanced_player.on_bye = enhancement.on_bye
-                        enhanced_player.recent_performance_data = enhancement.recent_performance
-                        enhanced_player.performance_flags = enhancement.performance_flags
-                        enhanced_player.enhancement_context = enhancement.context_message
-
-                        # Use adjusted projection if available
-                        if enhancement.adjusted_projection is not None and not enhancement.on_bye:
-                            enhanced_player.adjusted_projection = enhancement.adjusted_projection
-                        else:
-                            enhanced_player.adjusted_projection = enhanced_player.sleeper_projection
-
                     except Exception:
-                        # If enhancement fails, continue with original data
-                        logger.exception("Player enhancement failed for %s", player.name)
-                        enhanced_player.on_bye = False
-                        enhanced_player.recent_performance_data = None
-                        enhanced_player.performance_flags = []
-                        enhanced_player.enhancement_context = "Enhancement unavailable"
-                        enhanced_player.adjusted_projection = enhanced_player.sleeper_projection
-
-                except Exception:
-                    # If Sleeper lookup fails, keep original data
-                    enhanced_player.sleeper_match_method = "failed"
+                        enhanced_player.sleeper_match_method = "failed"
 
+            for enhanced_player in roster:
                 # Populate derived metrics with dynamic weighting
                 match_confidence = _calculate_match_confidence(enhanced_player.sleeper_match_method)
                 weights = _calculate_dynamic_weights(
@@ -684,6 +678,232 @@ class LineupOptimizer:
 
         return enhanced
 
+    async def _run_enrichment_stages(
+        self,
+        player: Player,
+        stage_order: Sequence[str],
+        *,
+        season: int,
+        week: int,
+        sleeper_client: Any,
+        recent_stats: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Apply each stage's memoized field updates to ``player`` in dependency order.
+
+        ``recent_stats`` is the roster-wide lookup from ``_prefetch_recent_stats``.
+        """
+        stage_handlers: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+            "sleeper_id": self._stage_sleeper_id,
+            "projection": self._stage_projection,
+            "expert_advice": self._stage_expert_advice,
+            "trending": self._stage_trending,
+            "recent_stats": partial(self._stage_recent_stats, recent_stats=recent_stats),
+        }
+
+        for stage in stage_order:
+            cache_key = self._stage_cache_key(stage, player, season, week)
+            updates = await self.stage_cache.get(cache_key)
+            if updates is None:
+                updates = await stage_handlers[stage](
+                    player, season=season, week=week, sleeper_client=sleeper_client
+                )
+                await self.stage_cache.set(cache_key, updates, ttl=STAGE_TTLS[stage])
+
+            for attr, value in updates.items():
+                setattr(player, attr, value)
+
+    @staticmethod
+    def _stage_cache_key(stage: str, player: Player, season: int, week: int) -> str:
+        identity = f"{player.name}|{player.position}|{player.team}".lower()
+        if stage == "sleeper_id":
+            return f"enrichment/{stage}/{identity}"
+        if stage == "recent_stats":
+            return f"enrichment/{stage}/{season}/{week}/{player.bye}/{identity}"
+        return f"enrichment/{stage}/{season}/{week}/{identity}"
+
+    async def _prefetch_recent_stats(
+        self, players: Sequence[Player], *, season: int, week: int, sleeper_client: Any
+    ) -> Dict[str, Any]:
+        """Recent stats for every player without a cached recent_stats result, in one lookup."""
+        from src.services.player_enhancement import detect_bye_week, get_recent_stats_batch
+
+        sleeper_ids = [
+            player.sleeper_id
+            for player in players
+            if player.sleeper_id
+            and not detect_bye_week(player.bye, week)
+            and not self.stage_cache.remaining_ttl(
+                self._stage_cache_key("recent_stats", player, season, week)
+            )
+        ]
+        if not sleeper_ids:
+            return {}
+        return await get_recent_stats_batch(sleeper_client, sleeper_ids, season, week, lookback=3)
+
+    async def _stage_sleeper_id(
+        self, player: Player, *, season: int, week: int, sleeper_client: Any
+    ) -> Dict[str, Any]:
+        sleeper_id = await sleeper_client.map_yahoo_to_sleeper(
+            player.name, position=player.position, team=player.team
+        )
+        if not sleeper_id:
+            return {}
+        return {"sleeper_id": sleeper_id, "sleeper_match_method": "api"}
+
+    async def _stage_projection(
+        self, player: Player, *, season: int, week: int, sleeper_client: Any
+    ) -> Dict[str, Any]:
+        sleeper_id = player.sleeper_id
+        if not sleeper_id:
+            return {}
+
+        try:
+            projections = await sleeper_client.get_projections(season, week)
+        except Exception:
+            return {"sleeper_projection": 0.0}  # Fallback if projections fail
+        if sleeper_id not in projections:
+            return {}
+
+        proj_data = projections[sleeper_id]
+        # Sleeper projections typically have 'projected_stats' with 'pts' or position-specific
+        stats = proj_data.get("projected_stats", {})
+        if isinstance(stats, list):
+            # Sum pts from list of stats if present
+            return {
+                "sleeper_projection": sum(_coerce_float(s.get("pts", 0)) for s in stats),
+                "sleeper_projection_std": sum(_coerce_float(s.get("pts_std", 0)) for s in stats),
+                "sleeper_projection_ppr": sum(_coerce_float(s.get("pts_ppr", 0)) for s in stats),
+                "sleeper_projection_half_ppr": sum(
+                    _coerce_float(s.get("pts_half_ppr", 0)) for s in stats
+                ),
+            }
+
+        # Dict or direct pts
+        projection = _coerce_float(stats.get("pts") or proj_data.get("pts", 0))
+        return {
+            "sleeper_projection": projection,
+            "sleeper_projection_std": _coerce_float(
+                stats.get("pts_std") or proj_data.get("pts_std", 0)
+            ),
+            "sleeper_projection_ppr": _coerce_float(
+                stats.get("pts_ppr") or proj_data.get("pts_ppr", projection)
+            ),
+            "sleeper_projection_half_ppr": _coerce_float(
+                stats.get("pts_half_ppr") or proj_data.get("pts_half_ppr", projection)
+            ),
+        }
+
+    async def _stage_expert_advice(
+        self, player: Player, *, season: int, week: int, sleeper_client: Any
+    ) -> Dict[str, Any]:
+        if not player.sleeper_id:
+            return {}
+
+        advice = await sleeper_client.get_expert_advice(player.name, week=week)
+        if not advice or advice.get("confidence", 0) <= 0:
+            return {}
+
+        # Set risk level based on tier and confidence
+        confidence = advice.get("confidence", 50)
+        if confidence >= 70:
+            risk_level = "low"
+        elif confidence >= 50:
+            risk_level = "medium"
+        else:
+            risk_level = "high"
+
+        return {
+            "expert_tier": advice.get("tier", "starter"),
+            "expert_recommendation": advice.get("recommendation", "Start"),
+            "expert_confidence": confidence,
+            "expert_advice": advice.get("advice", "No advice available"),
+            "search_rank": advice.get("search_rank", 500),
+            "matchup_description": advice.get("advice", "No advice available"),
+            # Convert confidence to matchup score (0-100 -> 0-100)
+            "matchup_score": confidence,
+            "risk_level": risk_level,
+        }
+
+    async def _stage_trending(
+        self, player: Player, *, season: int, week: int, sleeper_client: Any
+    ) -> Dict[str, Any]:
+        if not player.sleeper_id:
+            return {}
+
+        try:
+            trending_adds = await sleeper_client.get_trending_players("nfl", "add", hours=24)
+            trending_drops = await sleeper_client.get_trending_players("nfl", "drop", hours=24)
+        except Exception:
+            return {"trending_score": 50}  # Default if trending fails
+
+        # Check if this player is trending
+        if player.sleeper_id in [p.get("player_id") for p in trending_adds]:
+            return {"trending_score": 75}  # Trending up
+        if player.sleeper_id in [p.get("player_id") for p in trending_drops]:
+            return {"trending_score": 25}  # Trending down
+        return {"trending_score": 50}  # Neutral
+
+    async def _stage_recent_stats(
+        self,
+        player: Player,
+        *,
+        season: int,
+        week: int,
+        sleeper_client: Any,
+        recent_stats: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Bye weeks & recent stats context from the enhancement layer."""
+        try:
+            from src.services.player_enhancement import enhance_player_with_context
+
+            enhancement = await enhance_player_with_context(
+                player,
+                current_week=week,
+                season=season,
+                sleeper_api=sleeper_client,
+                recent_stats=recent_stats,
+            )
+        except Exception:
+            # If enhancement fails, continue with original data
+            logger.exception("Player enhancement failed for %s", player.name)
+            return {
+                "on_bye": False,
+                "recent_performance_data": None,
+                "performance_flags": [],
+                "enhancement_context": "Enhancement unavailable",
+                "adjusted_projection": player.sleeper_projection,
+            }
+
+        updates: Dict[str, Any] = {
+            "on_bye": enhancement.on_bye,
+            "recent_performance_data": enhancement.recent_performance,
+            "performance_flags": enhancement.performance_flags,
+            "enhancement_context": enhancement.context_message,
+        }
+
+        # Apply bye week override
+        if enhancement.on_bye:
+            updates.update(
+                {
+                    "sleeper_projection": 0.0,
+                    "yahoo_projection": 0.0,
+                    "sleeper_projection_ppr": 0.0,
+                    "sleeper_projection_std": 0.0,
+                    "sleeper_projection_half_ppr": 0.0,
+                    "expert_recommendation": enhancement.recommendation_override,
+                    "risk_level": "n/a",
+                    "player_tier": "bye",
+                    "adjusted_projection": 0.0,
+                }
+            )
+        elif enhancement.adjusted_projection is not None:
+            # Use adjusted projection if available
+            updates["adjusted_projection"] = enhancement.adjusted_projection
+        else:
+            updates["adjusted_projection"] = player.sleeper_projection
+
+        return updates
+
     async def optimize_lineup_smart(
         self,
         players: Sequence[Player],
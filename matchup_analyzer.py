@@ -4,21 +4,121 @@ Matchup Analyzer for Fantasy Football
 Analyzes player matchups against opposing defenses
 """
 
-from typing import Dict, List, Optional, Tuple
+import hashlib
+import json
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
 from sleeper_api import sleeper_client
 
+NUM_TEAMS = 32
+DEFAULT_RANK = 16
+# Steepness of the rank-to-score sigmoid (reduced for less extreme differences)
+SIGMOID_STEEPNESS = 0.05
+
+RANKING_KEYS = ("vs_qb", "vs_rb", "vs_wr", "vs_te")
+# Map position to ranking key; kickers correlate with offensive success and
+# defenses face the opposing QB, so both share the QB column
+POSITION_RANKING_KEYS = {
+    "QB": "vs_qb",
+    "RB": "vs_rb",
+    "WR": "vs_wr",
+    "TE": "vs_te",
+    "K": "vs_qb",
+    "DEF": "vs_qb",
+}
+DEFAULT_RANKING_KEY = "vs_qb"
+
+# Description tiers, checked from the top: (minimum score, label)
+MATCHUP_TIERS = [
+    (90, "SMASH SPOT"),
+    (80, "Elite matchup"),
+    (70, "Great matchup"),
+    (60, "Good matchup"),
+    (50, "Neutral matchup"),
+    (40, "Below average"),
+    (30, "Tough matchup"),
+    (20, "Bad matchup"),
+    (10, "Terrible matchup"),
+    (0, "AVOID - Elite defense"),
+]
+
+UNKNOWN_MATCHUP = (50, "Unknown matchup")
+
+
+def _opponent_team(opponent: str) -> str:
+    """Strip the away marker from an opponent ("@DAL" -> "DAL")."""
+    return opponent.replace("@", "").strip()
+
+
+def _describe(score: int, team: str, ranking) -> str:
+    label = next(label for floor, label in MATCHUP_TIERS if score >= floor)
+    return f"{label} vs {team} (#{ranking}/{NUM_TEAMS})"
+
 
 class MatchupAnalyzer:
-    """Analyzes fantasy football matchups based on defensive rankings."""
+    """Analyzes fantasy football matchups based on defensive rankings.
 
-    def __init__(self):
-        self.defensive_rankings = None
+    Scores and descriptions for every team and ranking column are computed
+    once per rankings version, so single and batch lookups are table reads.
+    """
 
-    async def load_defensive_rankings(self):
-        """Load defensive rankings if not already loaded."""
-        if not self.defensive_rankings:
+    def __init__(self):
+        self._rankings = None
+        self.rankings_version = None
+        self.team_index: Dict[str, int] = {}
+        self.score_table = np.zeros((0, len(RANKING_KEYS)), dtype=int)
+        self.description_table = np.empty((0, len(RANKING_KEYS)), dtype=object)
+        self._columns = {
+            position: RANKING_KEYS.index(key) for position, key in POSITION_RANKING_KEYS.items()
+        }
+        self._default_column = RANKING_KEYS.index(DEFAULT_RANKING_KEY)
+
+    @property
+    def defensive_rankings(self) -> Optional[Dict[str, Dict]]:
+        return self._rankings
+
+    @defensive_rankings.setter
+    def defensive_rankings(self, rankings: Optional[Dict[str, Dict]]):
+        """Store rankings, rebuilding the lookup tables only when they changed."""
+        self._rankings = rankings
+        version = hashlib.blake2b(
+            json.dumps(rankings or {}, sort_keys=True).encode(), digest_size=8
+        ).hexdigest()
+        if version != self.rankings_version:
+            self._build_tables(rankings or {})
+            self.rankings_version = version
+
+    async def load_defensive_rankings(self, refresh: bool = False):
+        """Load defensive rankings if not already loaded (or when refreshing)."""
+        if refresh or not self.defensive_rankings:
             self.defensive_rankings = await sleeper_client.get_defensive_rankings()
 
+    def _build_tables(self, rankings: Dict[str, Dict]):
+        """Precompute the team x ranking-column score and description tables."""
+        teams = list(rankings)
+        raw_ranks = [
+            [rankings[team].get(key, DEFAULT_RANK) for key in RANKING_KEYS] for team in teams
+        ]
+        ranks = np.array(raw_ranks, dtype=float).reshape(len(teams), len(RANKING_KEYS))
+
+        # Non-linear transformation using sigmoid curve
+        # Convert ranking to percentile (32nd = 100th percentile = best matchup),
+        # then flatten the middle and steepen the extremes
+        percentile = ((NUM_TEAMS - ranks + 1) / NUM_TEAMS) * 100
+        scores = 100 / (1 + np.exp(-SIGMOID_STEEPNESS * (percentile - 50)))
+        scores = np.clip(scores.astype(int), 1, 100)
+
+        descriptions = np.empty(scores.shape, dtype=object)
+        for row, team in enumerate(teams):
+            for col, ranking in enumerate(raw_ranks[row]):
+                descriptions[row, col] = _describe(int(scores[row, col]), team, ranking)
+
+        self.team_index = {team: row for row, team in enumerate(teams)}
+        self.score_table = scores
+        self.description_table = descriptions
+
     def get_matchup_score(self, opponent_team: str, position: str) -> Tuple[int, str]:
         """
         Get matchup score using non-linear transformation.
@@ -31,60 +131,41 @@ class MatchupAnalyzer:
             Score: 1-100 (100 = best matchup, 1 = worst matchup)
             Description: Text description of matchup quality
         """
-        import numpy as np
-
-        if not self.defensive_rankings or opponent_team not in self.defensive_rankings:
-            return (50, "Unknown matchup")
-
-        # Map position to ranking key
-        position_map = {
-            "QB": "vs_qb",
-            "RB": "vs_rb",
-            "WR": "vs_wr",
-            "TE": "vs_te",
-            "K": "vs_qb",  # Kickers correlate with offensive success
-            "DEF": "vs_qb",  # Defense vs opposing QB
-        }
-
-        ranking_key = position_map.get(position, "vs_qb")
-        ranking = self.defensive_rankings[opponent_team].get(ranking_key, 16)
+        row = self.team_index.get(_opponent_team(opponent_team))
+        if row is None:
+            return UNKNOWN_MATCHUP
 
-        # Non-linear transformation using sigmoid curve
-        # This better reflects the actual difference in fantasy points allowed
-        # Convert ranking to percentile (32nd = 100th percentile = best matchup)
-        percentile = ((32 - ranking + 1) / 32) * 100
-
-        # Apply sigmoid transformation for better differentiation
-        # Steeper curve at extremes, flatter in middle
-        k = 0.05  # Steepness factor (further reduced for even less extreme differences)
-        score = 100 / (1 + np.exp(-k * (percentile - 50)))
+        col = self._columns.get(position, self._default_column)
+        return (int(self.score_table[row, col]), self.description_table[row, col])
 
-        # Ensure score is in valid range
-        score = max(1, min(100, int(score)))
+    def scores(self, opponents: Sequence[str], positions: Sequence[str]) -> List[Tuple[int, str]]:
+        """
+        Look up matchup scores for many players at once.
 
-        # Generate description with more granular tiers
-        if score >= 90:
-            description = f"SMASH SPOT vs {opponent_team} (#{ranking}/32)"
-        elif score >= 80:
-            description = f"Elite matchup vs {opponent_team} (#{ranking}/32)"
-        elif score >= 70:
-            description = f"Great matchup vs {opponent_team} (#{ranking}/32)"
-        elif score >= 60:
-            description = f"Good matchup vs {opponent_team} (#{ranking}/32)"
-        elif score >= 50:
-            description = f"Neutral matchup vs {opponent_team} (#{ranking}/32)"
-        elif score >= 40:
-            description = f"Below average vs {opponent_team} (#{ranking}/32)"
-        elif score >= 30:
-            description = f"Tough matchup vs {opponent_team} (#{ranking}/32)"
-        elif score >= 20:
-            description = f"Bad matchup vs {opponent_team} (#{ranking}/32)"
-        elif score >= 10:
-            description = f"Terrible matchup vs {opponent_team} (#{ranking}/32)"
-        else:
-            description = f"AVOID - Elite defense vs {opponent_team} (#{ranking}/32)"
+        Args:
+            opponents: Opponent team abbreviations (e.g., "BAL", "@DAL")
+            positions: Player positions, parallel to ``opponents``
 
-        return (score, description)
+        Returns:
+            List of (score, description) in input order; unknown teams get
+            (50, "Unknown matchup")
+        """
+        if not self.team_index:
+            return [UNKNOWN_MATCHUP] * len(opponents)
+
+        rows = np.array(
+            [self.team_index.get(_opponent_team(opponent), -1) for opponent in opponents],
+            dtype=np.intp,
+        )
+        cols = np.array(
+            [self._columns.get(position, self._default_column) for position in positions],
+            dtype=np.intp,
+        )
+        known = rows >= 0
+        score, description = UNKNOWN_MATCHUP
+        matched_scores = np.where(known, self.score_table[rows, cols], score)
+        matched_descriptions = np.where(known, self.description_table[rows, cols], description)
+        return list(zip(matched_scores.tolist(), matched_descriptions.tolist()))
 
     def get_matchup_score_empirical(
         self, opponent_team: str, position: str, historical_data: Dict = None
@@ -147,11 +228,13 @@ class MatchupAnalyzer:
         """
         await self.load_defensive_rankings()
 
-        # Clean opponent (remove @ for away games)
-        opp_team = opponent.replace("@", "").strip()
-
-        score, description = self.get_matchup_score(opp_team, position)
+        score, description = self.get_matchup_score(opponent, position)
+        return await self._matchup_analysis(player_name, position, opponent, score, description)
 
+    async def _matchup_analysis(
+        self, player_name: str, position: str, opponent: str, score: int, description: str
+    ) -> Dict:
+        """Combine a matchup score with the player's Sleeper projection."""
         # Get Sleeper projection if available
         from sleeper_api import get_player_projection
 
@@ -207,13 +290,15 @@ class MatchupAnalyzer:
         """
         await self.load_defensive_rankings()
 
-        analyses = []
-        for player in roster:
-            if not player.get("opponent"):
-                continue
+        players = [player for player in roster if player.get("opponent")]
+        matchups = self.scores(
+            [player["opponent"] for player in players], [player["position"] for player in players]
+        )
 
-            analysis = await self.analyze_player_matchup(
-                player["name"], player["position"], player["opponent"]
+        analyses = []
+        for player, (score, description) in zip(players, matchups):
+            analysis = await self._matchup_analysis(
+                player["name"], player["position"], player["opponent"], score, description
             )
             analyses.append(analysis)
 
@@ -236,14 +321,16 @@ class MatchupAnalyzer:
         if not self.defensive_rankings:
             return []
 
-        matchups = []
-        for team, opponent in week_matchups.items():
-            opp_team = opponent.replace("@", "").strip()
-            if opp_team in self.defensive_rankings:
-                score, description = self.get_matchup_score(opp_team, position)
-                matchups.append(
-                    {"team": team, "opponent": opponent, "score": score, "description": description}
-                )
+        games = [
+            (team, opponent)
+            for team, opponent in week_matchups.items()
+            if _opponent_team(opponent) in self.team_index
+        ]
+        scores = self.scores([opponent for _, opponent in games], [position] * len(games))
+        matchups = [
+            {"team": team, "opponent": opponent, "score": score, "description": description}
+            for (team, opponent), (score, description) in zip(games, scores)
+        ]
 
         # Sort by score (best matchups first)
         matchups.sort(key=lambda x: x["score"], reverse=True)
@@ -93,6 +93,13 @@ class SleeperAPI:
     _normalized_index: Dict[str, str] = {}
     _normalized_variants: Dict[str, List[str]] = {}
 
+    def normalized_name_index(self) -> Dict[str, str]:
+        """Normalized full name -> player_id, one player per name (active, best ranked).
+
+        Empty until ``get_all_players`` has loaded the player list.
+        """
+        return dict(self._normalized_index)
+
     @staticmethod
     def _normalize_name(name: str) -> str:
         """Normalize player name for matching.
@@ -294,7 +301,9 @@ class SleeperAPI:
         """Get current NFL season state (week, season, etc)."""
         return await self._make_request("state/nfl") or {}
 
-    async def get_player_stats(self, season: int, week: int) -> Dict[str, Dict]:
+    async def get_player_stats(
+        self, season: int, week: int, use_cache: bool = True
+    ) -> Dict[str, Dict]:
         """Get actual player stats for a specific week.
 
         This fetches ACTUAL performance data (not projections) for players
@@ -303,6 +312,7 @@ class SleeperAPI:
         Args:
             season: NFL season year (e.g., 2024)
             week: Week number (1-18)
+            use_cache: Set False to bypass the response cache (live polling)
 
         Returns:
             Dict keyed by player_id with actual stats including:
@@ -317,7 +327,7 @@ class SleeperAPI:
             points = player_stats.get("pts_ppr", 0)
         """
         endpoint = f"stats/nfl/{season}/{week}"
-        raw = await self._make_request(endpoint, use_cache=True) or {}
+        raw = await self._make_request(endpoint, use_cache=use_cache) or {}
 
         # Sleeper returns stats keyed by player_id
         # No additional processing needed - return raw data
@@ -739,11 +749,10 @@ class SleeperAPI:
 
         # Matchup analysis (import here to avoid circular imports)
         try:
-            from matchup_analyzer import MatchupAnalyzer
+            from matchup_analyzer import matchup_analyzer
 
-            analyzer = MatchupAnalyzer()
-            await analyzer.load_defensive_rankings()
-            matchup_score, matchup_desc = analyzer.get_matchup_score(team, position)
+            await matchup_analyzer.load_defensive_rankings()
+            matchup_score, matchup_desc = matchup_analyzer.get_matchup_score(team, position)
         except:
             matchup_score, matchup_desc = 50, "Unknown matchup"
 
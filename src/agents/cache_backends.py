@@ -0,0 +1,532 @@
+"""
+Persistent (L2) storage backends for the cache manager.
+
+CacheManagerAgent keeps hot entries in memory and writes every entry behind
+to one of these backends:
+
+- ``FileCacheBackend``: one pickle file per key plus an append-only index
+  journal. Private to one process; the manager's in-memory index is the
+  source of truth for keys, tags and expiry.
+- ``SQLiteCacheBackend``: one SQLite database in WAL mode with memory-mapped
+  reads, an indexed expiry column and a tag table, so expiry sweeps and
+  tag/league/week invalidation are index lookups. Worker processes on the
+  same host can share it.
+- ``RedisCacheBackend``: a Redis-compatible server for multi-instance
+  deployments (needs the optional ``redis`` package). Expiry is native.
+
+Backend methods block; the manager calls them from its I/O thread pool.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set
+
+from loguru import logger
+
+try:
+    import redis
+
+    HAS_REDIS = True
+except ImportError:  # pragma: no cover - depends on optional dependency
+    redis = None
+    HAS_REDIS = False
+
+if TYPE_CHECKING:
+    from .cache_manager import CacheEntry
+
+# Journal records appended before FileCacheBackend compacts into index.json
+JOURNAL_COMPACT_MIN = 1000
+
+# Bytes of the SQLite database mapped into memory for reads
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    size_bytes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_entries_expiry ON cache_entries (expires_at);
+CREATE TABLE IF NOT EXISTS cache_tags (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (tag, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cache_tags_key ON cache_tags (key);
+"""
+
+
+def index_record(entry: "CacheEntry") -> Dict[str, Any]:
+    """JSON-safe metadata of an entry (no value)."""
+    return {
+        "key": entry.key,
+        "created_at": entry.created_at.isoformat(),
+        "expires_at": entry.expires_at.isoformat() if entry.expires_at else None,
+        "access_count": entry.access_count,
+        "last_accessed": entry.last_accessed.isoformat() if entry.last_accessed else None,
+        "tags": entry.tags,
+        "size_bytes": entry.size_bytes,
+    }
+
+
+def _to_epoch(value: Optional[datetime]) -> Optional[float]:
+    """Naive UTC datetime (as CacheEntry stores them) to a POSIX timestamp."""
+    if value is None:
+        return None
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _from_epoch(value: Optional[float]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, timezone.utc).replace(tzinfo=None)
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+class CacheBackend(ABC):
+    """Persistent storage for cache entries behind the memory tier."""
+
+    name = "base"
+
+    # Whether other processes write to the same store. The manager then asks
+    # the backend on memory misses and tag lookups instead of trusting its index.
+    shared = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional["CacheEntry"]:
+        """Entry with its value, or None when absent or expired."""
+
+    @abstractmethod
+    def write_batch(self, changes: Dict[str, Optional["CacheEntry"]]) -> None:
+        """Apply queued writes (entry) and deletes (None) as one batch."""
+
+    @abstractmethod
+    def set_expiry(self, key: str, expires_at: Optional[datetime]) -> None:
+        """Change an entry's expiry without rewriting its value."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry."""
+
+    def load_index(self) -> List[Dict[str, Any]]:
+        """Index records (see ``index_record``) used to seed the manager's index."""
+        return []
+
+    def keys_with_tags(self, tags: Iterable[str], match_all: bool = False) -> Set[str]:
+        """Keys carrying any (or, with ``match_all``, every one) of ``tags``."""
+        return set()
+
+    def purge_expired(self) -> int:
+        """Drop expired entries the manager may not know about; returns how many."""
+        return 0
+
+    def close(self) -> None:
+        """Flush indexes and release connections."""
+
+
+class FileCacheBackend(CacheBackend):
+    """One pickle file per key with an index snapshot plus append-only journal."""
+
+    name = "file"
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._index_path = self.path / "index.json"
+        self._journal_path = self.path / "index.journal"
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._journal_records = 0
+        self._lock = threading.Lock()
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{hashlib.sha256(key.encode()).hexdigest()[:16]}.pkl"
+
+    def get(self, key: str) -> Optional["CacheEntry"]:
+        record = self._records.get(key)
+        if record is None:
+            return None
+        expires_at = _parse_datetime(record.get("expires_at"))
+        if expires_at is not None and expires_at <= datetime.utcnow():
+            return None
+
+        cache_file = self._file(key)
+        if not cache_file.exists():
+            return None
+        with open(cache_file, "rb") as f:
+            entry = pickle.load(f)
+        # The index is authoritative for expiry (set_expiry only journals it)
+        entry.expires_at = expires_at
+        return entry
+
+    def write_batch(self, changes: Dict[str, Optional["CacheEntry"]]) -> None:
+        journal = []
+        for key, entry in changes.items():
+            cache_file = self._file(key)
+            try:
+                if entry is None:
+                    cache_file.unlink(missing_ok=True)
+                    journal.append({"op": "del", "key": key})
+                else:
+                    tmp_file = cache_file.with_suffix(".tmp")
+                    with open(tmp_file, "wb") as f:
+                        pickle.dump(entry, f)
+                    os.replace(tmp_file, cache_file)
+                    journal.append({"op": "set", **index_record(entry)})
+            except Exception as e:
+                logger.error(f"Error writing to file cache for key {key}: {e}")
+
+        with self._lock:
+            self._append_journal(journal)
+
+    def set_expiry(self, key: str, expires_at: Optional[datetime]) -> None:
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None:
+                expiry = expires_at.isoformat() if expires_at else None
+                self._append_journal([{**record, "op": "set", "expires_at": expiry}])
+
+    def _append_journal(self, journal: List[Dict[str, Any]]) -> None:
+        """Apply records to the index and append them with one fsync; caller holds the lock."""
+        if not journal:
+            return
+        for record in journal:
+            if record["op"] == "del":
+                self._records.pop(record["key"], None)
+            else:
+                self._records[record["key"]] = {k: v for k, v in record.items() if k != "op"}
+
+        with open(self._journal_path, "a") as f:
+            f.writelines(json.dumps(record) + "\n" for record in journal)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._journal_records += len(journal)
+        if self._journal_records > max(JOURNAL_COMPACT_MIN, 2 * len(self._records)):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Atomically replace index.json with the live index and drop the journal."""
+        now = datetime.utcnow()
+        entries = [
+            record
+            for record in self._records.values()
+            if (_parse_datetime(record.get("expires_at")) or now) >= now
+        ]
+        tmp_file = self._index_path.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump({"entries": entries}, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self._index_path)
+        self._journal_path.unlink(missing_ok=True)
+        self._journal_records = 0
+        logger.debug(f"Saved cache index with {len(entries)} entries")
+
+    def load_index(self) -> List[Dict[str, Any]]:
+        """The index.json snapshot with the journal replayed on top."""
+        with self._lock:
+            records: Dict[str, Dict[str, Any]] = {}
+            if self._index_path.exists():
+                with open(self._index_path, "r") as f:
+                    for key_data in json.load(f).get("entries", []):
+                        records[key_data["key"]] = key_data
+
+            replayed = 0
+            if self._journal_path.exists():
+                with open(self._journal_path, "r") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            break  # Torn final write
+                        replayed += 1
+                        if record.get("op") == "del":
+                            records.pop(record["key"], None)
+                        else:
+                            records[record["key"]] = {
+                                k: v for k, v in record.items() if k != "op"
+                            }
+
+            self._records = records
+            self._journal_records = replayed
+            return list(records.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            for cache_file in self.path.glob("*"):
+                if cache_file.is_file():
+                    cache_file.unlink()
+            self._records.clear()
+            self._journal_records = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._journal_records:
+                self._compact()
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Entries in one SQLite database (WAL) with indexed expiry and tags."""
+
+    name = "sqlite"
+    shared = True
+
+    def __init__(self, path: Path, mmap_size: int = SQLITE_MMAP_SIZE):
+        self.path = Path(path)
+        self.mmap_size = mmap_size
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+            # WAL lets readers in other processes proceed during a write batch;
+            # NORMAL syncs the WAL at checkpoints rather than on every commit
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+            conn.executescript(_SQLITE_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional["CacheEntry"]:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT value, expires_at FROM cache_entries "
+                    "WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                    (key, time.time()),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        entry = pickle.loads(row[0])
+        entry.expires_at = _from_epoch(row[1])
+        return entry
+
+    def write_batch(self, changes: Dict[str, Optional["CacheEntry"]]) -> None:
+        rows, tags, deletes = [], [], []
+        for key, entry in changes.items():
+            if entry is not None:
+                try:
+                    blob = pickle.dumps(entry)
+                except Exception as e:
+                    logger.error(f"Error writing to cache database for key {key}: {e}")
+                    entry = None
+                else:
+                    rows.append(
+                        (
+                            key,
+                            blob,
+                            _to_epoch(entry.created_at),
+                            _to_epoch(entry.expires_at),
+                            entry.size_bytes,
+                        )
+                    )
+                    tags.extend((tag, key) for tag in entry.tags)
+            if entry is None:
+                deletes.append((key,))
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany("DELETE FROM cache_tags WHERE key = ?", [(k,) for k in changes])
+                conn.executemany("DELETE FROM cache_entries WHERE key = ?", deletes)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?, ?)", rows
+                )
+                conn.executemany("INSERT OR IGNORE INTO cache_tags VALUES (?, ?)", tags)
+
+    def set_expiry(self, key: str, expires_at: Optional[datetime]) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "UPDATE cache_entries SET expires_at = ? WHERE key = ?",
+                    (_to_epoch(expires_at), key),
+                )
+
+    def keys_with_tags(self, tags: Iterable[str], match_all: bool = False) -> Set[str]:
+        tags = list(dict.fromkeys(tags))
+        if not tags:
+            return set()
+        placeholders = ",".join("?" * len(tags))
+        query = f"SELECT key FROM cache_tags WHERE tag IN ({placeholders})"
+        params: List[Any] = list(tags)
+        if match_all:
+            query += " GROUP BY key HAVING COUNT(*) = ?"
+            params.append(len(tags))
+        with self._lock:
+            return {row[0] for row in self._connect().execute(query, params)}
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "DELETE FROM cache_tags WHERE key IN "
+                    "(SELECT key FROM cache_entries WHERE expires_at <= ?)",
+                    (now,),
+                )
+                cursor = conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM cache_tags")
+                conn.execute("DELETE FROM cache_entries")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class RedisCacheBackend(CacheBackend):
+    """Entries in a Redis-compatible server shared by every server instance."""
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, url: str, namespace: str = "fantasy_football", client: Any = None):
+        if client is None:
+            if not HAS_REDIS:
+                raise ImportError(
+                    "The redis cache backend requires the 'redis' package: pip install redis"
+                )
+            client = redis.Redis.from_url(url)
+        self._client = client
+        self.namespace = namespace
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self.namespace}:entry:{key}"
+
+    def _tags_key(self, key: str) -> str:
+        return f"{self.namespace}:entry_tags:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.namespace}:tag:{tag}"
+
+    def get(self, key: str) -> Optional["CacheEntry"]:
+        pipe = self._client.pipeline(transaction=False)
+        pipe.get(self._entry_key(key))
+        pipe.pttl(self._entry_key(key))
+        blob, ttl_ms = pipe.execute()
+        if blob is None:
+            return None
+        entry = pickle.loads(blob)
+        if ttl_ms is not None and ttl_ms > 0:
+            entry.expires_at = _from_epoch(time.time() + ttl_ms / 1000)
+        return entry
+
+    def write_batch(self, changes: Dict[str, Optional["CacheEntry"]]) -> None:
+        # Previous tags of every changed key, so stale tag memberships are removed
+        lookup = self._client.pipeline(transaction=False)
+        for key in changes:
+            lookup.smembers(self._tags_key(key))
+        previous_tags = dict(zip(changes, lookup.execute()))
+
+        pipe = self._client.pipeline(transaction=False)
+        for key, entry in changes.items():
+            for tag in previous_tags.get(key) or ():
+                tag = tag.decode() if isinstance(tag, bytes) else tag
+                pipe.srem(self._tag_key(tag), key)
+            pipe.delete(self._tags_key(key))
+
+            if entry is None:
+                pipe.delete(self._entry_key(key))
+                continue
+            try:
+                blob = pickle.dumps(entry)
+            except Exception as e:
+                logger.error(f"Error writing to redis cache for key {key}: {e}")
+                pipe.delete(self._entry_key(key))
+                continue
+
+            ttl_ms = None
+            if entry.expires_at is not None:
+                ttl_ms = max(1, int((_to_epoch(entry.expires_at) - time.time()) * 1000))
+            pipe.set(self._entry_key(key), blob, px=ttl_ms)
+            if entry.tags:
+                pipe.sadd(self._tags_key(key), *entry.tags)
+                if ttl_ms is not None:
+                    pipe.pexpire(self._tags_key(key), ttl_ms)
+                for tag in entry.tags:
+                    pipe.sadd(self._tag_key(tag), key)
+        pipe.execute()
+
+    def set_expiry(self, key: str, expires_at: Optional[datetime]) -> None:
+        pipe = self._client.pipeline(transaction=False)
+        for redis_key in (self._entry_key(key), self._tags_key(key)):
+            if expires_at is None:
+                pipe.persist(redis_key)
+            else:
+                pipe.pexpireat(redis_key, int(_to_epoch(expires_at) * 1000))
+        pipe.execute()
+
+    def keys_with_tags(self, tags: Iterable[str], match_all: bool = False) -> Set[str]:
+        tag_keys = [self._tag_key(tag) for tag in dict.fromkeys(tags)]
+        if not tag_keys:
+            return set()
+        members = self._client.sinter(tag_keys) if match_all else self._client.sunion(tag_keys)
+        return {m.decode() if isinstance(m, bytes) else m for m in members}
+
+    def purge_expired(self) -> int:
+        # Redis expires entries itself, but not their memberships in the tag sets
+        for tag_key in self._client.scan_iter(match=self._tag_key("*"), count=500):
+            members = list(self._client.smembers(tag_key))
+            if not members:
+                continue
+            pipe = self._client.pipeline(transaction=False)
+            for member in members:
+                key = member.decode() if isinstance(member, bytes) else member
+                pipe.exists(self._entry_key(key))
+            stale = [member for member, exists in zip(members, pipe.execute()) if not exists]
+            if stale:
+                self._client.srem(tag_key, *stale)
+        return 0
+
+    def clear(self) -> None:
+        batch = []
+        for redis_key in self._client.scan_iter(match=f"{self.namespace}:*", count=500):
+            batch.append(redis_key)
+            if len(batch) >= 500:
+                self._client.delete(*batch)
+                batch = []
+        if batch:
+            self._client.delete(*batch)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def create_cache_backend(settings) -> CacheBackend:
+    """Backend named by ``settings.cache_backend`` (file, sqlite or redis)."""
+    kind = settings.cache_backend.lower()
+    if kind == "file":
+        return FileCacheBackend(settings.cache_dir / "file_cache")
+    if kind == "sqlite":
+        return SQLiteCacheBackend(settings.cache_dir / "cache.sqlite")
+    if kind == "redis":
+        return RedisCacheBackend(settings.cache_redis_url or "redis://localhost:6379/0")
+    raise ValueError(f"Unknown cache backend: {settings.cache_backend}")
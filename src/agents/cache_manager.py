@@ -7,26 +7,48 @@ persistence, TTL management, and cache invalidation strategies.
 """
 
 import asyncio
-import json
 import pickle
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Tuple, Protocol, runtime_checkable
-from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Union, Tuple, Protocol, runtime_checkable
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import hashlib
+import heapq
+import itertools
 import sys
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import threading
 from abc import ABC, abstractmethod
 
 import aiocache
 from aiocache import SimpleMemoryCache, Cache
-from aiocache.serializers import PickleSerializer, JsonSerializer
+from aiocache.serializers import NullSerializer, JsonSerializer
 from loguru import logger
 
 from config.settings import Settings
 
+from .cache_backends import CacheBackend, create_cache_backend
+
+# Operations on keys in different shards never wait on each other
+LOCK_SHARDS = 64
+
+# Seconds queued backend writes wait so they reach disk as one batch
+WRITE_BEHIND_DELAY = 0.5
+
+# generate_key() parameters indexed as "name:value" tags, so invalidating a
+# league, week, player or team is a tag lookup rather than a scan of every key
+KEY_FACETS = ("league_id", "week", "year", "player_id", "team_id")
+
+
+def key_facets(key: str) -> List[str]:
+    """``name:value`` tags for the KEY_FACETS parameters in a generate_key() key."""
+    parts = key.split(":")
+    if parts[0] != "ff":
+        return []
+    return [f"{name}:{value}" for name, value in zip(parts[2:], parts[3:]) if name in KEY_FACETS]
+
 
 class CacheStrategy(str, Enum):
     """Cache strategy options."""
@@ -130,6 +152,131 @@ class CacheStats:
         }
 
 
+class EvictionIndex:
+    """
+    Eviction victim selection for every policy without scanning all entries.
+
+    LRU is an ordered dict; LFU keeps keys in per-access-count buckets (least
+    recently used first within a bucket); SIZE and TTL use heaps that are
+    pruned lazily: stale items are skipped when they surface and the heaps are
+    rebuilt once they hold more than twice as many items as there are keys.
+    """
+
+    def __init__(self):
+        self.lru: OrderedDict[str, None] = OrderedDict()
+        self._counts: Dict[str, int] = {}
+        self._buckets: Dict[int, OrderedDict[str, None]] = {}
+        self._min_count = 0
+        # key -> (version, size_bytes, expires_at) of the tracked entry
+        self._meta: Dict[str, Tuple[int, int, Optional[datetime]]] = {}
+        self._size_heap: List[Tuple[int, int, str]] = []  # (-size, version, key)
+        self._expiry_heap: List[Tuple[datetime, int, str]] = []  # (expires_at, version, key)
+        self._versions = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.lru)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.lru
+
+    def add(self, entry: CacheEntry) -> None:
+        """Track ``entry`` (replacing any previous entry under its key) as most recent."""
+        key = entry.key
+        self.remove(key)
+        version = next(self._versions)
+        self.lru[key] = None
+        self._counts[key] = entry.access_count
+        self._bucket(entry.access_count)[key] = None
+        self._min_count = min(self._min_count, entry.access_count)
+        self._meta[key] = (version, entry.size_bytes, entry.expires_at)
+        heapq.heappush(self._size_heap, (-entry.size_bytes, version, key))
+        if entry.expires_at is not None:
+            heapq.heappush(self._expiry_heap, (entry.expires_at, version, key))
+        self._compact()
+
+    def remove(self, key: str) -> None:
+        if self.lru.pop(key, False) is False:
+            return
+        count = self._counts.pop(key)
+        self._unbucket(key, count)
+        del self._meta[key]
+
+    def touch(self, key: str) -> None:
+        """Record one access to ``key``."""
+        if key not in self.lru:
+            return
+        self.lru.move_to_end(key)
+        count = self._counts[key]
+        self._unbucket(key, count)
+        if count == self._min_count and count not in self._buckets:
+            self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._bucket(count + 1)[key] = None
+
+    def update_expiry(self, key: str, expires_at: Optional[datetime]) -> None:
+        if key not in self._meta:
+            return
+        version, size, _ = self._meta[key]
+        self._meta[key] = (version, size, expires_at)
+        if expires_at is not None:
+            heapq.heappush(self._expiry_heap, (expires_at, version, key))
+        self._compact()
+
+    def victim(self, policy: EvictionPolicy) -> Optional[str]:
+        """Key the policy evicts next, or None when nothing is tracked."""
+        if not self.lru:
+            return None
+        if policy == EvictionPolicy.LFU:
+            if self._min_count not in self._buckets:
+                self._min_count = min(self._buckets)
+            return next(iter(self._buckets[self._min_count]))
+        if policy == EvictionPolicy.SIZE:
+            key = self._peek(self._size_heap, lambda item, meta: True)
+            if key is not None:
+                return key
+        if policy == EvictionPolicy.TTL:
+            # Fall back to LRU when no tracked entry has a TTL
+            key = self._peek(self._expiry_heap, lambda item, meta: meta[2] == item[0])
+            if key is not None:
+                return key
+        return next(iter(self.lru))
+
+    def _peek(self, heap: List[tuple], valid) -> Optional[str]:
+        """Top key of a heap, discarding items whose entry was replaced or removed."""
+        while heap:
+            item = heap[0]
+            meta = self._meta.get(item[2])
+            if meta is not None and meta[0] == item[1] and valid(item, meta):
+                return item[2]
+            heapq.heappop(heap)
+        return None
+
+    def _bucket(self, count: int) -> OrderedDict:
+        bucket = self._buckets.get(count)
+        if bucket is None:
+            bucket = self._buckets[count] = OrderedDict()
+        return bucket
+
+    def _unbucket(self, key: str, count: int) -> None:
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+
+    def _compact(self) -> None:
+        limit = 2 * len(self._meta) + 64
+        if len(self._size_heap) > limit:
+            self._size_heap = [(-size, v, key) for key, (v, size, _) in self._meta.items()]
+            heapq.heapify(self._size_heap)
+        if len(self._expiry_heap) > limit:
+            self._expiry_heap = [
+                (expires_at, v, key)
+                for key, (v, _, expires_at) in self._meta.items()
+                if expires_at is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+
+
 class CacheManagerAgent:
     """
     Agent responsible for intelligent caching with TTL and persistence.
@@ -143,7 +290,8 @@ class CacheManagerAgent:
     - Tag-based cache invalidation
     - Partial cache invalidation (by league, by week, etc.)
     - Memory-efficient with configurable size limits
-    - Thread-safe for concurrent access
+    - Safe for concurrent access: per-key sharded locks, file I/O on a thread pool
+      with write-behind batching, and an append-only index journal
     - Enhanced cache key generation for different data types
     """
 
@@ -152,6 +300,8 @@ class CacheManagerAgent:
         settings: Settings,
         max_memory_size: int = 100 * 1024 * 1024,  # 100MB default
         eviction_policy: EvictionPolicy = EvictionPolicy.LRU,
+        write_behind_delay: float = WRITE_BEHIND_DELAY,
+        backend: Optional[CacheBackend] = None,
     ):
         """
         Initialize the cache manager agent.
@@ -160,6 +310,8 @@ class CacheManagerAgent:
             settings: Application settings containing cache configuration
             max_memory_size: Maximum memory cache size in bytes
             eviction_policy: Eviction policy for memory management
+            write_behind_delay: Seconds backend writes are batched before flushing
+            backend: Persistent (L2) backend; defaults to ``settings.cache_backend``
         """
         self.settings = settings
         self.strategy = CacheStrategy.HYBRID
@@ -173,25 +325,33 @@ class CacheManagerAgent:
 
         # Initialize caches
         self._memory_cache: Optional[Cache] = None
-        self._file_cache_path = self.cache_dir / "file_cache"
-        self._file_cache_path.mkdir(exist_ok=True)
+        self._backend = backend or create_cache_backend(settings)
 
         # Cache entries tracking with LRU support
         self._entries: Dict[str, CacheEntry] = {}
-        self._lru_order: OrderedDict[str, None] = OrderedDict()
-        self._tag_index: Dict[str, List[str]] = {}
+        self._eviction = EvictionIndex()
+        self._tag_index: Dict[str, Set[str]] = {}
 
         # Memory management
         self._current_memory_size = 0
 
-        # Locks for thread safety
-        self._lock = asyncio.Lock()
+        # Locks for thread safety: one lock per key shard, no cache-wide lock
+        self._shard_locks = [asyncio.Lock() for _ in range(LOCK_SHARDS)]
         self._thread_lock = threading.RLock()  # For sync operations
         self._cleanup_task: Optional[asyncio.Task] = None
 
+        # Backend (L2): blocking calls run on a small thread pool and writes are
+        # queued, then flushed to the backend in batches
+        self._io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-io")
+        self.write_behind_delay = write_behind_delay
+        self._pending_writes: Dict[str, Optional[CacheEntry]] = {}  # None = delete
+        self._inflight_writes: Dict[str, Optional[CacheEntry]] = {}  # batch being written
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
         logger.info(
             f"CacheManagerAgent initialized with max_memory_size={max_memory_size/1024/1024:.1f}MB, "
-            f"eviction_policy={eviction_policy}"
+            f"eviction_policy={eviction_policy}, backend={self._backend.name}"
         )
 
     async def __aenter__(self):
@@ -206,9 +366,9 @@ class CacheManagerAgent:
     async def initialize(self) -> None:
         """Initialize cache systems."""
         try:
-            # Initialize memory cache
+            # Initialize memory cache; it holds the pickled values set() produces
             self._memory_cache = SimpleMemoryCache(
-                serializer=PickleSerializer(), namespace="fantasy_football"
+                serializer=NullSerializer(), namespace="fantasy_football"
             )
 
             # Load existing file cache entries
@@ -234,8 +394,13 @@ class CacheManagerAgent:
                 except asyncio.CancelledError:
                     pass
 
-            # Save file cache index
-            await self._save_file_cache_index()
+            if self._flush_task:
+                self._flush_task.cancel()
+
+            # Write queued changes, then let the backend compact and disconnect
+            await self.flush()
+            async with self._flush_lock:
+                await self._run_io(self._backend.close)
 
             # Close memory cache
             if self._memory_cache:
@@ -256,33 +421,53 @@ class CacheManagerAgent:
         Returns:
             Cached value or None if not found/expired
         """
-        async with self._lock:
-            try:
-                # Check memory cache first (L1)
+        async with self._key_lock(key):
+            value, promoted = await self._lookup(key)
+
+        if promoted:
+            # Evict outside the shard lock; victims are evicted under their own shards
+            await self._enforce_memory_limits()
+        return value
+
+    async def _lookup(self, key: str) -> Tuple[Optional[Any], bool]:
+        """Read ``key`` across levels; the caller holds the key's shard lock.
+
+        Returns:
+            (value, whether the value was promoted into the memory tier)
+        """
+        try:
+            # Check memory cache first (L1)
+            if self._memory_cache:
+                payload = await self._memory_cache.get(key)
+                if payload is not None:
+                    await self._record_hit(key, CacheLevel.L1_MEMORY)
+                    return pickle.loads(payload), False
+
+            # Check file cache (L2); only this key's shard waits on the read
+            file_value = await self._get_from_file_cache(key)
+            if file_value is not None:
+                promoted = False
+                # Promote to memory cache for the rest of the entry's TTL
                 if self._memory_cache:
-                    value = await self._memory_cache.get(key)
-                    if value is not None:
-                        await self._record_hit(key, CacheLevel.L1_MEMORY)
-                        return value
-
-                # Check file cache (L2)
-                file_value = await self._get_from_file_cache(key)
-                if file_value is not None:
-                    # Promote to memory cache
-                    if self._memory_cache:
-                        await self._memory_cache.set(key, file_value)
-                    await self._record_hit(key, CacheLevel.L2_FILE)
-                    return file_value
-
-                # Record miss
-                self.stats.misses += 1
-                logger.debug(f"Cache miss for key: {key}")
-                return None
+                    entry = self._entries[key]
+                    remaining = entry.time_until_expiry()
+                    ttl = max(1, int(remaining.total_seconds())) if remaining else None
+                    await self._memory_cache.set(key, pickle.dumps(file_value), ttl=ttl)
+                    if key not in self._eviction:
+                        self._admit(entry)
+                        promoted = True
+                await self._record_hit(key, CacheLevel.L2_FILE)
+                return file_value, promoted
+
+            # Record miss
+            self.stats.misses += 1
+            logger.debug(f"Cache miss for key: {key}")
+            return None, False
 
-            except Exception as e:
-                logger.error(f"Error getting cache key {key}: {e}")
-                self.stats.misses += 1
-                return None
+        except Exception as e:
+            logger.error(f"Error getting cache key {key}: {e}")
+            self.stats.misses += 1
+            return None, False
 
     async def set(
         self,
@@ -303,61 +488,58 @@ class CacheManagerAgent:
         Returns:
             True if successfully cached
         """
-        async with self._lock:
-            try:
-                # Normalize TTL
-                if isinstance(ttl, int):
-                    ttl = timedelta(seconds=ttl)
-                elif ttl is None:
-                    ttl = timedelta(seconds=self.settings.cache_ttl_seconds)
-
-                expires_at = datetime.utcnow() + ttl
-
-                # Create cache entry
-                entry = CacheEntry(
-                    key=key,
-                    value=value,
-                    created_at=datetime.utcnow(),
-                    expires_at=expires_at,
-                    tags=tags or [],
-                    size_bytes=self._estimate_size(value),
-                )
+        try:
+            # Normalize TTL
+            if isinstance(ttl, int):
+                ttl = timedelta(seconds=ttl)
+            elif ttl is None:
+                ttl = timedelta(seconds=self.settings.cache_ttl_seconds)
+
+            expires_at = datetime.utcnow() + ttl
+            tags = list(dict.fromkeys((tags or []) + key_facets(key)))
+
+            # Serialize once: the memory cache stores this payload and sizes come from it
+            payload = pickle.dumps(value)
+
+            # Create cache entry
+            entry = CacheEntry(
+                key=key,
+                value=value,
+                created_at=datetime.utcnow(),
+                expires_at=expires_at,
+                tags=tags,
+                size_bytes=len(payload),
+            )
 
+            async with self._key_lock(key):
                 # Store in memory cache
                 if self._memory_cache:
-                    await self._memory_cache.set(key, value, ttl=int(ttl.total_seconds()))
-
-                # Store in file cache for persistence
-                await self._set_in_file_cache(key, entry)
+                    await self._memory_cache.set(key, payload, ttl=int(ttl.total_seconds()))
 
-                # Check memory limits and evict if necessary
-                await self._enforce_memory_limits(entry.size_bytes)
+                # Queue the backend write for persistence
+                self._queue_write(key, entry)
 
                 # Update tracking
                 old_entry = self._entries.get(key)
-                old_size = old_entry.size_bytes if old_entry else 0
+                self._release(key)
 
                 self._entries[key] = entry
-                self._lru_order[key] = None
-                self._lru_order.move_to_end(key)
-                await self._update_tag_index(key, tags or [])
+                self._admit(entry)
+                if old_entry:
+                    self._drop_tags(key, old_entry.tags)
+                await self._update_tag_index(key, tags)
 
-                # Update memory tracking
-                size_delta = entry.size_bytes - old_size
-                self._current_memory_size += size_delta
-
-                # Update stats
                 self.stats.sets += 1
-                self.stats.size_bytes += size_delta
-                if not old_entry:
-                    self.stats.entry_count += 1
 
-                logger.debug(f"Cached key {key} with TTL {ttl}")
-                return True
+            # Evict outside the shard lock; victims are deleted under their own shards
+            await self._enforce_memory_limits()
 
-            except Exception as e:
-                logger.error(f"Error setting cache key {key}: {e}")
-                return False
+            logger.debug(f"Cached key {key} with TTL {ttl}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error setting cache key {key}: {e}")
+            return False
 
     async def delete(self, key: str) -> bool:
         """
@@ -369,47 +551,38 @@ class CacheManagerAgent:
         Returns:
             True if key was deleted
         """
-        async with self._lock:
+        async with self._key_lock(key):
             try:
-                deleted = False
-
-                # Remove from memory cache
-                if self._memory_cache:
-                    await self._memory_cache.delete(key)
-                    deleted = True
-
-                # Remove from file cache
-                if await self._delete_from_file_cache(key):
-                    deleted = True
+                return await self._remove_entry(key)
 
-                # Update tracking
-                if key in self._entries:
-                    entry = self._entries[key]
-                    self.stats.size_bytes -= entry.size_bytes
-                    self._current_memory_size -= entry.size_bytes
-                    self.stats.entry_count -= 1
+            except Exception as e:
+                logger.error(f"Error deleting cache key {key}: {e}")
+                return False
 
-                    # Remove from LRU tracking
-                    self._lru_order.pop(key, None)
+    async def _remove_entry(self, key: str) -> bool:
+        """Remove a key from every cache level; the caller holds the key's shard lock."""
+        deleted = False
 
-                    # Remove from tag index
-                    for tag in entry.tags:
-                        if tag in self._tag_index and key in self._tag_index[tag]:
-                            self._tag_index[tag].remove(key)
-                            if not self._tag_index[tag]:
-                                del self._tag_index[tag]
+        # Remove from memory cache
+        if self._memory_cache:
+            await self._memory_cache.delete(key)
+            deleted = True
 
-                    del self._entries[key]
+        # Remove from the backend (queued like writes)
+        self._queue_write(key, None)
 
-                if deleted:
-                    self.stats.deletes += 1
-                    logger.debug(f"Deleted cache key: {key}")
+        # Update tracking
+        self._release(key)
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            deleted = True
+            self._drop_tags(key, entry.tags)
 
-                return deleted
+        if deleted:
+            self.stats.deletes += 1
+            logger.debug(f"Deleted cache key: {key}")
 
-            except Exception as e:
-                logger.error(f"Error deleting cache key {key}: {e}")
-                return False
+        return deleted
 
     async def exists(self, key: str) -> bool:
         """
@@ -421,51 +594,53 @@ class CacheManagerAgent:
         Returns:
             True if key exists and is not expired
         """
-        async with self._lock:
-            try:
-                # Check memory cache first
-                if self._memory_cache and await self._memory_cache.exists(key):
-                    return True
+        try:
+            # Check memory cache first
+            if self._memory_cache and await self._memory_cache.exists(key):
+                return True
 
-                # Check file cache
-                entry = self._entries.get(key)
-                if entry and not entry.is_expired():
-                    return True
+            # Check backend
+            entry = self._entries.get(key)
+            if entry and not entry.is_expired():
+                return True
+            if entry is None and self._backend.shared:
+                return await self._run_io(self._backend.get, key) is not None
 
-                return False
+            return False
 
-            except Exception as e:
-                logger.error(f"Error checking cache key existence {key}: {e}")
-                return False
+        except Exception as e:
+            logger.error(f"Error checking cache key existence {key}: {e}")
+            return False
 
     async def clear(self) -> None:
         """Clear all cache entries."""
-        async with self._lock:
-            try:
-                # Clear memory cache
-                if self._memory_cache:
-                    await self._memory_cache.clear()
+        try:
+            # Queued writes are moot now
+            self._pending_writes.clear()
 
-                # Clear file cache
-                for cache_file in self._file_cache_path.glob("*"):
-                    if cache_file.is_file():
-                        cache_file.unlink()
+            # Clear memory cache
+            if self._memory_cache:
+                await self._memory_cache.clear()
 
-                # Reset tracking
-                self._entries.clear()
-                self._lru_order.clear()
-                self._tag_index.clear()
-                self._current_memory_size = 0
+            # Reset tracking
+            self._entries.clear()
+            self._eviction = EvictionIndex()
+            self._tag_index.clear()
+            self._current_memory_size = 0
 
-                # Reset stats
-                old_stats = self.stats
-                self.stats = CacheStats()
-                self.stats.start_time = old_stats.start_time
+            # Reset stats
+            old_stats = self.stats
+            self.stats = CacheStats()
+            self.stats.start_time = old_stats.start_time
 
-                logger.info("Cache cleared")
+            # Clear the backend once any batch being written has landed
+            async with self._flush_lock:
+                await self._run_io(self._backend.clear)
 
-            except Exception as e:
-                logger.error(f"Error clearing cache: {e}")
+            logger.info("Cache cleared")
+
+        except Exception as e:
+            logger.error(f"Error clearing cache: {e}")
 
     async def invalidate_by_tags(self, tags: List[str]) -> int:
         """
@@ -477,55 +652,53 @@ class CacheManagerAgent:
         Returns:
             Number of entries invalidated
         """
-        async with self._lock:
-            try:
-                keys_to_delete = set()
+        try:
+            keys_to_delete = set()
 
-                for tag in tags:
-                    if tag in self._tag_index:
-                        keys_to_delete.update(self._tag_index[tag])
+            for tag in tags:
+                if tag in self._tag_index:
+                    keys_to_delete.update(self._tag_index[tag])
+            if self._backend.shared:
+                keys_to_delete |= await self._run_io(self._backend.keys_with_tags, tags)
 
-                # Delete all matching keys
-                for key in keys_to_delete:
-                    await self.delete(key)
+            # Delete all matching keys
+            for key in keys_to_delete:
+                await self.delete(key)
 
-                logger.info(f"Invalidated {len(keys_to_delete)} entries with tags: {tags}")
-                return len(keys_to_delete)
+            logger.info(f"Invalidated {len(keys_to_delete)} entries with tags: {tags}")
+            return len(keys_to_delete)
 
-            except Exception as e:
-                logger.error(f"Error invalidating by tags {tags}: {e}")
-                return 0
+        except Exception as e:
+            logger.error(f"Error invalidating by tags {tags}: {e}")
+            return 0
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        async with self._lock:
-            stats_dict = self.stats.to_dict()
+        stats_dict = self.stats.to_dict()
 
-            # Add memory usage info
-            memory_usage_pct = (
-                (self._current_memory_size / self.max_memory_size * 100)
-                if self.max_memory_size > 0
-                else 0
-            )
+        # Add memory usage info
+        memory_usage_pct = (
+            (self._current_memory_size / self.max_memory_size * 100)
+            if self.max_memory_size > 0
+            else 0
+        )
 
-            stats_dict.update(
-                {
-                    "memory_cache_size": (
-                        len(await self._memory_cache.keys()) if self._memory_cache else 0
-                    ),
-                    "file_cache_entries": len(self._entries),
-                    "tag_count": len(self._tag_index),
-                    "expired_entries": sum(
-                        1 for entry in self._entries.values() if entry.is_expired()
-                    ),
-                    "current_memory_size": self._current_memory_size,
-                    "max_memory_size": self.max_memory_size,
-                    "memory_usage_percent": round(memory_usage_pct, 2),
-                    "eviction_policy": self.eviction_policy,
-                    "lru_order_size": len(self._lru_order),
-                }
-            )
-            return stats_dict
+        stats_dict.update(
+            {
+                # SimpleMemoryCache has no key listing; count what the LRU tracks
+                "memory_cache_size": len(self._eviction) if self._memory_cache else 0,
+                "file_cache_entries": len(self._entries),
+                "tag_count": len(self._tag_index),
+                "expired_entries": sum(1 for entry in self._entries.values() if entry.is_expired()),
+                "current_memory_size": self._current_memory_size,
+                "max_memory_size": self.max_memory_size,
+                "memory_usage_percent": round(memory_usage_pct, 2),
+                "eviction_policy": self.eviction_policy,
+                "lru_order_size": len(self._eviction),
+                "backend": self._backend.name,
+            }
+        )
+        return stats_dict
 
     async def warm_cache(self, warm_data: Dict[str, Any], ttl: Optional[timedelta] = None) -> int:
         """
@@ -563,10 +736,9 @@ class CacheManagerAgent:
         expiring_keys = []
         now = datetime.utcnow()
 
-        async with self._lock:
-            for key, entry in self._entries.items():
-                if entry.expires_at and entry.expires_at - now <= threshold:
-                    expiring_keys.append(key)
+        for key, entry in list(self._entries.items()):
+            if entry.expires_at and entry.expires_at - now <= threshold:
+                expiring_keys.append(key)
 
         return expiring_keys
 
@@ -577,26 +749,29 @@ class CacheManagerAgent:
         Returns:
             Number of entries cleared
         """
-        async with self._lock:
-            try:
-                expired_keys = []
+        try:
+            expired_keys = []
 
-                for key, entry in self._entries.items():
-                    if entry.is_expired():
-                        expired_keys.append(key)
+            for key, entry in self._entries.items():
+                if entry.is_expired():
+                    expired_keys.append(key)
 
-                cleared_count = 0
-                for key in expired_keys:
-                    if await self.delete(key):
-                        cleared_count += 1
-                        self.stats.evictions += 1
+            cleared_count = 0
+            for key in expired_keys:
+                if await self.delete(key):
+                    cleared_count += 1
+                    self.stats.evictions += 1
 
-                logger.info(f"Cleared {cleared_count} expired cache entries")
-                return cleared_count
+            # Expired entries only the backend knows about (e.g. other processes')
+            await self.flush()
+            cleared_count += await self._run_io(self._backend.purge_expired)
 
-            except Exception as e:
-                logger.error(f"Error clearing expired entries: {e}")
-                return 0
+            logger.info(f"Cleared {cleared_count} expired cache entries")
+            return cleared_count
+
+        except Exception as e:
+            logger.error(f"Error clearing expired entries: {e}")
+            return 0
 
     async def extend_ttl(self, key: str, additional_time: timedelta) -> bool:
         """
@@ -609,13 +784,14 @@ class CacheManagerAgent:
         Returns:
             True if TTL was extended
         """
-        async with self._lock:
+        async with self._key_lock(key):
             try:
                 if key in self._entries:
                     entry = self._entries[key]
                     if entry.expires_at:
                         entry.expires_at += additional_time
-                        await self._set_in_file_cache(key, entry)
+                        self._eviction.update_expiry(key, entry.expires_at)
+                        await self._run_io(self._backend.set_expiry, key, entry.expires_at)
                         logger.debug(f"Extended TTL for key {key} by {additional_time}")
                         return True
                 return False
@@ -683,8 +859,7 @@ class CacheManagerAgent:
         Returns:
             Number of entries invalidated
         """
-        pattern = f"ff:*:league_id:{league_id}*"
-        return await self._invalidate_by_pattern(pattern)
+        return await self._invalidate_by_facets([f"league_id:{league_id}"])
 
     async def invalidate_by_week(self, week: int, year: Optional[int] = None) -> int:
         """
@@ -697,11 +872,10 @@ class CacheManagerAgent:
         Returns:
             Number of entries invalidated
         """
+        facets = [f"week:{week}"]
         if year:
-            pattern = f"ff:*:week:{week}:year:{year}*"
-        else:
-            pattern = f"ff:*:week:{week}*"
-        return await self._invalidate_by_pattern(pattern)
+            facets.append(f"year:{year}")
+        return await self._invalidate_by_facets(facets)
 
     async def invalidate_by_player(self, player_id: str) -> int:
         """
@@ -713,8 +887,7 @@ class CacheManagerAgent:
         Returns:
             Number of entries invalidated
         """
-        pattern = f"ff:*:player_id:{player_id}*"
-        return await self._invalidate_by_pattern(pattern)
+        return await self._invalidate_by_facets([f"player_id:{player_id}"])
 
     async def invalidate_by_team(self, team_id: str) -> int:
         """
@@ -726,159 +899,148 @@ class CacheManagerAgent:
         Returns:
             Number of entries invalidated
         """
-        pattern = f"ff:*:team_id:{team_id}*"
-        return await self._invalidate_by_pattern(pattern)
+        return await self._invalidate_by_facets([f"team_id:{team_id}"])
 
-    async def _invalidate_by_pattern(self, pattern: str) -> int:
+    async def _invalidate_by_facets(self, facets: List[str]) -> int:
         """
-        Invalidate cache entries matching a pattern.
+        Invalidate cache entries whose keys carry every one of ``facets``.
 
         Args:
-            pattern: Pattern to match (supports * wildcards)
+            facets: ``name:value`` key facets (see KEY_FACETS)
 
         Returns:
             Number of entries invalidated
         """
-        async with self._lock:
-            try:
-                import fnmatch
-
-                keys_to_delete = []
-                for key in self._entries.keys():
-                    if fnmatch.fnmatch(key, pattern):
-                        keys_to_delete.append(key)
+        try:
+            keys_to_delete = set(self._tag_index.get(facets[0], ()))
+            for facet in facets[1:]:
+                keys_to_delete &= self._tag_index.get(facet, set())
+            if self._backend.shared:
+                keys_to_delete |= await self._run_io(self._backend.keys_with_tags, facets, True)
 
-                # Delete all matching keys
-                deleted_count = 0
-                for key in keys_to_delete:
-                    if await self.delete(key):
-                        deleted_count += 1
+            # Delete all matching keys
+            deleted_count = 0
+            for key in keys_to_delete:
+                if await self.delete(key):
+                    deleted_count += 1
 
-                logger.info(f"Invalidated {deleted_count} entries matching pattern: {pattern}")
-                return deleted_count
+            logger.info(f"Invalidated {deleted_count} entries with key facets: {facets}")
+            return deleted_count
 
-            except Exception as e:
-                logger.error(f"Error invalidating by pattern {pattern}: {e}")
-                return 0
+        except Exception as e:
+            logger.error(f"Error invalidating by key facets {facets}: {e}")
+            return 0
 
     async def _get_from_file_cache(self, key: str) -> Optional[Any]:
-        """Get value from file cache."""
+        """Get value from the backend, called on the I/O thread pool."""
         try:
             entry = self._entries.get(key)
-            if not entry or entry.is_expired():
+            if entry is None and not self._backend.shared:
+                return None
+            if entry is not None:
+                if entry.is_expired():
+                    await self._remove_entry(key)
+                    return None
+                # Set by this process: the value is at hand even if its write is still queued
+                if entry.value is not None:
+                    return entry.value
+                # Evicted from memory before its write reached the backend
+                queued = self._queued_write(key)
+                if queued is not None:
+                    return queued.value
+
+            stored = await self._run_io(self._backend.get, key)
+            if stored is None:
+                if entry is not None:
+                    # Gone from the backend (lost file, or deleted by another process)
+                    await self._remove_entry(key)
                 return None
 
-            cache_file = self._file_cache_path / f"{self._hash_key(key)}.pkl"
-            if cache_file.exists():
-                with open(cache_file, "rb") as f:
-                    cached_entry = pickle.load(f)
-                    if not cached_entry.is_expired():
-                        cached_entry.touch()
-                        return cached_entry.value
-                    else:
-                        # Clean up expired file
-                        cache_file.unlink()
-                        if key in self._entries:
-                            del self._entries[key]
-
-            return None
+            if entry is None:
+                # Written by another process sharing the backend; track its metadata
+                self._entries[key] = replace(stored, value=None)
+                await self._update_tag_index(key, stored.tags)
+            return stored.value
 
         except Exception as e:
-            logger.error(f"Error reading from file cache for key {key}: {e}")
+            logger.error(f"Error reading from cache backend for key {key}: {e}")
             return None
 
-    async def _set_in_file_cache(self, key: str, entry: CacheEntry) -> bool:
-        """Set value in file cache."""
-        try:
-            cache_file = self._file_cache_path / f"{self._hash_key(key)}.pkl"
-            with open(cache_file, "wb") as f:
-                pickle.dump(entry, f)
-            return True
-
-        except Exception as e:
-            logger.error(f"Error writing to file cache for key {key}: {e}")
-            return False
-
-    async def _delete_from_file_cache(self, key: str) -> bool:
-        """Delete value from file cache."""
-        try:
-            cache_file = self._file_cache_path / f"{self._hash_key(key)}.pkl"
-            if cache_file.exists():
-                cache_file.unlink()
-                return True
-            return False
-
-        except Exception as e:
-            logger.error(f"Error deleting from file cache for key {key}: {e}")
-            return False
+    def _key_lock(self, key: str) -> asyncio.Lock:
+        """Lock for the shard ``key`` falls in."""
+        return self._shard_locks[hash(key) % LOCK_SHARDS]
+
+    async def _run_io(self, func, *args) -> Any:
+        """Run a blocking backend call on the cache's thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._io_executor, func, *args)
+
+    def _queued_write(self, key: str) -> Optional[CacheEntry]:
+        """Entry waiting to be written (or being written) to the backend, if any."""
+        entry = self._pending_writes.get(key)
+        if entry is None:
+            entry = self._inflight_writes.get(key)
+        return entry
+
+    def _queue_write(self, key: str, entry: Optional[CacheEntry]) -> None:
+        """Queue a backend write (or delete, for None) and make sure a flush is scheduled."""
+        self._pending_writes[key] = entry
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_soon())
+
+    async def _flush_soon(self) -> None:
+        await asyncio.sleep(self.write_behind_delay)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write queued changes to the backend now, as one batch."""
+        async with self._flush_lock:
+            if not self._pending_writes:
+                return
+
+            changes, self._pending_writes = self._pending_writes, {}
+            self._inflight_writes = changes
+            try:
+                await self._run_io(self._backend.write_batch, changes)
+            except Exception as e:
+                logger.error(f"Error flushing cache writes to {self._backend.name}: {e}")
+            finally:
+                self._inflight_writes = {}
 
     async def _load_file_cache_index(self) -> None:
-        """Load file cache index from disk."""
+        """Seed the entry index from the backend (file backend: snapshot plus journal)."""
         try:
-            index_file = self._file_cache_path / "index.json"
-            if index_file.exists():
-                with open(index_file, "r") as f:
-                    index_data = json.load(f)
-
-                # Rebuild entries tracking
-                for key_data in index_data.get("entries", []):
-                    entry = CacheEntry(
-                        key=key_data["key"],
-                        value=None,  # Will be loaded on demand
-                        created_at=datetime.fromisoformat(key_data["created_at"]),
-                        expires_at=(
-                            datetime.fromisoformat(key_data["expires_at"])
-                            if key_data.get("expires_at")
-                            else None
-                        ),
-                        access_count=key_data.get("access_count", 0),
-                        last_accessed=(
-                            datetime.fromisoformat(key_data["last_accessed"])
-                            if key_data.get("last_accessed")
-                            else None
-                        ),
-                        tags=key_data.get("tags", []),
-                        size_bytes=key_data.get("size_bytes", 0),
-                    )
-
-                    # Only keep non-expired entries
-                    if not entry.is_expired():
-                        self._entries[key_data["key"]] = entry
-                        await self._update_tag_index(key_data["key"], entry.tags)
-
-                logger.info(f"Loaded {len(self._entries)} cache entries from index")
+            records = await self._run_io(self._backend.load_index)
 
-        except Exception as e:
-            logger.error(f"Error loading file cache index: {e}")
-
-    async def _save_file_cache_index(self) -> None:
-        """Save file cache index to disk."""
-        try:
-            index_data = {"entries": []}
+            # Rebuild entries tracking
+            for key_data in records:
+                entry = CacheEntry(
+                    key=key_data["key"],
+                    value=None,  # Will be loaded on demand
+                    created_at=datetime.fromisoformat(key_data["created_at"]),
+                    expires_at=(
+                        datetime.fromisoformat(key_data["expires_at"])
+                        if key_data.get("expires_at")
+                        else None
+                    ),
+                    access_count=key_data.get("access_count", 0),
+                    last_accessed=(
+                        datetime.fromisoformat(key_data["last_accessed"])
+                        if key_data.get("last_accessed")
+                        else None
+                    ),
+                    tags=key_data.get("tags", []),
+                    size_bytes=key_data.get("size_bytes", 0),
+                )
 
-            for key, entry in self._entries.items():
+                # Only keep non-expired entries
                 if not entry.is_expired():
-                    entry_data = {
-                        "key": key,
-                        "created_at": entry.created_at.isoformat(),
-                        "expires_at": entry.expires_at.isoformat() if entry.expires_at else None,
-                        "access_count": entry.access_count,
-                        "last_accessed": (
-                            entry.last_accessed.isoformat() if entry.last_accessed else None
-                        ),
-                        "tags": entry.tags,
-                        "size_bytes": entry.size_bytes,
-                    }
-                    index_data["entries"].append(entry_data)
-
-            index_file = self._file_cache_path / "index.json"
-            with open(index_file, "w") as f:
-                json.dump(index_data, f, indent=2)
-
-            logger.debug(f"Saved cache index with {len(index_data['entries'])} entries")
+                    self._entries[key_data["key"]] = entry
+                    await self._update_tag_index(key_data["key"], entry.tags)
+
+            logger.info(f"Loaded {len(self._entries)} cache entries from index")
 
         except Exception as e:
-            logger.error(f"Error saving file cache index: {e}")
+            logger.error(f"Error loading file cache index: {e}")
 
     async def _cleanup_loop(self) -> None:
         """Background cleanup loop for expired entries."""
@@ -894,23 +1056,25 @@ class CacheManagerAgent:
 
     async def _cleanup_expired(self) -> None:
         """Clean up expired cache entries."""
-        async with self._lock:
-            try:
-                expired_keys = []
+        try:
+            expired_keys = []
 
-                for key, entry in self._entries.items():
-                    if entry.is_expired():
-                        expired_keys.append(key)
+            for key, entry in self._entries.items():
+                if entry.is_expired():
+                    expired_keys.append(key)
 
-                for key in expired_keys:
-                    await self.delete(key)
-                    self.stats.evictions += 1
+            for key in expired_keys:
+                await self.delete(key)
+                self.stats.evictions += 1
 
-                if expired_keys:
-                    logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
+            await self.flush()
+            purged = await self._run_io(self._backend.purge_expired)
 
-            except Exception as e:
-                logger.error(f"Error during cleanup: {e}")
+            if expired_keys or purged:
+                logger.info(f"Cleaned up {len(expired_keys) + purged} expired cache entries")
+
+        except Exception as e:
+            logger.error(f"Error during cleanup: {e}")
 
     async def _record_hit(self, key: str, level: CacheLevel) -> None:
         """Record cache hit statistics."""
@@ -918,40 +1082,24 @@ class CacheManagerAgent:
 
         if key in self._entries:
             self._entries[key].touch()
-            # Update LRU order
-            if key in self._lru_order:
-                self._lru_order.move_to_end(key)
+            # Update LRU order and LFU count
+            self._eviction.touch(key)
 
         logger.debug(f"Cache hit for key {key} at level {level}")
 
     async def _update_tag_index(self, key: str, tags: List[str]) -> None:
         """Update tag index for key."""
         for tag in tags:
-            if tag not in self._tag_index:
-                self._tag_index[tag] = []
-            if key not in self._tag_index[tag]:
-                self._tag_index[tag].append(key)
-
-    def _hash_key(self, key: str) -> str:
-        """Generate hash for cache key."""
-        return hashlib.sha256(key.encode()).hexdigest()[:16]
+            self._tag_index.setdefault(tag, set()).add(key)
 
-    def _estimate_size(self, value: Any) -> int:
-        """Estimate size of value in bytes."""
-        try:
-            return len(pickle.dumps(value))
-        except Exception:
-            # Fallback estimation
-            if isinstance(value, str):
-                return len(value.encode("utf-8"))
-            elif isinstance(value, (int, float)):
-                return 8
-            elif isinstance(value, bool):
-                return 1
-            elif isinstance(value, (list, dict)):
-                return len(str(value))
-            else:
-                return 100  # Default estimate
+    def _drop_tags(self, key: str, tags: List[str]) -> None:
+        """Remove key from the tag index for ``tags``."""
+        for tag in tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
 
     async def _enforce_memory_limits(self, new_entry_size: int = 0) -> None:
         """
@@ -965,53 +1113,58 @@ class CacheManagerAgent:
 
         target_size = self.max_memory_size - new_entry_size
 
-        while self._current_memory_size > target_size and self._lru_order:
-            # Evict based on policy
-            if self.eviction_policy == EvictionPolicy.LRU:
-                # Remove least recently used
-                lru_key = next(iter(self._lru_order))
-                await self._evict_entry(lru_key)
-
-            elif self.eviction_policy == EvictionPolicy.LFU:
-                # Remove least frequently used
-                lfu_key = min(self._entries.keys(), key=lambda k: self._entries[k].access_count)
-                await self._evict_entry(lfu_key)
-
-            elif self.eviction_policy == EvictionPolicy.SIZE:
-                # Remove largest entry
-                largest_key = max(self._entries.keys(), key=lambda k: self._entries[k].size_bytes)
-                await self._evict_entry(largest_key)
-
-            else:  # TTL-based
-                # Remove entry closest to expiration
-                closest_expiry_key = min(
-                    (k for k, v in self._entries.items() if v.expires_at),
-                    key=lambda k: self._entries[k].expires_at,
-                    default=None,
-                )
-                if closest_expiry_key:
-                    await self._evict_entry(closest_expiry_key)
-                else:
-                    # Fallback to LRU if no TTL entries
-                    if self._lru_order:
-                        lru_key = next(iter(self._lru_order))
-                        await self._evict_entry(lru_key)
-                    else:
-                        break
+        while self._current_memory_size > target_size:
+            victim = self._eviction.victim(self.eviction_policy)
+            if victim is None or not await self._evict_entry(victim):
+                break
 
-    async def _evict_entry(self, key: str) -> None:
+    async def _evict_entry(self, key: str) -> bool:
         """
-        Evict a specific cache entry.
+        Evict a cache entry from the in-process memory tier.
+
+        The backend copy is kept: with a shared backend other processes still
+        rely on it, and this process reads it back on the next miss.
 
         Args:
             key: Cache key to evict
+
+        Returns:
+            True if the entry was evicted
         """
         try:
-            if await self.delete(key):
-                self.stats.evictions += 1
-                logger.debug(f"Evicted cache entry: {key}")
+            async with self._key_lock(key):
+                if not self._release(key):
+                    return False
+                if self._memory_cache:
+                    await self._memory_cache.delete(key)
+                entry = self._entries.get(key)
+                if entry is not None and entry.value is not None:
+                    self._entries[key] = replace(entry, value=None)
+
+            self.stats.evictions += 1
+            logger.debug(f"Evicted cache entry from memory: {key}")
+            return True
         except Exception as e:
             logger.error(f"Error evicting cache entry {key}: {e}")
+        return False
+
+    def _admit(self, entry: CacheEntry) -> None:
+        """Count ``entry`` as resident in the memory tier."""
+        self._eviction.add(entry)
+        self._current_memory_size += entry.size_bytes
+        self.stats.size_bytes += entry.size_bytes
+        self.stats.entry_count += 1
+
+    def _release(self, key: str) -> bool:
+        """Stop counting ``key`` as resident in the memory tier; False if it was not."""
+        if key not in self._eviction:
+            return False
+        self._eviction.remove(key)
+        size = self._entries[key].size_bytes
+        self._current_memory_size -= size
+        self.stats.size_bytes -= size
+        self.stats.entry_count -= 1
+        return True
 
     def get_memory_usage(self) -> Dict[str, Any]:
         """
@@ -1033,8 +1186,10 @@ class CacheManagerAgent:
                 "max_size_bytes": self.max_memory_size,
                 "max_size_mb": round(self.max_memory_size / 1024 / 1024, 2),
                 "usage_percent": round(usage_pct, 2),
-                "entry_count": len(self._entries),
+                "entry_count": len(self._eviction),
                 "avg_entry_size": (
-                    round(self._current_memory_size / len(self._entries), 2) if self._entries else 0
+                    round(self._current_memory_size / len(self._eviction), 2)
+                    if self._eviction
+                    else 0
                 ),
             }
@@ -8,8 +8,10 @@ and intelligent caching through the cache manager.
 
 import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union, Tuple
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Union, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import hashlib
@@ -137,8 +139,12 @@ class DataFetcherAgent:
             window_seconds=settings.yahoo_api_rate_window_seconds,
         )
 
-        # Yahoo API client (initialized on first use)
+        # Yahoo API clients (initialized on first use). yfpy clients carry the
+        # league context as mutable state, so each league gets its own instance
+        # and concurrent requests for different leagues never share one.
         self._yahoo_client: Optional[YahooFantasySportsQuery] = None
+        self._league_clients: Dict[str, YahooFantasySportsQuery] = {}
+        self._client_lock = asyncio.Lock()
         self._auth_token: Optional[str] = None
         self._auth_expires: Optional[datetime] = None
 
@@ -148,6 +154,16 @@ class DataFetcherAgent:
         # Semaphore for controlling concurrent requests
         self._semaphore = asyncio.Semaphore(settings.max_workers)
 
+        # yfpy is synchronous; its calls run here so they never block the event loop.
+        # A timed-out call cannot be interrupted and keeps its thread until yfpy
+        # returns, so a slot is only freed when the thread finishes. The extra
+        # thread keeps client creation (serialized by _client_lock) from queueing
+        # behind hung calls.
+        self._yfpy_slots = asyncio.Semaphore(settings.max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.max_workers + 1, thread_name_prefix="yfpy"
+        )
+
         logger.info("DataFetcherAgent initialized")
 
     async def __aenter__(self):
@@ -181,6 +197,9 @@ class DataFetcherAgent:
             if self._session:
                 await self._session.close()
 
+            self._executor.shutdown(wait=False)
+            self._league_clients.clear()
+
             logger.info("DataFetcherAgent cleaned up")
 
         except Exception as e:
@@ -618,11 +637,16 @@ class DataFetcherAgent:
         return league_data
 
     async def _initialize_yahoo_client(self) -> None:
-        """Initialize Yahoo Fantasy Sports API client."""
+        """Initialize the user-level Yahoo Fantasy Sports API client."""
+        self._yahoo_client = await self._get_yahoo_client()
+        logger.info("Yahoo API client initialized")
+
+    def _create_yahoo_client(self, league_id: Optional[str] = None) -> YahooFantasySportsQuery:
+        """Create a yfpy client bound to a single league (blocking, runs in the executor)."""
         try:
             # Create Yahoo API client with OAuth2 credentials
-            self._yahoo_client = YahooFantasySportsQuery(
-                league_id=None,  # Will be set per request
+            return YahooFantasySportsQuery(
+                league_id=league_id,
                 game_code="nfl",
                 game_id=None,  # Will be determined from current season
                 yahoo_consumer_key=self.settings.yahoo_client_id,
@@ -630,12 +654,37 @@ class DataFetcherAgent:
                 env_file_location=".env",  # OAuth tokens stored here
             )
 
-            logger.info("Yahoo API client initialized")
-
         except Exception as e:
             logger.error(f"Failed to initialize Yahoo API client: {e}")
             raise AuthenticationError(f"Yahoo API authentication failed: {e}")
 
+    async def _get_yahoo_client(self, league_id: Optional[str] = None) -> YahooFantasySportsQuery:
+        """
+        Get the yfpy client for a league, creating it on first use.
+
+        Args:
+            league_id: Yahoo league ID, or None for user-level requests
+
+        Returns:
+            Client instance dedicated to that league
+        """
+        client_key = league_id or ""
+        client = self._league_clients.get(client_key)
+        if client is not None:
+            return client
+
+        async with self._client_lock:
+            client = self._league_clients.get(client_key)
+            if client is None:
+                loop = asyncio.get_running_loop()
+                client = await loop.run_in_executor(
+                    self._executor, self._create_yahoo_client, league_id
+                )
+                self._league_clients[client_key] = client
+                logger.debug(f"Created Yahoo API client for league: {league_id or 'user'}")
+
+        return client
+
     async def _make_api_request(self, request: APIRequest) -> Any:
         """
         Make API request with rate limiting, retry logic, and error handling.
@@ -697,65 +746,94 @@ class DataFetcherAgent:
             raise last_exception or Exception("API request failed")
 
     async def _execute_yahoo_request(self, request: APIRequest) -> Any:
-        """Execute the actual Yahoo API request."""
+        """Execute the actual Yahoo API request in the yfpy thread pool."""
         try:
-            if not self._yahoo_client:
-                await self._initialize_yahoo_client()
-
-            # Route to appropriate Yahoo API method
-            if request.endpoint == APIEndpoint.USER_LEAGUES:
-                return self._yahoo_client.get_user_leagues()
+            call = await self._resolve_yahoo_call(request)
+            return await self._run_yfpy(call, request.timeout)
 
-            elif request.endpoint == APIEndpoint.TEAM_ROSTER:
-                league_key = request.params["league_key"]
-                team_key = request.params["team_key"]
-                week = request.params.get("week")
+        except Exception as e:
+            logger.error(f"Yahoo API request execution failed: {e}")
+            raise
 
-                # Set league context
-                self._yahoo_client.league_id = league_key.split(".")[-1]
+    async def _run_yfpy(self, call: Callable[[], Any], timeout: float) -> Any:
+        """
+        Run a blocking yfpy call in the executor, giving up after ``timeout``.
 
-                if week:
-                    return self._yahoo_client.get_team_roster_player_info_by_week(
-                        team_id=team_key.split(".")[-1], chosen_week=week
-                    )
-                else:
-                    return self._yahoo_client.get_team_roster_player_info(
-                        team_id=team_key.split(".")[-1]
-                    )
-
-            elif request.endpoint == APIEndpoint.TEAM_MATCHUP:
-                league_key = request.params["league_key"]
-                team_key = request.params["team_key"]
-                week = request.params["week"]
-
-                self._yahoo_client.league_id = league_key.split(".")[-1]
-                return self._yahoo_client.get_team_matchups(
-                    team_id=team_key.split(".")[-1], chosen_week=week
+        The wait is abandoned on timeout but the thread runs on, so the call
+        holds its slot until it actually returns; with every slot held by hung
+        calls, new requests time out waiting for one instead of piling up in
+        the executor queue.
+        """
+        await asyncio.wait_for(self._yfpy_slots.acquire(), timeout=timeout)
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(self._executor, call)
+        except BaseException:
+            self._yfpy_slots.release()
+            raise
+        future.add_done_callback(self._release_yfpy_slot)
+        # shield: a timeout must not cancel the future, or its slot would be freed early
+        return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+
+    def _release_yfpy_slot(self, future: "asyncio.Future[Any]") -> None:
+        self._yfpy_slots.release()
+        if not future.cancelled():
+            future.exception()  # abandoned calls: mark their error as retrieved
+
+    async def _resolve_yahoo_call(self, request: APIRequest) -> Callable[[], Any]:
+        """Route a request to the matching yfpy method on a league-scoped client."""
+        # Route to appropriate Yahoo API method
+        if request.endpoint == APIEndpoint.USER_LEAGUES:
+            client = await self._get_yahoo_client()
+            return client.get_user_leagues
+
+        elif request.endpoint == APIEndpoint.TEAM_ROSTER:
+            league_key = request.params["league_key"]
+            team_key = request.params["team_key"]
+            week = request.params.get("week")
+
+            client = await self._get_yahoo_client(league_key.split(".")[-1])
+
+            if week:
+                return partial(
+                    client.get_team_roster_player_info_by_week,
+                    team_id=team_key.split(".")[-1],
+                    chosen_week=week,
                 )
+            else:
+                return partial(client.get_team_roster_player_info, team_id=team_key.split(".")[-1])
 
-            elif request.endpoint == APIEndpoint.PLAYER_INFO:
-                player_key = request.params["player_key"]
-                return self._yahoo_client.get_player_info(player_key)
-
-            elif request.endpoint == APIEndpoint.AVAILABLE_PLAYERS:
-                league_key = request.params["league_key"]
-                self._yahoo_client.league_id = league_key.split(".")[-1]
-
-                return self._yahoo_client.get_league_players(
-                    player_count_limit=request.params.get("count", 25),
-                    player_count_start=0,
-                    search_filters={
-                        "position": request.params.get("position"),
-                        "status": request.params.get("status", "A"),
-                    },
-                )
+        elif request.endpoint == APIEndpoint.TEAM_MATCHUP:
+            league_key = request.params["league_key"]
+            team_key = request.params["team_key"]
+            week = request.params["week"]
 
-            else:
-                raise ValueError(f"Unsupported endpoint: {request.endpoint}")
+            client = await self._get_yahoo_client(league_key.split(".")[-1])
+            return partial(
+                client.get_team_matchups, team_id=team_key.split(".")[-1], chosen_week=week
+            )
 
-        except Exception as e:
-            logger.error(f"Yahoo API request execution failed: {e}")
-            raise
+        elif request.endpoint == APIEndpoint.PLAYER_INFO:
+            player_key = request.params["player_key"]
+            client = await self._get_yahoo_client()
+            return partial(client.get_player_info, player_key)
+
+        elif request.endpoint == APIEndpoint.AVAILABLE_PLAYERS:
+            league_key = request.params["league_key"]
+            client = await self._get_yahoo_client(league_key.split(".")[-1])
+
+            return partial(
+                client.get_league_players,
+                player_count_limit=request.params.get("count", 25),
+                player_count_start=0,
+                search_filters={
+                    "position": request.params.get("position"),
+                    "status": request.params.get("status", "A"),
+                },
+            )
+
+        else:
+            raise ValueError(f"Unsupported endpoint: {request.endpoint}")
 
     async def _transform_yahoo_player(self, yahoo_player: YfpyPlayer) -> Dict[str, Any]:
         """
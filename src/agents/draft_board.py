@@ -0,0 +1,282 @@
+"""
+Vectorized draft board for the Draft Evaluator Agent.
+
+The available player pool is held as NumPy arrays (projection, position code,
+bye week and the static risk and upside scores), so every factor score and the
+strategy-weighted total for the whole pool come out of a single array pass.
+Replacement levels are kept per position and updated incrementally as players
+are drafted, instead of re-sorting every position for each recommendation.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..models.draft import (
+    AGE_RISK_THRESHOLDS,
+    POSITION_INJURY_RISK,
+    DraftState,
+    DraftTier,
+    PlayerEvaluation,
+    PositionalNeed,
+    RosterNeed,
+    StrategyWeights,
+)
+from ..models.player import Player, Position
+
+POSITIONS = list(Position)
+POSITION_CODES = {position.value: code for code, position in enumerate(POSITIONS)}
+
+# Replacement level: the Nth best available player at each position
+REPLACEMENT_RANKS = {
+    Position.QB: 12,
+    Position.RB: 24,
+    Position.WR: 30,
+    Position.TE: 12,
+    Position.K: 12,
+    Position.DEF: 12,
+}
+
+SCARCITY_BY_NEED = {
+    PositionalNeed.CRITICAL: 100,
+    PositionalNeed.HIGH: 80,
+    PositionalNeed.MEDIUM: 60,
+    PositionalNeed.LOW: 30,
+    PositionalNeed.SATURATED: 10,
+}
+
+NEED_SCORES = {
+    PositionalNeed.CRITICAL: 100,
+    PositionalNeed.HIGH: 75,
+    PositionalNeed.MEDIUM: 50,
+    PositionalNeed.LOW: 25,
+    PositionalNeed.SATURATED: 0,
+}
+
+# Per position code: age above which risk grows (none for defenses), injury risk multiplier
+AGE_LIMITS = np.array([AGE_RISK_THRESHOLDS.get(position) or np.inf for position in POSITIONS])
+INJURY_RISK = np.array([POSITION_INJURY_RISK.get(position, 1.0) for position in POSITIONS])
+
+STATUS_PENALTIES = {"questionable": -15.0, "doubtful": -15.0, "out": -30.0}
+
+# Bye week penalty by number of rostered players sharing the bye (3 or more: -20)
+BYE_PENALTIES = np.array([0.0, -5.0, -10.0, -20.0])
+
+# Lower bounds of the ELITE, STUD, SOLID and FLEX tiers; anything lower is BENCH
+TIER_FLOORS = np.array([85.0, 70.0, 55.0, 40.0])
+TIERS = [DraftTier.ELITE, DraftTier.STUD, DraftTier.SOLID, DraftTier.FLEX, DraftTier.BENCH]
+
+
+def position_code(position: Any) -> int:
+    """Index of a position (enum or its value) in ``POSITIONS``; -1 if unknown."""
+    return POSITION_CODES.get(getattr(position, "value", position), -1)
+
+
+def _attr(player: Player, name: str, default: float) -> float:
+    """Numeric player attribute, with ``default`` when it is missing or None."""
+    value = getattr(player, name, None)
+    return default if value is None else float(value)
+
+
+class DraftBoard:
+    """Available draft pool as arrays, scored in one pass."""
+
+    def __init__(self, players: Iterable[Player]):
+        self.players: List[Player] = [p for p in players if position_code(p.position) >= 0]
+        self.index: Dict[str, int] = {player.id: row for row, player in enumerate(self.players)}
+
+        self.projection = np.array([_attr(p, "projected_points", 0.0) for p in self.players])
+        self.position = np.array([position_code(p.position) for p in self.players], dtype=int)
+        self.bye = np.array([int(_attr(p, "bye_week", 0)) for p in self.players], dtype=int)
+        self.available = np.ones(len(self.players), dtype=bool)
+
+        age = np.array([_attr(p, "age", 28) for p in self.players])
+        self.risk = self._risk_scores(age)
+        self.upside = self._upside_scores(age)
+
+        # Per position: rows by descending projection and a pointer to the replacement player
+        self._order: Dict[int, np.ndarray] = {}
+        self._rank = np.zeros(len(self.players), dtype=int)
+        self._pointer: Dict[int, int] = {}
+        self.replacement = np.zeros(len(POSITIONS))
+        for code, position in enumerate(POSITIONS):
+            rows = np.flatnonzero(self.position == code)
+            order = rows[np.argsort(-self.projection[rows], kind="stable")]
+            self._order[code] = order
+            self._rank[order] = np.arange(len(order))
+            pointer = min(REPLACEMENT_RANKS.get(position, 24), len(order) - 1)
+            self._set_pointer(code, pointer)
+
+    def _risk_scores(self, age: np.ndarray) -> np.ndarray:
+        """Injury and performance risk (higher is safer), 0-100."""
+        age_limit = AGE_LIMITS[self.position]
+        age_penalty = np.where(age > age_limit, (age - age_limit) * -3, 0.0)
+        games_missed = np.array([_attr(p, "games_missed_last_2_years", 0) for p in self.players])
+        status_penalty = np.array(
+            [STATUS_PENALTIES.get(getattr(p, "injury_status", None), 0.0) for p in self.players]
+        )
+        position_penalty = (INJURY_RISK[self.position] - 1.0) * -10
+        total_risk = age_penalty + games_missed * -2 + position_penalty + status_penalty
+        return np.clip(50 - total_risk, 0, 100)
+
+    def _upside_scores(self, age: np.ndarray) -> np.ndarray:
+        """Ceiling potential from youth, volatility and experience, 0-100."""
+        volatility = np.array([_attr(p, "volatility", 0.5) for p in self.players])
+        years_pro = np.array([_attr(p, "years_pro", 5) for p in self.players])
+        upside = (
+            np.select([age < 25, age < 27], [20, 10], 0)
+            + np.select([volatility > 0.7, volatility > 0.6], [15, 10], 0)
+            + np.select([years_pro <= 2, years_pro <= 3], [15, 10], 0)
+        )
+        return np.minimum(100, upside).astype(float)
+
+    # Replacement levels
+
+    def _set_pointer(self, code: int, pointer: int) -> None:
+        self._pointer[code] = pointer
+        order = self._order[code]
+        self.replacement[code] = self.projection[order[pointer]] if pointer >= 0 else 0.0
+
+    def draft(self, player_id: str) -> bool:
+        """
+        Remove a drafted player from the pool, updating its position's replacement level.
+
+        Returns:
+            False if the player is not on the board or was already drafted
+        """
+        row = self.index.get(player_id)
+        if row is None or not self.available[row]:
+            return False
+        self.available[row] = False
+        code = int(self.position[row])
+        order = self._order[code]
+        pointer = self._pointer[code]
+        if self._rank[row] > pointer:
+            return True
+
+        # One fewer player at or above the replacement rank: it moves to the next available
+        following = pointer + 1
+        while following < len(order) and not self.available[order[following]]:
+            following += 1
+        if following < len(order):
+            pointer = following
+        else:
+            # Fewer players left than the replacement rank: the last available one
+            while pointer >= 0 and not self.available[order[pointer]]:
+                pointer -= 1
+        self._set_pointer(code, pointer)
+        return True
+
+    def sync(self, available_players: Iterable[Player]) -> bool:
+        """
+        Draft every player missing from ``available_players``.
+
+        Returns:
+            False if the pool contains players the board does not know (rebuild it)
+        """
+        player_ids = set()
+        for player in available_players:
+            if player.id not in self.index:
+                return False
+            player_ids.add(player.id)
+        for row in np.flatnonzero(self.available):
+            if self.players[row].id not in player_ids:
+                self.draft(self.players[row].id)
+        return True
+
+    def replacement_level(self, position: Any) -> float:
+        """Projection of the replacement player at ``position`` (0 when none is left)."""
+        code = position_code(position)
+        return float(self.replacement[code]) if code >= 0 else 0.0
+
+    # Scoring
+
+    def evaluate(
+        self,
+        draft_state: DraftState,
+        current_roster: List[Player],
+        weights: StrategyWeights,
+        limit: Optional[int] = None,
+    ) -> List[PlayerEvaluation]:
+        """
+        Score every available player and return evaluations by descending overall score.
+
+        Args:
+            draft_state: Roster needs and draft position
+            current_roster: Players already on the roster (for bye week conflicts)
+            weights: Strategy weights for the overall score
+            limit: Only build evaluations for the best ``limit`` players
+        """
+        rows = np.flatnonzero(self.available)
+        codes = self.position[rows]
+
+        replacement = self.replacement[codes]
+        vorp = np.minimum(100, np.maximum(0, self.projection[rows] - replacement))
+
+        scarcity_by_position, need_by_position = self._need_tables(draft_state)
+        scarcity = scarcity_by_position[codes]
+        need = need_by_position[codes]
+
+        roster_byes = np.zeros(max(int(self.bye.max(initial=0)), 18) + 1, dtype=int)
+        for player in current_roster:
+            bye = int(_attr(player, "bye_week", 0))
+            if 0 < bye < len(roster_byes):
+                roster_byes[bye] += 1
+        byes = self.bye[rows]
+        conflicts = np.minimum(roster_byes[byes], len(BYE_PENALTIES) - 1)
+        bye_week = np.where(byes > 0, BYE_PENALTIES[conflicts], 0.0)
+
+        risk = self.risk[rows]
+        upside = self.upside[rows]
+        total = (
+            vorp * weights.vorp
+            + scarcity * weights.scarcity
+            + need * weights.need
+            + bye_week * weights.bye_week
+            + risk * weights.risk
+            + upside * weights.upside
+        )
+        tiers = np.searchsorted(-TIER_FLOORS, -total)
+        overall = np.clip(total, 0, 100)
+
+        ranked = np.argsort(-overall, kind="stable")
+        if limit is not None:
+            ranked = ranked[:limit]
+
+        evaluations = []
+        for i in ranked:
+            player = self.players[rows[i]]
+            evaluations.append(
+                PlayerEvaluation(
+                    player=player,
+                    overall_score=float(overall[i]),
+                    vorp_score=float(vorp[i]),
+                    scarcity_score=float(scarcity[i]),
+                    need_score=float(need[i]),
+                    bye_week_score=float(bye_week[i]),
+                    risk_score=float(risk[i]),
+                    upside_score=float(upside[i]),
+                    tier=TIERS[tiers[i]],
+                    projected_points=getattr(player, "projected_points", None),
+                    replacement_level=float(replacement[i]),
+                )
+            )
+        return evaluations
+
+    @staticmethod
+    def _need_tables(draft_state: DraftState) -> Tuple[np.ndarray, np.ndarray]:
+        """Scarcity and roster need score per position code (50 where no need is listed)."""
+        scarcity = np.full(len(POSITIONS), 50.0)
+        need = np.full(len(POSITIONS), 50.0)
+        round_multiplier = 1 + (draft_state.draft_position.round_number - 1) * 0.1
+        # Reversed, so the first need listed for a position wins
+        roster_needs: List[RosterNeed] = list(draft_state.roster_needs)
+        for roster_need in reversed(roster_needs):
+            code = position_code(roster_need.position)
+            if code < 0:
+                continue
+            level = PositionalNeed(roster_need.need_level)
+            scarcity[code] = min(100, SCARCITY_BY_NEED[level] * round_multiplier)
+            bye_bonus = min(20, roster_need.bye_week_conflicts * 5)
+            need[code] = min(100, NEED_SCORES[level] + bye_bonus)
+        return scarcity, need
@@ -14,28 +14,26 @@ import statistics
 
 from loguru import logger
 
-from models.draft import (
+from ..models.draft import (
     DraftStrategy,
     DraftAnalysis,
     DraftRecommendation,
     DraftState,
-    DraftTier,
     PlayerEvaluation,
     RosterNeed,
     PositionalNeed,
     PositionalRun,
     OpportunityCost,
-    StrategyWeights,
     STRATEGY_WEIGHTS,
     STANDARD_ROSTER_REQUIREMENTS,
     FLEX_POSITIONS,
-    POSITION_INJURY_RISK,
-    AGE_RISK_THRESHOLDS,
     DraftPosition,
 )
-from models.player import Player, Position
+from ..models.player import Player, Position
 from .data_fetcher import DataFetcherAgent
-from .cache_manager import CacheManager
+from .cache_manager import CacheManagerAgent
+from .draft_board import DraftBoard
+from .draft_simulator import DEFAULT_SIMULATIONS, MockDraftSimulator
 from config.settings import Settings
 
 
@@ -46,7 +44,7 @@ class DraftEvaluatorAgent:
     """
 
     def __init__(
-        self, settings: Settings, cache_manager: CacheManager, data_fetcher: DataFetcherAgent
+        self, settings: Settings, cache_manager: CacheManagerAgent, data_fetcher: DataFetcherAgent
     ):
         """Initialize the draft evaluator with required dependencies."""
         self.settings = settings
@@ -54,7 +52,7 @@ class DraftEvaluatorAgent:
         self.data_fetcher = data_fetcher
 
         # Draft evaluation parameters
-        self.replacement_level_cache: Dict[Position, float] = {}
+        self.draft_boards: Dict[str, DraftBoard] = {}
         self.adp_data: Dict[str, float] = {}
         self.tier_boundaries: Dict[Position, List[float]] = {}
 
@@ -87,16 +85,11 @@ class DraftEvaluatorAgent:
             available_players = await self.data_fetcher.get_available_players(league_key)
             current_roster = await self._get_current_roster(league_key)
 
-            # Evaluate all available players
-            evaluations = await self._evaluate_available_players(
-                available_players, draft_state, current_roster
+            # Evaluate all available players, keeping the top N
+            top_evaluations = await self._evaluate_available_players(
+                available_players, draft_state, current_roster, limit=num_recommendations
             )
 
-            # Sort by overall score and take top N
-            top_evaluations = sorted(evaluations, key=lambda x: x.overall_score, reverse=True)[
-                :num_recommendations
-            ]
-
             # Convert to recommendations
             recommendations = [
                 await self._create_recommendation(eval_data, idx + 1)
@@ -119,6 +112,32 @@ class DraftEvaluatorAgent:
             logger.error(f"Failed to get draft recommendation for league {league_key}: {e}")
             raise
 
+    async def simulate_strategies(
+        self,
+        players: List[Player],
+        adp: Optional[Dict[str, float]] = None,
+        num_teams: int = 12,
+        rounds: int = 16,
+        draft_slots: Optional[List[int]] = None,
+        simulations: int = DEFAULT_SIMULATIONS,
+    ) -> Dict[str, Any]:
+        """
+        Compare draft strategies over simulated mock drafts.
+
+        Args:
+            players: Draft pool with season projections
+            adp: Average draft position by player id
+            num_teams: Teams in the league
+            rounds: Draft rounds
+            draft_slots: 1-based draft slots to simulate (default: all)
+            simulations: Mock drafts per strategy and slot
+
+        Returns:
+            Expected lineup points and positional outcomes per strategy and slot
+        """
+        simulator = MockDraftSimulator(players, adp, num_teams=num_teams, rounds=rounds)
+        return await simulator.compare_strategies(draft_slots=draft_slots, simulations=simulations)
+
     async def analyze_draft_state(
         self, league_key: str, strategy: DraftStrategy = DraftStrategy.BALANCED
     ) -> Dict[str, Any]:
@@ -203,267 +222,28 @@ class DraftEvaluatorAgent:
             draft_phase=draft_phase,
         )
 
-    async def _evaluate_available_players(
-        self, available_players: List[Player], draft_state: DraftState, current_roster: List[Player]
-    ) -> List[PlayerEvaluation]:
-        """Evaluate all available players using multi-factor analysis."""
-
-        strategy_weights = STRATEGY_WEIGHTS[draft_state.strategy]
-        evaluations = []
-
-        # Calculate replacement levels for all positions
-        await self._calculate_replacement_levels(available_players)
-
-        for player in available_players[:200]:  # Limit to top 200 for performance
-            try:
-                eval_data = await self._evaluate_single_player(
-                    player, draft_state, current_roster, strategy_weights
-                )
-                evaluations.append(eval_data)
-            except Exception as e:
-                logger.warning(f"Failed to evaluate player {player.name}: {e}")
-                continue
-
-        return evaluations
+    def _draft_board(self, league_key: str, available_players: List[Player]) -> DraftBoard:
+        """Get the league's draft board, catching it up with the players drafted since."""
+        board = self.draft_boards.get(league_key)
+        if board is None or not board.sync(available_players):
+            board = DraftBoard(available_players)
+            self.draft_boards[league_key] = board
+        return board
 
-    async def _evaluate_single_player(
+    async def _evaluate_available_players(
         self,
-        player: Player,
+        available_players: List[Player],
         draft_state: DraftState,
         current_roster: List[Player],
-        strategy_weights: StrategyWeights,
-    ) -> PlayerEvaluation:
-        """Perform comprehensive evaluation of a single player."""
-
-        # Core calculations
-        vorp_score = await self._calculate_vorp(player)
-        scarcity_score = await self._calculate_positional_scarcity(player, draft_state)
-        need_score = self._calculate_roster_need_score(player, draft_state.roster_needs)
-        bye_week_score = self._calculate_bye_week_score(player, current_roster)
-        risk_score = self._calculate_risk_score(player)
-        upside_score = self._calculate_upside_score(player)
-
-        # Apply strategy weights
-        overall_score = (
-            (vorp_score * strategy_weights.vorp)
-            + (scarcity_score * strategy_weights.scarcity)
-            + (need_score * strategy_weights.need)
-            + (bye_week_score * strategy_weights.bye_week)
-            + (risk_score * strategy_weights.risk)
-            + (upside_score * strategy_weights.upside)
-        )
+        limit: Optional[int] = None,
+    ) -> List[PlayerEvaluation]:
+        """Evaluate all available players using multi-factor analysis, best first."""
 
-        # Determine tier
-        tier = self._determine_player_tier(player, overall_score)
-
-        return PlayerEvaluation(
-            player=player,
-            overall_score=max(0, min(100, overall_score)),  # Clamp to 0-100
-            vorp_score=vorp_score,
-            scarcity_score=scarcity_score,
-            need_score=need_score,
-            bye_week_score=bye_week_score,
-            risk_score=risk_score,
-            upside_score=upside_score,
-            tier=tier,
-            projected_points=getattr(player, "projected_points", None),
-            replacement_level=self.replacement_level_cache.get(player.position, 0),
+        board = self._draft_board(draft_state.league_key, available_players)
+        return board.evaluate(
+            draft_state, current_roster, STRATEGY_WEIGHTS[draft_state.strategy], limit
         )
 
-    async def _calculate_vorp(self, player: Player) -> float:
-        """Calculate Value Over Replacement Player score."""
-        projected_points = getattr(player, "projected_points", 0)
-        replacement_level = self.replacement_level_cache.get(player.position, 0)
-
-        vorp = max(0, projected_points - replacement_level)
-
-        # Normalize to 0-100 scale (assuming max VORP is around 100 points)
-        return min(100, (vorp / 100) * 100)
-
-    async def _calculate_positional_scarcity(
-        self, player: Player, draft_state: DraftState
-    ) -> float:
-        """Calculate positional scarcity score based on remaining quality players."""
-
-        # Find positional need for this player
-        position_need = None
-        for need in draft_state.roster_needs:
-            if need.position == player.position:
-                position_need = need
-                break
-
-        if not position_need:
-            return 50  # Neutral if position not found
-
-        # Base scarcity on need level
-        need_multipliers = {
-            PositionalNeed.CRITICAL: 100,
-            PositionalNeed.HIGH: 80,
-            PositionalNeed.MEDIUM: 60,
-            PositionalNeed.LOW: 30,
-            PositionalNeed.SATURATED: 10,
-        }
-
-        base_scarcity = need_multipliers[position_need.need_level]
-
-        # Adjust for draft position (scarcity increases in later rounds)
-        draft_round = draft_state.draft_position.round_number
-        round_multiplier = 1 + (draft_round - 1) * 0.1  # 10% increase per round
-
-        return min(100, base_scarcity * round_multiplier)
-
-    def _calculate_roster_need_score(self, player: Player, roster_needs: List[RosterNeed]) -> float:
-        """Calculate how much the team needs this player's position."""
-
-        for need in roster_needs:
-            if need.position == player.position:
-                need_scores = {
-                    PositionalNeed.CRITICAL: 100,
-                    PositionalNeed.HIGH: 75,
-                    PositionalNeed.MEDIUM: 50,
-                    PositionalNeed.LOW: 25,
-                    PositionalNeed.SATURATED: 0,
-                }
-
-                base_score = need_scores[need.need_level]
-
-                # Bonus for bye week conflicts (need extra depth)
-                bye_bonus = min(20, need.bye_week_conflicts * 5)
-
-                return min(100, base_score + bye_bonus)
-
-        return 50  # Default neutral score
-
-    def _calculate_bye_week_score(self, player: Player, current_roster: List[Player]) -> float:
-        """Calculate penalty/bonus for bye week distribution."""
-
-        player_bye = getattr(player, "bye_week", None)
-        if not player_bye:
-            return 0
-
-        # Count existing players with same bye week
-        bye_conflicts = sum(1 for p in current_roster if getattr(p, "bye_week", None) == player_bye)
-
-        if bye_conflicts >= 3:
-            return -20  # Heavy penalty
-        elif bye_conflicts == 2:
-            return -10  # Moderate penalty
-        elif bye_conflicts == 1:
-            return -5  # Light penalty
-        else:
-            return 0  # No penalty
-
-    def _calculate_risk_score(self, player: Player) -> float:
-        """Calculate injury and performance risk score."""
-
-        risk_factors = []
-
-        # Age risk
-        age = getattr(player, "age", 28)
-        age_threshold = AGE_RISK_THRESHOLDS.get(player.position, 32)
-        if age_threshold and age > age_threshold:
-            age_penalty = (age - age_threshold) * -3
-            risk_factors.append(age_penalty)
-
-        # Injury history risk
-        games_missed = getattr(player, "games_missed_last_2_years", 0)
-        injury_penalty = games_missed * -2
-        risk_factors.append(injury_penalty)
-
-        # Position-based injury risk
-        position_risk = POSITION_INJURY_RISK.get(player.position, 1.0)
-        position_penalty = (position_risk - 1.0) * -10
-        risk_factors.append(position_penalty)
-
-        # Current injury status
-        injury_status = getattr(player, "injury_status", None)
-        if injury_status in ["questionable", "doubtful"]:
-            risk_factors.append(-15)
-        elif injury_status == "out":
-            risk_factors.append(-30)
-
-        total_risk = sum(risk_factors)
-
-        # Convert to positive score (lower risk = higher score)
-        return max(0, min(100, 50 - total_risk))
-
-    def _calculate_upside_score(self, player: Player) -> float:
-        """Calculate ceiling/upside potential score."""
-
-        # For now, use simple heuristics
-        upside_factors = []
-
-        # Young player bonus (more upside potential)
-        age = getattr(player, "age", 28)
-        if age < 25:
-            upside_factors.append(20)
-        elif age < 27:
-            upside_factors.append(10)
-
-        # High volatility can mean high upside
-        volatility = getattr(player, "volatility", 0.5)
-        if volatility > 0.7:
-            upside_factors.append(15)
-        elif volatility > 0.6:
-            upside_factors.append(10)
-
-        # Breakout candidate indicators (would need more sophisticated analysis)
-        # For now, assume newer players have more upside
-        years_pro = getattr(player, "years_pro", 5)
-        if years_pro <= 2:
-            upside_factors.append(15)
-        elif years_pro <= 3:
-            upside_factors.append(10)
-
-        return min(100, sum(upside_factors))
-
-    def _determine_player_tier(self, player: Player, overall_score: float) -> DraftTier:
-        """Assign player to a tier based on overall score."""
-
-        if overall_score >= 85:
-            return DraftTier.ELITE
-        elif overall_score >= 70:
-            return DraftTier.STUD
-        elif overall_score >= 55:
-            return DraftTier.SOLID
-        elif overall_score >= 40:
-            return DraftTier.FLEX
-        else:
-            return DraftTier.BENCH
-
-    async def _calculate_replacement_levels(self, available_players: List[Player]) -> None:
-        """Calculate replacement level values for each position."""
-
-        position_players = {}
-        for player in available_players:
-            if player.position not in position_players:
-                position_players[player.position] = []
-            position_players[player.position].append(getattr(player, "projected_points", 0))
-
-        for position, point_projections in position_players.items():
-            if not point_projections:
-                self.replacement_level_cache[position] = 0
-                continue
-
-            # Sort descending
-            sorted_projections = sorted(point_projections, reverse=True)
-
-            # Replacement level is roughly the 24th best player at skill positions
-            # Adjust based on typical starter requirements
-            replacement_indices = {
-                Position.QB: 12,  # 12th best QB
-                Position.RB: 24,  # 24th best RB
-                Position.WR: 30,  # 30th best WR
-                Position.TE: 12,  # 12th best TE
-                Position.K: 12,  # 12th best K
-                Position.DST: 12,  # 12th best DST
-            }
-
-            replacement_idx = replacement_indices.get(position, 24)
-            replacement_idx = min(replacement_idx, len(sorted_projections) - 1)
-
-            self.replacement_level_cache[position] = sorted_projections[replacement_idx]
-
     async def _analyze_roster_needs(self, current_roster: List[Player]) -> List[RosterNeed]:
         """Analyze current roster to determine positional needs."""
 
@@ -0,0 +1,344 @@
+"""
+Mock draft simulator for comparing draft strategies.
+
+Runs full snake drafts offline, thousands at a time. Opponents pick the
+available player with the earliest draft slot drawn around his ADP (within
+positional roster limits); our team picks with the Draft Evaluator's factor
+scoring (VORP, scarcity, need, bye week, risk, upside) under each strategy's
+weights. Every draft state is an array over simulations, so one pick is one
+NumPy step for all simulated drafts, and batches of simulations run in the
+shared worker pool. Results are the starting lineup's projected season points and
+the positional make-up of our roster per strategy and draft slot.
+"""
+
+import asyncio
+from dataclasses import astuple
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from ..models.draft import (
+    FLEX_POSITIONS,
+    STANDARD_ROSTER_REQUIREMENTS,
+    STRATEGY_WEIGHTS,
+    DraftStrategy,
+    PositionalNeed,
+)
+from ..models.player import Player
+from .draft_board import (
+    BYE_PENALTIES,
+    NEED_SCORES,
+    POSITIONS,
+    REPLACEMENT_RANKS,
+    SCARCITY_BY_NEED,
+    DraftBoard,
+)
+from .worker_pool import WorkerPool, shared_worker_pool
+
+DEFAULT_SIMULATIONS = 2000
+# Simulations per worker pool job
+BATCH_SIZE = 250
+
+# Spread of an opponent's pick around a player's ADP
+ADP_SPREAD = 0.2
+MIN_ADP_SPREAD = 3.0
+
+MAX_BYE_WEEK = 18
+
+# Per position code: roster requirements, and the largest number an opponent drafts
+STARTERS = np.array([STANDARD_ROSTER_REQUIREMENTS[p]["starters"] for p in POSITIONS])
+OPTIMAL = np.array([STANDARD_ROSTER_REQUIREMENTS[p]["optimal_total"] for p in POSITIONS])
+MAX_USEFUL = np.array([STANDARD_ROSTER_REQUIREMENTS[p]["max_useful"] for p in POSITIONS])
+FLEX_CODES = [POSITIONS.index(position) for position in FLEX_POSITIONS]
+
+# Scores by need level, in the CRITICAL..SATURATED order of PositionalNeed
+NEED_LEVELS = list(PositionalNeed)
+SCARCITY_BY_LEVEL = np.array([SCARCITY_BY_NEED[level] for level in NEED_LEVELS], dtype=float)
+NEED_BY_LEVEL = np.array([NEED_SCORES[level] for level in NEED_LEVELS], dtype=float)
+REPLACEMENT_BY_CODE = [REPLACEMENT_RANKS.get(p, 24) for p in POSITIONS]
+
+
+def snake_order(num_teams: int, rounds: int) -> np.ndarray:
+    """Team index (0-based) on the clock for every overall pick of a snake draft."""
+    order = np.tile(np.arange(num_teams), (rounds, 1))
+    order[1::2] = order[1::2, ::-1]
+    return order.ravel()
+
+
+def _replacement_levels(pool: Dict[str, np.ndarray], available: np.ndarray) -> np.ndarray:
+    """Replacement projection per simulation and position code, shape (S, positions)."""
+    simulations = available.shape[0]
+    levels = np.zeros((simulations, len(POSITIONS)))
+    for code, rank in enumerate(REPLACEMENT_BY_CODE):
+        order = pool["order"][code]
+        if len(order) == 0:
+            continue
+        left = available[:, order]
+        seen = np.cumsum(left, axis=1)
+        # The (rank + 1)th available player, or the last one when fewer are left
+        at_rank = np.argmax(seen > rank, axis=1)
+        last = len(order) - 1 - np.argmax(left[:, ::-1], axis=1)
+        index = np.where(seen[:, -1] > rank, at_rank, last)
+        projection = pool["projection"][order[index]]
+        levels[:, code] = np.where(seen[:, -1] > 0, projection, 0.0)
+    return levels
+
+
+def _our_scores(
+    pool: Dict[str, np.ndarray],
+    weights: tuple,
+    available: np.ndarray,
+    counts: np.ndarray,
+    position_byes: np.ndarray,
+    round_number: int,
+) -> np.ndarray:
+    """Overall score of every player in every simulation, as DraftBoard.evaluate scores it."""
+    position, bye = pool["position"], pool["bye"]
+    vorp_w, scarcity_w, need_w, bye_w, risk_w, upside_w = weights
+
+    replacement = _replacement_levels(pool, available)[:, position]
+    vorp = np.clip(pool["projection"] - replacement, 0, 100)
+
+    # Need level per position from our counts, as DraftEvaluatorAgent assesses a roster
+    level = np.select(
+        [counts == 0, counts < STARTERS, counts < OPTIMAL, counts < MAX_USEFUL], [0, 1, 2, 3], 4
+    )
+    round_multiplier = 1 + (round_number - 1) * 0.1
+    scarcity = np.minimum(100, SCARCITY_BY_LEVEL[level] * round_multiplier)
+    bye_conflicts = np.maximum(position_byes - 1, 0).sum(axis=2)
+    need = np.minimum(100, NEED_BY_LEVEL[level] + np.minimum(20, bye_conflicts * 5))
+
+    roster_byes = position_byes.sum(axis=1)
+    conflicts = np.minimum(roster_byes[:, bye], len(BYE_PENALTIES) - 1)
+    bye_week = np.where(bye > 0, BYE_PENALTIES[conflicts], 0.0)
+
+    return (
+        vorp * vorp_w
+        + scarcity[:, position] * scarcity_w
+        + need[:, position] * need_w
+        + bye_week * bye_w
+        + pool["risk"] * risk_w
+        + pool["upside"] * upside_w
+    )
+
+
+def _lineup_points(projection: np.ndarray, position: np.ndarray) -> np.ndarray:
+    """Projected points of the best starting lineup (starters plus one flex) per simulation."""
+    total = np.zeros(projection.shape[0])
+    flex = np.zeros(projection.shape[0])
+    for code, starters in enumerate(STARTERS):
+        points = np.where(position == code, projection, 0.0)
+        ranked = -np.sort(-points, axis=1)
+        total += ranked[:, :starters].sum(axis=1)
+        if code in FLEX_CODES and ranked.shape[1] > starters:
+            flex = np.maximum(flex, ranked[:, starters])
+    return total + flex
+
+
+def simulate_drafts(
+    pool: Dict[str, np.ndarray],
+    weights: tuple,
+    draft_slot: int,
+    num_teams: int,
+    rounds: int,
+    simulations: int,
+    seed: Any = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Run ``simulations`` snake drafts at once (module level, so it pickles to worker processes).
+
+    Returns:
+        Dict with ``points`` (lineup points per simulation), ``counts`` (our
+        players per position code) and ``position_points`` (projected points
+        drafted per position code)
+    """
+    rng = np.random.default_rng(seed)
+    position, adp = pool["position"], pool["adp"]
+    rows = np.arange(simulations)
+    our_team = draft_slot - 1
+
+    spread = np.maximum(MIN_ADP_SPREAD, adp * ADP_SPREAD)
+    adp_keys = adp + spread * rng.standard_normal((simulations, len(adp)))
+    available = np.ones((simulations, len(adp)), dtype=bool)
+    team_counts = np.zeros((simulations, num_teams, len(POSITIONS)), dtype=int)
+    position_byes = np.zeros((simulations, len(POSITIONS), MAX_BYE_WEEK + 1), dtype=int)
+    our_picks = np.zeros((simulations, rounds), dtype=int)
+
+    for pick, team in enumerate(snake_order(num_teams, rounds)):
+        round_number = pick // num_teams + 1
+        if team == our_team:
+            scores = _our_scores(
+                pool, weights, available, team_counts[:, our_team], position_byes, round_number
+            )
+            choice = np.argmax(np.where(available, scores, -np.inf), axis=1)
+            our_picks[:, round_number - 1] = choice
+            bye = pool["bye"][choice]
+            position_byes[rows, position[choice], bye] += bye > 0
+        else:
+            # Earliest drawn ADP among players at positions the team still wants
+            full = team_counts[:, team] >= MAX_USEFUL
+            keys = np.where(full[:, position], np.inf, adp_keys)
+            stuck = np.isinf(keys.min(axis=1))
+            keys[stuck] = adp_keys[stuck]
+            choice = np.argmin(keys, axis=1)
+        available[rows, choice] = False
+        adp_keys[rows, choice] = np.inf
+        team_counts[rows, team, position[choice]] += 1
+
+    our_projection = pool["projection"][our_picks]
+    our_positions = position[our_picks]
+    position_points = np.stack(
+        [
+            np.where(our_positions == code, our_projection, 0.0).sum(axis=1)
+            for code in range(len(POSITIONS))
+        ],
+        axis=1,
+    )
+    return {
+        "points": _lineup_points(our_projection, our_positions),
+        "counts": team_counts[:, our_team],
+        "position_points": position_points,
+    }
+
+
+class MockDraftSimulator:
+    """Compare draft strategies and draft slots over many simulated drafts."""
+
+    def __init__(
+        self,
+        players: Iterable[Player],
+        adp: Optional[Dict[str, float]] = None,
+        num_teams: int = 12,
+        rounds: int = 16,
+        worker_pool: Optional[WorkerPool] = None,
+    ):
+        """
+        Args:
+            players: Draft pool; ``projected_points`` are season projections
+            adp: Average draft position by player id (defaults to a player's
+                ``adp`` attribute, then to the projection rank)
+            num_teams: Teams in the league
+            rounds: Draft rounds
+            worker_pool: Pool for simulation batches (default: the shared pool)
+        """
+        board = DraftBoard(players)
+        self.players = board.players
+        self.num_teams = num_teams
+        self.rounds = min(rounds, len(self.players) // num_teams)
+        if self.rounds < rounds:
+            logger.warning(f"Pool of {len(self.players)} players only covers {self.rounds} rounds")
+
+        projection_rank = np.empty(len(self.players))
+        projection_rank[np.argsort(-board.projection, kind="stable")] = np.arange(
+            1, len(self.players) + 1
+        )
+        adp = adp or {}
+        self.pool = {
+            "projection": board.projection,
+            "position": board.position,
+            "bye": np.clip(board.bye, 0, MAX_BYE_WEEK),
+            "risk": board.risk,
+            "upside": board.upside,
+            "order": [board._order[code] for code in range(len(POSITIONS))],
+            "adp": np.array(
+                [
+                    adp.get(player.id) or getattr(player, "adp", None) or projection_rank[row]
+                    for row, player in enumerate(self.players)
+                ],
+                dtype=float,
+            ),
+        }
+        self.worker_pool = worker_pool or shared_worker_pool()
+
+    async def compare_strategies(
+        self,
+        strategies: Optional[List[DraftStrategy]] = None,
+        draft_slots: Optional[List[int]] = None,
+        simulations: int = DEFAULT_SIMULATIONS,
+        seed: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Simulate every strategy from every draft slot.
+
+        Args:
+            strategies: Strategies to compare (default: all)
+            draft_slots: 1-based draft slots (default: all)
+            simulations: Drafts per strategy and slot
+            seed: Seed for reproducible results
+
+        Returns:
+            Per strategy and slot: lineup point distribution and positional
+            outcomes, plus the best strategy for each slot
+        """
+        strategies = strategies or list(DraftStrategy)
+        draft_slots = draft_slots or list(range(1, self.num_teams + 1))
+        batch_sizes = [
+            min(BATCH_SIZE, simulations - start) for start in range(0, simulations, BATCH_SIZE)
+        ]
+        keys = [(strategy, slot) for strategy in strategies for slot in draft_slots]
+        seeds = iter(np.random.SeedSequence(seed).spawn(len(keys) * len(batch_sizes)))
+
+        jobs = []
+        for strategy, slot in keys:
+            weights = astuple(STRATEGY_WEIGHTS[strategy])
+            for batch in batch_sizes:
+                args = (self.pool, weights, slot, self.num_teams, self.rounds, batch, next(seeds))
+                jobs.append(((strategy, slot), args))
+
+        outputs = await asyncio.gather(
+            *(self.worker_pool.run(simulate_drafts, *args) for _, args in jobs)
+        )
+        batches: Dict[Any, List[Dict[str, np.ndarray]]] = {}
+        for (key, _), output in zip(jobs, outputs):
+            batches.setdefault(key, []).append(output)
+
+        results = []
+        for (strategy, slot), parts in batches.items():
+            merged = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+            results.append(self._summarize(strategy, slot, merged))
+
+        best_by_slot = {}
+        for result in results:
+            best = best_by_slot.get(result["draft_slot"])
+            if best is None or result["expected_points"] > best["expected_points"]:
+                best_by_slot[result["draft_slot"]] = result
+        return {
+            "simulations": simulations,
+            "num_teams": self.num_teams,
+            "rounds": self.rounds,
+            "results": results,
+            "best_strategy_by_slot": {
+                slot: result["strategy"] for slot, result in sorted(best_by_slot.items())
+            },
+        }
+
+    def _summarize(
+        self, strategy: DraftStrategy, slot: int, merged: Dict[str, np.ndarray]
+    ) -> Dict[str, Any]:
+        points = merged["points"]
+        p10, p50, p90 = np.percentile(points, [10, 50, 90])
+        positions = {}
+        for code, position in enumerate(POSITIONS):
+            counts = merged["counts"][:, code]
+            values, frequency = np.unique(counts, return_counts=True)
+            positions[position.value] = {
+                "mean_count": round(float(counts.mean()), 2),
+                "count_distribution": {
+                    int(value): round(float(share), 3)
+                    for value, share in zip(values, frequency / len(counts))
+                },
+                "mean_points": round(float(merged["position_points"][:, code].mean()), 1),
+            }
+        return {
+            "strategy": strategy.value,
+            "draft_slot": slot,
+            "expected_points": round(float(points.mean()), 1),
+            "points_std": round(float(points.std()), 1),
+            "points_percentiles": {
+                "p10": round(float(p10), 1),
+                "p50": round(float(p50), 1),
+                "p90": round(float(p90), 1),
+            },
+            "positions": positions,
+        }
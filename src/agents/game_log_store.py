@@ -0,0 +1,304 @@
+"""
+Columnar game-log store for player weekly stats.
+
+The statistical agent used to rebuild a pandas DataFrame from ``PlayerStats``
+objects in every helper, several times per analysis. This store keeps one
+float64 table for every player's weekly stats, indexed by
+(player_id, season, week) and sorted, so a player's games are a contiguous
+block handed out as a slice instead of a fresh conversion. Games are appended
+incrementally as new weeks arrive and rolling features (L3/L5 averages, EWMA,
+team target share) are maintained as they are merged in.
+"""
+
+import threading
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..models.player import PlayerStats
+
+# Numeric PlayerStats fields kept in the store
+STAT_COLUMNS: Tuple[str, ...] = tuple(
+    name
+    for name, field in PlayerStats.model_fields.items()
+    if name not in ("games_played", "games_started")
+)
+
+# Features derived on write
+ROLLING_COLUMNS: Tuple[str, ...] = ("fp_l3", "fp_l5", "fp_ewma", "target_share")
+
+INDEX_NAMES = ["player_id", "season", "week"]
+
+# EWMA span (games) for the smoothed fantasy points column
+EWMA_SPAN = 4
+
+
+def _games_to_array(games: Sequence[PlayerStats]) -> np.ndarray:
+    values = np.full((len(games), len(STAT_COLUMNS)), np.nan)
+    for row, game in enumerate(games):
+        for col, name in enumerate(STAT_COLUMNS):
+            value = getattr(game, name, None)
+            if value is not None:
+                values[row, col] = float(value)
+    return values
+
+
+def _game_signature(values: np.ndarray) -> List[bytes]:
+    """Per-game identity over every stat column, to detect whether stored rows are current."""
+    return [row.tobytes() for row in values]
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean over ``window`` games, skipping missing values (pandas min_periods=1)."""
+    present = ~np.isnan(values)
+    sums = np.concatenate(([0.0], np.cumsum(np.where(present, values, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(present)))
+    ends = np.arange(1, len(values) + 1)
+    starts = np.maximum(ends - window, 0)
+    window_counts = counts[ends] - counts[starts]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(window_counts > 0, (sums[ends] - sums[starts]) / window_counts, np.nan)
+
+
+class GameLogStore:
+    """Weekly stats for all players in one table indexed by (player_id, season, week).
+
+    Syncs are buffered and merged into the table in one batch (one concat, one
+    sort) on the next read, so syncing many players costs one rebuild instead
+    of one per player. Target shares are recomputed only for the (team, season)
+    groups touched since the last merge.
+    """
+
+    def __init__(self):
+        columns = list(STAT_COLUMNS) + list(ROLLING_COLUMNS)
+        self._frame = pd.DataFrame(
+            np.empty((0, len(columns))),
+            columns=columns,
+            index=pd.MultiIndex.from_tuples([], names=INDEX_NAMES),
+        )
+        self._signatures: Dict[Tuple[str, int], List[bytes]] = {}
+        self._teams: Dict[str, str] = {}
+        # Rows waiting to be merged: (player_id, season) -> (first week - 1, stat values)
+        self._pending: Dict[Tuple[str, int], Tuple[int, np.ndarray]] = {}
+        self._replaced: Set[Tuple[str, int]] = set()
+        self._stale_shares: Set[Tuple[str, int]] = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._flush()
+            return len(self._frame)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """The whole store (read-only by convention)."""
+        with self._lock:
+            self._flush()
+            return self._frame
+
+    def sync(
+        self,
+        player_id: str,
+        games: Sequence[PlayerStats],
+        season: int,
+        team: Optional[str] = None,
+    ) -> int:
+        """
+        Make the store match ``games`` (ordered oldest first, week = position + 1).
+
+        Games are compared on every stat column: only games beyond the stored ones
+        are appended, and stored rows are replaced when any earlier game changed. Rows become visible to
+        readers on the next read.
+
+        Returns:
+            Number of rows written
+        """
+        key = (player_id, season)
+        all_values = _games_to_array(games)
+        signature = _game_signature(all_values)
+
+        with self._lock:
+            if team is not None:
+                team = str(getattr(team, "value", team))
+                previous = self._teams.get(player_id)
+                if previous != team:
+                    self._teams[player_id] = team
+                    seasons = {s for pid, s in self._signatures if pid == player_id}
+                    if previous is not None:
+                        self._stale_shares.update((previous, s) for s in seasons)
+                    self._stale_shares.update((team, s) for s in seasons)
+
+            stored = self._signatures.get(key, [])
+            if stored == signature:
+                return 0
+
+            if stored and signature[: len(stored)] == stored:
+                start = len(stored)
+            else:
+                start = 0
+                if stored:
+                    self._replaced.add(key)
+                    self._pending.pop(key, None)
+
+            values = all_values[start:]
+            if key in self._pending:
+                first, pending = self._pending[key]
+                self._pending[key] = (first, np.vstack([pending, values]))
+            else:
+                self._pending[key] = (start, values)
+            self._signatures[key] = signature
+            if player_id in self._teams:
+                self._stale_shares.add((self._teams[player_id], season))
+            return len(values)
+
+    def _flush(self) -> None:
+        """Merge buffered syncs into the table (caller holds the lock)."""
+        if not (self._pending or self._replaced or self._stale_shares):
+            return
+
+        frame = self._frame
+        if self._replaced:
+            keys = frame.index.droplevel("week")
+            frame = frame[~keys.isin(list(self._replaced))]
+            self._replaced.clear()
+
+        if self._pending:
+            frame = self._append(frame, self._pending)
+            self._pending.clear()
+
+        if self._stale_shares:
+            self._update_target_share(frame, self._stale_shares)
+            self._stale_shares.clear()
+        self._frame = frame
+
+    def _append(
+        self, frame: pd.DataFrame, pending: Dict[Tuple[str, int], Tuple[int, np.ndarray]]
+    ) -> pd.DataFrame:
+        """One concat and sort for every buffered block, rolling features included."""
+        points_col = STAT_COLUMNS.index("fantasy_points")
+        rolling = {name: frame.columns.get_loc(name) for name in ("fp_l3", "fp_l5", "fp_ewma")}
+        stored_points = frame["fantasy_points"].to_numpy()
+
+        blocks, player_ids, seasons, weeks = [], [], [], []
+        for (player_id, season), (start, values) in pending.items():
+            block = np.full((len(values), len(frame.columns)), np.nan)
+            block[:, : len(STAT_COLUMNS)] = values
+
+            # Rolling features only look back, so stored rows keep their values
+            prior = stored_points[self._slice(frame, player_id, season)] if start else []
+            points = np.concatenate([prior, values[:, points_col]])
+            block[:, rolling["fp_l3"]] = _rolling_mean(points, 3)[start:]
+            block[:, rolling["fp_l5"]] = _rolling_mean(points, 5)[start:]
+            block[:, rolling["fp_ewma"]] = (
+                pd.Series(points).ewm(span=EWMA_SPAN, ignore_na=True).mean().to_numpy()[start:]
+            )
+
+            blocks.append(block)
+            player_ids.extend([player_id] * len(values))
+            seasons.extend([season] * len(values))
+            weeks.extend(range(start + 1, start + len(values) + 1))
+
+        index = pd.MultiIndex.from_arrays([player_ids, seasons, weeks], names=INDEX_NAMES)
+        rows = pd.DataFrame(np.vstack(blocks), columns=frame.columns, index=index)
+        frame = pd.concat([frame, rows]) if len(frame) else rows
+        # A single float64 block keeps player slices as views of the store
+        return frame.sort_index()
+
+    def _update_target_share(self, frame: pd.DataFrame, groups: Set[Tuple[str, int]]) -> None:
+        """Player targets / team targets per week, for the given (team, season) groups only."""
+        teams = {team for team, _ in groups}
+        players = [player_id for player_id, team in self._teams.items() if team in teams]
+        mask = frame.index.get_level_values("player_id").isin(players)
+        subset = frame[mask]
+        labels = np.array(
+            [self._teams[player_id] for player_id in subset.index.get_level_values("player_id")],
+            dtype=object,
+        )
+        season = subset.index.get_level_values("season")
+        in_groups = np.array([(team, s) in groups for team, s in zip(labels, season)], dtype=bool)
+        subset, labels = subset[in_groups], labels[in_groups]
+        keys = [
+            labels,
+            subset.index.get_level_values("season"),
+            subset.index.get_level_values("week"),
+        ]
+        team_targets = subset["targets"].groupby(keys).transform("sum")
+        share = subset["targets"] / team_targets.replace(0, np.nan)
+        rows = np.flatnonzero(mask)[in_groups]
+        frame.iloc[rows, frame.columns.get_loc("target_share")] = share.to_numpy()
+
+    def _team_labels(self) -> np.ndarray:
+        player_ids = self._frame.index.get_level_values("player_id")
+        return np.array([self._teams.get(player_id, "") for player_id in player_ids], dtype=object)
+
+    @staticmethod
+    def _slice(frame: pd.DataFrame, player_id: str, season: Optional[int] = None) -> slice:
+        key = (player_id,) if season is None else (player_id, season)
+        try:
+            loc = frame.index.get_locs(list(key))
+        except KeyError:
+            return slice(0, 0)
+        if len(loc) == 0:
+            return slice(0, 0)
+        return slice(int(loc[0]), int(loc[-1]) + 1)
+
+    def player_frame(self, player_id: str, season: Optional[int] = None) -> pd.DataFrame:
+        """A player's games in week order, as a positional slice of the store."""
+        with self._lock:
+            self._flush()
+            return self._frame.iloc[self._slice(self._frame, player_id, season)]
+
+    def games_frame(
+        self,
+        player_id: str,
+        games: Sequence[PlayerStats],
+        season: int,
+        team: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Sync ``games`` for a player and return their slice."""
+        self.sync(player_id, games, season, team)
+        return self.player_frame(player_id, season)
+
+    def team_weekly_totals(self, season: Optional[int] = None) -> pd.DataFrame:
+        """Stat totals per (team, season, week) across all stored players."""
+        with self._lock:
+            self._flush()
+            frame = self._frame
+            teams = self._team_labels()
+        if season is not None:
+            mask = frame.index.get_level_values("season") == season
+            frame, teams = frame[mask], teams[mask]
+        keys = [
+            pd.Index(teams, name="team"),
+            frame.index.get_level_values("season"),
+            frame.index.get_level_values("week"),
+        ]
+        return frame[list(STAT_COLUMNS)].groupby(keys).sum(min_count=1)
+
+    def player_summary(self, season: Optional[int] = None) -> pd.DataFrame:
+        """Per-player games, mean/total fantasy points and latest rolling features."""
+        frame = self.frame
+        if season is not None:
+            frame = frame[frame.index.get_level_values("season") == season]
+        grouped = frame.groupby(level="player_id")
+        return pd.DataFrame(
+            {
+                "games": grouped["fantasy_points"].count(),
+                "fp_mean": grouped["fantasy_points"].mean(),
+                "fp_total": grouped["fantasy_points"].sum(),
+                "fp_l3": grouped["fp_l3"].last(),
+                "fp_l5": grouped["fp_l5"].last(),
+                "fp_ewma": grouped["fp_ewma"].last(),
+                "target_share": grouped["target_share"].mean(),
+            }
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frame = self._frame.iloc[0:0]
+            self._signatures.clear()
+            self._teams.clear()
+            self._pending.clear()
+            self._replaced.clear()
+            self._stale_shares.clear()
@@ -0,0 +1,142 @@
+"""
+Fitted projection model registry.
+
+Keeps fitted estimators keyed by (scope, schema, fingerprint) where scope is a
+player id or position, schema describes the feature set and model family, and
+fingerprint hashes the training rows. A bounded in-memory LRU sits in front of
+estimators persisted with joblib, so repeated analyses within a week reuse the
+same fit (inference only) and a refit is only triggered when new weekly stats
+change the training rows. The most recent entry for a scope/schema is also
+available for warm-starting the refit.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import joblib
+import numpy as np
+from loguru import logger
+
+
+def _default_registry_dir() -> Path:
+    return Path(os.getenv("CACHE_DIR", "./.cache")) / "models"
+
+
+class ModelRegistry:
+    """LRU + on-disk store of fitted models, one current entry per scope and schema."""
+
+    def __init__(self, directory: Optional[Path] = None, max_entries: int = 256):
+        """
+        Initialize the registry.
+
+        Args:
+            directory: Where estimators are persisted (default: ``$CACHE_DIR/models``)
+            max_entries: Entries kept in memory before least recently used are dropped
+        """
+        self.directory = Path(directory) if directory is not None else _default_registry_dir()
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(*arrays: np.ndarray) -> str:
+        """Hash training data (shape, dtype and bytes of each array)."""
+        digest = hashlib.sha256()
+        for array in arrays:
+            array = np.ascontiguousarray(array)
+            digest.update(str(array.shape).encode())
+            digest.update(array.dtype.str.encode())
+            digest.update(array.tobytes())
+        return digest.hexdigest()
+
+    def _path(self, scope: str, schema: str) -> Path:
+        name = hashlib.md5(f"{scope}|{schema}".encode()).hexdigest()
+        return self.directory / f"{name}.joblib"
+
+    def _remember(self, key: Tuple[str, str], entry: Tuple[str, Any]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _load(self, scope: str, schema: str) -> Optional[Tuple[str, Any]]:
+        key = (scope, schema)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+
+        path = self._path(scope, schema)
+        if not path.exists():
+            return None
+        try:
+            stored = joblib.load(path)
+            entry = (stored["fingerprint"], stored["value"])
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable model registry entry {path}: {e}")
+            return None
+
+        with self._lock:
+            self._remember(key, entry)
+        return entry
+
+    def get(self, scope: str, schema: str, fingerprint: str) -> Optional[Any]:
+        """Return the stored value if it was fitted on exactly this data."""
+        entry = self._load(scope, schema)
+        if entry is not None and entry[0] == fingerprint:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def latest(self, scope: str, schema: str) -> Optional[Any]:
+        """Return the most recent value for a scope/schema, whatever data it was fitted on."""
+        entry = self._load(scope, schema)
+        return entry[1] if entry is not None else None
+
+    def put(self, scope: str, schema: str, fingerprint: str, value: Any) -> None:
+        """Store a fitted value, replacing the previous fit for this scope/schema."""
+        with self._lock:
+            self._remember((scope, schema), (fingerprint, value))
+
+        path = self._path(scope, schema)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            joblib.dump(
+                {"scope": scope, "schema": schema, "fingerprint": fingerprint, "value": value},
+                tmp_path,
+            )
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not persist model registry entry to {path}: {e}")
+
+    def clear(self) -> None:
+        """Drop every entry from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+        if self.directory.exists():
+            for path in self.directory.glob("*.joblib"):
+                try:
+                    path.unlink()
+                except OSError as e:
+                    logger.warning(f"Could not remove model registry entry {path}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and memory usage."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "memory_entries": len(self._memory),
+            "max_entries": self.max_entries,
+            "directory": str(self.directory),
+        }
@@ -5,13 +5,18 @@ for lineup decisions with robust error handling and async support.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 import os
 import re
+import sqlite3
+import threading
 import time
-from collections import defaultdict, Counter
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any, Union
+from collections import Counter, OrderedDict, defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from concurrent.futures import ThreadPoolExecutor
@@ -49,6 +54,15 @@ except ImportError as e:
     TextBlob = None
     TEXTBLOB_AVAILABLE = False
 
+# Optional: single-pass keyword matching (pip install pyahocorasick)
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on optional dependency
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
 
 class SentimentModel(str, Enum):
     """Available sentiment analysis models."""
@@ -100,10 +114,309 @@ class RateLimitInfo:
     is_rate_limited: bool = False
 
 
+class KeywordMatcher:
+    """
+    Weighted multi-class keyword matcher built once over all keyword classes.
+
+    ``classes`` maps a class name (positive, negative, injury, ...) to
+    keyword -> weight. ``scan`` returns, per class, the summed weight of the
+    distinct keywords that occur in a text. Lowercase keywords match as
+    case-insensitive substrings, found in a single Aho-Corasick pass when
+    pyahocorasick is installed (one substring test per distinct keyword
+    otherwise). Keywords containing capitals (acronyms such as "IR") match
+    case-sensitively as whole words.
+    """
+
+    def __init__(self, classes: Dict[str, Dict[str, float]]):
+        self.classes = list(classes)
+        # keyword -> [(class, weight)]; a keyword may belong to several classes
+        self._targets: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
+        for class_name, keywords in classes.items():
+            for keyword, weight in keywords.items():
+                self._targets[keyword].append((class_name, weight))
+
+        self._folded = [keyword for keyword in self._targets if keyword.islower()]
+        self._exact = [
+            (keyword, re.compile(rf"\b{re.escape(keyword)}\b"))
+            for keyword in self._targets
+            if not keyword.islower()
+        ]
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and self._folded:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self._folded:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+
+    def find(self, text: str) -> Set[str]:
+        """Distinct keywords occurring in ``text``."""
+        lowered = text.lower()
+        if self._automaton is not None:
+            found = {keyword for _, keyword in self._automaton.iter(lowered)}
+        else:
+            found = {keyword for keyword in self._folded if keyword in lowered}
+        for keyword, pattern in self._exact:
+            # The substring test is cheap and rules most texts out before the regex
+            if keyword in text and pattern.search(text):
+                found.add(keyword)
+        return found
+
+    def scan(self, text: str) -> Dict[str, float]:
+        """Summed keyword weight per class for one text."""
+        scores = dict.fromkeys(self.classes, 0.0)
+        for keyword in self.find(text):
+            for class_name, weight in self._targets[keyword]:
+                scores[class_name] += weight
+        return scores
+
+    def scan_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        """``scan`` for each of ``texts``."""
+        return [self.scan(text) for text in texts]
+
+
+# Scored texts kept across restarts; least recently used scores are dropped beyond this
+SENTIMENT_CACHE_SIZE = 50_000
+
+# Seconds between trims of the sentiment cache down to SENTIMENT_CACHE_SIZE
+SENTIMENT_CACHE_TRIM_INTERVAL = 300
+
+_SENTIMENT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sentiment_scores (
+    digest TEXT PRIMARY KEY,
+    score REAL NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sentiment_scores_used ON sentiment_scores (used_at);
+"""
+
+
+def _default_sentiment_cache_path() -> Path:
+    return Path(os.getenv("CACHE_DIR", "./.cache")) / "reddit_sentiment.sqlite"
+
+
+def _textblob_polarities(texts: List[str]) -> List[float]:
+    """TextBlob polarity for each text (0.0 where analysis fails); runs in one executor job."""
+    polarities = []
+    for text in texts:
+        try:
+            polarities.append(TextBlob(text).sentiment.polarity)
+        except Exception as e:
+            logger.warning(f"TextBlob sentiment analysis failed: {e}")
+            polarities.append(0.0)
+    return polarities
+
+
+class SentimentCache:
+    """
+    Bounded, persistent LRU of sentiment scores keyed by a content digest.
+
+    Keys are stable across processes (unlike ``hash()``), so a Reddit thread
+    scored once is never rescored, even by a new agent or after a restart.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_entries: int = SENTIMENT_CACHE_SIZE,
+        trim_interval: float = SENTIMENT_CACHE_TRIM_INTERVAL,
+    ):
+        self.path = Path(path) if path is not None else _default_sentiment_cache_path()
+        self.max_entries = max_entries
+        self.trim_interval = trim_interval
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # Hits not yet written back as used_at updates (digest -> time used)
+        self._touched: Dict[str, float] = {}
+        self._next_trim = 0.0
+
+    @staticmethod
+    def digest(text: str, scorer: str) -> str:
+        """Stable key for ``text`` scored by ``scorer`` (model plus scoring version)."""
+        return hashlib.blake2b(f"{scorer}\0{text}".encode("utf-8"), digest_size=16).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.executescript(_SENTIMENT_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, digests: List[str]) -> Dict[str, float]:
+        """Cached scores for ``digests``; hits become most recently used on the next write."""
+        digests = list(dict.fromkeys(digests))
+        if not digests:
+            return {}
+        scores: Dict[str, float] = {}
+        try:
+            with self._lock:
+                conn = self._connect()
+                for start in range(0, len(digests), 500):
+                    chunk = digests[start : start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    scores.update(
+                        conn.execute(
+                            "SELECT digest, score FROM sentiment_scores "
+                            f"WHERE digest IN ({placeholders})",
+                            chunk,
+                        ).fetchall()
+                    )
+                now = time.time()
+                self._touched.update((digest, now) for digest in scores)
+        except sqlite3.Error as e:
+            logger.warning(f"Sentiment cache unavailable: {e}")
+        return scores
+
+    def put_many(self, scores: Dict[str, float]) -> None:
+        """Store new scores; every ``trim_interval`` drop the least recently used."""
+        if not scores:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO sentiment_scores VALUES (?, ?, ?)",
+                        [(digest, score, now) for digest, score in scores.items()],
+                    )
+                    self._write_touched(conn)
+                    if now >= self._next_trim:
+                        self._trim(conn)
+                        self._next_trim = now + self.trim_interval
+        except sqlite3.Error as e:
+            logger.warning(f"Could not persist sentiment scores: {e}")
+
+    def trim(self) -> None:
+        """Drop the least recently used scores beyond ``max_entries`` now."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    self._write_touched(conn)
+                    self._trim(conn)
+                self._next_trim = time.time() + self.trim_interval
+        except sqlite3.Error as e:
+            logger.warning(f"Could not trim sentiment cache: {e}")
+
+    def _write_touched(self, conn: sqlite3.Connection) -> None:
+        if self._touched:
+            conn.executemany(
+                "UPDATE sentiment_scores SET used_at = ? WHERE digest = ?",
+                [(used_at, digest) for digest, used_at in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _trim(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "DELETE FROM sentiment_scores WHERE digest IN ("
+            "SELECT digest FROM sentiment_scores "
+            "ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def __len__(self) -> int:
+        try:
+            with self._lock:
+                row = self._connect().execute("SELECT COUNT(*) FROM sentiment_scores").fetchone()
+            return row[0]
+        except sqlite3.Error:
+            return 0
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM sentiment_scores")
+            self._touched.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    with self._conn:
+                        self._write_touched(self._conn)
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not persist sentiment cache usage: {e}")
+                self._conn.close()
+                self._conn = None
+
+
+# Global instance
+shared_sentiment_cache = SentimentCache()
+
+
+def content_weight(subreddit_weight: float, score: int) -> float:
+    """Weight of a post or comment: its subreddit's importance, boosted up to 3x by score."""
+    return subreddit_weight * max(1, min(score / 10, 3))
+
+
+def summarize_sentiment(weighted_total: float, mentions: int, positive: int) -> Dict[str, Any]:
+    """
+    Overall sentiment, hype score, consensus and confidence for a player.
+
+    Args:
+        weighted_total: Sum of the weighted sentiment of every analyzed text
+        mentions: Number of analyzed texts
+        positive: How many of them scored positive
+    """
+    if not mentions:
+        return {"overall_sentiment": 0.0, "hype_score": 0.0, "consensus": None, "confidence": 0.0}
+
+    overall_sentiment = weighted_total / mentions
+
+    # Calculate hype score
+    positive_ratio = positive / mentions
+    hype_score = (overall_sentiment + 1) / 2 * min(mentions / 20, 1.0)
+
+    # Determine consensus
+    if positive_ratio > 0.6 and overall_sentiment > 0.2:
+        consensus = "START"
+        confidence = min(95, positive_ratio * 100)
+    elif positive_ratio < 0.3 or overall_sentiment < -0.2:
+        consensus = "SIT"
+        confidence = min(95, (1 - positive_ratio) * 100)
+    else:
+        consensus = "MIXED"
+        confidence = abs(overall_sentiment) * 50
+
+    return {
+        "overall_sentiment": overall_sentiment,
+        "hype_score": hype_score,
+        "consensus": consensus,
+        "confidence": confidence,
+    }
+
+
+# Reddit rejects longer search queries
+MAX_QUERY_LENGTH = 512
+# Comment trees fetched per Reddit thread are reused for this long, across players and calls
+THREAD_CACHE_TTL = 900
+THREAD_CACHE_SIZE = 1000
+
+
+def _search_query(names: List[str]) -> str:
+    """A single name as is, several as an OR of quoted names."""
+    if len(names) == 1:
+        return names[0]
+    return " OR ".join(f'"{name}"' for name in names)
+
+
+def _top_comments(post) -> List[Dict[str, Any]]:
+    """The first ten comments of a thread; runs on the thread pool."""
+    post.comments.replace_more(limit=0)
+    return [
+        {"text": comment.body, "score": comment.score, "created_utc": comment.created_utc}
+        for comment in post.comments.list()[:10]
+    ]
+
+
 class RedditSentimentAgent:
     """Enhanced Reddit sentiment analyzer with robust error handling and async support."""
 
-    def __init__(self, settings, max_workers: int = 2):
+    def __init__(
+        self, settings, max_workers: int = 2, sentiment_cache: Optional[SentimentCache] = None
+    ):
         """Initialize the Reddit sentiment analyzer."""
         self.settings = settings
         self.reddit = None
@@ -197,6 +510,30 @@ class RedditSentimentAgent:
             "day-to-day",
         ]
 
+        # Keyword strength tiers for sentiment scoring (anything else weighs 0.1)
+        keyword_tiers = {
+            "must start": 0.3,
+            "smash play": 0.3,
+            "league winner": 0.3,
+            "elite": 0.3,
+            "start": 0.2,
+            "stud": 0.2,
+            "locked in": 0.2,
+            "avoid": 0.3,
+            "bust": 0.3,
+            "sit": 0.3,
+            "bench": 0.2,
+            "fade": 0.2,
+            "risky": 0.2,
+        }
+        self.keyword_matcher = KeywordMatcher(
+            {
+                "positive": {kw: keyword_tiers.get(kw, 0.1) for kw in self.positive_keywords},
+                "negative": {kw: keyword_tiers.get(kw, 0.1) for kw in self.negative_keywords},
+                "injury": dict.fromkeys(self.injury_keywords, 1.0),
+            }
+        )
+
         # Subreddits to search with priority order
         self.subreddits = [
             {"name": "fantasyfootball", "weight": 1.0, "priority": 1},
@@ -205,8 +542,17 @@ class RedditSentimentAgent:
             {"name": "nfl", "weight": 0.5, "priority": 4},
         ]
 
-        # Cache for sentiment analysis to avoid re-processing
-        self.sentiment_cache = {}
+        # Scores persist across agents and restarts; keyword scores are keyed by the
+        # keyword lists too, so editing them does not serve stale scores
+        self.sentiment_cache = (
+            sentiment_cache if sentiment_cache is not None else shared_sentiment_cache
+        )
+        # Reddit thread id -> (fetched at, top comments), shared by every player it mentions
+        self._thread_cache: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._scoring_version = hashlib.blake2b(
+            json.dumps([self.positive_keywords, self.negative_keywords, keyword_tiers]).encode(),
+            digest_size=8,
+        ).hexdigest()
 
         # Initialize Reddit connection
         self._initialize_reddit()
@@ -271,26 +617,75 @@ class RedditSentimentAgent:
         Returns:
             RedditAnalysisResult with comprehensive analysis data
         """
-        logger.info(f"Starting Reddit sentiment analysis for {player_name}")
+        results = await self.analyze_players_sentiment(
+            [player_name], time_window_hours, max_posts, sentiment_model
+        )
+        return results[player_name]
 
-        result = RedditAnalysisResult(player=player_name)
+    async def analyze_players_sentiment(
+        self,
+        players: List[str],
+        time_window_hours: int = 48,
+        max_posts: int = 50,
+        sentiment_model: SentimentModel = SentimentModel.HYBRID,
+    ) -> Dict[str, RedditAnalysisResult]:
+        """
+        Analyze Reddit sentiment for several players from one shared set of searches.
+
+        Args:
+            players: Names of the players to analyze
+            time_window_hours: How far back to look for posts (default 48 hours)
+            max_posts: Maximum number of posts to analyze per player
+            sentiment_model: Sentiment analysis model to use
+
+        Returns:
+            Dict of player name -> RedditAnalysisResult
+        """
+        players = list(dict.fromkeys(players))
+        logger.info(f"Starting Reddit sentiment analysis for {', '.join(players)}")
 
         # Check API availability
         if not self._is_reddit_available():
-            result.status = "error"
-            result.errors.append("Reddit API not available")
-            result.fallback_used = True
-            return await self._generate_fallback_sentiment(player_name, result)
+            return await self._fallback_results(players, "Reddit API not available")
 
         try:
             # Rate limiting check
             await self._wait_for_rate_limit()
 
-            # Get Reddit data asynchronously
+            # Get Reddit data for every player at once
             reddit_data = await self._fetch_reddit_data_async(
-                player_name, time_window_hours, max_posts
+                players, time_window_hours, max_posts
             )
 
+        except TooManyRequests as e:
+            logger.warning(f"Reddit API rate limited for {', '.join(players)}: {e}")
+            self.api_status = RedditAPIStatus.RATE_LIMITED
+            return await self._fallback_results(players, "Reddit API rate limited")
+
+        except (RequestException, ServerError) as e:
+            logger.error(f"Reddit API error for {', '.join(players)}: {e}")
+            self.api_status = RedditAPIStatus.DEGRADED
+            return await self._fallback_results(players, f"Reddit API error: {str(e)}")
+
+        except Exception as e:
+            logger.error(f"Unexpected error analyzing {', '.join(players)}: {e}")
+            return await self._fallback_results(players, f"Unexpected error: {str(e)}")
+
+        results = await asyncio.gather(
+            *(
+                self._analyze_player_data(player, reddit_data[player], sentiment_model)
+                for player in players
+            )
+        )
+        return dict(zip(players, results))
+
+    async def _analyze_player_data(
+        self, player_name: str, reddit_data: Dict[str, Any], sentiment_model: SentimentModel
+    ) -> RedditAnalysisResult:
+        """Build one player's analysis result from the Reddit data attributed to them."""
+        result = RedditAnalysisResult(player=player_name)
+
+        try:
             if not reddit_data["posts"] and not reddit_data["comments"]:
                 result.status = "error"
                 result.errors.append("No Reddit data found for player")
@@ -327,22 +722,6 @@ class RedditSentimentAgent:
             logger.info(f"Reddit analysis complete for {player_name}: {result.status}")
             return result
 
-        except TooManyRequests as e:
-            logger.warning(f"Reddit API rate limited for {player_name}: {e}")
-            result.status = "error"
-            result.errors.append("Reddit API rate limited")
-            result.fallback_used = True
-            self.api_status = RedditAPIStatus.RATE_LIMITED
-            return await self._generate_fallback_sentiment(player_name, result)
-
-        except (RequestException, ServerError) as e:
-            logger.error(f"Reddit API error for {player_name}: {e}")
-            result.status = "error"
-            result.errors.append(f"Reddit API error: {str(e)}")
-            result.fallback_used = True
-            self.api_status = RedditAPIStatus.DEGRADED
-            return await self._generate_fallback_sentiment(player_name, result)
-
         except Exception as e:
             logger.error(f"Unexpected error analyzing {player_name}: {e}")
             result.status = "error"
@@ -350,118 +729,192 @@ class RedditSentimentAgent:
             result.fallback_used = True
             return await self._generate_fallback_sentiment(player_name, result)
 
+    async def _fallback_results(
+        self, players: List[str], error: str
+    ) -> Dict[str, RedditAnalysisResult]:
+        """Fallback results for players whose Reddit data could not be fetched."""
+        results = {}
+        for player in players:
+            result = RedditAnalysisResult(
+                player=player, status="error", errors=[error], fallback_used=True
+            )
+            results[player] = await self._generate_fallback_sentiment(player, result)
+        return results
+
     async def _fetch_reddit_data_async(
-        self, player_name: str, time_window_hours: int, max_posts: int
-    ) -> Dict[str, Any]:
-        """Fetch Reddit data asynchronously using thread executor."""
-
-        def _fetch_reddit_data_sync():
-            """Synchronous Reddit data fetching to run in thread."""
-            posts_data = []
-            comments_data = []
-            stats = {
-                "posts_analyzed": 0,
-                "comments_analyzed": 0,
-                "subreddits_searched": 0,
-                "api_calls_made": 0,
-                "errors": [],
+        self, players: List[str], time_window_hours: int, max_posts: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch posts and comments for several players with shared searches.
+
+        Each subreddit is searched once per group of players (an OR query
+        within Reddit's query length) and every post is attributed to each
+        player whose name it mentions, so a thread about two players is
+        fetched once. Searches and comment trees run concurrently on the
+        thread pool, which bounds how many requests praw has in flight while
+        it paces them against Reddit's rate limit.
+        """
+        loop = asyncio.get_running_loop()
+        posts_limit = max(5, max_posts // len(self.subreddits))
+        # Reddit returns at most 100 results per search
+        group_size = max(1, 100 // posts_limit)
+        name_index = KeywordMatcher({player: {player.lower(): 1.0} for player in players})
+        cutoff = time.time() - time_window_hours * 3600
+
+        reddit_data = {
+            player: {
+                "posts": [],
+                "comments": [],
+                "stats": {
+                    "posts_analyzed": 0,
+                    "comments_analyzed": 0,
+                    "subreddits_searched": 0,
+                    "api_calls_made": 0,
+                    "errors": [],
+                },
             }
+            for player in players
+        }
 
-            cutoff_time = datetime.now() - timedelta(hours=time_window_hours)
-
-            for subreddit_info in self.subreddits:
-                try:
-                    subreddit_name = subreddit_info["name"]
-                    subreddit_weight = subreddit_info["weight"]
-
-                    subreddit = self.reddit.subreddit(subreddit_name)
-                    posts_limit = max(5, max_posts // len(self.subreddits))
-
-                    # Search for posts mentioning the player
-                    posts = subreddit.search(
-                        player_name, time_filter="week", limit=posts_limit, sort="relevance"
-                    )
-
-                    stats["api_calls_made"] += 1
-                    stats["subreddits_searched"] += 1
-
-                    for post in posts:
-                        # Check if post is within time window
-                        post_time = datetime.fromtimestamp(post.created_utc)
-                        if post_time < cutoff_time:
-                            continue
-
-                        # Filter for relevance
-                        post_text = f"{post.title} {post.selftext}"
-                        if player_name.lower() not in post_text.lower():
-                            continue
+        def _search(subreddit_name: str, query: str, limit: int) -> List[Any]:
+            subreddit = self.reddit.subreddit(subreddit_name)
+            return list(subreddit.search(query, time_filter="week", limit=limit, sort="relevance"))
+
+        groups: List[List[str]] = []
+        for player in players:
+            if (
+                groups
+                and len(groups[-1]) < group_size
+                and len(_search_query(groups[-1] + [player])) <= MAX_QUERY_LENGTH
+            ):
+                groups[-1].append(player)
+            else:
+                groups.append([player])
+
+        searches = [(info, group) for info in self.subreddits for group in groups]
+        search_results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self.thread_executor,
+                    _search,
+                    info["name"],
+                    _search_query(group),
+                    posts_limit * len(group),
+                )
+                for info, group in searches
+            ),
+            return_exceptions=True,
+        )
 
-                        posts_data.append(
+        # Attribute posts by the names they mention, at most posts_limit per subreddit each
+        threads: Dict[str, Any] = {}
+        attributed: Dict[str, List[Tuple[str, Dict[str, Any]]]] = defaultdict(list)
+        seen: Set[Tuple[str, str]] = set()
+        taken: Counter = Counter()
+        searched: Dict[str, Set[str]] = defaultdict(set)
+        for (info, group), posts in zip(searches, search_results):
+            subreddit_name = info["name"]
+            if isinstance(posts, Exception):
+                error_msg = f"Error searching r/{subreddit_name}: {str(posts)}"
+                logger.debug(error_msg)
+                for player in group:
+                    reddit_data[player]["stats"]["errors"].append(error_msg)
+                continue
+            for player in group:
+                reddit_data[player]["stats"]["api_calls_made"] += 1
+                searched[player].add(subreddit_name)
+
+            for post in posts:
+                # Check if post is within time window
+                if post.created_utc < cutoff:
+                    continue
+
+                # Filter for relevance
+                post_text = f"{post.title} {post.selftext}"
+                mentions = name_index.scan(post_text)
+                for player in players:
+                    if not mentions[player] or (player, post.id) in seen:
+                        continue
+                    if taken[player, subreddit_name] >= posts_limit:
+                        continue
+                    seen.add((player, post.id))
+                    taken[player, subreddit_name] += 1
+                    threads[post.id] = post
+                    attributed[post.id].append(
+                        (
+                            player,
                             {
                                 "text": post_text,
                                 "score": post.score,
                                 "num_comments": post.num_comments,
                                 "created_utc": post.created_utc,
                                 "subreddit": subreddit_name,
-                                "weight": subreddit_weight,
+                                "weight": info["weight"],
                                 "url": post.url,
-                            }
+                            },
                         )
+                    )
 
-                        stats["posts_analyzed"] += 1
-
-                        # Analyze comments
-                        try:
-                            post.comments.replace_more(limit=0)
-                            comment_count = 0
-
-                            for comment in post.comments.list()[:10]:  # Top 10 comments
-                                if comment_count >= 10:  # Limit comments per post
-                                    break
-
-                                if player_name.lower() in comment.body.lower():
-                                    comments_data.append(
-                                        {
-                                            "text": comment.body,
-                                            "score": comment.score,
-                                            "created_utc": comment.created_utc,
-                                            "subreddit": subreddit_name,
-                                            "weight": subreddit_weight,
-                                        }
-                                    )
+        comments_by_thread = await self._thread_comments(list(threads.values()))
 
-                                    stats["comments_analyzed"] += 1
-                                    comment_count += 1
+        for post_id, mentions in attributed.items():
+            comments = comments_by_thread[post_id]
+            for player, post_data in mentions:
+                data = reddit_data[player]
+                data["posts"].append(post_data)
+                data["stats"]["posts_analyzed"] += 1
+                data["stats"]["api_calls_made"] += 1
 
-                        except Exception as e:
-                            stats["errors"].append(f"Error processing comments for post: {str(e)}")
+                if isinstance(comments, BaseException):
+                    data["stats"]["errors"].append(
+                        f"Error processing comments for post: {str(comments)}"
+                    )
+                    continue
+                for comment in comments:
+                    if player.lower() in comment["text"].lower():
+                        data["comments"].append(
+                            {
+                                **comment,
+                                "subreddit": post_data["subreddit"],
+                                "weight": post_data["weight"],
+                            }
+                        )
+                        data["stats"]["comments_analyzed"] += 1
 
-                except Exception as e:
-                    error_msg = f"Error searching r/{subreddit_info['name']}: {str(e)}"
-                    stats["errors"].append(error_msg)
-                    logger.debug(error_msg)
+        for player in players:
+            reddit_data[player]["stats"]["subreddits_searched"] = len(searched[player])
+        return reddit_data
 
-            return {"posts": posts_data, "comments": comments_data, "stats": stats}
+    async def _thread_comments(self, posts: List[Any]) -> Dict[str, Any]:
+        """
+        Top comments per thread id, fetched concurrently and cached per thread.
 
-        # Run the synchronous Reddit API calls in a thread
-        try:
-            loop = asyncio.get_event_loop()
-            reddit_data = await loop.run_in_executor(self.thread_executor, _fetch_reddit_data_sync)
-            return reddit_data
+        Threads whose comments could not be fetched map to the exception.
+        """
+        loop = asyncio.get_running_loop()
+        now = time.time()
+        comments: Dict[str, Any] = {}
+        missing = []
+        for post in posts:
+            cached = self._thread_cache.get(post.id)
+            if cached is not None and now - cached[0] < THREAD_CACHE_TTL:
+                self._thread_cache.move_to_end(post.id)
+                comments[post.id] = cached[1]
+            else:
+                missing.append(post)
 
-        except Exception as e:
-            logger.error(f"Error in async Reddit data fetch: {e}")
-            return {
-                "posts": [],
-                "comments": [],
-                "stats": {
-                    "posts_analyzed": 0,
-                    "comments_analyzed": 0,
-                    "subreddits_searched": 0,
-                    "api_calls_made": 0,
-                    "errors": [str(e)],
-                },
-            }
+        fetched = await asyncio.gather(
+            *(loop.run_in_executor(self.thread_executor, _top_comments, post) for post in missing),
+            return_exceptions=True,
+        )
+        for post, result in zip(missing, fetched):
+            comments[post.id] = result
+            if not isinstance(result, BaseException):
+                self._thread_cache[post.id] = (now, result)
+                self._thread_cache.move_to_end(post.id)
+        while len(self._thread_cache) > THREAD_CACHE_SIZE:
+            self._thread_cache.popitem(last=False)
+        return comments
 
     async def _analyze_sentiment_data(
         self, reddit_data: Dict[str, Any], sentiment_model: SentimentModel, player_name: str
@@ -507,16 +960,19 @@ class RedditSentimentAgent:
 
         # Analyze sentiment for each piece of content
         sentiment_breakdown = {"positive": 0, "negative": 0, "neutral": 0}
+        texts = [content["text"] for content in all_content]
+        keyword_hits = self.keyword_matcher.scan_batch(texts)
+        try:
+            # One batch for every text: cached scores plus a single executor job
+            sentiment_scores = await self._score_texts(texts, sentiment_model, keyword_hits)
+        except Exception as e:
+            logger.warning(f"Error calculating sentiment: {e}")
+            sentiment_scores = [0.0] * len(texts)  # Neutral fallback
 
-        for content in all_content:
+        for content, hits, sentiment_score in zip(all_content, keyword_hits, sentiment_scores):
             try:
-                # Calculate sentiment using specified model
-                sentiment_score = await self._calculate_sentiment_async(
-                    content["text"], sentiment_model
-                )
-
                 # Weight sentiment by subreddit importance and content score
-                weight_factor = content["weight"] * max(1, min(content["score"] / 10, 3))
+                weight_factor = content_weight(content["weight"], content["score"])
                 weighted_sentiments.append(sentiment_score * weight_factor)
 
                 # Categorize sentiment
@@ -528,7 +984,7 @@ class RedditSentimentAgent:
                     sentiment_breakdown["neutral"] += 1
 
                 # Check for injury mentions
-                if any(keyword in content["text"].lower() for keyword in self.injury_keywords):
+                if hits["injury"]:
                     injury_mentions += 1
 
             except Exception as e:
@@ -536,125 +992,96 @@ class RedditSentimentAgent:
                 continue
 
         # Calculate overall metrics
-        if weighted_sentiments:
-            overall_sentiment = sum(weighted_sentiments) / len(weighted_sentiments)
-
-            # Calculate hype score
-            total_mentions = len(all_content)
-            positive_ratio = sentiment_breakdown["positive"] / len(weighted_sentiments)
-            hype_score = (overall_sentiment + 1) / 2 * min(total_mentions / 20, 1.0)
-
-            # Determine consensus
-            if positive_ratio > 0.6 and overall_sentiment > 0.2:
-                consensus = "START"
-                confidence = min(95, positive_ratio * 100)
-            elif positive_ratio < 0.3 or overall_sentiment < -0.2:
-                consensus = "SIT"
-                confidence = min(95, (1 - positive_ratio) * 100)
-            else:
-                consensus = "MIXED"
-                confidence = abs(overall_sentiment) * 50
-        else:
-            overall_sentiment = 0.0
-            hype_score = 0.0
-            consensus = None
-            confidence = 0.0
+        summary = summarize_sentiment(
+            sum(weighted_sentiments), len(weighted_sentiments), sentiment_breakdown["positive"]
+        )
 
         # Sort top comments by score
         top_comments.sort(key=lambda x: x["score"], reverse=True)
 
         return {
-            "overall_sentiment": overall_sentiment,
+            **summary,
             "sentiment_breakdown": sentiment_breakdown,
             "injury_mentions": injury_mentions,
-            "hype_score": hype_score,
             "top_comments": top_comments[:5],
-            "consensus": consensus,
-            "confidence": confidence,
         }
 
-    async def _calculate_sentiment_async(self, text: str, model: SentimentModel) -> float:
-        """Calculate sentiment score asynchronously."""
-
-        # Check cache first
-        text_hash = hash(text)
-        if text_hash in self.sentiment_cache:
-            return self.sentiment_cache[text_hash]
-
+    async def _calculate_sentiment_async(
+        self, text: str, model: SentimentModel, hits: Optional[Dict[str, float]] = None
+    ) -> float:
+        """Calculate sentiment score asynchronously (``hits``: the text's keyword scan, if done)."""
         try:
-            if model == SentimentModel.TEXTBLOB and TEXTBLOB_AVAILABLE:
-                sentiment = await self._textblob_sentiment(text)
-            elif model == SentimentModel.KEYWORD_BASED:
-                sentiment = self._keyword_sentiment(text)
-            elif model == SentimentModel.HYBRID:
-                # Combine multiple approaches
-                textblob_score = await self._textblob_sentiment(text) if TEXTBLOB_AVAILABLE else 0.0
-                keyword_score = self._keyword_sentiment(text)
-                sentiment = (textblob_score * 0.6) + (keyword_score * 0.4)
-            else:
-                # Fallback to keyword-based
-                sentiment = self._keyword_sentiment(text)
-
-            # Cache result
-            self.sentiment_cache[text_hash] = sentiment
-            return sentiment
-
+            scores = await self._score_texts([text], model, [hits] if hits is not None else None)
+            return scores[0]
         except Exception as e:
             logger.warning(f"Error calculating sentiment: {e}")
             return 0.0  # Neutral fallback
 
-    async def _textblob_sentiment(self, text: str) -> float:
-        """Calculate sentiment using TextBlob."""
-        try:
-            # Clean text
-            cleaned_text = self._clean_text(text)
-
-            # Run TextBlob in thread to avoid blocking
-            def _get_textblob_sentiment():
-                blob = TextBlob(cleaned_text)
-                return blob.sentiment.polarity
-
-            loop = asyncio.get_event_loop()
-            sentiment = await loop.run_in_executor(self.thread_executor, _get_textblob_sentiment)
+    async def _score_texts(
+        self,
+        texts: List[str],
+        model: SentimentModel,
+        keyword_hits: Optional[List[Dict[str, float]]] = None,
+    ) -> List[float]:
+        """
+        Sentiment scores for many texts at once.
 
-            return sentiment
+        Cached scores are looked up in one query; the rest are scored with a
+        single TextBlob executor job (for the TextBlob and hybrid models) and
+        written back to the cache.
+        """
+        use_textblob = TEXTBLOB_AVAILABLE and model in (
+            SentimentModel.TEXTBLOB,
+            SentimentModel.HYBRID,
+        )
+        scorer = f"{model.value}:{int(use_textblob)}:{self._scoring_version}"
+        digests = [SentimentCache.digest(text, scorer) for text in texts]
+        # The cache is SQLite: keep its reads and writes off the event loop
+        loop = asyncio.get_running_loop()
+        scores = await loop.run_in_executor(
+            self.thread_executor, self.sentiment_cache.get_many, digests
+        )
 
-        except Exception as e:
-            logger.warning(f"TextBlob sentiment analysis failed: {e}")
-            return 0.0
+        pending = {}  # digest -> index of the first text with it
+        for index, digest in enumerate(digests):
+            if digest not in scores:
+                pending.setdefault(digest, index)
+        if pending:
+            indexes = list(pending.values())
+            if keyword_hits is None:
+                keyword_hits = [None] * len(texts)
+            polarities = [0.0] * len(indexes)
+            if use_textblob:
+                cleaned = [self._clean_text(texts[index]) for index in indexes]
+                polarities = await loop.run_in_executor(
+                    self.thread_executor, _textblob_polarities, cleaned
+                )
 
-    def _keyword_sentiment(self, text: str) -> float:
-        """Calculate sentiment using keyword analysis."""
-        text_lower = text.lower()
-
-        positive_score = 0
-        negative_score = 0
-
-        # Count positive keywords with weights
-        for keyword in self.positive_keywords:
-            if keyword in text_lower:
-                # Weight by keyword strength
-                if keyword in ["must start", "smash play", "league winner", "elite"]:
-                    positive_score += 0.3
-                elif keyword in ["start", "stud", "locked in"]:
-                    positive_score += 0.2
+            fresh = {}
+            for digest, index, polarity in zip(pending, indexes, polarities):
+                if model == SentimentModel.TEXTBLOB and use_textblob:
+                    score = polarity
                 else:
-                    positive_score += 0.1
-
-        # Count negative keywords with weights
-        for keyword in self.negative_keywords:
-            if keyword in text_lower:
-                if keyword in ["avoid", "bust", "sit"]:
-                    negative_score += 0.3
-                elif keyword in ["bench", "fade", "risky"]:
-                    negative_score += 0.2
-                else:
-                    negative_score += 0.1
-
-        # Calculate final score
-        net_score = positive_score - negative_score
+                    keyword_score = self._keyword_sentiment(texts[index], keyword_hits[index])
+                    if model == SentimentModel.HYBRID:
+                        # Combine multiple approaches
+                        score = (polarity * 0.6) + (keyword_score * 0.4)
+                    else:
+                        # Keyword-based, also the fallback without TextBlob
+                        score = keyword_score
+                fresh[digest] = score
+            await loop.run_in_executor(self.thread_executor, self.sentiment_cache.put_many, fresh)
+            scores.update(fresh)
+
+        return [scores[digest] for digest in digests]
+
+    def _keyword_sentiment(self, text: str, hits: Optional[Dict[str, float]] = None) -> float:
+        """Calculate sentiment using keyword analysis."""
+        if hits is None:
+            hits = self.keyword_matcher.scan(text)
 
-        # Normalize to [-1, 1] range
+        # Net weighted keyword score, normalized to [-1, 1]
+        net_score = hits["positive"] - hits["negative"]
         return max(-1.0, min(1.0, net_score))
 
     def _clean_text(self, text: str) -> str:
@@ -749,58 +1176,13 @@ class RedditSentimentAgent:
         logger.info(f"Comparing Reddit sentiment for {len(players)} players")
 
         try:
-            # Analyze all players in parallel with timeout
-            tasks = [self.analyze_player_sentiment(player, time_window_hours) for player in players]
-
-            # Use timeout to prevent hanging
+            # Analyze all players from shared searches, with timeout
             timeout_seconds = min(60, time_window_hours * 2)  # Reasonable timeout
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=True), timeout=timeout_seconds
+            analysis = await asyncio.wait_for(
+                self.analyze_players_sentiment(players, time_window_hours),
+                timeout=timeout_seconds,
             )
-
-            # Process results and handle any exceptions
-            analysis = {}
-            successful_results = []
-
-            for i, result in enumerate(results):
-                player = players[i]
-                if isinstance(result, Exception):
-                    logger.error(f"Error analyzing {player}: {result}")
-                    # Create error result
-                    error_result = RedditAnalysisResult(
-                        player=player, status="error", errors=[f"Analysis failed: {str(result)}"]
-                    )
-                    analysis[player] = error_result
-                else:
-                    analysis[player] = result
-                    if result.status in ["success", "partial"]:
-                        successful_results.append((player, result))
-
-            # Create comparison summary
-            comparison = {
-                "players": players,
-                "analysis": analysis,
-                "recommendation": None,
-                "confidence": 0.0,
-                "timestamp": datetime.now().isoformat(),
-                "successful_analyses": len(successful_results),
-                "total_players": len(players),
-            }
-
-            # Generate recommendation if we have successful results
-            if successful_results:
-                comparison["recommendation"] = self._generate_comparison_recommendation(
-                    successful_results
-                )
-                comparison["confidence"] = self._calculate_comparison_confidence(successful_results)
-            else:
-                comparison["recommendation"] = {
-                    "start": None,
-                    "sit": players,
-                    "reasoning": "Unable to analyze any players - Reddit data unavailable",
-                }
-
-            return comparison
+            return self.summarize_comparison(players, analysis)
 
         except asyncio.TimeoutError:
             logger.error(f"Timeout comparing players sentiment (>{timeout_seconds}s)")
@@ -840,6 +1222,42 @@ class RedditSentimentAgent:
                 "error": str(e),
             }
 
+    def summarize_comparison(
+        self, players: List[str], analysis: Dict[str, RedditAnalysisResult]
+    ) -> Dict[str, Any]:
+        """Comparison summary and recommendation from per-player analysis results."""
+        successful_results = [
+            (player, result)
+            for player, result in analysis.items()
+            if result.status in ["success", "partial"]
+        ]
+
+        # Create comparison summary
+        comparison = {
+            "players": players,
+            "analysis": analysis,
+            "recommendation": None,
+            "confidence": 0.0,
+            "timestamp": datetime.now().isoformat(),
+            "successful_analyses": len(successful_results),
+            "total_players": len(players),
+        }
+
+        # Generate recommendation if we have successful results
+        if successful_results:
+            comparison["recommendation"] = self._generate_comparison_recommendation(
+                successful_results
+            )
+            comparison["confidence"] = self._calculate_comparison_confidence(successful_results)
+        else:
+            comparison["recommendation"] = {
+                "start": None,
+                "sit": players,
+                "reasoning": "Unable to analyze any players - Reddit data unavailable",
+            }
+
+        return comparison
+
     def _generate_comparison_recommendation(
         self, successful_results: List[Tuple[str, RedditAnalysisResult]]
     ) -> Dict[str, Any]:
@@ -974,9 +1392,6 @@ class RedditSentimentAgent:
             if self.thread_executor:
                 self.thread_executor.shutdown(wait=True)
 
-            # Clear cache
-            self.sentiment_cache.clear()
-
             logger.info("Reddit sentiment agent cleaned up")
 
         except Exception as e:
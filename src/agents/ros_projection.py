@@ -0,0 +1,146 @@
+"""
+Batch rest-of-season projection engine.
+
+Rest-of-season (ROS) projections used to be built one matchup at a time per
+player, recomputing the matchup difficulty for every model inside the loop.
+Here the whole pool is projected at once: remaining schedules become a
+players x weeks grid of matchup multipliers (difficulty looked up once per
+defense, position and week), each player's model ensemble collapses to a
+single base projection, and weekly projections, totals, variances and
+confidence intervals are computed as array operations over the grid.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.stats import norm
+
+from ..models.matchup import Matchup
+from ..models.player import Player
+
+# Neutral matchup on the 0-10 difficulty scale; each point away from it moves
+# the projection by DIFFICULTY_SCALE
+NEUTRAL_DIFFICULTY = 5.0
+DIFFICULTY_SCALE = 0.1
+
+# Variance used when a player has no remaining games / no model error estimate
+EMPTY_SCHEDULE_VARIANCE = 100.0
+DEFAULT_MODEL_VARIANCE = 25.0
+MIN_VARIANCE = 1.0
+
+DifficultyKey = Tuple[str, str, int]
+
+
+def _team_code(team) -> str:
+    return str(getattr(team, "value", team))
+
+
+def difficulty_key(player: Player, matchup: Matchup) -> DifficultyKey:
+    """(defense, position, week) the player faces in ``matchup``."""
+    team = _team_code(player.team)
+    home = _team_code(matchup.home_team)
+    defense = _team_code(matchup.away_team) if team == home else home
+    return defense, _team_code(player.position), matchup.week
+
+
+@dataclass
+class ScheduleGrid:
+    """Remaining schedules as a players x weeks matrix of matchup difficulty."""
+
+    player_ids: List[str]
+    difficulty: np.ndarray  # (players, weeks), NEUTRAL_DIFFICULTY where no game
+    mask: np.ndarray  # (players, weeks), True where the player has a game
+
+    @classmethod
+    def build(
+        cls,
+        players: Sequence[Player],
+        schedules: Dict[str, List[Matchup]],
+        difficulty_fn: Callable[[Player, Matchup], float],
+        cache: Optional[Dict[DifficultyKey, float]] = None,
+    ) -> "ScheduleGrid":
+        """
+        Lay out each player's remaining games left-aligned in one matrix.
+
+        ``difficulty_fn`` is evaluated once per (defense, position, week); pass
+        ``cache`` to share those values across calls.
+        """
+        cache = {} if cache is None else cache
+        width = max((len(schedules.get(player.id, [])) for player in players), default=0)
+        difficulty = np.full((len(players), width), NEUTRAL_DIFFICULTY)
+        mask = np.zeros((len(players), width), dtype=bool)
+
+        for row, player in enumerate(players):
+            for col, matchup in enumerate(schedules.get(player.id, [])):
+                key = difficulty_key(player, matchup)
+                value = cache.get(key)
+                if value is None:
+                    value = cache[key] = difficulty_fn(player, matchup)
+                difficulty[row, col] = value
+                mask[row, col] = True
+
+        return cls([player.id for player in players], difficulty, mask)
+
+
+@dataclass
+class RosProjections:
+    """Vectorized ROS projections, one entry per player in grid order."""
+
+    weekly: np.ndarray  # (players, weeks), 0 where no game
+    total: np.ndarray
+    variance: np.ndarray
+    standard_error: np.ndarray
+    lower_bound: np.ndarray
+    upper_bound: np.ndarray
+    confidence_level: float
+
+
+def project_rest_of_season(
+    grid: ScheduleGrid,
+    base_projection: np.ndarray,
+    matchup_adjusted: np.ndarray,
+    model_variance: np.ndarray,
+    confidence_level: float = 0.95,
+) -> RosProjections:
+    """
+    Project every player's remaining games at once.
+
+    Args:
+        grid: Remaining schedule grid
+        base_projection: Per-player points per game before matchup adjustment
+        matchup_adjusted: Per-player flag; players without fitted models keep
+            their plain average, as the per-game projection always did
+        model_variance: Per-player model error variance (mean RMSE squared)
+        confidence_level: Two-sided confidence level for the interval
+
+    Returns:
+        RosProjections with weekly points, totals, variances and intervals
+    """
+    multiplier = 1.0 - (grid.difficulty - NEUTRAL_DIFFICULTY) * DIFFICULTY_SCALE
+    multiplier = np.where(matchup_adjusted[:, None], multiplier, 1.0)
+    weekly = np.maximum(0.0, base_projection[:, None] * multiplier)
+    weekly = np.where(grid.mask, weekly, 0.0)
+
+    games = grid.mask.sum(axis=1)
+    total = weekly.sum(axis=1)
+
+    # Population variance of the weekly projections over each player's own games
+    safe_games = np.maximum(games, 1)
+    mean = total / safe_games
+    spread = np.where(grid.mask, (weekly - mean[:, None]) ** 2, 0.0).sum(axis=1) / safe_games
+    variance = np.where(
+        games > 0, np.maximum(MIN_VARIANCE, spread + model_variance), EMPTY_SCHEDULE_VARIANCE
+    )
+
+    standard_error = np.sqrt(variance)
+    margin = norm.ppf((1 + confidence_level) / 2) * standard_error
+    return RosProjections(
+        weekly=weekly,
+        total=total,
+        variance=variance,
+        standard_error=standard_error,
+        lower_bound=np.maximum(0.0, total - margin),
+        upper_bound=total + margin,
+        confidence_level=confidence_level,
+    )
@@ -6,18 +6,19 @@ including performance projections, trend analysis, and advanced metrics calculat
 """
 
 import asyncio
+import copy
 import statistics
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple, Union, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import warnings
 
 import numpy as np
 import pandas as pd
 from scipy import stats
-from scipy.stats import norm, pearsonr, spearmanr
+from scipy.stats import pearsonr, spearmanr
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from sklearn.linear_model import LinearRegression, Ridge, Lasso, ElasticNet
 from sklearn.metrics import mean_squared_error, r2_score
@@ -30,6 +31,14 @@ from loguru import logger
 
 from ..models.player import Player, PlayerStats, PlayerProjections, Position, Team
 from ..models.matchup import Matchup, GameEnvironment, WeatherCondition
+from .game_log_store import GameLogStore
+from .model_registry import ModelRegistry
+from .ros_projection import (
+    DEFAULT_MODEL_VARIANCE,
+    ScheduleGrid,
+    project_rest_of_season,
+)
+from .worker_pool import WorkerPool, shared_worker_pool
 
 
 @dataclass
@@ -92,6 +101,7 @@ class ProjectionRange:
     confidence_level: float
     standard_error: float
     variance: float
+    weekly_projections: List[float] = field(default_factory=list)
 
 
 @dataclass
@@ -122,6 +132,172 @@ class WaiverAnalysis:
     confidence: float
 
 
+# Model fitting runs in worker processes. These functions live at module level so
+# they can be pickled; arguments and results travel as NumPy arrays and fitted
+# estimators.
+
+# Bump when the feature set, model configuration or registry entry layout changes so
+# stale fits are not reused
+MODEL_SCHEMA_VERSION = 2
+
+# Trees added per warm-started refit, and the size at which ensembles are rebuilt
+WARM_START_TREES = 25
+MAX_WARM_START_TREES = 300
+
+
+def fit_regression_models(
+    X: np.ndarray,
+    y: np.ndarray,
+    include_trees: bool = True,
+    previous: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Fit the linear (and optionally tree-based) projection models.
+
+    Args:
+        X: Feature matrix, one row per game
+        y: Fantasy points per game
+        include_trees: Also fit the 100-tree RandomForest and GradientBoosting models
+        previous: Estimators fitted on a prefix of these rows; tree ensembles are
+            warm-started from them instead of rebuilt
+
+    Returns:
+        Fitted estimators keyed by model name
+    """
+    estimators: Dict[str, Any] = {
+        "linear": LinearRegression(),
+        "ridge": Ridge(alpha=1.0),
+        "elastic_net": ElasticNet(alpha=1.0, l1_ratio=0.5),
+    }
+    if include_trees:
+        estimators["random_forest"] = RandomForestRegressor(n_estimators=100, random_state=42)
+        estimators["gradient_boosting"] = GradientBoostingRegressor(
+            n_estimators=100, random_state=42
+        )
+
+        for name in ("random_forest", "gradient_boosting"):
+            prior = (previous or {}).get(name)
+            if prior is None or prior.n_estimators >= MAX_WARM_START_TREES:
+                continue
+            # Keep the existing trees/stages and only grow new ones on the new rows
+            warm = copy.deepcopy(prior)
+            warm.set_params(warm_start=True, n_estimators=prior.n_estimators + WARM_START_TREES)
+            estimators[name] = warm
+
+    fitted = {}
+    for name, estimator in estimators.items():
+        try:
+            fitted[name] = estimator.fit(X, y)
+        except Exception as e:
+            logger.error(f"Error fitting {name} model: {str(e)}")
+    return fitted
+
+
+def fit_time_series_model(
+    y: np.ndarray,
+    order: Optional[Tuple[int, int, int]] = None,
+    start_params: Optional[np.ndarray] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Fit an ARIMA model, grid-searching orders by AIC unless ``order`` is given.
+
+    Args:
+        y: Fantasy points per game
+        order: Order from an earlier fit; skips the grid search
+        start_params: Parameters from an earlier fit, used as the optimizer start
+
+    Returns:
+        Dict with the chosen ``order``, fitted ``params`` and ``results``
+        (RegressionResults), or None when no model could be fitted
+    """
+    if len(y) < 8:  # Need sufficient data for ARIMA
+        return None
+
+    try:
+        # Find best ARIMA parameters (simplified)
+        best_aic = float("inf")
+        best_model = None
+        best_order = None
+
+        if order is not None:
+            candidates = [tuple(order)]
+        else:
+            candidates = [(p, d, q) for p in range(3) for d in range(2) for q in range(3)]
+
+        for candidate in candidates:
+            try:
+                model = ARIMA(y, order=candidate)
+                if start_params is not None and len(start_params) == len(model.start_params):
+                    fitted_model = model.fit(start_params=start_params)
+                else:
+                    fitted_model = model.fit()
+                if fitted_model.aic < best_aic:
+                    best_aic = fitted_model.aic
+                    best_model = fitted_model
+                    best_order = candidate
+            except:
+                continue
+
+        if best_model is None and order is not None:
+            # Warm start failed; fall back to the full search
+            return fit_time_series_model(y)
+
+        if best_model is not None:
+            best_pred = best_model.fittedvalues
+            return {
+                "order": best_order,
+                "params": np.asarray(best_model.params),
+                "results": RegressionResults(
+                    model_type="arima",
+                    r2_score=r2_score(y, best_pred),
+                    mse=mean_squared_error(y, best_pred),
+                    rmse=np.sqrt(mean_squared_error(y, best_pred)),
+                    predictions=best_pred,
+                ),
+            }
+
+    except Exception as e:
+        logger.error(f"Error fitting ARIMA model: {str(e)}")
+
+    return None
+
+
+MODEL_TYPES = {
+    "linear": "linear_regression",
+    "ridge": "ridge_regression",
+    "elastic_net": "elastic_net",
+    "random_forest": "random_forest",
+    "gradient_boosting": "gradient_boosting",
+}
+
+
+def score_fitted_models(
+    fitted: Dict[str, Any], X: np.ndarray, y: np.ndarray
+) -> Dict[str, RegressionResults]:
+    """Predict with already fitted estimators and summarize the fit on ``X``/``y``."""
+    feature_names = [f"feature_{i}" for i in range(X.shape[1])]
+    results = {}
+    for name, estimator in fitted.items():
+        pred = estimator.predict(X)
+        coefficients = None
+        feature_importance = None
+        if hasattr(estimator, "coef_"):
+            coefficients = dict(zip(feature_names, estimator.coef_))
+        if hasattr(estimator, "feature_importances_"):
+            feature_importance = dict(zip(feature_names, estimator.feature_importances_))
+
+        results[name] = RegressionResults(
+            model_type=MODEL_TYPES.get(name, name),
+            r2_score=r2_score(y, pred),
+            mse=mean_squared_error(y, pred),
+            rmse=np.sqrt(mean_squared_error(y, pred)),
+            coefficients=coefficients,
+            feature_importance=feature_importance,
+            predictions=pred,
+        )
+    return results
+
+
 class StatisticalAnalysisAgent:
     """
     Advanced statistical analysis agent for fantasy football players and teams.
@@ -134,12 +310,21 @@ class StatisticalAnalysisAgent:
     - Confidence intervals and variance analysis
     """
 
-    def __init__(self, max_workers: int = 4):
+    def __init__(
+        self,
+        max_workers: int = 4,
+        model_registry: Optional[ModelRegistry] = None,
+        worker_pool: Optional[WorkerPool] = None,
+    ):
         """Initialize the statistical analysis agent."""
         self.max_workers = max_workers
         self.thread_executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.process_executor = ProcessPoolExecutor(max_workers=max_workers)
-        self.models_cache: Dict[str, Any] = {}
+        # Model fitting runs in the long-lived pool shared with the other agents
+        self.worker_pool = worker_pool or shared_worker_pool()
+        # Fitted models keyed by player/position, feature schema and training data
+        self.model_registry = model_registry or ModelRegistry()
+        # Weekly stats for every analyzed player, converted once and sliced per helper
+        self.game_logs = GameLogStore()
 
         # Suppress sklearn warnings
         warnings.filterwarnings("ignore", category=FutureWarning)
@@ -152,6 +337,7 @@ class StatisticalAnalysisAgent:
         historical_games: List[PlayerStats],
         upcoming_matchups: List[Matchup],
         league_context: Optional[Dict[str, Any]] = None,
+        pooled_models: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Comprehensive statistical analysis of a player.
@@ -161,6 +347,7 @@ class StatisticalAnalysisAgent:
             historical_games: List of historical game stats
             upcoming_matchups: Future matchups
             league_context: Additional league context data
+            pooled_models: Estimators already fitted for the player's position
 
         Returns:
             Dictionary containing comprehensive analysis results
@@ -171,8 +358,8 @@ class StatisticalAnalysisAgent:
             # Run analysis components in parallel
             tasks = [
                 self._calculate_advanced_metrics(player, historical_games),
-                self._analyze_performance_trends(historical_games),
-                self._generate_projection_models(player, historical_games),
+                self._analyze_performance_trends(player, historical_games),
+                self._generate_projection_models(player, historical_games, pooled_models),
                 self._analyze_matchup_difficulty(player, upcoming_matchups),
                 self._calculate_situational_splits(player, historical_games),
             ]
@@ -252,6 +439,9 @@ class StatisticalAnalysisAgent:
             # Strength of schedule analysis
             sos_analysis = await self._analyze_strength_of_schedule(team, upcoming_matchups)
 
+            # Fantasy production of the team's players in the game-log store
+            fantasy_production = self._team_fantasy_production(team)
+
             return {
                 "team": team.value,
                 "analysis_timestamp": datetime.utcnow().isoformat(),
@@ -261,6 +451,7 @@ class StatisticalAnalysisAgent:
                 "scoring_trend": scoring_trend,
                 "defensive_trend": defensive_trend,
                 "strength_of_schedule": sos_analysis,
+                "fantasy_production": fantasy_production,
                 "upcoming_matchups": len(upcoming_matchups),
             }
 
@@ -285,42 +476,53 @@ class StatisticalAnalysisAgent:
         logger.info(f"Generating ROS projection for {player.name}")
 
         try:
-            # Generate multiple projection models
-            projection_models = await self._generate_projection_models(player, historical_games)
-
-            # Calculate game-by-game projections
-            game_projections = []
-            for matchup in remaining_schedule:
-                game_proj = await self._project_single_game(
-                    player, historical_games, matchup, projection_models
-                )
-                game_projections.append(game_proj)
-
-            # Aggregate to season total
-            total_projection = sum(game_projections)
-
-            # Calculate variance and confidence intervals
-            variance = self._calculate_projection_variance(game_projections, projection_models)
-            std_error = np.sqrt(variance)
-
-            # 95% confidence interval
-            confidence_level = 0.95
-            z_score = norm.ppf((1 + confidence_level) / 2)
-            margin_error = z_score * std_error
-
-            return ProjectionRange(
-                projected_value=total_projection,
-                lower_bound=max(0, total_projection - margin_error),
-                upper_bound=total_projection + margin_error,
-                confidence_level=confidence_level,
-                standard_error=std_error,
-                variance=variance,
+            projections = await self.get_ros_projections(
+                [player], {player.id: historical_games}, {player.id: remaining_schedule}
             )
+            return projections[player.id]
 
         except Exception as e:
             logger.error(f"Error generating ROS projection for {player.name}: {str(e)}")
             raise
 
+    async def get_ros_projections(
+        self,
+        players: List[Player],
+        historical_data: Dict[str, List[PlayerStats]],
+        remaining_schedules: Dict[str, List[Matchup]],
+        position_models: Optional[Dict[Position, Dict[str, Any]]] = None,
+    ) -> Dict[str, ProjectionRange]:
+        """
+        Generate rest-of-season projections for a whole player pool at once.
+
+        Args:
+            players: Players to project
+            historical_data: Historical stats by player ID
+            remaining_schedules: Remaining games by player ID
+            position_models: Estimators already fitted per position (optional)
+
+        Returns:
+            ProjectionRange by player ID
+        """
+        position_models = position_models or {}
+        self._sync_game_logs(players, historical_data)
+        model_sets = await asyncio.gather(
+            *[
+                self._generate_projection_models(
+                    player,
+                    historical_data.get(player.id, []),
+                    position_models.get(player.position),
+                )
+                for player in players
+            ]
+        )
+        return self._project_ros(
+            players,
+            historical_data,
+            remaining_schedules,
+            {player.id: models for player, models in zip(players, model_sets)},
+        )
+
     async def analyze_waiver_value(
         self,
         players: List[Player],
@@ -343,21 +545,22 @@ class StatisticalAnalysisAgent:
         logger.info(f"Analyzing waiver value for {len(players)} players")
 
         try:
-            # Analyze players in parallel
-            tasks = []
-            for player in players:
-                task = self._analyze_single_waiver_candidate(
+            self._sync_game_logs(players, historical_data)
+            # One pooled fit per position, then a single batch projection for everyone
+            position_models = await self._fit_position_models(players, historical_data)
+            projections = await self.get_ros_projections(
+                players, historical_data, remaining_schedules, position_models
+            )
+
+            waiver_analyses = [
+                self._analyze_single_waiver_candidate(
                     player,
                     historical_data.get(player.id, []),
-                    remaining_schedules.get(player.id, []),
+                    projections[player.id],
                     current_rosters.get(player.id, 0.0),
                 )
-                tasks.append(task)
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Filter out exceptions and sort by value
-            waiver_analyses = [r for r in results if not isinstance(r, Exception)]
+                for player in players
+            ]
             waiver_analyses.sort(key=lambda x: x.projected_ros_value, reverse=True)
 
             return waiver_analyses
@@ -384,24 +587,22 @@ class StatisticalAnalysisAgent:
             List of analysis results
         """
         logger.info(f"Analyzing {len(players)} players in parallel")
-
-        # Create analysis tasks
-        tasks = []
-        for player in players:
-            task = self.analyze_player(
-                player, historical_data.get(player.id, []), upcoming_matchups.get(player.id, [])
+        self._sync_game_logs(players, historical_data)
+
+        # Fit one set of regression models per position up front (in the process
+        # pool); each player then only needs predict calls
+        position_models = await self._fit_position_models(players, historical_data)
+
+        tasks = [
+            self.analyze_player(
+                player,
+                historical_data.get(player.id, []),
+                upcoming_matchups.get(player.id, []),
+                pooled_models=position_models.get(player.position),
             )
-            tasks.append(task)
-
-        # Execute in parallel with controlled concurrency
-        semaphore = asyncio.Semaphore(self.max_workers)
-
-        async def bounded_analysis(task):
-            async with semaphore:
-                return await task
-
-        bounded_tasks = [bounded_analysis(task) for task in tasks]
-        results = await asyncio.gather(*bounded_tasks, return_exceptions=True)
+            for player in players
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Filter successful results
         successful_results = [r for r in results if not isinstance(r, Exception)]
@@ -420,7 +621,7 @@ class StatisticalAnalysisAgent:
 
         try:
             # Convert to DataFrame for easier analysis
-            df = self._stats_to_dataframe(historical_games)
+            df = self._game_log(player, historical_games)
 
             metrics = StatisticalMetrics()
 
@@ -461,15 +662,15 @@ class StatisticalAnalysisAgent:
             return StatisticalMetrics()
 
     async def _analyze_performance_trends(
-        self, historical_games: List[PlayerStats]
+        self, player: Player, historical_games: List[PlayerStats]
     ) -> Optional[TrendAnalysis]:
         """Analyze performance trends using time series analysis."""
         if len(historical_games) < 4:
             return None
 
         try:
-            df = self._stats_to_dataframe(historical_games)
-            fantasy_points = df["fantasy_points"].fillna(0)
+            df = self._game_log(player, historical_games)
+            fantasy_points = df["fantasy_points"].fillna(0).reset_index(drop=True)
 
             if len(fantasy_points) < 4:
                 return None
@@ -524,9 +725,17 @@ class StatisticalAnalysisAgent:
             return None
 
     async def _generate_projection_models(
-        self, player: Player, historical_games: List[PlayerStats]
+        self,
+        player: Player,
+        historical_games: List[PlayerStats],
+        pooled_models: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, RegressionResults]:
-        """Generate multiple projection models for ensemble predictions."""
+        """
+        Generate multiple projection models for ensemble predictions.
+
+        When ``pooled_models`` (estimators already fitted for the player's position)
+        are given, only a predict call is made for this player.
+        """
         if len(historical_games) < 3:
             return {}
 
@@ -539,15 +748,16 @@ class StatisticalAnalysisAgent:
 
             models = {}
 
-            # Linear regression models
-            models.update(await self._fit_linear_models(X, y))
-
-            # Tree-based models
-            if len(X) >= 5:  # Need more data for complex models
-                models.update(await self._fit_tree_models(X, y))
+            scope = f"player:{player.id}"
+            if pooled_models:
+                models.update(score_fitted_models(pooled_models, X, y))
+            else:
+                # Tree-based models need more data
+                fitted = await self._get_or_fit_regression(scope, X, y, len(X) >= 5)
+                models.update(score_fitted_models(fitted, X, y))
 
             # Time series models
-            ts_model = await self._fit_time_series_model(y)
+            ts_model = await self._fit_time_series_model(y, scope)
             if ts_model:
                 models["arima"] = ts_model
 
@@ -598,7 +808,7 @@ class StatisticalAnalysisAgent:
             return {}
 
         try:
-            df = self._stats_to_dataframe(historical_games)
+            df = self._game_log(player, historical_games)
             splits = {}
 
             # Home vs Away (would need additional data)
@@ -621,10 +831,12 @@ class StatisticalAnalysisAgent:
             # Recent performance (last 3, 5, 10 games)
             fantasy_points = df["fantasy_points"].dropna()
             if len(fantasy_points) > 0:
+                # L3/L5/EWMA windows are maintained by the game-log store
                 splits["recent_performance"] = {
-                    "last_3_avg": fantasy_points.tail(3).mean(),
-                    "last_5_avg": fantasy_points.tail(5).mean(),
+                    "last_3_avg": df["fp_l3"].iloc[-1],
+                    "last_5_avg": df["fp_l5"].iloc[-1],
                     "last_10_avg": fantasy_points.tail(10).mean(),
+                    "ewma": df["fp_ewma"].iloc[-1],
                     "season_avg": fantasy_points.mean(),
                 }
 
@@ -646,18 +858,12 @@ class StatisticalAnalysisAgent:
             if not projection_models:
                 return {"error": "No projection models available"}
 
-            # Get base projection
-            ros_projection = await self.get_ros_projection(
-                player, historical_games, upcoming_matchups
-            )
-
-            # Calculate additional metrics
-            weekly_projections = []
-            for matchup in upcoming_matchups:
-                weekly_proj = await self._project_single_game(
-                    player, historical_games, matchup, projection_models
-                )
-                weekly_projections.append(weekly_proj)
+            ros_projection = self._project_ros(
+                [player],
+                {player.id: historical_games},
+                {player.id: upcoming_matchups},
+                {player.id: projection_models},
+            )[player.id]
 
             return {
                 "total_projection": ros_projection.projected_value,
@@ -666,7 +872,7 @@ class StatisticalAnalysisAgent:
                     "upper": ros_projection.upper_bound,
                     "confidence_level": ros_projection.confidence_level,
                 },
-                "weekly_projections": weekly_projections,
+                "weekly_projections": ros_projection.weekly_projections,
                 "variance": ros_projection.variance,
                 "standard_error": ros_projection.standard_error,
                 "games_remaining": len(upcoming_matchups),
@@ -678,13 +884,18 @@ class StatisticalAnalysisAgent:
 
     # Additional helper methods for statistical calculations
 
-    def _stats_to_dataframe(self, stats_list: List[PlayerStats]) -> pd.DataFrame:
-        """Convert list of PlayerStats to DataFrame."""
-        data = []
-        for stat in stats_list:
-            stat_dict = stat.dict() if hasattr(stat, "dict") else stat.__dict__
-            data.append(stat_dict)
-        return pd.DataFrame(data)
+    def _game_log(self, player: Player, historical_games: List[PlayerStats]) -> pd.DataFrame:
+        """Player's games as a slice of the shared game-log store (converted once)."""
+        return self.game_logs.games_frame(player.id, historical_games, player.season, player.team)
+
+    def _sync_game_logs(
+        self, players: List[Player], historical_data: Dict[str, List[PlayerStats]]
+    ) -> None:
+        """Buffer a whole pool's games so the store merges them in one batch."""
+        for player in players:
+            self.game_logs.sync(
+                player.id, historical_data.get(player.id, []), player.season, player.team
+            )
 
     def _safe_divide(self, numerator: float, denominator: float) -> Optional[float]:
         """Safely divide two numbers, returning None if denominator is 0."""
@@ -693,9 +904,9 @@ class StatisticalAnalysisAgent:
         return numerator / denominator
 
     def _calculate_target_share(self, df: pd.DataFrame) -> Optional[float]:
-        """Calculate target share (would need team data)."""
-        # Placeholder - would need team total targets
-        return None
+        """Average weekly share of team targets among players in the game-log store."""
+        share = df["target_share"].dropna() if "target_share" in df else pd.Series(dtype=float)
+        return float(share.mean()) if len(share) else None
 
     def _calculate_air_yards_share(self, df: pd.DataFrame) -> Optional[float]:
         """Calculate air yards share (would need air yards data)."""
@@ -741,10 +952,10 @@ class StatisticalAnalysisAgent:
     ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
         """Prepare feature matrix and target for modeling."""
         try:
-            df = self._stats_to_dataframe(historical_games)
+            df = self._game_log(player, historical_games)
 
             # Target variable
-            y = df["fantasy_points"].fillna(0).values
+            y = df["fantasy_points"].fillna(0).astype(float).values
 
             # Feature engineering
             features = []
@@ -787,7 +998,7 @@ class StatisticalAnalysisAgent:
             if not features:
                 return None, None
 
-            X = np.column_stack(features)
+            X = np.column_stack(features).astype(float)
 
             # Remove any rows with NaN values
             mask = ~np.isnan(X).any(axis=1) & ~np.isnan(y)
@@ -800,143 +1011,134 @@ class StatisticalAnalysisAgent:
             logger.error(f"Error preparing modeling data: {str(e)}")
             return None, None
 
-    async def _fit_linear_models(
-        self, X: np.ndarray, y: np.ndarray
-    ) -> Dict[str, RegressionResults]:
-        """Fit various linear regression models."""
-        models = {}
+    async def _run_cpu_bound(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run CPU-heavy work in the worker pool so it never blocks the event loop."""
+        return await self.worker_pool.run(func, *args)
 
-        try:
-            # Standard linear regression
-            lr = LinearRegression()
-            lr.fit(X, y)
-            lr_pred = lr.predict(X)
-
-            models["linear"] = RegressionResults(
-                model_type="linear_regression",
-                r2_score=r2_score(y, lr_pred),
-                mse=mean_squared_error(y, lr_pred),
-                rmse=np.sqrt(mean_squared_error(y, lr_pred)),
-                coefficients=dict(zip([f"feature_{i}" for i in range(X.shape[1])], lr.coef_)),
-                predictions=lr_pred,
-            )
-
-            # Ridge regression
-            ridge = Ridge(alpha=1.0)
-            ridge.fit(X, y)
-            ridge_pred = ridge.predict(X)
-
-            models["ridge"] = RegressionResults(
-                model_type="ridge_regression",
-                r2_score=r2_score(y, ridge_pred),
-                mse=mean_squared_error(y, ridge_pred),
-                rmse=np.sqrt(mean_squared_error(y, ridge_pred)),
-                coefficients=dict(zip([f"feature_{i}" for i in range(X.shape[1])], ridge.coef_)),
-                predictions=ridge_pred,
-            )
-
-            # Elastic Net
-            elastic = ElasticNet(alpha=1.0, l1_ratio=0.5)
-            elastic.fit(X, y)
-            elastic_pred = elastic.predict(X)
-
-            models["elastic_net"] = RegressionResults(
-                model_type="elastic_net",
-                r2_score=r2_score(y, elastic_pred),
-                mse=mean_squared_error(y, elastic_pred),
-                rmse=np.sqrt(mean_squared_error(y, elastic_pred)),
-                coefficients=dict(zip([f"feature_{i}" for i in range(X.shape[1])], elastic.coef_)),
-                predictions=elastic_pred,
-            )
-
-        except Exception as e:
-            logger.error(f"Error fitting linear models: {str(e)}")
-
-        return models
-
-    async def _fit_tree_models(self, X: np.ndarray, y: np.ndarray) -> Dict[str, RegressionResults]:
-        """Fit tree-based models."""
-        models = {}
-
-        try:
-            # Random Forest
-            rf = RandomForestRegressor(n_estimators=100, random_state=42)
-            rf.fit(X, y)
-            rf_pred = rf.predict(X)
-
-            feature_importance = dict(
-                zip([f"feature_{i}" for i in range(X.shape[1])], rf.feature_importances_)
-            )
-
-            models["random_forest"] = RegressionResults(
-                model_type="random_forest",
-                r2_score=r2_score(y, rf_pred),
-                mse=mean_squared_error(y, rf_pred),
-                rmse=np.sqrt(mean_squared_error(y, rf_pred)),
-                feature_importance=feature_importance,
-                predictions=rf_pred,
-            )
-
-            # Gradient Boosting
-            gbr = GradientBoostingRegressor(n_estimators=100, random_state=42)
-            gbr.fit(X, y)
-            gbr_pred = gbr.predict(X)
-
-            feature_importance = dict(
-                zip([f"feature_{i}" for i in range(X.shape[1])], gbr.feature_importances_)
-            )
-
-            models["gradient_boosting"] = RegressionResults(
-                model_type="gradient_boosting",
-                r2_score=r2_score(y, gbr_pred),
-                mse=mean_squared_error(y, gbr_pred),
-                rmse=np.sqrt(mean_squared_error(y, gbr_pred)),
-                feature_importance=feature_importance,
-                predictions=gbr_pred,
-            )
+    async def _registry_io(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Model registry reads/writes may hit disk; keep them off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.thread_executor, func, *args)
 
-        except Exception as e:
-            logger.error(f"Error fitting tree models: {str(e)}")
-
-        return models
+    async def _get_or_fit_regression(
+        self, scope: str, X: np.ndarray, y: np.ndarray, include_trees: bool
+    ) -> Dict[str, Any]:
+        """
+        Return registered estimators for this exact data, fitting only on a miss.
 
-    async def _fit_time_series_model(self, y: np.ndarray) -> Optional[RegressionResults]:
-        """Fit ARIMA time series model."""
+        Tree ensembles are warm-started only when the new rows extend the previous
+        fit's training data (new games appended); if earlier rows changed, e.g. a
+        stat correction or a different player pool, the old trees describe data
+        that no longer exists and everything is refit from scratch.
+        """
+        schema = (
+            f"regression/v{MODEL_SCHEMA_VERSION}/{X.shape[1]}f/"
+            f"{'trees' if include_trees else 'linear'}"
+        )
+        fingerprint = ModelRegistry.fingerprint(X, y)
+
+        entry = await self._registry_io(self.model_registry.get, scope, schema, fingerprint)
+        if entry is not None:
+            return entry["models"]
+
+        previous = await self._registry_io(self.model_registry.latest, scope, schema)
+        warm_from = None
+        if previous is not None:
+            rows = previous["rows"]
+            if (
+                len(y) > rows
+                and ModelRegistry.fingerprint(X[:rows], y[:rows]) == previous["fingerprint"]
+            ):
+                warm_from = previous["models"]
+
+        fitted = await self._run_cpu_bound(fit_regression_models, X, y, include_trees, warm_from)
+        entry = {"models": fitted, "rows": len(y), "fingerprint": fingerprint}
+        await self._registry_io(self.model_registry.put, scope, schema, fingerprint, entry)
+        return fitted
+
+    async def _fit_time_series_model(
+        self, y: np.ndarray, scope: Optional[str] = None
+    ) -> Optional[RegressionResults]:
+        """Fit ARIMA time series model, reusing or warm-starting from the registry."""
         if len(y) < 8:  # Need sufficient data for ARIMA
             return None
 
         try:
-            # Find best ARIMA parameters (simplified)
-            best_aic = float("inf")
-            best_model = None
-            best_pred = None
-
-            for p in range(3):
-                for d in range(2):
-                    for q in range(3):
-                        try:
-                            model = ARIMA(y, order=(p, d, q))
-                            fitted_model = model.fit()
-                            if fitted_model.aic < best_aic:
-                                best_aic = fitted_model.aic
-                                best_model = fitted_model
-                                best_pred = fitted_model.fittedvalues
-                        except:
-                            continue
-
-            if best_model is not None:
-                return RegressionResults(
-                    model_type="arima",
-                    r2_score=r2_score(y, best_pred),
-                    mse=mean_squared_error(y, best_pred),
-                    rmse=np.sqrt(mean_squared_error(y, best_pred)),
-                    predictions=best_pred,
+            schema = f"arima/v{MODEL_SCHEMA_VERSION}"
+            fingerprint = ModelRegistry.fingerprint(y)
+            if scope is not None:
+                cached = await self._registry_io(
+                    self.model_registry.get, scope, schema, fingerprint
                 )
+                if cached is not None:
+                    return cached["results"]
+                previous = await self._registry_io(self.model_registry.latest, scope, schema)
+            else:
+                previous = None
+
+            if previous:
+                fit = await self._run_cpu_bound(
+                    fit_time_series_model, y, previous["order"], previous["params"]
+                )
+            else:
+                fit = await self._run_cpu_bound(fit_time_series_model, y)
+            if fit is None:
+                return None
 
+            if scope is not None:
+                await self._registry_io(self.model_registry.put, scope, schema, fingerprint, fit)
+            return fit["results"]
         except Exception as e:
             logger.error(f"Error fitting ARIMA model: {str(e)}")
+            return None
 
-        return None
+    async def _fit_position_models(
+        self,
+        players: List[Player],
+        historical_data: Dict[str, List[PlayerStats]],
+    ) -> Dict[Position, Dict[str, Any]]:
+        """
+        Train one pooled set of regression models per position.
+
+        Players at the same position share a feature set, so their game rows are
+        stacked and each model is fitted once per position instead of once per
+        player. Positions are fitted concurrently in the process pool.
+        """
+        stacked: Dict[Position, Tuple[List[np.ndarray], List[np.ndarray]]] = {}
+        for player in players:
+            games = historical_data.get(player.id, [])
+            if len(games) < 3:
+                continue
+            X, y = self._prepare_modeling_data(player, games)
+            if X is None or y is None or len(X) < 3:
+                continue
+            features, targets = stacked.setdefault(player.position, ([], []))
+            features.append(X)
+            targets.append(y)
+
+        positions = list(stacked)
+        jobs = []
+        for position in positions:
+            features, targets = stacked[position]
+            X = np.vstack(features)
+            y = np.concatenate(targets)
+            scope = f"position:{Position(position).value}"
+            jobs.append(self._get_or_fit_regression(scope, X, y, len(X) >= 5))
+
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+
+        position_models: Dict[Position, Dict[str, Any]] = {}
+        for position, result in zip(positions, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fitting {position} models: {str(result)}")
+                continue
+            position_models[position] = result
+
+        logger.info(
+            f"Fitted pooled models for {len(position_models)} positions "
+            f"covering {sum(len(stacked[p][0]) for p in position_models)} players"
+        )
+        return position_models
 
     def _calculate_matchup_difficulty(self, player: Player, matchup: Matchup) -> float:
         """Calculate matchup difficulty score (0-10 scale)."""
@@ -961,83 +1163,72 @@ class StatisticalAnalysisAgent:
             logger.error(f"Error calculating matchup difficulty: {str(e)}")
             return 5.0
 
-    async def _project_single_game(
-        self,
-        player: Player,
-        historical_games: List[PlayerStats],
-        matchup: Matchup,
-        projection_models: Dict[str, RegressionResults],
-    ) -> float:
-        """Project fantasy points for a single game."""
-        if not projection_models:
-            # Fallback to simple average
-            df = self._stats_to_dataframe(historical_games)
-            return df["fantasy_points"].fillna(0).mean()
-
-        try:
-            # Ensemble prediction from multiple models
-            predictions = []
-
-            # Weight models by their R² score
-            for model_name, model in projection_models.items():
-                if hasattr(model, "predictions") and model.predictions is not None:
-                    # Use the most recent prediction as base
-                    base_pred = model.predictions[-1] if len(model.predictions) > 0 else 10.0
-
-                    # Adjust for matchup difficulty
-                    difficulty_adj = self._calculate_matchup_difficulty(player, matchup)
-                    adjusted_pred = base_pred * (1.0 - (difficulty_adj - 5.0) * 0.1)
-
-                    # Weight by model quality
-                    weight = max(0.1, model.r2_score)
-                    predictions.append((adjusted_pred, weight))
-
-            if predictions:
-                # Weighted average
-                total_weight = sum(weight for _, weight in predictions)
-                weighted_sum = sum(pred * weight for pred, weight in predictions)
-                return max(0.0, weighted_sum / total_weight)
-            else:
-                # Fallback
-                df = self._stats_to_dataframe(historical_games)
-                return df["fantasy_points"].fillna(0).mean()
-
-        except Exception as e:
-            logger.error(f"Error projecting single game: {str(e)}")
-            return 10.0  # Reasonable fallback
-
-    def _calculate_projection_variance(
-        self, game_projections: List[float], projection_models: Dict[str, RegressionResults]
-    ) -> float:
-        """Calculate variance in projections."""
-        if not game_projections:
-            return 100.0  # High default variance
-
-        try:
-            # Base variance from game projections
-            base_variance = np.var(game_projections)
-
-            # Model uncertainty
-            model_rmse_values = [
-                model.rmse
-                for model in projection_models.values()
-                if hasattr(model, "rmse") and model.rmse is not None
-            ]
+    def _ensemble_base(
+        self, projection_models: Dict[str, RegressionResults]
+    ) -> Tuple[Optional[float], float]:
+        """
+        Collapse a model ensemble to one pre-matchup points-per-game value.
 
-            if model_rmse_values:
-                avg_rmse = np.mean(model_rmse_values)
-                model_variance = avg_rmse**2
+        Returns:
+            (R²-weighted mean of each model's latest prediction, or None if no
+            model has predictions; mean squared RMSE as the model variance)
+        """
+        predictions = []
+        for model in projection_models.values():
+            if getattr(model, "predictions", None) is not None:
+                base_pred = model.predictions[-1] if len(model.predictions) > 0 else 10.0
+                predictions.append((base_pred, max(0.1, model.r2_score)))
+
+        base = None
+        if predictions:
+            total_weight = sum(weight for _, weight in predictions)
+            base = sum(pred * weight for pred, weight in predictions) / total_weight
+
+        rmse_values = [
+            model.rmse
+            for model in projection_models.values()
+            if getattr(model, "rmse", None) is not None
+        ]
+        model_variance = np.mean(rmse_values) ** 2 if rmse_values else DEFAULT_MODEL_VARIANCE
+        return base, float(model_variance)
+
+    def _project_ros(
+        self,
+        players: List[Player],
+        historical_data: Dict[str, List[PlayerStats]],
+        remaining_schedules: Dict[str, List[Matchup]],
+        models_by_player: Dict[str, Dict[str, RegressionResults]],
+    ) -> Dict[str, ProjectionRange]:
+        """Project already-modeled players over their remaining schedules in one pass."""
+        base = np.zeros(len(players))
+        matchup_adjusted = np.zeros(len(players), dtype=bool)
+        model_variance = np.full(len(players), DEFAULT_MODEL_VARIANCE)
+
+        for row, player in enumerate(players):
+            ensemble, model_variance[row] = self._ensemble_base(models_by_player.get(player.id, {}))
+            if ensemble is not None:
+                base[row] = ensemble
+                matchup_adjusted[row] = True
             else:
-                model_variance = 25.0  # Default model variance
+                # No usable models: plain average, no matchup adjustment
+                points = self._game_log(player, historical_data.get(player.id, []))
+                base[row] = points["fantasy_points"].fillna(0).mean() if len(points) else 0.0
 
-            # Combine variances
-            total_variance = base_variance + model_variance
+        grid = ScheduleGrid.build(players, remaining_schedules, self._calculate_matchup_difficulty)
+        ros = project_rest_of_season(grid, base, matchup_adjusted, model_variance)
 
-            return max(1.0, total_variance)  # Minimum variance
-
-        except Exception as e:
-            logger.error(f"Error calculating projection variance: {str(e)}")
-            return 100.0
+        return {
+            player.id: ProjectionRange(
+                projected_value=float(ros.total[row]),
+                lower_bound=float(ros.lower_bound[row]),
+                upper_bound=float(ros.upper_bound[row]),
+                confidence_level=ros.confidence_level,
+                standard_error=float(ros.standard_error[row]),
+                variance=float(ros.variance[row]),
+                weekly_projections=ros.weekly[row, grid.mask[row]].tolist(),
+            )
+            for row, player in enumerate(players)
+        }
 
     def _calculate_analysis_confidence(
         self,
@@ -1078,22 +1269,17 @@ class StatisticalAnalysisAgent:
             logger.error(f"Error calculating analysis confidence: {str(e)}")
             return 0.5
 
-    async def _analyze_single_waiver_candidate(
+    def _analyze_single_waiver_candidate(
         self,
         player: Player,
         historical_games: List[PlayerStats],
-        remaining_schedule: List[Matchup],
+        ros_projection: ProjectionRange,
         current_roster_pct: float,
     ) -> WaiverAnalysis:
-        """Analyze a single waiver wire candidate."""
+        """Score a single waiver wire candidate from its batch ROS projection."""
         try:
-            # Generate ROS projection
-            ros_projection = await self.get_ros_projection(
-                player, historical_games, remaining_schedule
-            )
-
             # Calculate opportunity score based on recent trends
-            df = self._stats_to_dataframe(historical_games)
+            df = self._game_log(player, historical_games)
             recent_avg = df["fantasy_points"].tail(3).mean() if len(df) >= 3 else 0
             season_avg = df["fantasy_points"].mean() if len(df) > 0 else 0
 
@@ -1168,6 +1354,20 @@ class StatisticalAnalysisAgent:
             "neutral_script_pace": 65.0,  # Would calculate from situational data
         }
 
+    def _team_fantasy_production(self, team: Team) -> Dict[str, float]:
+        """Weekly fantasy totals for a team from one group-by over the game-log store."""
+        totals = self.game_logs.team_weekly_totals()
+        if totals.empty or team.value not in totals.index.get_level_values("team"):
+            return {}
+
+        weekly = totals.xs(team.value, level="team")
+        return {
+            "weeks": len(weekly),
+            "fantasy_points_per_week": weekly["fantasy_points"].mean(),
+            "targets_per_week": weekly["targets"].mean(),
+            "rushing_attempts_per_week": weekly["rushing_attempts"].mean(),
+        }
+
     def _analyze_scoring_trend(self, df: pd.DataFrame) -> Dict[str, float]:
         """Analyze team scoring trends."""
         points = df.get("points_per_game", pd.Series([0]))
@@ -1250,7 +1450,5 @@ class StatisticalAnalysisAgent:
         try:
             if hasattr(self, "thread_executor"):
                 self.thread_executor.shutdown(wait=False)
-            if hasattr(self, "process_executor"):
-                self.process_executor.shutdown(wait=False)
         except:
             pass
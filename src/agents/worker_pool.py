@@ -0,0 +1,130 @@
+"""
+Long-lived worker pool for CPU-bound agent work.
+
+Model fitting and draft simulation are pure-Python/numpy loops that would
+block the event loop, so they run in a process pool shared by every agent.
+Starting worker processes is expensive, so the pool lives for the whole
+process instead of per call. When a worker dies the executor is broken for
+good; the pool swaps in a fresh one, and where processes cannot be started at
+all (or keep dying) it falls back to threads, which still free the loop.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional
+
+from loguru import logger
+
+# Broken process pools replaced before giving up on processes for good
+MAX_POOL_RESTARTS = 3
+
+
+class WorkerPool:
+    """Process pool that replaces itself when broken, with a thread fallback."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        processes: bool = True,
+        max_restarts: int = MAX_POOL_RESTARTS,
+    ):
+        """
+        Initialize the pool; executors are created on first use.
+
+        Args:
+            max_workers: Worker count (default: one per CPU)
+            processes: False to run everything in threads
+            max_restarts: Broken process pools to replace before using threads only
+        """
+        self.max_workers = max_workers
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self._processes = processes
+        self._process_executor: Optional[ProcessPoolExecutor] = None
+        self._thread_executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def uses_processes(self) -> bool:
+        """Whether work still goes to worker processes."""
+        return self._processes
+
+    def _get_process_executor(self) -> Optional[ProcessPoolExecutor]:
+        with self._lock:
+            if self._processes and self._process_executor is None:
+                try:
+                    self._process_executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                except (OSError, NotImplementedError) as e:
+                    logger.warning(f"Process pool unavailable ({e}); using threads instead")
+                    self._processes = False
+            return self._process_executor
+
+    def _get_thread_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._thread_executor is None:
+                self._thread_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._thread_executor
+
+    def _discard(self, executor: ProcessPoolExecutor, reason: Exception) -> None:
+        """Drop a broken executor so the next call starts a fresh one."""
+        with self._lock:
+            if self._process_executor is not executor:
+                return  # another caller already replaced it
+            self._process_executor = None
+            if isinstance(reason, BrokenProcessPool):
+                self.restarts += 1
+                if self.restarts > self.max_restarts:
+                    self._processes = False
+            else:
+                # Workers cannot be started here (e.g. sandboxes without fork/spawn)
+                self._processes = False
+        executor.shutdown(wait=False, cancel_futures=True)
+        if self._processes:
+            logger.warning(f"Process pool broken ({reason}); starting a new one")
+        else:
+            logger.warning(f"Process pool unavailable ({reason}); using threads from now on")
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run ``func(*args)`` in a worker process, or a thread where processes fail.
+
+        ``func`` and its arguments must be picklable. A call whose worker died
+        is retried once in a thread rather than risking another crash.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_process_executor()
+        if executor is not None:
+            try:
+                future = loop.run_in_executor(executor, func, *args)
+            except (BrokenProcessPool, OSError) as e:
+                self._discard(executor, e)
+            else:
+                try:
+                    return await future
+                except BrokenProcessPool as e:
+                    self._discard(executor, e)
+        return await loop.run_in_executor(self._get_thread_executor(), func, *args)
+
+    def shutdown(self) -> None:
+        """Shut down both executors; later calls start new ones."""
+        with self._lock:
+            executors: List[Optional[Executor]] = [self._process_executor, self._thread_executor]
+            self._process_executor = self._thread_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+
+_shared_pool: Optional[WorkerPool] = None
+_shared_lock = threading.Lock()
+
+
+def shared_worker_pool() -> WorkerPool:
+    """The process-wide pool agents use unless they are given their own."""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = WorkerPool()
+        return _shared_pool
@@ -6,8 +6,9 @@ Yahoo API utilities for rate limiting and caching
 import asyncio
 import time
 import hashlib
+import itertools
 import json
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable
 from functools import wraps
 from collections import deque
 from dataclasses import dataclass
@@ -97,9 +98,17 @@ class CacheEntry:
 class ResponseCache:
     """Simple TTL-based cache for API responses."""
 
-    def __init__(self):
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Args:
+            max_entries: Entry limit; once exceeded, expired entries are purged and
+                then the oldest entries dropped (default: unbounded)
+        """
         self.cache: Dict[str, CacheEntry] = {}
+        self.max_entries = max_entries
         self._lock = asyncio.Lock()
+        # Called with (endpoint, hit) on every lookup; must be cheap and not raise
+        self._access_listeners: List[Callable[[str, bool], None]] = []
 
         # Default TTLs for different endpoint types (in seconds)
         self.default_ttls = {
@@ -138,8 +147,30 @@ class ResponseCache:
             return self.default_ttls["user"]
         return 300  # Default 5 minutes
 
+    def add_access_listener(self, listener: Callable[[str, bool], None]) -> None:
+        """Register a callback invoked with ``(endpoint, hit)`` on every lookup."""
+        if listener not in self._access_listeners:
+            self._access_listeners.append(listener)
+
+    def remove_access_listener(self, listener: Callable[[str, bool], None]) -> None:
+        if listener in self._access_listeners:
+            self._access_listeners.remove(listener)
+
     async def get(self, endpoint: str) -> Optional[Any]:
         """Get cached response if valid."""
+        data = await self._lookup(endpoint)
+        for listener in self._access_listeners:
+            listener(endpoint, data is not None)
+        return data
+
+    def remaining_ttl(self, endpoint: str) -> float:
+        """Seconds until the cached response for ``endpoint`` expires (0 if absent)."""
+        entry = self.cache.get(self._get_cache_key(endpoint))
+        if not isinstance(entry, CacheEntry):
+            return 0.0
+        return max(0.0, entry.ttl - entry.age)
+
+    async def _lookup(self, endpoint: str) -> Optional[Any]:
         cache_key = self._get_cache_key(endpoint)
         async with self._lock:
             entry = self.cache.get(cache_key)
@@ -165,12 +196,41 @@ class ResponseCache:
         cache_key = self._get_cache_key(endpoint)
         ttl_value = ttl if ttl is not None else self._get_ttl_for_endpoint(endpoint)
         async with self._lock:
+            # Re-insert so dict order stays oldest-written first
+            self.cache.pop(cache_key, None)
             self.cache[cache_key] = CacheEntry(
                 data=data,
                 timestamp=time.time(),
                 endpoint=endpoint,
                 ttl=ttl_value,
             )
+            if self.max_entries is not None and len(self.cache) > self.max_entries:
+                self._shrink()
+
+    def _shrink(self) -> None:
+        """Purge expired entries, then drop the oldest down to 90% of ``max_entries``."""
+        # The headroom means a full cache is scanned once per ~10% of writes, not every write
+        self._purge_expired()
+        excess = len(self.cache) - (self.max_entries - self.max_entries // 10)
+        if excess > 0:
+            for key in list(itertools.islice(self.cache, excess)):
+                del self.cache[key]
+
+    def _purge_expired(self) -> int:
+        now = time.time()
+        expired = [
+            key
+            for key, entry in self.cache.items()
+            if isinstance(entry, CacheEntry) and now - entry.timestamp >= entry.ttl
+        ]
+        for key in expired:
+            del self.cache[key]
+        return len(expired)
+
+    async def purge_expired(self) -> int:
+        """Drop expired entries; returns how many were removed."""
+        async with self._lock:
+            return self._purge_expired()
 
     async def clear(self, pattern: Optional[str] = None):
         """Clear cache entries matching pattern or all if no pattern."""
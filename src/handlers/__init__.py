@@ -22,6 +22,7 @@ from .roster_handlers import handle_ff_get_roster
 from .matchup_handlers import (
     handle_ff_build_lineup,
     handle_ff_compare_teams,
+    handle_ff_get_live_scores,
     handle_ff_get_matchup,
 )
 
@@ -126,6 +127,7 @@ __all__ = [
     # Roster handlers (extracted, need dependency injection)
     "handle_ff_get_roster",
     # Matchup handlers (extracted, need dependency injection)
+    "handle_ff_get_live_scores",
     "handle_ff_get_matchup",
     "handle_ff_build_lineup",
     "handle_ff_compare_teams",
@@ -38,6 +38,42 @@ async def handle_ff_get_matchup(arguments: dict) -> dict:
     }
 
 
+async def handle_ff_get_live_scores(arguments: dict) -> dict:
+    """Get the live scoreboard for a league from the shared live scoring snapshot.
+
+    Args:
+        arguments: Dict containing:
+            - league_key: League identifier
+
+    Returns:
+        Dict with every matchup's points, projections and projected final scores
+    """
+    from src.services.live_scoring import live_scores
+
+    league_key = arguments.get("league_key")
+    if not league_key:
+        return {"error": "league_key is required"}
+
+    scoreboard = await live_scores.scoreboard(league_key)
+    team_key = await get_user_team_key(league_key)
+    your_matchup = next(
+        (
+            matchup
+            for matchup in scoreboard["matchups"]
+            if any(team.get("team_key") == team_key for team in matchup["teams"])
+        ),
+        None,
+    )
+
+    return {
+        "status": "success",
+        **scoreboard,
+        "team_key": team_key,
+        "your_matchup_id": your_matchup["matchup_id"] if your_matchup else None,
+        "watched": league_key in live_scores.watched_leagues(),
+    }
+
+
 async def handle_ff_compare_teams(arguments: dict) -> dict:
     """Compare rosters of two teams.
 
@@ -2,10 +2,28 @@
 
 from typing import Any, Dict
 
+from src.utils.field_selection import (
+    needs_enrichment,
+    parse_fields,
+    parse_output_format,
+    requests_any,
+    shape_records,
+)
+
 # These will be injected from main file
 yahoo_api_call = None
 get_waiver_wire_players = None
 
+# Waiver fields derived from the Sleeper expert-advice and trending lookups
+WAIVER_ANALYSIS_FIELDS = ("waiver_priority", "analysis", "pickup_urgency")
+EXPERT_ADVICE_FIELDS = (
+    "expert_tier",
+    "expert_recommendation",
+    "expert_confidence",
+    "expert_advice",
+) + WAIVER_ANALYSIS_FIELDS
+TRENDING_FIELDS = ("trending_count", "trending_position") + WAIVER_ANALYSIS_FIELDS
+
 
 async def handle_ff_get_players(arguments: dict) -> dict:
     """Get top available players with optional enhanced data.
@@ -19,6 +37,8 @@ async def handle_ff_get_players(arguments: dict) -> dict:
             - include_analysis: Include analysis (default: False)
             - include_projections: Include projections (default: True)
             - include_external_data: Include Sleeper data (default: True)
+            - fields: Player fields to return, list or comma-separated (optional)
+            - output_format: "records" (default) or "table" (columns + rows)
 
     Returns:
         Dict with player data and optional enhancements
@@ -33,6 +53,8 @@ async def handle_ff_get_players(arguments: dict) -> dict:
     include_analysis = arguments.get("include_analysis", False)
     include_projections = arguments.get("include_projections", True)
     include_external_data = arguments.get("include_external_data", True)
+    fields = parse_fields(arguments.get("fields"))
+    output_format = parse_output_format(arguments.get("output_format"))
 
     pos_filter = f";position={position}" if position else ""
     data = await yahoo_api_call(f"league/{league_key}/players;status=A{pos_filter};count={count}")
@@ -85,16 +107,16 @@ async def handle_ff_get_players(arguments: dict) -> dict:
         "league_key": league_key,
         "position": position or "all",
         "total_players": len(basic_players),
-        "players": basic_players[:count],
+        "players": shape_records(basic_players[:count], fields, output_format),
     }
 
     needs_enhancement = include_projections or include_external_data or include_analysis
-
-    if not needs_enhancement:
+    # Skip enrichment entirely when every requested field comes straight from Yahoo
+    if not needs_enhancement or not needs_enrichment(fields):
         return result
 
     try:
-        from lineup_optimizer import lineup_optimizer, Player
+        from lineup_optimizer import enrichment_stages_for, lineup_optimizer, Player
     except ImportError as exc:
         result["note"] = f"Enhanced data unavailable: {exc}"
         return result
@@ -107,8 +129,14 @@ async def handle_ff_get_players(arguments: dict) -> dict:
         }
         enhanced_players = await lineup_optimizer.parse_yahoo_roster(optimizer_payload)
         if enhanced_players:
+            stages = enrichment_stages_for(
+                include_projections=include_projections,
+                include_external_data=include_external_data,
+                include_analysis=include_analysis,
+                fields=fields,
+            )
             enhanced_players = await lineup_optimizer.enhance_with_external_data(
-                enhanced_players, week=week
+                enhanced_players, week=week, stages=stages
             )
 
             def serialize_free_agent_player(player: Player) -> Dict[str, Any]:
@@ -136,6 +164,7 @@ async def handle_ff_get_players(arguments: dict) -> dict:
                     ),
                     "trending_score": player.trending_score if include_external_data else None,
                     "risk_level": player.risk_level,
+                    "composite_score": player.composite_score if include_projections else None,
                     "owned_pct": next(
                         (
                             p.get("owned_pct") or 0
@@ -207,7 +236,7 @@ async def handle_ff_get_players(arguments: dict) -> dict:
 
             result.update(
                 {
-                    "enhanced_players": enhanced_list,
+                    "enhanced_players": shape_records(enhanced_list, fields, output_format),
                     "analysis_context": {
                         "data_sources": ["Yahoo"] + (["Sleeper"] if include_external_data else []),
                         "includes": {
@@ -216,6 +245,9 @@ async def handle_ff_get_players(arguments: dict) -> dict:
                             "analysis": include_analysis,
                         },
                         "week": week or "current",
+                        "enrichment_stages": stages,
+                        "fields": fields,
+                        "output_format": output_format,
                     },
                 }
             )
@@ -275,6 +307,8 @@ async def handle_ff_get_waiver_wire(arguments: dict) -> dict:
             - include_analysis: Include detailed analysis (default: False)
             - include_projections: Include projections (default: True)
             - include_external_data: Include Sleeper data (default: True)
+            - fields: Player fields to return, list or comma-separated (optional)
+            - output_format: "records" (default) or "table" (columns + rows)
 
     Returns:
         Dict with waiver wire players and optional analysis
@@ -311,6 +345,8 @@ async def handle_ff_get_waiver_wire(arguments: dict) -> dict:
     include_analysis = arguments.get("include_analysis", False)
     include_projections = arguments.get("include_projections", True)
     include_external_data = arguments.get("include_external_data", True)
+    fields = parse_fields(arguments.get("fields"))
+    output_format = parse_output_format(arguments.get("output_format"))
 
     # Fetch basic Yahoo waiver players
     basic_players = await get_waiver_wire_players(league_key, position, sort, count)
@@ -331,17 +367,27 @@ async def handle_ff_get_waiver_wire(arguments: dict) -> dict:
         "position": position,
         "sort": sort,
         "total_players": len(basic_players),
-        "players": basic_players,
+        "players": shape_records(basic_players, fields, output_format),
     }
 
     needs_enhancement = include_projections or include_external_data or include_analysis
-
-    if not needs_enhancement:
+    # Skip enrichment entirely when every requested field comes straight from Yahoo
+    if not needs_enhancement or not needs_enrichment(fields):
         return result
 
+    # Expert advice and the trending list are only fetched when a
+    # selected field depends on them
+    fetch_expert_advice = include_analysis and requests_any(fields, EXPERT_ADVICE_FIELDS)
+    fetch_trending = requests_any(fields, TRENDING_FIELDS)
+
     try:
-        from lineup_optimizer import lineup_optimizer, Player
-        from sleeper_api import get_trending_adds, sleeper_client
+        from lineup_optimizer import (
+            Player,
+            enrichment_stages_for,
+            lineup_optimizer,
+            resolve_enrichment_stages,
+        )
+        from sleeper_api import get_trending_adds
     except ImportError as exc:
         result["note"] = f"Enhanced data unavailable: {exc}"
         return result
@@ -355,28 +401,30 @@ async def handle_ff_get_waiver_wire(arguments: dict) -> dict:
         }
         enhanced_players = await lineup_optimizer.parse_yahoo_roster(optimizer_payload)
         if enhanced_players:
+            stages = enrichment_stages_for(
+                include_projections=include_projections,
+                include_external_data=include_external_data,
+                include_analysis=include_analysis,
+                fields=fields,
+            )
+            if fetch_expert_advice and "expert_advice" not in stages:
+                # Expert advice comes from the optimizer's memoized stage, not per-player calls
+                stages = resolve_enrichment_stages([*stages, "expert_advice"])
             enhanced_players = await lineup_optimizer.enhance_with_external_data(
-                enhanced_players, week=week
+                enhanced_players, week=week, stages=stages
             )
 
-            # Add expert advice for waiver wire analysis
-            if include_analysis:
+            # Players without Sleeper advice get neutral defaults for waiver analysis
+            if fetch_expert_advice:
                 for player in enhanced_players:
-                    try:
-                        expert_advice = await sleeper_client.get_expert_advice(player.name, week)
-                        player.expert_tier = expert_advice.get("tier", "Depth")
-                        player.expert_recommendation = expert_advice.get("recommendation", "Bench")
-                        player.expert_confidence = expert_advice.get("confidence", 50)
-                        player.expert_advice = expert_advice.get("advice", "No analysis available")
-                    except Exception:
-                        # Continue with default values if expert advice fails
+                    if not player.expert_tier:
                         player.expert_tier = "Depth"
-                        player.expert_recommendation = "Monitor"
+                        player.expert_recommendation = "Bench"
                         player.expert_confidence = 50
-                        player.expert_advice = f"Expert analysis unavailable"
+                        player.expert_advice = "No analysis available"
 
             # Fetch and merge trending data
-            trending = await get_trending_adds(count)
+            trending = await get_trending_adds(count) if fetch_trending else []
             trending_dict = {p["name"].lower(): p for p in trending}
 
             def serialize_waiver_player(player: Player) -> Dict[str, Any]:
@@ -404,6 +452,7 @@ async def handle_ff_get_waiver_wire(arguments: dict) -> dict:
                     ),
                     "trending_score": player.trending_score if include_external_data else None,
                     "risk_level": player.risk_level,
+                    "composite_score": player.composite_score if include_projections else None,
                     "owned_pct": next(
                         (
                             p.get("owned_pct") or 0.0
@@ -581,14 +630,14 @@ async def handle_ff_get_waiver_wire(arguments: dict) -> dict:
 
             result.update(
                 {
-                    "enhanced_players": enhanced_list,
+                    "enhanced_players": shape_records(enhanced_list, fields, output_format),
                     "analysis_context": {
                         "data_sources": ["Yahoo"] + (["Sleeper"] if include_external_data else []),
                         "includes": {
                             "projections": include_projections,
                             "external_data": include_external_data,
                             "analysis": include_analysis,
-                            "expert_advice": include_analysis,  # Expert advice tied to analysis flag
+                            "expert_advice": fetch_expert_advice,
                         },
                         "features": [
                             "Yahoo ownership and change data",
@@ -615,6 +664,9 @@ async def handle_ff_get_waiver_wire(arguments: dict) -> dict:
                         "position_scarcity": position_scarcity if include_analysis else None,
                         "week": week or "current",
                         "trending_count": len(trending),
+                        "enrichment_stages": stages,
+                        "fields": fields,
+                        "output_format": output_format,
                     },
                 }
             )
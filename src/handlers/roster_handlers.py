@@ -3,6 +3,13 @@
 import logging
 from typing import Any, Dict, List
 
+from src.utils.field_selection import (
+    needs_enrichment,
+    parse_fields,
+    parse_output_format,
+    shape_records,
+)
+
 # These will be injected from main file
 get_user_team_info = None
 yahoo_api_call = None
@@ -21,6 +28,8 @@ async def handle_ff_get_roster(arguments: dict) -> dict:
             - include_external_data: Include Sleeper API data (default: True)
             - include_analysis: Include analysis (default: True)
             - week: Specific week (optional)
+            - fields: Player fields to return, list or comma-separated (optional)
+            - output_format: "records" (default) or "table" (columns + rows)
 
     Returns:
         Dict with roster data and optional enhancements
@@ -32,6 +41,8 @@ async def handle_ff_get_roster(arguments: dict) -> dict:
     include_external_data = arguments.get("include_external_data", True)
     include_analysis = arguments.get("include_analysis", True)
     week = arguments.get("week")
+    fields = parse_fields(arguments.get("fields"))
+    output_format = parse_output_format(arguments.get("output_format"))
 
     if data_level == "basic":
         effective_projections = False
@@ -54,6 +65,9 @@ async def handle_ff_get_roster(arguments: dict) -> dict:
         effective_analysis = False
 
     needs_enhanced = effective_projections or effective_external or effective_analysis
+    # Skip enrichment entirely when every requested field comes straight from Yahoo
+    if not needs_enrichment(fields):
+        needs_enhanced = False
 
     team_info = None
     if not team_key:
@@ -88,7 +102,7 @@ async def handle_ff_get_roster(arguments: dict) -> dict:
         "team_name": team_info.get("team_name") if team_info else None,
         "draft_position": team_info.get("draft_position") if team_info else None,
         "draft_grade": team_info.get("draft_grade") if team_info else None,
-        "roster": roster,
+        "roster": shape_records(roster, fields, output_format),
     }
 
     if not roster and data:
@@ -103,7 +117,7 @@ async def handle_ff_get_roster(arguments: dict) -> dict:
         return result
 
     try:
-        from lineup_optimizer import lineup_optimizer, Player
+        from lineup_optimizer import enrichment_stages_for, lineup_optimizer, Player
     except ImportError as exc:
         result["note"] = f"Enhanced view unavailable: {exc}"
         return result
@@ -117,7 +131,15 @@ async def handle_ff_get_roster(arguments: dict) -> dict:
         players = await lineup_optimizer.parse_yahoo_roster(optimizer_payload)
         if not players:
             raise ValueError("No players parsed from roster payload")
-        players = await lineup_optimizer.enhance_with_external_data(players, week=week)
+        stages = enrichment_stages_for(
+            include_projections=effective_projections,
+            include_external_data=effective_external,
+            include_analysis=effective_analysis,
+            fields=fields,
+        )
+        players = await lineup_optimizer.enhance_with_external_data(
+            players, week=week, stages=stages
+        )
     except Exception as exc:
         result["note"] = f"Enhanced view unavailable: {exc}"
         return result
@@ -144,6 +166,7 @@ async def handle_ff_get_roster(arguments: dict) -> dict:
             "matchup_description": player.matchup_description if effective_external else None,
             "trending_score": player.trending_score if effective_external else None,
             "risk_level": player.risk_level,
+            "composite_score": player.composite_score if effective_projections else None,
             # Expert advice fields
             "expert_tier": player.expert_tier if effective_external else None,
             "expert_recommendation": player.expert_recommendation if effective_external else None,
@@ -234,11 +257,16 @@ async def handle_ff_get_roster(arguments: dict) -> dict:
     for bucket in players_by_position.values():
         bucket.sort(key=lambda entry: entry.get("yahoo_projection", 0), reverse=True)
 
+    all_players = [serialize_player(player) for player in players]
+
     result.update(
         {
             "total_players": len(players),
-            "players_by_position": players_by_position,
-            "all_players": [serialize_player(player) for player in players],
+            "players_by_position": {
+                position: shape_records(bucket, fields, output_format)
+                for position, bucket in players_by_position.items()
+            },
+            "all_players": shape_records(all_players, fields, output_format),
             "analysis_context": {
                 "data_sources": ["Yahoo"] + (["Sleeper"] if effective_external else []),
                 "data_level": data_level,
@@ -258,13 +286,16 @@ async def handle_ff_get_roster(arguments: dict) -> dict:
                     if effective_external
                     else []
                 ),
+                "enrichment_stages": stages,
+                "fields": fields,
+                "output_format": output_format,
             },
         }
     )
 
     # Add overall analysis if flagged
     if effective_analysis:
-        total_proj = sum(p.get("projected_points", 0) for p in result["all_players"])
+        total_proj = sum(p.get("projected_points", 0) for p in all_players)
         starters_count = sum(1 for pos in players_by_position if pos not in ["BN", "IR"])
         result["overall_analysis"] = {
             "total_projected_points": round(total_proj, 1),
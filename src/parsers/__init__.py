@@ -1,5 +1,19 @@
 """Yahoo API response parsers."""
 
-from .yahoo_parsers import parse_team_roster, parse_yahoo_free_agent_players
+from .yahoo_parsers import (
+    parse_draft_rankings,
+    parse_draft_results,
+    parse_league_scoreboard,
+    parse_team_roster,
+    parse_user_team_index,
+    parse_yahoo_free_agent_players,
+)
 
-__all__ = ["parse_team_roster", "parse_yahoo_free_agent_players"]
+__all__ = [
+    "parse_draft_rankings",
+    "parse_draft_results",
+    "parse_league_scoreboard",
+    "parse_team_roster",
+    "parse_yahoo_free_agent_players",
+    "parse_user_team_index",
+]
@@ -233,3 +233,335 @@ def parse_yahoo_free_agent_players(data: Dict) -> List[Dict]:
                 players.append(info)
 
     return players
+
+
+def _iter_keyed(container: Any) -> List[Any]:
+    """Return the values of a Yahoo ``{"0": ..., "1": ..., "count": n}`` collection."""
+    if not isinstance(container, dict):
+        return []
+    return [value for key, value in container.items() if key != "count"]
+
+
+def _parse_user_team(team_array: Any, user_guid: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Parse one team entry, returning its details if it belongs to the current user."""
+    if not isinstance(team_array, list) or not team_array:
+        return None
+    team_data = team_array[0]
+    if not isinstance(team_data, list):
+        return None
+
+    info: Dict[str, Any] = {}
+    is_users_team = False
+
+    for element in team_data:
+        if not isinstance(element, dict):
+            continue
+        for key, field in (
+            ("team_key", "team_key"),
+            ("name", "team_name"),
+            ("draft_grade", "draft_grade"),
+            ("draft_position", "draft_position"),
+        ):
+            if key in element:
+                info[field] = element[key]
+
+        # API may return int, bool or string for the ownership flag
+        owned_flag = element.get("is_owned_by_current_login")
+        if str(owned_flag) == "1" or owned_flag is True:
+            is_users_team = True
+
+        if "managers" in element:
+            managers = element["managers"]
+            if isinstance(managers, dict):
+                managers = _iter_keyed(managers)
+            for entry in managers or []:
+                manager = entry.get("manager", {}) if isinstance(entry, dict) else {}
+                guid = manager.get("guid")
+                if str(manager.get("is_current_login")) == "1" or (
+                    user_guid and guid == user_guid
+                ):
+                    is_users_team = True
+                    info["manager_guid"] = guid
+                    break
+
+    if not is_users_team or not info.get("team_key"):
+        return None
+
+    info.setdefault("team_name", None)
+    info.setdefault("draft_grade", None)
+    info.setdefault("draft_position", None)
+    info.setdefault("manager_guid", user_guid)
+    return info
+
+
+def parse_user_team_index(data: Dict, user_guid: Optional[str] = None) -> Dict[str, Dict]:
+    """Map every league of the current user to the user's team in it.
+
+    Args:
+        data: Raw Yahoo API response from
+            ``users;use_login=1/games;game_keys=nfl/leagues;out=teams``
+        user_guid: Yahoo GUID of the user, used when ownership flags are missing
+
+    Returns:
+        Dict mapping league_key to team_key, team_name, manager_guid, draft data,
+        season and game_key
+    """
+    index: Dict[str, Dict] = {}
+    users = data.get("fantasy_content", {}).get("users", {}) if isinstance(data, dict) else {}
+
+    for user_entry in _iter_keyed(users):
+        user = user_entry.get("user", []) if isinstance(user_entry, dict) else []
+        if not isinstance(user, list):
+            continue
+
+        guid = user_guid
+        for item in user:
+            if isinstance(item, dict) and item.get("guid") and not guid:
+                guid = item["guid"]
+
+        for item in user:
+            if not isinstance(item, dict) or "games" not in item:
+                continue
+            for game_entry in _iter_keyed(item["games"]):
+                game = game_entry.get("game", []) if isinstance(game_entry, dict) else []
+                if not isinstance(game, list):
+                    continue
+                for game_part in game:
+                    if not isinstance(game_part, dict) or "leagues" not in game_part:
+                        continue
+                    for league_entry in _iter_keyed(game_part["leagues"]):
+                        league = league_entry.get("league") if isinstance(league_entry, dict) else None
+                        if not isinstance(league, list) or not league:
+                            continue
+
+                        league_meta = league[0] if isinstance(league[0], dict) else {}
+                        league_key = league_meta.get("league_key")
+                        if not league_key:
+                            continue
+
+                        for league_part in league[1:]:
+                            if not isinstance(league_part, dict) or "teams" not in league_part:
+                                continue
+                            for team_entry in _iter_keyed(league_part["teams"]):
+                                if not isinstance(team_entry, dict):
+                                    continue
+                                team_info = _parse_user_team(team_entry.get("team"), guid)
+                                if team_info:
+                                    team_info["season"] = league_meta.get("season")
+                                    team_info["game_key"] = league_key.split(".")[0]
+                                    index[league_key] = team_info
+                                    break
+
+    return index
+
+
+def _team_total(value: Any) -> Optional[float]:
+    """Read the ``total`` of a Yahoo points block (``team_points`` etc.) as a float."""
+    if not isinstance(value, dict):
+        return None
+    try:
+        return float(value.get("total"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_scoreboard_team(team_array: Any) -> Optional[Dict[str, Any]]:
+    """Parse one ``team`` entry of a scoreboard matchup."""
+    if not isinstance(team_array, list) or not team_array:
+        return None
+
+    info: Dict[str, Any] = {}
+    meta = team_array[0] if isinstance(team_array[0], list) else []
+    for element in meta:
+        if isinstance(element, dict):
+            if "team_key" in element:
+                info["team_key"] = element["team_key"]
+            if "name" in element:
+                info["name"] = element["name"]
+
+    for element in team_array[1:]:
+        if not isinstance(element, dict):
+            continue
+        if "team_points" in element:
+            info["points"] = _team_total(element["team_points"])
+        if "team_projected_points" in element:
+            info["projected_points"] = _team_total(element["team_projected_points"])
+        if "team_live_projected_points" in element:
+            info["live_projected_points"] = _team_total(element["team_live_projected_points"])
+
+    if not info.get("team_key"):
+        return None
+    info.setdefault("name", None)
+    info.setdefault("points", None)
+    info.setdefault("projected_points", None)
+    info.setdefault("live_projected_points", None)
+    return info
+
+
+def parse_league_scoreboard(data: Dict) -> List[Dict[str, Any]]:
+    """Extract matchups and team scores from a league scoreboard.
+
+    Args:
+        data: Raw Yahoo API response from ``league/{league_key}/scoreboard``
+
+    Returns:
+        List of matchup dicts with week, status, is_tied, winner_team_key and
+        teams (team_key, name, points, projected_points, live_projected_points)
+    """
+    matchups: List[Dict[str, Any]] = []
+    league = data.get("fantasy_content", {}).get("league", []) if isinstance(data, dict) else []
+    if not isinstance(league, list):
+        return matchups
+
+    for league_part in league:
+        if not isinstance(league_part, dict) or "scoreboard" not in league_part:
+            continue
+        scoreboard = league_part["scoreboard"]
+        for board_part in _iter_keyed(scoreboard):
+            if not isinstance(board_part, dict) or "matchups" not in board_part:
+                continue
+            for matchup_entry in _iter_keyed(board_part["matchups"]):
+                matchup = matchup_entry.get("matchup") if isinstance(matchup_entry, dict) else None
+                if not isinstance(matchup, dict):
+                    continue
+
+                teams = []
+                for matchup_part in matchup.values():
+                    if isinstance(matchup_part, dict) and "teams" in matchup_part:
+                        for team_entry in _iter_keyed(matchup_part["teams"]):
+                            if isinstance(team_entry, dict):
+                                team = _parse_scoreboard_team(team_entry.get("team"))
+                                if team:
+                                    teams.append(team)
+                if not teams:
+                    continue
+
+                week = matchup.get("week") or scoreboard.get("week")
+                matchups.append(
+                    {
+                        "week": int(week) if str(week).isdigit() else None,
+                        "status": matchup.get("status"),
+                        "is_tied": str(matchup.get("is_tied")) == "1",
+                        "winner_team_key": matchup.get("winner_team_key"),
+                        "teams": teams,
+                    }
+                )
+
+    return matchups
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """Yahoo numeric field as a float (``"-"`` and missing values are None)."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_draft_results(data: Dict) -> List[Dict[str, Any]]:
+    """Extract the picks of a league draft, made or still to come.
+
+    Args:
+        data: Raw Yahoo API response from ``league/{league_key}/draftresults``
+
+    Returns:
+        Picks ordered by overall pick number, each with pick, round, team_key
+        and player_key (None for picks not made yet)
+    """
+    picks: List[Dict[str, Any]] = []
+    league = data.get("fantasy_content", {}).get("league", []) if isinstance(data, dict) else []
+    if not isinstance(league, list):
+        return picks
+
+    for league_part in league:
+        if not isinstance(league_part, dict) or "draft_results" not in league_part:
+            continue
+        for entry in _iter_keyed(league_part["draft_results"]):
+            result = entry.get("draft_result") if isinstance(entry, dict) else None
+            if not isinstance(result, dict) or not str(result.get("pick", "")).isdigit():
+                continue
+            picks.append(
+                {
+                    "pick": int(result["pick"]),
+                    "round": int(result["round"]) if str(result.get("round")).isdigit() else None,
+                    "team_key": result.get("team_key"),
+                    "player_key": result.get("player_key") or None,
+                }
+            )
+
+    picks.sort(key=lambda pick: pick["pick"])
+    return picks
+
+
+def parse_draft_rankings(data: Dict, start: int = 0) -> List[Dict[str, Any]]:
+    """Extract ranked players with their draft analysis (ADP).
+
+    Args:
+        data: Raw Yahoo API response from
+            ``league/{league_key}/players;sort=OR;start={start};count=N;out=draft_analysis``
+        start: Offset of the page, so ranks continue across pages
+
+    Returns:
+        Players ordered by rank with player_key, name, position, team, bye,
+        rank, average_draft_position, average_round and percent_drafted
+    """
+    players: List[Dict[str, Any]] = []
+    league = data.get("fantasy_content", {}).get("league", []) if isinstance(data, dict) else []
+    if not isinstance(league, list):
+        return players
+
+    for league_part in league:
+        if not isinstance(league_part, dict) or "players" not in league_part:
+            continue
+        for key, entry in league_part["players"].items():
+            if key == "count" or not isinstance(entry, dict):
+                continue
+            player_array = entry.get("player")
+            if not isinstance(player_array, list):
+                continue
+
+            info: Dict[str, Any] = {}
+            draft: Dict[str, Any] = {}
+            elements: List[Any] = []
+            for element in player_array:
+                elements.extend(element if isinstance(element, list) else [element])
+            for element in elements:
+                if not isinstance(element, dict):
+                    continue
+                if "player_key" in element:
+                    info["player_key"] = element["player_key"]
+                name = element.get("name")
+                if isinstance(name, dict) and "full" in name:
+                    info["name"] = name["full"]
+                if "display_position" in element:
+                    info["position"] = element["display_position"]
+                if "editorial_team_abbr" in element:
+                    info["team"] = element["editorial_team_abbr"]
+                bye_weeks = element.get("bye_weeks")
+                if isinstance(bye_weeks, dict) and str(bye_weeks.get("week")).isdigit():
+                    info["bye"] = int(bye_weeks["week"])
+                analysis = element.get("draft_analysis")
+                # A dict, or a list of single-field dicts
+                for part in analysis if isinstance(analysis, list) else [analysis]:
+                    if isinstance(part, dict):
+                        draft.update(part)
+
+            if not info.get("player_key") or not info.get("name"):
+                continue
+            rank = start + int(key) + 1 if str(key).isdigit() else start + len(players) + 1
+            info["rank"] = rank
+            info.setdefault("position", None)
+            info.setdefault("team", None)
+            api_bye_week = info.get("bye")
+            info["bye"] = (
+                get_bye_week_with_fallback(info["team"], api_bye_week)
+                if info["team"]
+                else api_bye_week
+            )
+            info["average_draft_position"] = _as_float(draft.get("average_pick")) or float(rank)
+            info["average_round"] = _as_float(draft.get("average_round"))
+            info["percent_drafted"] = _as_float(draft.get("percent_drafted"))
+            players.append(info)
+
+    players.sort(key=lambda player: player["rank"])
+    return players
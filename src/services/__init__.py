@@ -1,5 +1,30 @@
 """Services for external integrations."""
 
+from .cache_warming import CacheWarmer, cache_warmer
+from .draft_room import DraftRoomService, DraftSession, draft_rooms
+from .live_scoring import LiveScoringService, live_scores
+from .prewarm import StartupPrewarm, startup_prewarm
+from .reddit_ingest import RedditIngestor, RedditPostStore, reddit_ingestor
 from .reddit_service import analyze_reddit_sentiment
+from .stats_warehouse import StatsWarehouse, stats_warehouse
+from .team_index import UserTeamIndex, user_team_index
 
-__all__ = ["analyze_reddit_sentiment"]
+__all__ = [
+    "CacheWarmer",
+    "cache_warmer",
+    "DraftRoomService",
+    "DraftSession",
+    "draft_rooms",
+    "LiveScoringService",
+    "live_scores",
+    "StartupPrewarm",
+    "startup_prewarm",
+    "RedditIngestor",
+    "RedditPostStore",
+    "reddit_ingestor",
+    "analyze_reddit_sentiment",
+    "StatsWarehouse",
+    "stats_warehouse",
+    "UserTeamIndex",
+    "user_team_index",
+]
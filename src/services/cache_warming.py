@@ -0,0 +1,505 @@
+"""Predictive warming of the API response caches.
+
+Tool calls follow a weekly rhythm: waiver pages on Tuesday and Wednesday,
+projections from Thursday through Sunday morning, scoreboards during games,
+and the same rosters and league pages all week. ``CacheWarmer`` listens to
+every response cache lookup and learns from it:
+
+* how often each endpoint is requested, grouped by key family (roster,
+  waiver, projections, league, live), with per-weekday counts per family;
+* which endpoints are requested together, so that the followers of a
+  request are fetched before the caller asks for them.
+
+Endpoints carrying the current NFL week are stored as templates, so a
+pattern learned in week 6 is replayed against week 7. A background task
+periodically prefetches the endpoints most likely to be requested next,
+weighted by the NFL calendar, but only while the caller is idle and only
+from the part of the Yahoo rate-limit budget above ``RESERVE_FRACTION``.
+Learned patterns are persisted under ``$CACHE_DIR`` so the first requests of
+a recurring weekly workflow are cache hits even after a restart.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from src.api import yahoo_api_call
+from src.api.yahoo_utils import RateLimiter, ResponseCache, rate_limiter, response_cache
+from src.services.live_scoring import EASTERN, in_game_window
+
+logger = logging.getLogger(__name__)
+
+# Seconds between calendar-driven warming passes
+WARM_INTERVAL = 300
+# Seconds without a cache lookup before the caller counts as idle
+IDLE_DELAY = 5
+# Share of the Yahoo rate-limit window never spent on prefetching
+RESERVE_FRACTION = 0.5
+# Upper bound on calendar-driven prefetches per pass
+MAX_PREFETCH_PER_PASS = 10
+
+# Lookups this many seconds apart count as requested together
+CO_ACCESS_WINDOW = 120
+# A follower is prefetched once seen this often and in this share of its leader's requests
+MIN_CO_ACCESS = 2
+MIN_CO_ACCESS_SHARE = 0.3
+MAX_FOLLOWERS = 8
+
+# Access scores halve every two weeks, so weekly habits stay warm
+SCORE_HALF_LIFE = 14 * 86400
+# Keys not requested for this long are no longer warmed
+STALE_AFTER = 21 * 86400
+MIN_PRIORITY = 2.0
+MAX_TRACKED_KEYS = 512
+# Lookups held back until the NFL state is known, so they can be templated
+MAX_UNRECORDED = 64
+
+# Set while the warmer itself looks something up, so it does not learn from its own requests
+_warming_lookup: ContextVar[bool] = ContextVar("warming_lookup", default=False)
+
+# Calendar weight of a key family inside its peak window
+PEAK_WEIGHT = 4.0
+
+_WEEK_PARAM = re.compile(r"week=(\d+)")
+_SLEEPER_WEEKLY = re.compile(r"^(projections|stats)/nfl/(\d{4})/(\d+)")
+
+
+def _default_patterns_path() -> Path:
+    return Path(os.getenv("CACHE_DIR", "./.cache")) / "cache_warming.json"
+
+
+def key_family(endpoint: str) -> str:
+    """Key family of an endpoint: live, projections, roster, waiver, league or other."""
+    if "scoreboard" in endpoint or "matchup" in endpoint or endpoint.startswith("stats/"):
+        return "live"
+    if endpoint.startswith("projections/") or "projected" in endpoint:
+        return "projections"
+    if "roster" in endpoint:
+        return "roster"
+    if "transactions" in endpoint or "trending" in endpoint:
+        return "waiver"
+    if "players" in endpoint and "status=" in endpoint:
+        return "waiver"
+    if endpoint.startswith(("league/", "users;")) or "standings" in endpoint:
+        return "league"
+    return "other"
+
+
+def endpoint_template(endpoint: str, nfl_state: Dict[str, Any]) -> str:
+    """Replace the current NFL week (and season) in ``endpoint`` with placeholders.
+
+    Other weeks are kept literally: a request for an earlier week is not a
+    weekly habit.
+    """
+    week, season = str(nfl_state.get("week", "")), str(nfl_state.get("season", ""))
+    if not week:
+        return endpoint
+
+    def weekly(match: "re.Match") -> str:
+        if match.group(2) != season or match.group(3) != week:
+            return match.group(0)
+        return f"{match.group(1)}/nfl/{{season}}/{{week}}"
+
+    template = _WEEK_PARAM.sub(
+        lambda match: "week={week}" if match.group(1) == week else match.group(0), endpoint
+    )
+    return _SLEEPER_WEEKLY.sub(weekly, template)
+
+
+def fill_template(template: str, nfl_state: Dict[str, Any]) -> Optional[str]:
+    """Endpoint for ``template`` in the current week; None when the week is unknown."""
+    if "{" not in template:
+        return template
+    week, season = nfl_state.get("week"), nfl_state.get("season")
+    if not week or ("{season}" in template and not season):
+        return None
+    return template.replace("{week}", str(week)).replace("{season}", str(season))
+
+
+def calendar_weight(family: str, now: datetime, nfl_state: Dict[str, Any]) -> float:
+    """How strongly the NFL week favours warming ``family`` at ``now``."""
+    if family == "live":
+        return PEAK_WEIGHT if in_game_window(now, nfl_state) else 0.0
+    if nfl_state.get("season_type") not in ("regular", "post"):
+        return 1.0
+
+    local = now.astimezone(EASTERN)
+    weekday = local.weekday()
+    if family == "waiver" and weekday in (1, 2):  # waivers process Tuesday/Wednesday
+        return PEAK_WEIGHT
+    if family == "projections" and (weekday in (3, 4, 5) or (weekday == 6 and local.hour < 13)):
+        return PEAK_WEIGHT  # lineup decisions before Thursday night through Sunday kickoff
+    return 1.0
+
+
+@dataclass
+class WarmSource:
+    """A response cache the warmer watches, and how to refill it."""
+
+    cache: ResponseCache
+    fetch: Callable[[str], Awaitable[Any]]  # must bypass ``cache``
+    rate_limiter: Optional[RateLimiter] = None
+
+
+class CacheWarmer:
+    """Learns request patterns from cache lookups and prefetches ahead of them."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        sleeper_client: Any = None,
+        interval: float = WARM_INTERVAL,
+        idle_delay: float = IDLE_DELAY,
+        clock: Optional[Callable[[], datetime]] = None,
+    ):
+        self.path = Path(path) if path is not None else _default_patterns_path()
+        self._sleeper_client = sleeper_client
+        self.interval = interval
+        self.idle_delay = idle_delay
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._sources: Dict[str, WarmSource] = {}
+        self._listeners: Dict[str, Callable[[str, bool], None]] = {}
+
+        # key ("source|template") -> [decayed score, last access, family]
+        self._keys: "OrderedDict[str, list]" = OrderedDict()
+        self._family_days: Dict[str, List[int]] = {}
+        self._followers: Dict[str, Dict[str, int]] = {}
+        self._recent: Deque[Tuple[float, str]] = deque(maxlen=16)
+        self._loaded = False
+        self._dirty = False
+
+        self._nfl_state: Dict[str, Any] = {}
+        self._state_checked = False
+        self._unrecorded: Deque[Tuple[str, str, datetime]] = deque(maxlen=MAX_UNRECORDED)
+        self._pending: Dict[str, None] = {}
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.last_access = 0.0
+        self.prefetches = 0
+
+    @property
+    def sleeper(self) -> Any:
+        if self._sleeper_client is None:
+            from sleeper_api import sleeper_client
+
+            self._sleeper_client = sleeper_client
+        return self._sleeper_client
+
+    # Sources
+
+    def attach(self, sources: Optional[Dict[str, WarmSource]] = None) -> None:
+        """Start watching ``sources`` (the Yahoo and Sleeper caches by default)."""
+        if sources is None:
+            sleeper = self.sleeper
+            sources = {
+                "yahoo": WarmSource(
+                    response_cache,
+                    lambda endpoint: yahoo_api_call(endpoint, use_cache=False),
+                    rate_limiter,
+                ),
+                "sleeper": WarmSource(
+                    sleeper.cache, lambda endpoint: sleeper._make_request(endpoint, use_cache=False)
+                ),
+            }
+        self._load()
+        for name, source in sources.items():
+            self.detach(name)
+            listener = self._make_listener(name)
+            source.cache.add_access_listener(listener)
+            self._sources[name] = source
+            self._listeners[name] = listener
+        self._ensure_running()  # fetches the NFL state where a loop is running
+
+    def detach(self, name: Optional[str] = None) -> None:
+        """Stop watching one source, or all of them (which also stops the scheduler)."""
+        for source_name in [name] if name else list(self._sources):
+            source = self._sources.pop(source_name, None)
+            listener = self._listeners.pop(source_name, None)
+            if source is not None and listener is not None:
+                source.cache.remove_access_listener(listener)
+        if not self._sources and self._task is not None:
+            self._task.cancel()
+            self._task = None
+            self._save()
+
+    def _make_listener(self, source: str) -> Callable[[str, bool], None]:
+        def listener(endpoint: str, hit: bool) -> None:
+            if _warming_lookup.get():
+                return
+            try:
+                self.record(source, endpoint)
+            except Exception:
+                logger.exception("Cache warming: failed to record %s", endpoint)
+
+        return listener
+
+    # Access patterns
+
+    def record(self, source: str, endpoint: str) -> None:
+        """Count one lookup and queue the endpoints usually requested right after it.
+
+        Until the warmer has asked for the NFL state, lookups are held back
+        and counted once it is known, so week-specific endpoints are stored as
+        templates from the first request on.
+        """
+        self._load()
+        if not self._state_checked:
+            self._unrecorded.append((source, endpoint, self._clock()))
+            self._ensure_running()
+            return
+        self._record(source, endpoint, self._clock())
+
+    def _record(self, source: str, endpoint: str, now: datetime) -> None:
+        ts = now.timestamp()
+        key = f"{source}|{endpoint_template(endpoint, self._nfl_state)}"
+        family = key_family(endpoint)
+
+        stats = self._keys.pop(key, None)
+        score = self._decayed(stats, ts) + 1.0
+        self._keys[key] = [score, ts, family]
+        while len(self._keys) > MAX_TRACKED_KEYS:
+            dropped, _ = self._keys.popitem(last=False)
+            self._followers.pop(dropped, None)
+
+        self._family_days.setdefault(family, [0] * 7)[now.astimezone(EASTERN).weekday()] += 1
+
+        for seen_at, leader in self._recent:
+            if leader != key and ts - seen_at <= CO_ACCESS_WINDOW:
+                followers = self._followers.setdefault(leader, {})
+                followers[key] = followers.get(key, 0) + 1
+                if len(followers) > 2 * MAX_FOLLOWERS:
+                    top = sorted(followers.items(), key=lambda item: item[1], reverse=True)
+                    self._followers[leader] = dict(top[:MAX_FOLLOWERS])
+        if not self._recent or self._recent[-1][1] != key:
+            self._recent.append((ts, key))
+
+        for follower in self.predicted_after(key):
+            self._pending[follower] = None
+        self.last_access = ts
+        self._dirty = True
+        self._ensure_running()
+
+    def predicted_after(self, key: str) -> List[str]:
+        """Keys reliably requested within ``CO_ACCESS_WINDOW`` after ``key``."""
+        stats = self._keys.get(key)
+        if stats is None:
+            return []
+        followers = self._followers.get(key, {})
+        threshold = max(MIN_CO_ACCESS, MIN_CO_ACCESS_SHARE * stats[0])
+        ranked = sorted(followers.items(), key=lambda item: item[1], reverse=True)
+        return [follower for follower, count in ranked[:MAX_FOLLOWERS] if count >= threshold]
+
+    def plan(self, now: datetime, nfl_state: Dict[str, Any], limit: int) -> List[str]:
+        """Keys to warm now, highest priority first.
+
+        Priority is the decayed access score times the calendar weight of the
+        key's family, boosted by the share of that family's requests that
+        historically fell on today's weekday.
+        """
+        ts = now.timestamp()
+        weekday = now.astimezone(EASTERN).weekday()
+        candidates = []
+        for key, (score, last, family) in self._keys.items():
+            if ts - last > STALE_AFTER:
+                continue
+            weight = calendar_weight(family, now, nfl_state)
+            if not weight:
+                continue
+            days = self._family_days.get(family, [0] * 7)
+            day_share = days[weekday] / sum(days) if sum(days) else 0.0
+            priority = self._decayed([score, last, family], ts) * weight * (1.0 + day_share)
+            if priority >= MIN_PRIORITY and not self._is_fresh(key, nfl_state):
+                candidates.append((priority, key))
+        candidates.sort(reverse=True)
+        return [key for _, key in candidates[:limit]]
+
+    @staticmethod
+    def _decayed(stats: Optional[list], ts: float) -> float:
+        if stats is None:
+            return 0.0
+        return stats[0] * 0.5 ** (max(0.0, ts - stats[1]) / SCORE_HALF_LIFE)
+
+    # Prefetching
+
+    def _resolve(self, key: str, nfl_state: Dict[str, Any]) -> Optional[Tuple[WarmSource, str]]:
+        name, _, template = key.partition("|")
+        source = self._sources.get(name)
+        endpoint = fill_template(template, nfl_state)
+        if source is None or endpoint is None:
+            return None
+        return source, endpoint
+
+    def _is_fresh(self, key: str, nfl_state: Dict[str, Any]) -> bool:
+        """Whether the cached response outlives the next warming pass."""
+        resolved = self._resolve(key, nfl_state)
+        if resolved is None:
+            return True  # nothing we could fetch
+        source, endpoint = resolved
+        return source.cache.remaining_ttl(endpoint) > self.interval
+
+    @staticmethod
+    def spare_budget(limiter: RateLimiter) -> int:
+        """Requests left in the rate-limit window above the reserved share."""
+        status = limiter.get_status()
+        return status["requests_remaining"] - int(status["max_requests"] * RESERVE_FRACTION)
+
+    async def prefetch(self, keys: List[str]) -> int:
+        """Fetch ``keys`` into their caches within the spare budget; returns the count warmed."""
+        warmed = 0
+        for key in keys:
+            resolved = self._resolve(key, self._nfl_state)
+            if resolved is None:
+                continue
+            source, endpoint = resolved
+            if source.rate_limiter is not None and self.spare_budget(source.rate_limiter) <= 0:
+                continue
+            try:
+                data = await source.fetch(endpoint)
+            except Exception as e:
+                logger.debug("Cache warming: prefetch of %s failed: %s", endpoint, e)
+                continue
+            if data is not None:
+                await source.cache.set(endpoint, data)
+                warmed += 1
+        self.prefetches += warmed
+        if warmed:
+            logger.debug("Cache warming: prefetched %d of %d endpoint(s)", warmed, len(keys))
+        return warmed
+
+    async def warm_once(self) -> int:
+        """One calendar-driven pass; skipped while the caller is active."""
+        now = self._clock()
+        await self._refresh_state()
+        if now.timestamp() - self.last_access < self.idle_delay:
+            return 0
+        return await self.prefetch(self.plan(now, self._nfl_state, MAX_PREFETCH_PER_PASS))
+
+    async def _drain_pending(self) -> int:
+        keys = [key for key in self._pending if not self._is_fresh(key, self._nfl_state)]
+        self._pending.clear()
+        return await self.prefetch(keys) if keys else 0
+
+    async def _refresh_state(self) -> None:
+        # Only marks this task's lookups; caller requests made meanwhile still count
+        token = _warming_lookup.set(True)
+        try:
+            state = await self.sleeper.get_nfl_state()
+        except Exception as e:
+            logger.debug("Cache warming: NFL state unavailable: %s", e)
+            return
+        finally:
+            _warming_lookup.reset(token)
+            self._state_checked = True
+        if isinstance(state, dict) and state:
+            self._nfl_state = state
+
+    async def _start(self) -> None:
+        """Fetch the NFL state, then count the lookups made while waiting for it."""
+        if not self._state_checked:
+            await self._refresh_state()
+        while self._unrecorded:
+            self._record(*self._unrecorded.popleft())
+
+    def _ensure_running(self) -> None:
+        if self._wake is not None and self._pending:
+            self._wake.set()
+        if not self._sources or (self._task is not None and not self._task.done()):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._wake = asyncio.Event()
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        # Started on attach or by a lookup, while the caller is getting going
+        next_pass = loop.time() + self.interval
+        try:
+            await self._start()
+        except Exception:
+            logger.exception("Cache warming startup failed")
+        while self._sources:
+            self._wake.clear()
+            try:
+                await self._drain_pending()
+                if loop.time() >= next_pass:
+                    await self.warm_once()
+                    next_pass = loop.time() + self.interval
+                self._save()
+            except Exception:
+                logger.exception("Cache warming pass failed")
+            if self._pending:
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), max(0.0, next_pass - loop.time()))
+            except asyncio.TimeoutError:
+                pass
+
+    # Persistence
+
+    def _load(self) -> None:
+        """Load learned patterns once, tolerating a missing or corrupt file."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable cache warming patterns %s: %s", self.path, e)
+            return
+
+        if isinstance(stored, dict) and isinstance(stored.get("keys"), dict):
+            self._keys = OrderedDict(sorted(stored["keys"].items(), key=lambda item: item[1][1]))
+            self._family_days = stored.get("families", {})
+            self._followers = stored.get("followers", {})
+            logger.debug("Loaded cache warming patterns for %d keys", len(self._keys))
+
+    def _save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "keys": self._keys,
+                        "families": self._family_days,
+                        "followers": self._followers,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning("Could not persist cache warming patterns to %s: %s", self.path, e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        families: Dict[str, int] = {}
+        for _, _, family in self._keys.values():
+            families[family] = families.get(family, 0) + 1
+        return {
+            "tracked_keys": len(self._keys),
+            "keys_by_family": families,
+            "co_access_leaders": len(self._followers),
+            "pending": len(self._pending),
+            "prefetches": self.prefetches,
+            "running": self._task is not None and not self._task.done(),
+        }
+
+
+# Global instance
+cache_warmer = CacheWarmer()
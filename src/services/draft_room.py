@@ -0,0 +1,397 @@
+"""Live draft room: an in-memory board kept current from draft results.
+
+Without this, every ``ff_get_draft_recommendation`` call during a live draft
+re-fetches the rankings and the draft state and scores everything again. A
+draft session per league loads the ranked pool (with ADP) once, then a
+background task polls ``league/{key}/draftresults`` and applies only the new
+picks, removing drafted players from the board. After every change it
+precomputes the recommendations for our next pick, while other teams are on
+the clock, and Monte-Carlo simulates from ADP which targets are likely to
+still be there when we pick. Recommendation calls read the precomputed result.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.api import yahoo_api_call
+from src.parsers import parse_draft_rankings, parse_draft_results
+from src.services.team_index import user_team_index
+
+logger = logging.getLogger(__name__)
+
+# Seconds between draft result polls
+DRAFT_POLL_INTERVAL = 5
+# A session stops polling after this many seconds without a recommendation request
+SESSION_IDLE_TIMEOUT = 1800
+# Seconds before a league without a live draft is checked again
+NO_DRAFT_TTL = 60
+
+# Ranked players loaded beyond the number of picks in the draft
+POOL_MARGIN = 60
+MAX_POOL_SIZE = 500
+# Yahoo returns at most 25 players per request
+RANKINGS_PAGE_SIZE = 25
+
+# Recommendations precomputed per strategy
+MAX_RECOMMENDATIONS = 20
+
+# Monte Carlo: draws per simulation run and the spread of a player's pick around his ADP
+SIMULATIONS = 1000
+ADP_SPREAD = 0.2
+MIN_ADP_SPREAD = 3.0
+
+DEFAULT_TEAMS = 12
+DEFAULT_ROUNDS = 16
+
+
+def score_ranked_player(
+    rank: int, strategy: str, owned_pct: Optional[float] = None
+) -> Tuple[float, str]:
+    """Strategy score and reasoning for a player from his overall rank."""
+    base_score = max(0, 100 - rank)
+    if strategy == "conservative":
+        # Prefer higher-ranked (safer) picks
+        score = base_score + (10 if rank <= 24 else 0)
+        reasoning = f"Rank #{rank}, conservative choice (proven player)"
+    elif strategy == "aggressive":
+        # Prefer potential breakouts (lower owned %)
+        owned_pct = 50 if owned_pct is None else owned_pct
+        upside_bonus = max(0, 20 - (owned_pct / 5))  # Bonus for lower ownership
+        score = base_score + upside_bonus
+        reasoning = f"Rank #{rank}, high upside potential ({owned_pct}% owned)"
+    else:  # balanced
+        score = base_score + (5 if rank <= 50 else 0)
+        reasoning = f"Rank #{rank}, balanced value pick"
+    return score, reasoning
+
+
+def snake_picks(draft_position: int, num_teams: int, rounds: int) -> List[int]:
+    """Overall pick numbers of a draft slot in a snake draft."""
+    return [
+        (rnd - 1) * num_teams
+        + (draft_position if rnd % 2 else num_teams - draft_position + 1)
+        for rnd in range(1, rounds + 1)
+    ]
+
+
+def survival_probabilities(
+    adp: List[float], picks_before: int, simulations: int = SIMULATIONS, seed: Optional[int] = None
+) -> List[float]:
+    """
+    Chance that each player is still available after ``picks_before`` picks.
+
+    Each simulation draws every player's draft slot from a normal distribution
+    around his ADP; the ``picks_before`` players with the earliest slots are
+    taken.
+    """
+    if picks_before <= 0:
+        return [1.0] * len(adp)
+    if picks_before >= len(adp):
+        return [0.0] * len(adp)
+
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    mean = np.asarray(adp, dtype=float)
+    spread = np.maximum(MIN_ADP_SPREAD, mean * ADP_SPREAD)
+    slots = mean + spread * rng.standard_normal((simulations, len(mean)))
+    last_taken = np.partition(slots, picks_before - 1, axis=1)[:, picks_before - 1]
+    return (slots > last_taken[:, None]).mean(axis=0).tolist()
+
+
+class DraftSession:
+    """Board and precomputed recommendations for one league's draft."""
+
+    def __init__(self, league_key: str, team_key: Optional[str] = None):
+        self.league_key = league_key
+        self.team_key = team_key
+        self.picks: List[Dict[str, Any]] = []
+        self.pool: List[Dict[str, Any]] = []
+        self.drafted: Dict[str, int] = {}
+        self.our_picks: List[int] = []
+        self.strategies = {"balanced"}
+        self.recommendations: Dict[str, Dict[str, Any]] = {}
+        self.updated_at: Optional[float] = None
+        self.last_used = time.monotonic()
+        self.polls = 0
+        self._task: Optional[asyncio.Task] = None
+
+    # State
+
+    @property
+    def current_pick(self) -> Optional[int]:
+        """Overall number of the next pick to be made (None once the draft is over)."""
+        for pick in self.picks:
+            if pick["player_key"] is None:
+                return pick["pick"]
+        return None if self.picks else 1
+
+    @property
+    def complete(self) -> bool:
+        return bool(self.picks) and self.current_pick is None
+
+    def available(self) -> List[Dict[str, Any]]:
+        return [player for player in self.pool if player["player_key"] not in self.drafted]
+
+    def next_turns(self) -> List[int]:
+        """Our remaining picks, from the current one on."""
+        current = self.current_pick
+        if current is None:
+            return []
+        return [pick for pick in self.our_picks if pick >= current]
+
+    def apply_picks(self, picks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Apply a fresh draft results listing (undone picks return to the board).
+
+        Returns:
+            The picks made since the previous listing
+        """
+        new_picks = [
+            pick for pick in picks if pick["player_key"] and pick["player_key"] not in self.drafted
+        ]
+        self.drafted = {pick["player_key"]: pick["pick"] for pick in picks if pick["player_key"]}
+        self.picks = picks
+        if self.team_key and picks:
+            self.our_picks = [pick["pick"] for pick in picks if pick["team_key"] == self.team_key]
+        return new_picks
+
+    # Recommendations
+
+    def precompute(self) -> None:
+        """Recompute the recommendations of every strategy in use."""
+        for strategy in self.strategies:
+            self.recommendations[strategy] = self._compute(strategy)
+        self.updated_at = time.time()
+
+    def recommend(self, strategy: str, count: int) -> Dict[str, Any]:
+        """Precomputed recommendations for ``strategy`` (computed now on first use)."""
+        self.last_used = time.monotonic()
+        if strategy not in self.recommendations:
+            self.strategies.add(strategy)
+            self.recommendations[strategy] = self._compute(strategy)
+        result = dict(self.recommendations[strategy])
+        result["recommendations"] = result["recommendations"][:count]
+        return result
+
+    def _compute(self, strategy: str) -> Dict[str, Any]:
+        available = self.available()
+        current = self.current_pick
+        turns = self.next_turns()
+        on_the_clock = bool(turns) and turns[0] == current
+
+        # Targets for our next pick: still there when we pick again after this one
+        target_pick = None
+        if turns:
+            target_pick = turns[1] if on_the_clock and len(turns) > 1 else turns[0]
+        survival: Optional[List[float]] = None
+        if target_pick is not None and available and target_pick != current:
+            survival = survival_probabilities(
+                [player["average_draft_position"] for player in available],
+                target_pick - current,
+            )
+
+        scored = []
+        for idx, player in enumerate(available):
+            percent_drafted = player.get("percent_drafted")
+            owned_pct = None if percent_drafted is None else round(percent_drafted * 100)
+            score, reasoning = score_ranked_player(player["rank"], strategy, owned_pct)
+            entry = {"player": player, "score": score, "reasoning": reasoning}
+            if survival is not None:
+                entry["survival_probability"] = round(survival[idx], 3)
+            scored.append(entry)
+        scored.sort(key=lambda entry: entry["score"], reverse=True)
+
+        insights = [f"Using {strategy} draft strategy", f"{len(available)} ranked players left"]
+        if survival is not None:
+            likely = [e for e in scored if e["survival_probability"] >= 0.5][:3]
+            names = ", ".join(e["player"]["name"] for e in likely) or "none of the ranked players"
+            insights.append(f"Likely still available at pick {target_pick}: {names}")
+
+        return {
+            "status": "success",
+            "league_key": self.league_key,
+            "strategy": strategy,
+            "current_pick": current,
+            "on_the_clock": on_the_clock,
+            "next_pick": turns[0] if turns else None,
+            "picks_until_turn": turns[0] - current if turns else None,
+            "survival_to_pick": target_pick if survival is not None else None,
+            "recommendations": scored[:MAX_RECOMMENDATIONS],
+            "total_analyzed": len(available),
+            "picks_made": len(self.drafted),
+            "insights": insights,
+            "data_source": "draft_room",
+        }
+
+
+class DraftRoomService:
+    """Draft sessions per league, each kept current by its own poller."""
+
+    def __init__(
+        self,
+        interval: float = DRAFT_POLL_INTERVAL,
+        idle_timeout: float = SESSION_IDLE_TIMEOUT,
+        no_draft_ttl: float = NO_DRAFT_TTL,
+    ):
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+        self.no_draft_ttl = no_draft_ttl
+        self._sessions: Dict[str, DraftSession] = {}
+        # league_key -> when the league was last found without a live draft
+        self._no_draft: Dict[str, float] = {}
+        self._start_locks: Dict[str, asyncio.Lock] = {}
+
+    async def recommend(
+        self, league_key: str, strategy: str = "balanced", count: int = 10
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Recommendations for our next pick in a live draft.
+
+        Returns:
+            None when the league has no draft in progress (no draft order yet,
+            or the draft is over), so callers fall back to the ranking path
+        """
+        session = await self.session(league_key)
+        if session is None:
+            return None
+        return session.recommend(strategy, count)
+
+    async def session(self, league_key: str) -> Optional[DraftSession]:
+        """The league's draft session, started on first use while the draft is live."""
+        session = self._sessions.get(league_key)
+        if session is None:
+            if self._no_draft_recently(league_key):
+                return None
+            async with self._start_lock(league_key):
+                session = self._sessions.get(league_key)
+                if session is None:
+                    if self._no_draft_recently(league_key):
+                        return None
+                    try:
+                        session = await self._start(league_key)
+                    except Exception as e:
+                        logger.warning("Draft room: could not start %s: %s", league_key, e)
+                    if session is None:
+                        self._no_draft[league_key] = time.monotonic()
+                        return None
+                    self._no_draft.pop(league_key, None)
+                    self._sessions[league_key] = session
+        if session.complete:
+            self._sessions.pop(league_key, None)
+            self._no_draft[league_key] = time.monotonic()
+            if session._task is not None:
+                session._task.cancel()
+            return None
+        return session
+
+    def _no_draft_recently(self, league_key: str) -> bool:
+        checked = self._no_draft.get(league_key)
+        return checked is not None and time.monotonic() - checked < self.no_draft_ttl
+
+    def _start_lock(self, league_key: str) -> asyncio.Lock:
+        lock = self._start_locks.get(league_key)
+        if lock is None:
+            lock = self._start_locks[league_key] = asyncio.Lock()
+        return lock
+
+    async def _start(self, league_key: str) -> Optional[DraftSession]:
+        picks = await self._fetch_picks(league_key)
+        if not picks or all(pick["player_key"] for pick in picks):
+            return None
+
+        team_info = await user_team_index.get(league_key) or {}
+        session = DraftSession(league_key, team_info.get("team_key"))
+        session.apply_picks(picks)
+        if not session.our_picks and str(team_info.get("draft_position", "")).isdigit():
+            num_teams = len({pick["team_key"] for pick in picks if pick["team_key"]})
+            num_teams = num_teams or DEFAULT_TEAMS
+            rounds = len(picks) // num_teams or DEFAULT_ROUNDS
+            session.our_picks = snake_picks(int(team_info["draft_position"]), num_teams, rounds)
+
+        session.pool = await self._fetch_pool(league_key, len(picks))
+        session.precompute()
+        session._task = asyncio.get_running_loop().create_task(self._run(session))
+        logger.info(
+            "Draft room: tracking %s from pick %s with %d ranked players",
+            league_key,
+            session.current_pick,
+            len(session.pool),
+        )
+        return session
+
+    async def _fetch_picks(self, league_key: str) -> List[Dict[str, Any]]:
+        data = await yahoo_api_call(f"league/{league_key}/draftresults", use_cache=False)
+        return parse_draft_results(data)
+
+    async def _fetch_pool(self, league_key: str, num_picks: int) -> List[Dict[str, Any]]:
+        """Ranked players with ADP, enough to cover the draft, fetched page by page."""
+        size = min(MAX_POOL_SIZE, num_picks + POOL_MARGIN)
+        starts = range(0, size, RANKINGS_PAGE_SIZE)
+        pages = await asyncio.gather(
+            *(
+                yahoo_api_call(
+                    f"league/{league_key}/players;sort=OR;start={start};"
+                    f"count={RANKINGS_PAGE_SIZE};out=draft_analysis"
+                )
+                for start in starts
+            ),
+            return_exceptions=True,
+        )
+        pool: Dict[str, Dict[str, Any]] = {}
+        for start, page in zip(starts, pages):
+            if isinstance(page, Exception):
+                logger.warning(
+                    "Draft room: rankings page %d failed for %s: %s", start, league_key, page
+                )
+                continue
+            for player in parse_draft_rankings(page, start):
+                pool.setdefault(player["player_key"], player)
+        return sorted(pool.values(), key=lambda player: player["rank"])
+
+    async def poll_once(self, session: DraftSession) -> int:
+        """Fetch the draft results once and apply the new picks; returns how many."""
+        picks = await self._fetch_picks(session.league_key)
+        session.polls += 1
+        changed = picks != session.picks
+        new_picks = session.apply_picks(picks)
+        if changed:
+            session.precompute()
+        return len(new_picks)
+
+    async def _run(self, session: DraftSession) -> None:
+        while not session.complete:
+            if time.monotonic() - session.last_used > self.idle_timeout:
+                logger.info("Draft room: %s idle, poller stopped", session.league_key)
+                break
+            await asyncio.sleep(self.interval)
+            try:
+                await self.poll_once(session)
+            except Exception as e:
+                logger.warning("Draft room: poll failed for %s: %s", session.league_key, e)
+        if self._sessions.get(session.league_key) is session:
+            del self._sessions[session.league_key]
+
+    def stop(self) -> None:
+        """Cancel every session poller."""
+        for session in self._sessions.values():
+            if session._task is not None:
+                session._task.cancel()
+        self._sessions.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            league_key: {
+                "current_pick": session.current_pick,
+                "picks_made": len(session.drafted),
+                "pool_size": len(session.pool),
+                "polls": session.polls,
+            }
+            for league_key, session in self._sessions.items()
+        }
+
+
+# Global instance
+draft_rooms = DraftRoomService()
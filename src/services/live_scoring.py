@@ -0,0 +1,273 @@
+"""Game-day live scoring with one shared poller.
+
+Without this, every client that wants live scores polls ``ff_get_matchup``
+and each poll re-fetches Yahoo scoreboards. During NFL game windows (from
+Sleeper's NFL state plus the weekly kickoff windows) a single background task
+polls, on one cadence, the Yahoo scoreboard of every league someone is
+watching. It diffs each scoreboard against the previous snapshot, keeps a
+projected final score per team, and hands only the changed matchups to
+subscribers (the MCP servers turn those into resource update notifications).
+Upstream cost depends on the number of watched leagues, not on the number of
+watchers, and each league refreshes under its own lock so one slow scoreboard
+never holds up another league.
+"""
+
+import asyncio
+import itertools
+import logging
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+from src.api import yahoo_api_call
+from src.api.yahoo_utils import response_cache
+from src.parsers import parse_league_scoreboard
+
+logger = logging.getLogger(__name__)
+
+# Seconds between polls inside a game window (the matchup cache TTL)
+LIVE_POLL_INTERVAL = 60
+# Seconds between NFL state checks while no games are on
+IDLE_CHECK_INTERVAL = 900
+
+EASTERN = ZoneInfo("America/New_York")
+
+# Kickoff-to-final windows in US Eastern time: weekday -> [(start_hour, end_hour)]
+GAME_WINDOWS_ET: Dict[int, List[tuple]] = {
+    0: [(19, 24)],  # Monday night
+    1: [(0, 1)],  # Monday night games running past midnight
+    3: [(20, 24)],  # Thursday night
+    5: [(13, 24)],  # Saturday, late regular season and playoffs only
+    6: [(9, 24)],  # Sunday, from the international morning games on
+}
+SATURDAY_FROM_WEEK = 15
+
+ChangeListener = Callable[[str, List[Dict[str, Any]]], Awaitable[None]]
+
+
+def in_game_window(now: datetime, nfl_state: Dict[str, Any]) -> bool:
+    """Whether NFL games may be in progress at ``now`` given Sleeper's NFL state."""
+    season_type = nfl_state.get("season_type")
+    if season_type not in ("regular", "post"):
+        return False
+
+    local = now.astimezone(EASTERN)
+    weekday = local.weekday()
+    if weekday == 5 and season_type == "regular":
+        week = nfl_state.get("week") or 0
+        if int(week) < SATURDAY_FROM_WEEK:
+            return False
+
+    hour = local.hour + local.minute / 60
+    return any(start <= hour < end for start, end in GAME_WINDOWS_ET.get(weekday, []))
+
+
+def matchup_id(matchup: Dict[str, Any]) -> str:
+    """Stable id for a scoreboard matchup: week plus the sorted Yahoo team ids."""
+    team_ids = sorted(team["team_key"].rsplit(".", 1)[-1] for team in matchup["teams"])
+    return f"week{matchup.get('week')}-" + "-".join(team_ids)
+
+
+def projected_final(team: Dict[str, Any], status: Optional[str]) -> Optional[float]:
+    """Yahoo's live projection when reported; otherwise the final or best-known score."""
+    if team.get("live_projected_points") is not None:
+        return team["live_projected_points"]
+    points = team.get("points")
+    if status == "postevent":
+        return points
+    projected = team.get("projected_points")
+    if points is None:
+        return projected
+    return max(points, projected) if projected is not None else points
+
+
+def diff_scoreboard(
+    previous: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Matchups in ``current`` that are new or differ from ``previous``."""
+    return [matchup for mid, matchup in current.items() if previous.get(mid) != matchup]
+
+
+class LiveScoringService:
+    """Shared live scoreboard poller with per-league subscribers."""
+
+    def __init__(
+        self,
+        sleeper_client: Any = None,
+        interval: float = LIVE_POLL_INTERVAL,
+        idle_interval: float = IDLE_CHECK_INTERVAL,
+        clock: Optional[Callable[[], datetime]] = None,
+    ):
+        self._sleeper_client = sleeper_client
+        self.interval = interval
+        self.idle_interval = idle_interval
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._subscribers: Dict[str, Dict[int, ChangeListener]] = {}
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        self._tokens = itertools.count(1)
+        self._task: Optional[asyncio.Task] = None
+        self._refresh_locks: Dict[str, asyncio.Lock] = {}
+        # Scoreboard fetches per league, so a poll can skip one refreshed while it waited
+        self._generations: Dict[str, int] = {}
+        self.polls = 0
+
+    @property
+    def sleeper(self) -> Any:
+        if self._sleeper_client is None:
+            from sleeper_api import sleeper_client
+
+            self._sleeper_client = sleeper_client
+        return self._sleeper_client
+
+    # Subscriptions
+
+    def subscribe(self, league_key: str, listener: ChangeListener) -> int:
+        """Register ``listener`` for changed matchups in a league; starts the poller."""
+        token = next(self._tokens)
+        self._subscribers.setdefault(league_key, {})[token] = listener
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info(
+            "Live scoring: %d watcher(s) on %s", len(self._subscribers[league_key]), league_key
+        )
+        return token
+
+    def unsubscribe(self, token: int) -> bool:
+        """Remove a subscription; the poller stops once nobody is watching."""
+        for league_key, listeners in list(self._subscribers.items()):
+            if listeners.pop(token, None) is not None:
+                if not listeners:
+                    del self._subscribers[league_key]
+                return True
+        return False
+
+    def watched_leagues(self) -> List[str]:
+        return list(self._subscribers)
+
+    # Snapshots
+
+    def snapshot(self, league_key: str) -> Optional[Dict[str, Any]]:
+        """Latest scoreboard snapshot for a league, if one has been taken."""
+        snapshot = self._snapshots.get(league_key)
+        if snapshot is None:
+            return None
+        return {
+            **snapshot,
+            "updated_at": snapshot["updated_at"].isoformat(),
+            "matchups": list(snapshot["matchups"].values()),
+        }
+
+    async def scoreboard(self, league_key: str) -> Dict[str, Any]:
+        """
+        Current scoreboard for a league.
+
+        Served from the shared snapshot while it is younger than the poll
+        interval, so concurrent callers cost one upstream request per interval.
+        """
+        if not self._is_fresh(league_key):
+            changed: List[Dict[str, Any]] = []
+            async with self._league_lock(league_key):
+                if not self._is_fresh(league_key):
+                    state = await self.sleeper.get_nfl_state()
+                    changed = await self._refresh_league(league_key, state)
+            if changed:
+                await self._notify(league_key, changed)
+        return self.snapshot(league_key) or {"league_key": league_key, "matchups": []}
+
+    def _league_lock(self, league_key: str) -> asyncio.Lock:
+        lock = self._refresh_locks.get(league_key)
+        if lock is None:
+            lock = self._refresh_locks[league_key] = asyncio.Lock()
+        return lock
+
+    def _is_fresh(self, league_key: str) -> bool:
+        snapshot = self._snapshots.get(league_key)
+        if snapshot is None:
+            return False
+        age = (self._clock() - snapshot["updated_at"]).total_seconds()
+        return age < self.interval
+
+    # Polling
+
+    async def poll_once(self) -> bool:
+        """
+        Poll every watched league once if games may be on.
+
+        Returns:
+            True when inside a game window (the caller polls again after
+            ``interval``), False otherwise
+        """
+        state = await self.sleeper.get_nfl_state()
+        if not in_game_window(self._clock(), state):
+            return False
+
+        self.polls += 1
+        leagues = self.watched_leagues()
+        results = await asyncio.gather(
+            *(self._poll_league(league_key, state) for league_key in leagues),
+            return_exceptions=True,
+        )
+        for league_key, changed in zip(leagues, results):
+            if isinstance(changed, Exception):
+                logger.warning(
+                    "Live scoring: scoreboard refresh failed for %s: %s", league_key, changed
+                )
+            elif changed:
+                await self._notify(league_key, changed)
+        return True
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            try:
+                live = await self.poll_once()
+            except Exception:
+                logger.exception("Live scoring poll failed")
+                live = True
+            await asyncio.sleep(self.interval if live else self.idle_interval)
+        logger.info("Live scoring: no watchers left, poller stopped")
+
+    async def _poll_league(self, league_key: str, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Refresh one league for the poller unless a reader refreshed it meanwhile."""
+        generation = self._generations.get(league_key, 0)
+        async with self._league_lock(league_key):
+            if self._generations.get(league_key, 0) != generation:
+                return []  # fetched (and notified) by scoreboard() while we waited
+            return await self._refresh_league(league_key, state)
+
+    async def _refresh_league(self, league_key: str, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Fetch one scoreboard, store the snapshot and return the changed matchups."""
+        week = state.get("week")
+        endpoint = f"league/{league_key}/scoreboard" + (f";week={week}" if week else "")
+        data = await yahoo_api_call(endpoint, use_cache=False)
+        # Tool calls for the same scoreboard within the cache TTL reuse this fetch
+        await response_cache.set(endpoint, data)
+
+        current: Dict[str, Dict[str, Any]] = {}
+        for matchup in parse_league_scoreboard(data):
+            for team in matchup["teams"]:
+                team["projected_final"] = projected_final(team, matchup.get("status"))
+            matchup["matchup_id"] = matchup_id(matchup)
+            current[matchup["matchup_id"]] = matchup
+
+        previous = self._snapshots.get(league_key, {}).get("matchups", {})
+        self._generations[league_key] = self._generations.get(league_key, 0) + 1
+        self._snapshots[league_key] = {
+            "league_key": league_key,
+            "week": week,
+            "updated_at": self._clock(),
+            "matchups": current,
+        }
+        return diff_scoreboard(previous, current)
+
+    async def _notify(self, league_key: str, changed: List[Dict[str, Any]]) -> None:
+        for token, listener in list(self._subscribers.get(league_key, {}).items()):
+            try:
+                await listener(league_key, changed)
+            except Exception as e:
+                # Session went away; stop pushing to it
+                logger.debug("Live scoring: dropping watcher %s on %s: %s", token, league_key, e)
+                self.unsubscribe(token)
+
+
+# Global instance
+live_scores = LiveScoringService()
@@ -11,6 +11,7 @@ import logging
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+from src.services.stats_warehouse import StatsWarehouse, stats_warehouse
 
 logger = logging.getLogger(__name__)
 
@@ -191,110 +192,107 @@ def calculate_breakout_score(recent_avg: float, projection: float, recent_high:
     return flags
 
 
-async def get_recent_stats(
-    sleeper_api, sleeper_id: str, season: int, current_week: int, lookback: int = 3
-) -> Optional[RecentPerformance]:
-    """Fetch recent actual stats for a player from Sleeper API.
+def build_recent_performance(weeks_data: List[Dict[str, Any]]) -> Optional[RecentPerformance]:
+    """Summarize per-week stat lines (``{"week", "stats", "points"}``, newest first)."""
+    if not weeks_data:
+        return None
+
+    # Trend is computed over weeks in chronological order
+    points_by_week = sorted((w["week"], w["points"]) for w in weeks_data)
+    return RecentPerformance(
+        weeks_analyzed=len(weeks_data),
+        avg_points=calculate_recent_avg([w["stats"] for w in weeks_data]),
+        total_points=sum(w["points"] for w in weeks_data),
+        weeks_data=weeks_data,
+        trend=calculate_performance_trend(points_by_week),
+    )
+
+
+async def get_recent_stats_batch(
+    sleeper_api,
+    sleeper_ids: List[str],
+    season: int,
+    current_week: int,
+    lookback: int = 3,
+    warehouse: Optional[StatsWarehouse] = None,
+) -> Dict[str, Optional[RecentPerformance]]:
+    """Recent actual stats for many players from the local stats warehouse.
+
+    Weeks missing from the warehouse are ingested from Sleeper once (one
+    league-wide request per week), then every player is answered by one query.
 
     Args:
-        sleeper_api: SleeperAPI instance
-        sleeper_id: Player's Sleeper ID
+        sleeper_api: SleeperAPI instance used to ingest missing weeks
+        sleeper_ids: Players' Sleeper IDs
         season: NFL season year
         current_week: Current week number
         lookback: Number of weeks to look back (default: 3)
+        warehouse: Stats warehouse (default: the shared instance)
 
     Returns:
-        RecentPerformance object or None if no stats available
+        Dict of sleeper_id -> RecentPerformance, or None if no stats available
     """
-    if not sleeper_id or current_week < 1:
-        logger.debug(
-            "get_recent_stats: skipping stats fetch sleeper_id=%r current_week=%s",
-            sleeper_id,
+    warehouse = warehouse or stats_warehouse
+    sleeper_ids = [sid for sid in sleeper_ids if sid]
+    if not sleeper_ids or current_week < 1:
+        return {sid: None for sid in sleeper_ids}
+
+    try:
+        recent = await warehouse.recent_stats(
+            sleeper_ids, season, current_week, lookback, sleeper_api=sleeper_api
+        )
+    except Exception:
+        logger.exception(
+            "get_recent_stats_batch: warehouse lookup failed season=%s current_week=%s",
+            season,
             current_week,
         )
-        return None
+        return {sid: None for sid in sleeper_ids}
 
     logger.debug(
-        "get_recent_stats: sleeper_id=%s season=%s current_week=%s lookback=%s",
-        sleeper_id,
+        "get_recent_stats_batch: %d/%d players with stats season=%s current_week=%s lookback=%s",
+        len(recent),
+        len(sleeper_ids),
         season,
         current_week,
         lookback,
     )
+    return {sid: build_recent_performance(recent.get(str(sid), [])) for sid in sleeper_ids}
 
-    weeks_data = []
-    points_by_week = []
-
-    # Fetch stats for last N weeks (going backwards from current_week - 1)
-    for i in range(1, lookback + 1):
-        week = current_week - i
-        if week < 1:
-            break
 
-        logger.debug(
-            "get_recent_stats: requesting stats sleeper_id=%s season=%s week=%s",
-            sleeper_id,
-            season,
-            week,
-        )
+async def get_recent_stats(
+    sleeper_api,
+    sleeper_id: str,
+    season: int,
+    current_week: int,
+    lookback: int = 3,
+    warehouse: Optional[StatsWarehouse] = None,
+) -> Optional[RecentPerformance]:
+    """Fetch recent actual stats for a player.
 
-        try:
-            stats = await sleeper_api.get_player_stats(season, week)
-            if stats and sleeper_id in stats:
-                week_stats = stats[sleeper_id]
-                points = week_stats.get("pts_ppr") or week_stats.get("pts", 0)
-                if isinstance(points, (int, float)):
-                    weeks_data.append({"week": week, "stats": week_stats, "points": float(points)})
-                    points_by_week.append((week, float(points)))
-                    logger.debug(
-                        "get_recent_stats: captured points=%s sleeper_id=%s week=%s",
-                        points,
-                        sleeper_id,
-                        week,
-                    )
-                else:
-                    logger.debug(
-                        "get_recent_stats: non-numeric points sleeper_id=%s week=%s payload_keys=%s",
-                        sleeper_id,
-                        week,
-                        list(week_stats.keys()),
-                    )
-            else:
-                logger.debug(
-                    "get_recent_stats: no stats entry sleeper_id=%s week=%s",
-                    sleeper_id,
-                    week,
-                )
-        except Exception:
-            logger.exception(
-                "get_recent_stats: error fetching stats sleeper_id=%s season=%s week=%s",
-                sleeper_id,
-                season,
-                week,
-            )
-            continue
+    Args:
+        sleeper_api: SleeperAPI instance
+        sleeper_id: Player's Sleeper ID
+        season: NFL season year
+        current_week: Current week number
+        lookback: Number of weeks to look back (default: 3)
+        warehouse: Stats warehouse (default: the shared instance)
 
-    if not weeks_data:
+    Returns:
+        RecentPerformance object or None if no stats available
+    """
+    if not sleeper_id or current_week < 1:
         logger.debug(
-            "get_recent_stats: no recent data sleeper_id=%s current_week=%s lookback=%s",
+            "get_recent_stats: skipping stats fetch sleeper_id=%r current_week=%s",
             sleeper_id,
             current_week,
-            lookback,
         )
         return None
 
-    # Calculate metrics
-    avg_points = calculate_recent_avg([w["stats"] for w in weeks_data])
-    total_points = sum(w["points"] for w in weeks_data)
-    trend = calculate_performance_trend(points_by_week)
-
-    return RecentPerformance(
-        weeks_analyzed=len(weeks_data),
-        avg_points=avg_points,
-        total_points=total_points,
-        weeks_data=weeks_data,
-        trend=trend,
+    recent = await get_recent_stats_batch(
+        sleeper_api, [sleeper_id], season, current_week, lookback, warehouse
     )
+    return recent.get(sleeper_id)
 
 
 async def enhance_player_with_context(
@@ -302,6 +300,7 @@ async def enhance_player_with_context(
     current_week: int,
     season: int,
     sleeper_api,
+    recent_stats: Optional[Dict[str, Optional[RecentPerformance]]] = None,
 ) -> EnhancedPlayerData:
     """Main enhancement function - adds bye week detection, recent stats, and flags.
 
@@ -310,6 +309,8 @@ async def enhance_player_with_context(
         current_week: Current NFL week
         season: Current NFL season
         sleeper_api: SleeperAPI instance for stats fetching
+        recent_stats: Recent performance by sleeper_id from ``get_recent_stats_batch``;
+            players missing from it are looked up individually
 
     Returns:
         EnhancedPlayerData with all context and flags
@@ -357,7 +358,9 @@ async def enhance_player_with_context(
 
     # Get recent performance stats
     sleeper_id = getattr(player, "sleeper_id", None)
-    if sleeper_id:
+    if recent_stats is not None and sleeper_id in recent_stats:
+        recent_performance = recent_stats[sleeper_id]
+    elif sleeper_id:
         try:
             recent_performance = await get_recent_stats(
                 sleeper_api, sleeper_id, season, current_week, lookback=3
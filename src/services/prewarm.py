@@ -0,0 +1,124 @@
+"""Opt-in start-up warm-up of reference data.
+
+Without it the first tool call pays for everything the server lazily loads:
+NFL state, the Sleeper player universe and its name index, defensive
+rankings, the static bye week table, league discovery and the user team
+index. With ``PREWARM_ON_START=1`` the server entry points load all of them
+concurrently as soon as they start, and ``/health`` reports not-ready (503)
+until that finishes. Each step that fails, e.g. offline or without Yahoo
+credentials, is recorded and skipped: after ``PREWARM_TIMEOUT`` seconds at
+most, the server reports ready and those lookups happen on first use as before.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from src.services.team_index import user_team_index
+from src.utils.bye_weeks import load_static_bye_weeks
+
+logger = logging.getLogger(__name__)
+
+# Seconds the warm-up may take before unfinished steps are abandoned
+PREWARM_TIMEOUT = 30.0
+
+Step = Callable[[], Awaitable[Any]]
+
+
+def prewarm_enabled() -> bool:
+    """Whether ``PREWARM_ON_START`` asks for a start-up warm-up."""
+    return os.getenv("PREWARM_ON_START", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def prewarm_timeout() -> float:
+    """``PREWARM_TIMEOUT`` in seconds, falling back to the default on bad values."""
+    try:
+        return float(os.getenv("PREWARM_TIMEOUT", PREWARM_TIMEOUT))
+    except ValueError:
+        return PREWARM_TIMEOUT
+
+
+def reference_data_steps(discover_leagues: Optional[Step] = None) -> Dict[str, Step]:
+    """The warm-up steps; league discovery lives in the server module, so it is passed in."""
+    from sleeper_api import sleeper_client
+
+    steps: Dict[str, Step] = {
+        "nfl_state": sleeper_client.get_nfl_state,
+        "players": sleeper_client.get_all_players,  # also builds the name index
+        "defensive_rankings": sleeper_client.get_defensive_rankings,
+        "bye_weeks": lambda: asyncio.to_thread(load_static_bye_weeks),
+        "user_teams": user_team_index.refresh,
+    }
+    if discover_leagues is not None:
+        steps["leagues"] = discover_leagues
+    return steps
+
+
+class StartupPrewarm:
+    """Runs the warm-up steps concurrently and tracks readiness for ``/health``."""
+
+    def __init__(self):
+        self.state = "idle"
+        self.results: Dict[str, str] = {}
+        self.duration: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        """False only while a warm-up is in progress; servers without one are always ready."""
+        return self.state != "warming"
+
+    async def run(self, steps: Dict[str, Step], timeout: float = PREWARM_TIMEOUT) -> Dict[str, str]:
+        """
+        Run every step concurrently, abandoning those still running after ``timeout``.
+
+        Returns:
+            Dict of step name -> "ok", "empty", "failed: <reason>" or "timeout"
+        """
+        self.state = "warming"
+        self.results = {}
+        started = time.monotonic()
+        tasks = {
+            name: asyncio.ensure_future(self._run_step(name, step)) for name, step in steps.items()
+        }
+        try:
+            if tasks:
+                _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+                for name, task in tasks.items():
+                    if task in pending:
+                        task.cancel()
+                        self.results[name] = "timeout"
+        finally:
+            self.duration = round(time.monotonic() - started, 3)
+            self.state = "ready"
+
+        degraded = sorted(name for name, result in self.results.items() if result != "ok")
+        logger.info(
+            "Start-up warm-up finished in %.2fs%s",
+            self.duration,
+            f" (degraded: {', '.join(degraded)})" if degraded else "",
+        )
+        return dict(self.results)
+
+    async def _run_step(self, name: str, step: Step) -> None:
+        try:
+            result = await step()
+        except Exception as e:
+            logger.warning("Start-up warm-up step %s failed: %s", name, e)
+            self.results[name] = f"failed: {e}"
+            return
+        # The Sleeper client returns empty data instead of raising when offline
+        self.results[name] = "ok" if result or result is None else "empty"
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "status": "ok" if self.ready else "warming",
+            "prewarm": self.state,
+            "prewarm_seconds": self.duration,
+            "prewarm_steps": dict(self.results),
+        }
+
+
+# Global instance
+startup_prewarm = StartupPrewarm()
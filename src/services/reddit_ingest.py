@@ -0,0 +1,568 @@
+"""Background Reddit ingestion into a local post store.
+
+Without it every sentiment request searches each subreddit for the past
+week and expands the comment trees of every hit. Here one worker polls the
+configured subreddits' new posts and new comments on a fixed cadence,
+reading only what arrived since the last seen fullname of each stream. Each
+item is scored once, indexed by the Sleeper player IDs it mentions (full
+names from the Sleeper name index) and added to hourly per-player sentiment
+buckets. While the store is fresh, ``ff_analyze_reddit_sentiment`` answers
+from SQLite and only the worker spends Reddit API budget. The worker is
+opt-in (``REDDIT_INGEST=1``); the store can also be filled by another
+process sharing ``CACHE_DIR``.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds between ingestion passes
+INGEST_INTERVAL = 120
+# How far back the first pass (or one after a long pause) reads
+BACKFILL_HOURS = 168
+# Items older than this are pruned together with their sentiment buckets
+RETENTION_DAYS = 14
+# Seconds after the last successful pass during which the store answers requests
+STALE_AFTER = 900
+# Upper bound on items read per stream and pass (Reddit listings stop at 1000)
+POLL_LIMIT = 1000
+
+# Positions whose names are indexed; team defenses would match every team mention
+INDEXED_POSITIONS = ("QB", "RB", "WR", "TE", "K")
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reddit_items (
+    fullname TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    subreddit TEXT NOT NULL,
+    created_utc REAL NOT NULL,
+    score INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    sentiment REAL NOT NULL,
+    injury INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reddit_items_created ON reddit_items (created_utc);
+CREATE TABLE IF NOT EXISTS reddit_mentions (
+    player_id TEXT NOT NULL,
+    fullname TEXT NOT NULL,
+    created_utc REAL NOT NULL,
+    PRIMARY KEY (player_id, fullname)
+);
+CREATE INDEX IF NOT EXISTS reddit_mentions_player ON reddit_mentions (player_id, created_utc);
+CREATE TABLE IF NOT EXISTS player_sentiment_hourly (
+    player_id TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    posts INTEGER NOT NULL,
+    comments INTEGER NOT NULL,
+    positive INTEGER NOT NULL,
+    negative INTEGER NOT NULL,
+    neutral INTEGER NOT NULL,
+    injury INTEGER NOT NULL,
+    weighted_total REAL NOT NULL,
+    PRIMARY KEY (player_id, hour)
+);
+CREATE TABLE IF NOT EXISTS ingest_cursors (
+    stream TEXT PRIMARY KEY,
+    fullname TEXT NOT NULL,
+    created_utc REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+_ADD_TO_BUCKET = """
+INSERT INTO player_sentiment_hourly VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (player_id, hour) DO UPDATE SET
+    posts = posts + excluded.posts,
+    comments = comments + excluded.comments,
+    positive = positive + excluded.positive,
+    negative = negative + excluded.negative,
+    neutral = neutral + excluded.neutral,
+    injury = injury + excluded.injury,
+    weighted_total = weighted_total + excluded.weighted_total
+"""
+
+Cursor = Tuple[str, float]
+
+
+def _default_store_path() -> Path:
+    return Path(os.getenv("CACHE_DIR", "./.cache")) / "reddit_posts.sqlite"
+
+
+def reddit_ingest_enabled() -> bool:
+    """Whether ``REDDIT_INGEST`` asks for the background ingestion worker."""
+    return os.getenv("REDDIT_INGEST", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase words separated by single spaces, padded so names match whole words."""
+    return f" {_NON_WORD.sub(' ', text.lower()).strip()} "
+
+
+def name_forms(normalized_name: str) -> List[str]:
+    """Forms of a Sleeper-normalized name to look for: "a j brown" also as "aj brown"."""
+    forms = [normalized_name]
+    parts = normalized_name.split()
+    if len(parts) > 2 and all(len(part) == 1 for part in parts[:-1]):
+        forms.append(f"{''.join(parts[:-1])} {parts[-1]}")
+    return forms
+
+
+class RedditPostStore:
+    """Ingested posts and comments indexed by player, plus hourly sentiment buckets."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else _default_store_path()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def cursors(self) -> Dict[str, Cursor]:
+        """Newest ingested item per stream ("<subreddit>:posts" or "<subreddit>:comments")."""
+        with self._db_lock:
+            rows = self._connect().execute(
+                "SELECT stream, fullname, created_utc FROM ingest_cursors"
+            ).fetchall()
+        return {stream: (fullname, created_utc) for stream, fullname, created_utc in rows}
+
+    def last_ingested(self) -> Optional[float]:
+        """When a pass last completed, or None if nothing was ever ingested here."""
+        if self._conn is None and not self.path.exists():
+            return None
+        with self._db_lock:
+            row = self._connect().execute("SELECT MAX(updated_at) FROM ingest_cursors").fetchone()
+        return row[0]
+
+    def add_items(self, items: List[Dict[str, Any]], cursors: Dict[str, Cursor]) -> int:
+        """
+        Store scored items and fold them into the hourly buckets of each player they mention.
+
+        Each item carries fullname, kind ("post"/"comment"), subreddit, created_utc,
+        score, text, sentiment, injury, weight (its content weight) and player_ids.
+        Items already stored are skipped, so a pass can safely overlap the previous one.
+
+        Returns:
+            Number of new items
+        """
+        now = time.time()
+        added = 0
+        with self._db_lock:
+            conn = self._connect()
+            with conn:
+                for item in items:
+                    inserted = conn.execute(
+                        "INSERT OR IGNORE INTO reddit_items VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            item["fullname"],
+                            item["kind"],
+                            item["subreddit"],
+                            item["created_utc"],
+                            item["score"],
+                            item["text"],
+                            item["sentiment"],
+                            int(item["injury"]),
+                        ),
+                    ).rowcount
+                    if not inserted:
+                        continue
+                    added += 1
+                    sentiment = item["sentiment"]
+                    is_post = item["kind"] == "post"
+                    bucket = (
+                        int(item["created_utc"] // 3600),
+                        int(is_post),
+                        int(not is_post),
+                        int(sentiment > 0.1),
+                        int(sentiment < -0.1),
+                        int(-0.1 <= sentiment <= 0.1),
+                        int(item["injury"]),
+                        sentiment * item["weight"],
+                    )
+                    for player_id in item["player_ids"]:
+                        conn.execute(
+                            "INSERT OR IGNORE INTO reddit_mentions VALUES (?, ?, ?)",
+                            (player_id, item["fullname"], item["created_utc"]),
+                        )
+                        conn.execute(_ADD_TO_BUCKET, (player_id, *bucket))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO ingest_cursors VALUES (?, ?, ?, ?)",
+                    [(stream, *cursor, now) for stream, cursor in cursors.items()],
+                )
+        return added
+
+    def player_totals(self, player_id: str, since: float) -> Dict[str, float]:
+        """Summed hourly buckets of a player from the hour containing ``since`` on."""
+        with self._db_lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT COALESCE(SUM(posts), 0), COALESCE(SUM(comments), 0), "
+                    "COALESCE(SUM(positive), 0), COALESCE(SUM(negative), 0), "
+                    "COALESCE(SUM(neutral), 0), COALESCE(SUM(injury), 0), "
+                    "COALESCE(SUM(weighted_total), 0.0) FROM player_sentiment_hourly "
+                    "WHERE player_id = ? AND hour >= ?",
+                    (str(player_id), int(since // 3600)),
+                )
+                .fetchone()
+            )
+        keys = ("posts", "comments", "positive", "negative", "neutral", "injury", "weighted_total")
+        return dict(zip(keys, row))
+
+    def top_comments(self, player_id: str, since: float, limit: int = 5) -> List[Dict[str, Any]]:
+        """Highest-scored comments mentioning a player (score above 5, as the live analysis)."""
+        with self._db_lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT i.text, i.score, i.subreddit FROM reddit_mentions m "
+                    "JOIN reddit_items i ON i.fullname = m.fullname "
+                    "WHERE m.player_id = ? AND m.created_utc >= ? "
+                    "AND i.kind = 'comment' AND i.score > 5 "
+                    "ORDER BY i.score DESC LIMIT ?",
+                    (str(player_id), since, limit),
+                )
+                .fetchall()
+            )
+        return [
+            {"text": text[:200], "score": score, "subreddit": subreddit}
+            for text, score, subreddit in rows
+        ]
+
+    def series(self, player_id: str, since: float) -> List[Dict[str, Any]]:
+        """A player's hourly sentiment time series: mentions and average weighted sentiment."""
+        with self._db_lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT hour, posts + comments, weighted_total, injury "
+                    "FROM player_sentiment_hourly WHERE player_id = ? AND hour >= ? "
+                    "ORDER BY hour",
+                    (str(player_id), int(since // 3600)),
+                )
+                .fetchall()
+            )
+        return [
+            {
+                "hour": hour * 3600,
+                "mentions": mentions,
+                "sentiment": weighted_total / mentions if mentions else 0.0,
+                "injury_mentions": injury,
+            }
+            for hour, mentions, weighted_total, injury in rows
+        ]
+
+    def prune(self, before: float) -> None:
+        """Drop items and buckets older than ``before``."""
+        with self._db_lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM reddit_items WHERE created_utc < ?", (before,))
+                conn.execute("DELETE FROM reddit_mentions WHERE created_utc < ?", (before,))
+                conn.execute(
+                    "DELETE FROM player_sentiment_hourly WHERE hour < ?", (int(before // 3600),)
+                )
+
+    def __len__(self) -> int:
+        if self._conn is None and not self.path.exists():
+            return 0
+        with self._db_lock:
+            return self._connect().execute("SELECT COUNT(*) FROM reddit_items").fetchone()[0]
+
+    def clear(self) -> None:
+        """Drop every ingested item, bucket and cursor."""
+        with self._db_lock:
+            conn = self._connect()
+            with conn:
+                for table in (
+                    "reddit_items",
+                    "reddit_mentions",
+                    "player_sentiment_hourly",
+                    "ingest_cursors",
+                ):
+                    conn.execute(f"DELETE FROM {table}")
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class RedditIngestor:
+    """Polls the configured subreddits and keeps the post store current."""
+
+    def __init__(
+        self,
+        store: Optional[RedditPostStore] = None,
+        agent: Any = None,
+        sleeper_client: Any = None,
+        interval: float = INGEST_INTERVAL,
+        stale_after: float = STALE_AFTER,
+    ):
+        self.store = store if store is not None else RedditPostStore()
+        self._agent = agent
+        self._sleeper_client = sleeper_client
+        self.interval = interval
+        self.stale_after = stale_after
+        self._task: Optional[asyncio.Task] = None
+        self._players: Optional[Dict[str, Any]] = None
+        self._name_ids: Dict[str, str] = {}
+        self._name_matcher: Any = None
+        # Kept in memory so freshness checks on every request skip the database
+        self._last_ingested: Optional[float] = None
+        self._last_ingested_loaded = False
+        self.passes = 0
+
+    @property
+    def agent(self) -> Any:
+        """The shared Reddit agent: its praw client, subreddit list and sentiment scoring."""
+        if self._agent is None:
+            from src.services.reddit_service import get_reddit_agent
+
+            self._agent = get_reddit_agent()
+        return self._agent
+
+    @property
+    def sleeper(self) -> Any:
+        if self._sleeper_client is None:
+            from sleeper_api import sleeper_client
+
+            self._sleeper_client = sleeper_client
+        return self._sleeper_client
+
+    async def is_fresh(self) -> bool:
+        """Whether the store was updated recently enough to answer requests."""
+        if not self._last_ingested_loaded:
+            self._last_ingested = await asyncio.to_thread(self.store.last_ingested)
+            self._last_ingested_loaded = True
+        last = self._last_ingested
+        return last is not None and time.time() - last < self.stale_after
+
+    # Ingestion
+
+    async def _refresh_name_index(self) -> None:
+        """Match full names of indexed positions, rebuilt whenever Sleeper reloads players."""
+        players = await self.sleeper.get_all_players()
+        if not players or players is self._players:
+            return
+        from src.agents.reddit_analyzer import KeywordMatcher
+
+        name_ids = {}
+        # The Sleeper index already picks one player per name (active, best ranked)
+        for name, player_id in self.sleeper.normalized_name_index().items():
+            player = players.get(player_id) or {}
+            if not player.get("active") or player.get("position") not in INDEXED_POSITIONS:
+                continue
+            for form in name_forms(name):
+                name_ids[f" {form} "] = player_id
+        self._players = players
+        self._name_ids = name_ids
+        self._name_matcher = KeywordMatcher({"players": dict.fromkeys(name_ids, 1.0)})
+        logger.debug("Indexed %d player names for Reddit ingestion", len(name_ids))
+
+    def player_ids(self, text: str) -> List[str]:
+        """Sleeper IDs of the players ``text`` mentions by full name."""
+        if self._name_matcher is None:
+            return []
+        found = self._name_matcher.find(normalize_text(text))
+        return sorted({self._name_ids[name] for name in found})
+
+    @staticmethod
+    def _pull(
+        reddit: Any, subreddit_name: str, kind: str, cursor: Optional[Cursor], floor: float
+    ) -> List[Dict[str, Any]]:
+        """New posts or comments of a subreddit, newest first, back to ``cursor``."""
+        subreddit = reddit.subreddit(subreddit_name)
+        listing = subreddit.new if kind == "post" else subreddit.comments
+        items = []
+        for item in listing(limit=POLL_LIMIT):
+            if item.created_utc < floor:
+                break
+            # Also stop at older items in case the cursor item was deleted
+            if cursor is not None and (item.fullname == cursor[0] or item.created_utc < cursor[1]):
+                break
+            text = f"{item.title} {item.selftext}" if kind == "post" else item.body
+            items.append(
+                {
+                    "fullname": item.fullname,
+                    "kind": kind,
+                    "subreddit": subreddit_name,
+                    "created_utc": item.created_utc,
+                    "score": item.score,
+                    "text": text,
+                }
+            )
+        return items
+
+    async def ingest_once(self) -> int:
+        """
+        Pull every stream since its cursor, score what mentions a player and store it.
+
+        Returns:
+            Number of new items stored
+        """
+        agent = self.agent
+        if not agent._is_reddit_available():
+            return 0
+        from src.agents.reddit_analyzer import SentimentModel, content_weight
+
+        await self._refresh_name_index()
+        loop = asyncio.get_running_loop()
+        now = time.time()
+        floor = now - BACKFILL_HOURS * 3600
+        # The store is SQLite; its calls run in a worker thread, off the event loop
+        cursors = await asyncio.to_thread(self.store.cursors)
+        weights = {info["name"]: info["weight"] for info in agent.subreddits}
+        streams = [(name, kind) for name in weights for kind in ("post", "comment")]
+
+        pulled = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    agent.thread_executor,
+                    self._pull,
+                    agent.reddit,
+                    name,
+                    kind,
+                    cursors.get(f"{name}:{kind}s"),
+                    floor,
+                )
+                for name, kind in streams
+            ),
+            return_exceptions=True,
+        )
+
+        items = []
+        new_cursors = {}
+        for (name, kind), stream_items in zip(streams, pulled):
+            stream = f"{name}:{kind}s"
+            if isinstance(stream_items, Exception):
+                logger.warning("Reddit ingestion of %s failed: %s", stream, stream_items)
+                continue
+            if stream_items:
+                newest = stream_items[0]
+                new_cursors[stream] = (newest["fullname"], newest["created_utc"])
+            elif stream in cursors:
+                new_cursors[stream] = cursors[stream]
+            for item in stream_items:
+                item["player_ids"] = self.player_ids(item["text"])
+                if item["player_ids"]:
+                    items.append(item)
+
+        if items:
+            texts = [item["text"] for item in items]
+            hits = agent.keyword_matcher.scan_batch(texts)
+            scores = await agent._score_texts(texts, SentimentModel.HYBRID, hits)
+            for item, item_hits, score in zip(items, hits, scores):
+                item["sentiment"] = score
+                item["injury"] = item_hits["injury"] > 0
+                item["weight"] = content_weight(weights[item["subreddit"]], item["score"])
+
+        added = await asyncio.to_thread(self.store.add_items, items, new_cursors)
+        await asyncio.to_thread(self.store.prune, now - RETENTION_DAYS * 86400)
+        self._last_ingested = await asyncio.to_thread(self.store.last_ingested)
+        self._last_ingested_loaded = True
+        self.passes += 1
+        logger.debug("Reddit ingestion pass stored %d new items", added)
+        return added
+
+    def start(self) -> None:
+        """Start the ingestion loop on the running event loop (once)."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.ingest_once()
+            except Exception:
+                logger.exception("Reddit ingestion pass failed")
+            await asyncio.sleep(self.interval)
+
+    # Answers
+
+    async def analyze_players(
+        self, players: List[str], time_window_hours: int = 48
+    ) -> Dict[str, Any]:
+        """
+        Per-player RedditAnalysisResult computed from the store, without calling Reddit.
+
+        Names are resolved to Sleeper IDs the same way the index was built.
+        """
+        from src.agents.reddit_analyzer import RedditAnalysisResult, summarize_sentiment
+
+        since = time.time() - time_window_hours * 3600
+        results = {}
+        for player_name in dict.fromkeys(players):
+            result = RedditAnalysisResult(player=player_name)
+            player = await self.sleeper.get_player_by_name(player_name)
+            if not player or not player.get("sleeper_id"):
+                result.status = "error"
+                result.errors.append("Player not found in Sleeper")
+                results[player_name] = result
+                continue
+
+            player_id = player["sleeper_id"]
+            totals = await asyncio.to_thread(self.store.player_totals, player_id, since)
+            mentions = totals["posts"] + totals["comments"]
+            summary = summarize_sentiment(totals["weighted_total"], mentions, totals["positive"])
+            result.posts_analyzed = totals["posts"]
+            result.comments_analyzed = totals["comments"]
+            result.overall_sentiment = summary["overall_sentiment"]
+            result.hype_score = summary["hype_score"]
+            result.consensus = summary["consensus"]
+            result.confidence = summary["confidence"]
+            result.injury_mentions = totals["injury"]
+            result.sentiment_breakdown = {
+                "positive": totals["positive"],
+                "negative": totals["negative"],
+                "neutral": totals["neutral"],
+            }
+            result.top_comments = await asyncio.to_thread(self.store.top_comments, player_id, since)
+            result.data_quality = {"source": "local_store", "player_id": player_id}
+
+            if mentions == 0:
+                result.status = "error"
+                result.errors.append("No Reddit data found for player")
+            elif result.posts_analyzed < 3 and result.comments_analyzed < 10:
+                result.status = "partial"
+                result.errors.append("Limited data available - results may be unreliable")
+            else:
+                result.status = "success"
+            results[player_name] = result
+        return results
+
+    async def get_stats(self) -> Dict[str, Any]:
+        fresh = await self.is_fresh()
+        return {
+            "items": await asyncio.to_thread(len, self.store),
+            "last_ingested": self._last_ingested,
+            "fresh": fresh,
+            "passes": self.passes,
+            "running": self._task is not None and not self._task.done(),
+        }
+
+
+# Global instance
+reddit_ingestor = RedditIngestor()
@@ -1,21 +1,51 @@
 """Reddit sentiment analysis for fantasy football players."""
 
+import importlib.util
 import os
+from types import SimpleNamespace
 from typing import Any, Dict, List
 
+from src.services.reddit_ingest import reddit_ingestor
+
 # Reddit configuration
 REDDIT_CLIENT_ID = os.getenv("REDDIT_CLIENT_ID")
 REDDIT_CLIENT_SECRET = os.getenv("REDDIT_CLIENT_SECRET")
 REDDIT_USERNAME = os.getenv("REDDIT_USERNAME")
 
-# Check if Reddit packages are available
-try:
-    import praw
-    from textblob import TextBlob
+# Check if Reddit packages are available without importing them: textblob pulls in
+# nltk (and through it scipy and sklearn), which would dominate server start-up
+REDDIT_AVAILABLE = all(
+    importlib.util.find_spec(package) is not None for package in ("praw", "textblob")
+)
+
+_reddit_agent = None
+
+
+def get_reddit_agent():
+    """The process-wide analyzer: its Reddit client, thread pool and thread cache are reused."""
+    global _reddit_agent
+
+    if _reddit_agent is None:
+        from src.agents.reddit_analyzer import RedditSentimentAgent
 
-    REDDIT_AVAILABLE = True
-except ImportError:
-    REDDIT_AVAILABLE = False
+        _reddit_agent = RedditSentimentAgent(SimpleNamespace(mcp_server_version="1.0.0"))
+    return _reddit_agent
+
+
+def _player_data(result) -> Dict[str, Any]:
+    """Legacy per-player fields of a RedditAnalysisResult."""
+    return {
+        "sentiment_score": result.overall_sentiment or 0.0,
+        "consensus": result.consensus or "MIXED",
+        "posts_analyzed": result.posts_analyzed,
+        "comments_analyzed": result.comments_analyzed,
+        "injury_mentions": result.injury_mentions,
+        "hype_score": result.hype_score,
+        "top_comments": result.top_comments[:3],
+        "status": result.status,
+        "confidence": result.confidence,
+        "fallback_used": result.fallback_used,
+    }
 
 
 async def analyze_reddit_sentiment(
@@ -23,6 +53,9 @@ async def analyze_reddit_sentiment(
 ) -> Dict[str, Any]:
     """Analyze Reddit sentiment for fantasy football players using enhanced analyzer.
 
+    While the ingestion worker keeps the local post store fresh, the answer
+    comes from that store and no Reddit API calls are made.
+
     Args:
         players: List of player names to analyze
         time_window_hours: Hours to look back for posts/comments
@@ -31,83 +64,55 @@ async def analyze_reddit_sentiment(
         Dictionary with sentiment analysis results for each player
     """
     try:
-        # Import enhanced Reddit analyzer
-        from src.agents.reddit_analyzer import RedditSentimentAgent
-
-        # Create mock settings for the analyzer
-        class MockSettings:
-            mcp_server_version = "1.0.0"
-
-        # Initialize enhanced analyzer
-        analyzer = RedditSentimentAgent(MockSettings())
+        # Shared enhanced analyzer
+        analyzer = get_reddit_agent()
+        data_source = "reddit_api"
 
         # Analyze sentiment with enhanced error handling
-        if len(players) == 1:
+        if await reddit_ingestor.is_fresh():
+            # Answer from ingested posts; only the ingestion worker calls Reddit
+            data_source = "local_store"
+            analysis = await reddit_ingestor.analyze_players(players, time_window_hours)
+            single = analysis[players[0]] if len(players) == 1 else None
+            comparison = analyzer.summarize_comparison(players, analysis)
+        elif len(players) == 1:
             # Single player analysis
-            result = await analyzer.analyze_player_sentiment(players[0], time_window_hours)
+            single = await analyzer.analyze_player_sentiment(players[0], time_window_hours)
+        else:
+            # Multiple player comparison from shared subreddit searches
+            single = None
+            comparison = await analyzer.compare_players_sentiment(players, time_window_hours)
 
+        if single is not None:
             # Convert to legacy format for compatibility
             return {
                 "players": players,
                 "analysis_type": "single",
                 "time_window_hours": time_window_hours,
-                "player_data": {
-                    players[0]: {
-                        "sentiment_score": result.overall_sentiment or 0.0,
-                        "consensus": result.consensus or "MIXED",
-                        "posts_analyzed": result.posts_analyzed,
-                        "comments_analyzed": result.comments_analyzed,
-                        "injury_mentions": result.injury_mentions,
-                        "hype_score": result.hype_score,
-                        "top_comments": result.top_comments[:3],
-                        "status": result.status,
-                        "confidence": result.confidence,
-                        "fallback_used": result.fallback_used,
-                    }
-                },
+                "player_data": {players[0]: _player_data(single)},
+                "data_source": data_source,
                 "enhanced_analyzer": True,  # Flag to indicate enhanced version
             }
-        else:
-            # Multiple player comparison
-            # TODO: Implement compare_players if needed; fallback to single analysis
-            comparison = {
-                "results": {
-                    p: await analyzer.analyze_player_sentiment(p, time_window_hours)
-                    for p in players
-                }
-            }
-
-            # Convert results to legacy format
-            player_data = {}
-            for player_name, result in comparison.get("results", {}).items():
-                player_data[player_name] = {
-                    "sentiment_score": result.overall_sentiment or 0.0,
-                    "consensus": result.consensus or "MIXED",
-                    "posts_analyzed": result.posts_analyzed,
-                    "comments_analyzed": result.comments_analyzed,
-                    "injury_mentions": result.injury_mentions,
-                    "hype_score": result.hype_score,
-                    "top_comments": result.top_comments[:3],
-                    "status": result.status,
-                    "confidence": result.confidence,
-                    "fallback_used": result.fallback_used,
-                }
 
-            return {
-                "players": players,
-                "analysis_type": "comparison",
-                "time_window_hours": time_window_hours,
-                "player_data": player_data,
-                "recommendation": comparison.get("recommendation", {}),
-                "confidence": comparison.get("confidence", 0),
-                "successful_analyses": comparison.get("successful_analyses", 0),
-                "total_players": comparison.get("total_players", len(players)),
-                "timestamp": comparison.get("timestamp", ""),
-                "enhanced_analyzer": True,  # Flag to indicate enhanced version
-            }
+        # Convert results to legacy format
+        player_data = {
+            player_name: _player_data(result)
+            for player_name, result in comparison.get("analysis", {}).items()
+        }
 
-        # Clean up
-        await analyzer.cleanup()
+        return {
+            "players": players,
+            "analysis_type": "comparison",
+            "time_window_hours": time_window_hours,
+            "player_data": player_data,
+            "recommendation": comparison.get("recommendation", {}),
+            "confidence": comparison.get("confidence", 0),
+            "successful_analyses": comparison.get("successful_analyses", 0),
+            "total_players": comparison.get("total_players", len(players)),
+            "timestamp": comparison.get("timestamp", ""),
+            "data_source": data_source,
+            "enhanced_analyzer": True,  # Flag to indicate enhanced version
+        }
 
     except ImportError as e:
         # Fallback to basic implementation if enhanced analyzer not available
@@ -143,6 +148,9 @@ async def _analyze_reddit_sentiment_fallback(
     if not REDDIT_CLIENT_ID or not REDDIT_CLIENT_SECRET:
         return {"error": "Reddit API credentials not configured", "fallback_reason": error_reason}
 
+    import praw
+    from textblob import TextBlob
+
     try:
         # Initialize Reddit client
         reddit = praw.Reddit(
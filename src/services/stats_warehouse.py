@@ -0,0 +1,248 @@
+"""Local warehouse of weekly Sleeper stats.
+
+Recent-performance lookups need a player's actual points for the last few
+weeks. Sleeper only serves those as full-league dumps per week
+(``stats/nfl/{season}/{week}``), so fetching them per player meant
+re-downloading and re-scanning the same dumps over and over. Here each week
+is ingested once into an indexed SQLite table. Completed weeks never change
+and are kept forever; only the in-progress week is re-fetched, after
+``LIVE_WEEK_TTL`` seconds. Lookups for any number of players are then a
+single query.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds before the in-progress week is re-fetched (matches the Sleeper stats TTL)
+LIVE_WEEK_TTL = 300
+
+# Stay well below SQLite's host-parameter limit for IN (...) lists
+_QUERY_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS weekly_stats (
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    player_id TEXT NOT NULL,
+    points REAL,
+    stats TEXT NOT NULL,
+    PRIMARY KEY (season, week, player_id)
+);
+CREATE INDEX IF NOT EXISTS weekly_stats_player ON weekly_stats (player_id, season, week);
+CREATE TABLE IF NOT EXISTS ingested_weeks (
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    final INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (season, week)
+);
+"""
+
+
+def _default_warehouse_path() -> Path:
+    return Path(os.getenv("CACHE_DIR", "./.cache")) / "stats_warehouse.sqlite"
+
+
+def week_points(week_stats: Dict[str, Any]) -> Optional[float]:
+    """PPR points for a stat line, falling back to standard; None if not numeric."""
+    points = week_stats.get("pts_ppr") or week_stats.get("pts", 0)
+    if isinstance(points, (int, float)):
+        return float(points)
+    return None
+
+
+class StatsWarehouse:
+    """Weekly stat lines keyed by (season, week, player_id), ingested a week at a time."""
+
+    def __init__(self, path: Optional[Path] = None, live_ttl: float = LIVE_WEEK_TTL):
+        self.path = Path(path) if path is not None else _default_warehouse_path()
+        self.live_ttl = live_ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._ingest_lock = asyncio.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _stale_weeks(self, season: int, weeks: Iterable[int]) -> List[int]:
+        """Weeks that were never ingested, plus non-final weeks once their TTL expires."""
+        weeks = sorted(set(weeks))
+        if not weeks:
+            return []
+        with self._db_lock:
+            rows = self._connect().execute(
+                "SELECT week, final, fetched_at FROM ingested_weeks "
+                "WHERE season = ? AND week BETWEEN ? AND ?",
+                (season, weeks[0], weeks[-1]),
+            ).fetchall()
+        ingested = {week: (final, fetched_at) for week, final, fetched_at in rows}
+
+        now = time.time()
+        stale = []
+        for week in weeks:
+            entry = ingested.get(week)
+            if entry is None:
+                stale.append(week)
+            elif not entry[0] and now - entry[1] >= self.live_ttl:
+                stale.append(week)
+        return stale
+
+    def ingest_week(
+        self, season: int, week: int, stats: Dict[str, Dict[str, Any]], final: bool
+    ) -> int:
+        """
+        Replace a week's stat lines with a fresh Sleeper dump.
+
+        Returns:
+            Number of player rows stored
+        """
+        rows = [
+            (season, week, str(player_id), week_points(line), json.dumps(line))
+            for player_id, line in stats.items()
+            if isinstance(line, dict)
+        ]
+        with self._db_lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "DELETE FROM weekly_stats WHERE season = ? AND week = ?", (season, week)
+                )
+                conn.executemany("INSERT INTO weekly_stats VALUES (?, ?, ?, ?, ?)", rows)
+                conn.execute(
+                    "INSERT OR REPLACE INTO ingested_weeks VALUES (?, ?, ?, ?)",
+                    (season, week, int(final), time.time()),
+                )
+        logger.debug(
+            "Ingested %d stat lines for %s week %s (final=%s)", len(rows), season, week, final
+        )
+        return len(rows)
+
+    async def ensure_weeks(
+        self, sleeper_api, season: int, weeks: Iterable[int], current_week: int
+    ) -> List[int]:
+        """
+        Ingest any of ``weeks`` that are missing or live and expired.
+
+        Weeks before ``current_week`` are stored as final (never re-fetched) as
+        long as Sleeper returned stats for them; the rest are refreshed after
+        the live TTL.
+
+        Returns:
+            Weeks that were (re)ingested
+        """
+        weeks = [week for week in weeks if week >= 1]
+        # The SQLite lock is shared with ingests running in threads; never wait on it here
+        if not await asyncio.to_thread(self._stale_weeks, season, weeks):
+            return []
+
+        async with self._ingest_lock:
+            # Another caller may have ingested while we waited
+            stale = await asyncio.to_thread(self._stale_weeks, season, weeks)
+            ingested = []
+            for week in stale:
+                try:
+                    stats = await sleeper_api.get_player_stats(season, week)
+                except Exception:
+                    logger.exception("Error fetching stats for %s week %s", season, week)
+                    continue
+                if not isinstance(stats, dict):
+                    continue
+                final = week < current_week and bool(stats)
+                # Encoding and inserting a full dump takes a while; keep it off the loop
+                await asyncio.to_thread(self.ingest_week, season, week, stats, final)
+                ingested.append(week)
+            return ingested
+
+    async def recent_stats(
+        self,
+        player_ids: Iterable[str],
+        season: int,
+        week: int,
+        lookback: int = 3,
+        sleeper_api=None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Stat lines for the ``lookback`` weeks before ``week`` for many players.
+
+        Args:
+            player_ids: Sleeper player IDs
+            season: NFL season year
+            week: Current week (stats come from the weeks before it)
+            lookback: Number of weeks to look back
+            sleeper_api: When given, missing weeks are ingested first
+
+        Returns:
+            Dict of player_id -> [{"week", "stats", "points"}, ...], most recent
+            week first; players without numeric points in the window are omitted
+        """
+        first_week = max(1, week - lookback)
+        last_week = week - 1
+        player_ids = list(dict.fromkeys(str(pid) for pid in player_ids if pid))
+        if not player_ids or last_week < first_week:
+            return {}
+
+        if sleeper_api is not None:
+            await self.ensure_weeks(sleeper_api, season, range(first_week, last_week + 1), week)
+
+        return await asyncio.to_thread(
+            self._select_recent, player_ids, season, first_week, last_week
+        )
+
+    def _select_recent(
+        self, player_ids: List[str], season: int, first_week: int, last_week: int
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Run the recent-stats query (blocking; called in a worker thread)."""
+        rows: List[Tuple[str, int, float, str]] = []
+        with self._db_lock:
+            conn = self._connect()
+            for start in range(0, len(player_ids), _QUERY_CHUNK):
+                chunk = player_ids[start : start + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    conn.execute(
+                        "SELECT player_id, week, points, stats FROM weekly_stats "
+                        f"WHERE player_id IN ({placeholders}) AND season = ? "
+                        "AND week BETWEEN ? AND ? AND points IS NOT NULL "
+                        "ORDER BY player_id, week DESC",
+                        (*chunk, season, first_week, last_week),
+                    ).fetchall()
+                )
+
+        recent: Dict[str, List[Dict[str, Any]]] = {}
+        for player_id, row_week, points, stats in rows:
+            recent.setdefault(player_id, []).append(
+                {"week": row_week, "stats": json.loads(stats), "points": points}
+            )
+        return recent
+
+    def clear(self) -> None:
+        """Drop every stored week."""
+        with self._db_lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM weekly_stats")
+                conn.execute("DELETE FROM ingested_weeks")
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Global instance
+stats_warehouse = StatsWarehouse()
@@ -0,0 +1,150 @@
+"""Persistent index of the authenticated user's team in each league.
+
+Roster, matchup, and lineup tools need the user's team_key whenever the caller
+does not pass one explicitly. Rather than fetching and parsing
+``league/{key}/teams`` on every call, all of the user's leagues are resolved in
+a single ``users;use_login=1/games;game_keys=nfl/leagues;out=teams`` request and
+the result is kept on disk. Entries only go stale when the NFL season (Yahoo
+game key) changes.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.api import yahoo_api_call
+from src.parsers import parse_user_team_index
+
+logger = logging.getLogger(__name__)
+
+USER_TEAMS_ENDPOINT = "users;use_login=1/games;game_keys=nfl/leagues;out=teams"
+
+
+def _default_index_path() -> Path:
+    return Path(os.getenv("CACHE_DIR", "./.cache")) / "user_team_index.json"
+
+
+class UserTeamIndex:
+    """league_key -> user team mapping, resolved in bulk and persisted across restarts."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else _default_index_path()
+        self._teams: Optional[Dict[str, Dict[str, Any]]] = None
+        self._game_key: Optional[str] = None
+        self._refreshed = False
+        self._lock = asyncio.Lock()
+
+    def _load(self) -> None:
+        """Load the persisted index, tolerating a missing or corrupt file."""
+        self._teams = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable user team index %s: %s", self.path, e)
+            return
+
+        if isinstance(stored, dict) and isinstance(stored.get("teams"), dict):
+            self._teams = stored["teams"]
+            self._game_key = stored.get("game_key")
+            logger.debug("Loaded user team index with %d leagues", len(self._teams))
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"game_key": self._game_key, "teams": self._teams}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Could not persist user team index to %s: %s", self.path, e)
+
+    async def refresh(self) -> Dict[str, Dict[str, Any]]:
+        """Resolve the user's team in every league with one Yahoo request.
+
+        Entries from earlier seasons are dropped when the current game key changes.
+        """
+        if self._teams is None:
+            self._load()
+
+        user_guid = os.getenv("YAHOO_GUID")
+        if user_guid == "your_yahoo_guid_here":
+            user_guid = None
+
+        data = await yahoo_api_call(USER_TEAMS_ENDPOINT)
+        fresh = parse_user_team_index(data, user_guid)
+        self._refreshed = True
+
+        game_keys = {entry.get("game_key") for entry in fresh.values() if entry.get("game_key")}
+        current_game_key = (
+            max(game_keys, key=lambda key: int(key) if str(key).isdigit() else 0)
+            if game_keys
+            else None
+        )
+
+        if current_game_key and current_game_key != self._game_key:
+            if self._game_key:
+                logger.info(
+                    "NFL season changed (%s -> %s); rebuilding user team index",
+                    self._game_key,
+                    current_game_key,
+                )
+            self._teams = {}
+            self._game_key = current_game_key
+
+        self._teams.update(fresh)
+        self._save()
+        logger.info("Resolved user teams for %d leagues", len(fresh))
+        return dict(self._teams)
+
+    async def get(self, league_key: str) -> Optional[Dict[str, Any]]:
+        """Return the user's team info for a league, refreshing once per process on a miss."""
+        if self._teams is None:
+            self._load()
+
+        entry = self._teams.get(league_key)
+        if entry is not None:
+            return dict(entry)
+
+        async with self._lock:
+            entry = self._teams.get(league_key)
+            if entry is None and not self._refreshed:
+                try:
+                    await self.refresh()
+                except Exception as e:
+                    # Callers fall back to the per-league lookup
+                    self._refreshed = True
+                    logger.debug("User team index refresh failed: %s", e)
+                entry = self._teams.get(league_key)
+
+        return dict(entry) if entry is not None else None
+
+    def record(self, league_key: str, team_info: Dict[str, Any]) -> None:
+        """Store a team resolved by another path (e.g. a per-league lookup)."""
+        if self._teams is None:
+            self._load()
+        entry = dict(team_info)
+        entry.setdefault("game_key", league_key.split(".")[0])
+        self._teams[league_key] = entry
+        self._save()
+
+    def invalidate(self) -> None:
+        """Forget every entry, in memory and on disk."""
+        self._teams = {}
+        self._game_key = None
+        self._refreshed = False
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not remove user team index %s: %s", self.path, e)
+
+
+# Global instance
+user_team_index = UserTeamIndex()
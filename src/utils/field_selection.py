@@ -0,0 +1,137 @@
+"""
+Field selection and compact encodings for player list payloads.
+
+Roster, player and waiver tools serialize every enrichment field for every
+player. Clients that only need a few columns can pass ``fields`` to keep just
+those keys and ``output_format="table"`` to receive a single column header
+plus value rows instead of repeating every key in every record.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+OUTPUT_FORMATS = ("records", "table")
+
+# Player fields available straight from Yahoo, without any external enrichment
+BASIC_PLAYER_FIELDS = frozenset(
+    {
+        "name",
+        "player_key",
+        "position",
+        "team",
+        "opponent",
+        "status",
+        "bye",
+        "owned_pct",
+        "weekly_change",
+        "injury_status",
+        "injury_detail",
+    }
+)
+
+
+def parse_fields(value: Any) -> Optional[List[str]]:
+    """
+    Normalize a ``fields`` tool argument.
+
+    Args:
+        value: List of field names, a comma-separated string, or None
+
+    Returns:
+        De-duplicated field names in request order, or None to keep every field
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, Iterable):
+        return None
+
+    fields: List[str] = []
+    for item in value:
+        name = str(item).strip()
+        if name and name not in fields:
+            fields.append(name)
+    return fields or None
+
+
+def parse_output_format(value: Any) -> str:
+    """Return a supported output format, defaulting to ``records``."""
+    if isinstance(value, str) and value.lower() in OUTPUT_FORMATS:
+        return value.lower()
+    return "records"
+
+
+def requests_any(fields: Optional[Sequence[str]], candidates: Iterable[str]) -> bool:
+    """True when every field is wanted (``fields`` is None) or any candidate is selected."""
+    if fields is None:
+        return True
+    wanted = set(fields)
+    return any(candidate in wanted for candidate in candidates)
+
+
+def needs_enrichment(
+    fields: Optional[Sequence[str]], basic_fields: Iterable[str] = BASIC_PLAYER_FIELDS
+) -> bool:
+    """True unless every selected field can be answered from basic Yahoo data."""
+    if fields is None:
+        return True
+    basic = set(basic_fields)
+    return any(field not in basic for field in fields)
+
+
+def select_fields(record: Dict[str, Any], fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+    """Keep only ``fields`` of a record (missing fields are omitted)."""
+    if fields is None:
+        return record
+    return {field: record[field] for field in fields if field in record}
+
+
+def to_table(
+    records: Sequence[Dict[str, Any]], columns: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    Encode records as a column header plus rows of values.
+
+    Args:
+        records: Player dictionaries
+        columns: Column order; defaults to keys in order of first appearance
+
+    Returns:
+        Dict with ``columns`` and ``rows`` lists
+    """
+    if columns is None:
+        seen: Dict[str, None] = {}
+        for record in records:
+            for key in record:
+                seen.setdefault(key, None)
+        columns = list(seen)
+    else:
+        columns = list(columns)
+
+    return {
+        "columns": columns,
+        "rows": [[record.get(column) for column in columns] for record in records],
+    }
+
+
+def shape_records(
+    records: Sequence[Dict[str, Any]],
+    fields: Optional[Sequence[str]] = None,
+    output_format: str = "records",
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Apply field selection and the requested encoding to a list of records.
+
+    Args:
+        records: Serialized player dictionaries
+        fields: Field names to keep, or None for all
+        output_format: ``records`` (list of dicts) or ``table`` (columns + rows)
+
+    Returns:
+        Projected list of dicts, or a table dict
+    """
+    if output_format == "table":
+        return to_table(records, fields)
+    if fields is None:
+        return list(records)
+    return [select_fields(record, fields) for record in records]
@@ -0,0 +1,63 @@
+"""
+JSON encoding for MCP tool responses.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both paths accept the same arguments and return ``str`` so callers
+never need to know which encoder is active.
+"""
+
+import json
+import os
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on optional dependency
+    orjson = None
+    HAS_ORJSON = False
+
+# Pretty-printing roughly doubles payload size; enable it only for debugging
+PRETTY_JSON = os.getenv("MCP_PRETTY_JSON", "").lower() in ("1", "true", "yes")
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for values the active encoder does not handle natively."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "value") and not callable(obj.value):
+        return obj.value
+    return str(obj)
+
+
+def dumps(obj: Any, *, pretty: bool = PRETTY_JSON) -> str:
+    """
+    Serialize ``obj`` to a JSON string.
+
+    Args:
+        obj: JSON-compatible value (dicts, lists, dataclasses and datetimes are accepted)
+        pretty: Indent the output by two spaces
+
+    Returns:
+        Encoded JSON text
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_default, option=option).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them
+            pass
+
+    if pretty:
+        return json.dumps(obj, indent=2, default=_default)
+    return json.dumps(obj, separators=(",", ":"), default=_default)
@@ -0,0 +1,70 @@
+"""
+Deferred imports for the tool modules' heavy dependencies.
+
+Importing the servers only registers tools; the analytics stack behind them
+(numpy/scipy via the lineup optimizer, praw/textblob/nltk via the Reddit
+analyzer) is imported by each handler on first use. Once a server is ready,
+``start_import_warmup`` imports those modules on a background thread so the
+first tool call does not pay for them either. ``HEAVY_MODULES`` is the
+import-time budget: none of them may be loaded by importing a server
+entry point (checked in the unit tests).
+"""
+
+import importlib
+import logging
+import threading
+from typing import Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Packages that must never load just by importing a server module
+HEAVY_MODULES = (
+    "numpy",
+    "pandas",
+    "scipy",
+    "sklearn",
+    "statsmodels",
+    "praw",
+    "textblob",
+    "nltk",
+)
+
+# Modules handlers import on first use, in the order tools usually need them
+DEFERRED_MODULES = (
+    "sleeper_api",
+    "lineup_optimizer",
+    "matchup_analyzer",
+    "src.agents.reddit_analyzer",
+)
+
+_warmup_thread: Optional[threading.Thread] = None
+
+
+def warm_up_imports(modules: Iterable[str] = DEFERRED_MODULES) -> List[str]:
+    """
+    Import ``modules``, skipping any whose optional dependencies are missing.
+
+    Returns:
+        Names of the modules that imported successfully
+    """
+    loaded = []
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            logger.debug("Deferred import of %s failed: %s", name, e)
+            continue
+        loaded.append(name)
+    return loaded
+
+
+def start_import_warmup(modules: Iterable[str] = DEFERRED_MODULES) -> threading.Thread:
+    """Import the deferred modules on a daemon thread; only the first call starts one."""
+    global _warmup_thread
+
+    if _warmup_thread is None:
+        _warmup_thread = threading.Thread(
+            target=warm_up_imports, args=(tuple(modules),), name="import-warmup", daemon=True
+        )
+        _warmup_thread.start()
+    return _warmup_thread
@@ -0,0 +1 @@
+"""Micro-benchmarks for hot paths (run with -m slow)."""
@@ -0,0 +1,124 @@
+"""Benchmark the tool response path on a full-data roster payload.
+
+Compares the previous path (``json.dumps(indent=2)`` in ``call_tool``, then
+``json.loads`` in the FastMCP wrapper, then a final FastMCP encode) against
+the direct dispatch path, where the handler dict is encoded exactly once.
+
+Run with: pytest tests/benchmarks -m slow -s
+"""
+
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import lineup_optimizer as lineup_module
+from src.handlers import roster_handlers
+from src.utils.json_encoder import dumps
+
+POSITIONS = ["QB", "RB", "RB", "WR", "WR", "WR", "TE", "W/R/T", "K", "DEF"] + ["BN"] * 6
+
+
+def build_roster(size: int = len(POSITIONS)) -> list:
+    """Simplified Yahoo roster entries."""
+    return [
+        {
+            "name": f"Player {i}",
+            "position": POSITIONS[i % len(POSITIONS)],
+            "team": "KC",
+            "status": "OK",
+            "bye": 10,
+        }
+        for i in range(size)
+    ]
+
+
+def enrich(players, week=None, stages=None):
+    """Stand-in for enhance_with_external_data that fills every enrichment field."""
+    for i, player in enumerate(players):
+        player.yahoo_projection = 10.0 + i
+        player.sleeper_projection = 11.0 + i
+        player.sleeper_id = str(4000 + i)
+        player.sleeper_match_method = "api"
+        player.floor_projection = 7.5 + i
+        player.ceiling_projection = 14.0 + i
+        player.matchup_score = 60
+        player.matchup_description = "Favorable matchup against a bottom-10 pass defense"
+        player.trending_score = 75
+        player.expert_tier = "starter"
+        player.expert_recommendation = "Start"
+        player.expert_confidence = 72
+        player.expert_advice = "Strong start with weekly upside. " * 4
+        player.performance_flags = ["TRENDING_UP", "BREAKOUT_CANDIDATE"]
+        player.enhancement_context = "L3W avg 18.2 pts, trending up vs projection. " * 2
+        player.adjusted_projection = 12.5 + i
+    return players
+
+
+async def full_roster_payload(size: int = len(POSITIONS)) -> dict:
+    """Produce a real ``ff_get_roster`` data_level='full' payload with mocked I/O."""
+    with (
+        patch.object(
+            roster_handlers,
+            "get_user_team_info",
+            AsyncMock(return_value={"team_key": "461.l.1.t.1", "team_name": "Bench"}),
+            create=True,
+        ),
+        patch.object(roster_handlers, "yahoo_api_call", AsyncMock(return_value={}), create=True),
+        patch.object(
+            roster_handlers,
+            "parse_team_roster",
+            MagicMock(return_value=build_roster(size)),
+            create=True,
+        ),
+        patch.object(
+            lineup_module.lineup_optimizer,
+            "enhance_with_external_data",
+            AsyncMock(side_effect=enrich),
+        ),
+    ):
+        return await roster_handlers.handle_ff_get_roster(
+            {"league_key": "461.l.1", "data_level": "full"}
+        )
+
+
+def legacy_path(result: dict) -> str:
+    text = json.dumps(result, indent=2)
+    return json.dumps(json.loads(text))
+
+
+def direct_path(result: dict) -> str:
+    return dumps(result)
+
+
+def _best_of(func, payload, rounds: int = 5, loops: int = 50) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func(payload)
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_direct_dispatch_encodes_faster_than_round_trip():
+    """The single-encode path is measurably faster on a full roster."""
+    payload = await full_roster_payload()
+    assert payload["all_players"][0]["expert_advice"]
+
+    legacy = _best_of(legacy_path, payload)
+    direct = _best_of(direct_path, payload)
+    size_legacy = len(json.dumps(payload, indent=2))
+    size_direct = len(direct_path(payload))
+
+    print(
+        f"\nfull roster ({len(payload['all_players'])} players): "
+        f"round trip {legacy * 1e6:.0f}us / {size_legacy} bytes, "
+        f"direct {direct * 1e6:.0f}us / {size_direct} bytes "
+        f"({legacy / direct:.1f}x)"
+    )
+    assert json.loads(direct_path(payload)) == json.loads(legacy_path(payload))
+    assert direct < legacy
@@ -8,6 +8,17 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_stats_warehouse(tmp_path, monkeypatch):
+    """Keep the shared stats warehouse out of the working tree during tests."""
+    from src.services.stats_warehouse import StatsWarehouse
+
+    warehouse = StatsWarehouse(tmp_path / "stats_warehouse.sqlite")
+    monkeypatch.setattr("src.services.player_enhancement.stats_warehouse", warehouse)
+    yield warehouse
+    warehouse.close()
+
+
 @pytest.fixture
 def mock_env_vars(monkeypatch):
     """Set up mock environment variables for testing."""
@@ -244,6 +255,96 @@ def mock_yahoo_standings_response() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture
+def mock_yahoo_user_teams_response() -> Dict[str, Any]:
+    """Mock Yahoo API response for users;use_login=1/games;game_keys=nfl/leagues;out=teams."""
+
+    def team(team_key: str, name: str, guid: str, owned: int) -> Dict[str, Any]:
+        return {
+            "team": [
+                [
+                    {"team_key": team_key},
+                    {"name": name},
+                    {"is_owned_by_current_login": owned} if owned else [],
+                    {"draft_position": 3},
+                    {"managers": [{"manager": {"nickname": name, "guid": guid}}]},
+                ]
+            ]
+        }
+
+    return {
+        "fantasy_content": {
+            "users": {
+                "0": {
+                    "user": [
+                        {"guid": "TEST_GUID_12345"},
+                        {
+                            "games": {
+                                "0": {
+                                    "game": [
+                                        {"game_key": "461", "season": "2025"},
+                                        {
+                                            "leagues": {
+                                                "0": {
+                                                    "league": [
+                                                        {
+                                                            "league_key": "461.l.61410",
+                                                            "season": "2025",
+                                                        },
+                                                        {
+                                                            "teams": {
+                                                                "0": team(
+                                                                    "461.l.61410.t.1",
+                                                                    "Rival",
+                                                                    "OTHER_GUID",
+                                                                    0,
+                                                                ),
+                                                                "1": team(
+                                                                    "461.l.61410.t.2",
+                                                                    "My Team",
+                                                                    "TEST_GUID_12345",
+                                                                    1,
+                                                                ),
+                                                                "count": 2,
+                                                            }
+                                                        },
+                                                    ]
+                                                },
+                                                "1": {
+                                                    "league": [
+                                                        {
+                                                            "league_key": "461.l.99999",
+                                                            "season": "2025",
+                                                        },
+                                                        {
+                                                            "teams": {
+                                                                "0": team(
+                                                                    "461.l.99999.t.7",
+                                                                    "Guid Match",
+                                                                    "TEST_GUID_12345",
+                                                                    0,
+                                                                ),
+                                                                "count": 1,
+                                                            }
+                                                        },
+                                                    ]
+                                                },
+                                                "count": 2,
+                                            }
+                                        },
+                                    ]
+                                },
+                                "count": 1,
+                            }
+                        },
+                    ]
+                },
+                "count": 1,
+            }
+        }
+    }
+
+
 @pytest.fixture
 def mock_rate_limiter():
     """Mock rate limiter for testing."""
@@ -11,6 +11,7 @@ from src.api.yahoo_client import (
     set_access_token,
     yahoo_api_call,
 )
+from src.api.yahoo_utils import ResponseCache
 
 
 class TestTokenManagement:
@@ -295,3 +296,34 @@ class TestRefreshYahooToken:
             assert result["status"] == "error"
             assert "Error refreshing token" in result["message"]
             assert "Network error" in result["message"]
+
+
+class TestResponseCacheBound:
+    """Test the optional entry limit on ResponseCache."""
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_go_before_the_oldest_live_ones(self):
+        cache = ResponseCache(max_entries=10)
+        for i in range(5):
+            await cache.set(f"expired/{i}", i, ttl=0)
+        for i in range(6):
+            await cache.set(f"live/{i}", i, ttl=60)
+
+        # Over the limit: the expired entries were enough to make room
+        assert len(cache.cache) == 6
+        assert await cache.get("live/0") == 0
+
+        for i in range(6, 11):
+            await cache.set(f"live/{i}", i, ttl=60)
+        assert len(cache.cache) == 9  # oldest dropped down to 90% of the limit
+        assert await cache.get("live/1") is None
+        assert await cache.get("live/2") == 2
+        assert await cache.get("live/10") == 10
+
+    @pytest.mark.asyncio
+    async def test_purge_expired(self):
+        cache = ResponseCache()
+        await cache.set("old", 1, ttl=0)
+        await cache.set("new", 2, ttl=60)
+        assert await cache.purge_expired() == 1
+        assert list(cache.cache) == [cache._get_cache_key("new")]
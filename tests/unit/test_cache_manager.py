@@ -0,0 +1,237 @@
+"""Unit tests for the CacheManagerAgent memory/file cache levels."""
+
+import asyncio
+import pickle
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.agents.cache_backends import SQLiteCacheBackend
+from src.agents.cache_manager import (
+    CacheEntry,
+    CacheManagerAgent,
+    EvictionIndex,
+    EvictionPolicy,
+    key_facets,
+)
+
+
+def make_cache(tmp_path, backend="file", **kwargs) -> CacheManagerAgent:
+    settings = SimpleNamespace(
+        cache_dir=tmp_path, cache_ttl_seconds=3600, cache_backend=backend, cache_redis_url=None
+    )
+    kwargs.setdefault("write_behind_delay", 0.01)
+    return CacheManagerAgent(settings, **kwargs)
+
+
+@pytest.fixture
+async def cache(tmp_path):
+    agent = make_cache(tmp_path)
+    await agent.initialize()
+    yield agent
+    await agent.cleanup()
+
+
+class TestCacheLevels:
+    """Test reads and writes across the memory and file levels."""
+
+    @pytest.mark.asyncio
+    async def test_file_level_read_through_after_restart(self, tmp_path):
+        async with make_cache(tmp_path) as cache:
+            assert await cache.set("ff:player:1", {"points": 12.5}, tags=["week:6"])
+            assert await cache.get("ff:player:1") == {"points": 12.5}
+            await cache.flush()
+            assert (tmp_path / "file_cache" / "index.journal").exists()
+
+        # cleanup() compacted the journal into index.json
+        assert not (tmp_path / "file_cache" / "index.journal").exists()
+
+        async with make_cache(tmp_path) as cache:
+            assert await cache.exists("ff:player:1")
+            assert await cache.get("ff:player:1") == {"points": 12.5}
+            # Promoted to memory for subsequent reads
+            assert pickle.loads(await cache._memory_cache.get("ff:player:1")) == {"points": 12.5}
+            assert await cache.invalidate_by_tags(["week:6"]) == 1
+
+        async with make_cache(tmp_path) as cache:
+            assert await cache.get("ff:player:1") is None
+
+    @pytest.mark.asyncio
+    async def test_journal_replayed_without_compaction(self, tmp_path):
+        writer = make_cache(tmp_path)
+        await writer.initialize()
+        await writer.set("a", 1)
+        await writer.set("b", 2)
+        await writer.delete("a")
+        await writer.extend_ttl("b", timedelta(hours=1))
+        await writer.flush()
+        writer._cleanup_task.cancel()  # simulate a crash: no cleanup()
+
+        async with make_cache(tmp_path) as reader:
+            assert set(reader._entries) == {"b"}
+            assert reader._entries["b"].expires_at == writer._entries["b"].expires_at
+            assert await reader.get("b") == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_are_batched(self, tmp_path):
+        async with make_cache(tmp_path, write_behind_delay=60) as cache:
+            for i in range(20):
+                await cache.set(f"key:{i}", i)
+            assert not list((tmp_path / "file_cache").glob("*.pkl"))
+
+            await cache.flush()
+            assert len(list((tmp_path / "file_cache").glob("*.pkl"))) == 20
+
+            await cache.clear()
+            assert not any((tmp_path / "file_cache").iterdir())
+
+
+class TestEvictionIndex:
+    """Test victim selection for each eviction policy."""
+
+    def test_policies_pick_expected_victims(self):
+        now = datetime.utcnow()
+        index = EvictionIndex()
+        for i, (size, minutes) in enumerate([(10, 30), (50, 5), (20, 60)]):
+            expires_at = now + timedelta(minutes=minutes)
+            index.add(CacheEntry(f"k{i}", None, now, expires_at, size_bytes=size))
+        index.touch("k0")
+        index.touch("k1")
+
+        assert index.victim(EvictionPolicy.LRU) == "k2"
+        assert index.victim(EvictionPolicy.LFU) == "k2"
+        assert index.victim(EvictionPolicy.SIZE) == "k1"
+        assert index.victim(EvictionPolicy.TTL) == "k1"
+
+        index.update_expiry("k1", now + timedelta(hours=2))
+        assert index.victim(EvictionPolicy.TTL) == "k0"
+
+        index.remove("k2")
+        assert index.victim(EvictionPolicy.LFU) == "k0"  # tie: least recently used first
+        index.add(CacheEntry("k1", None, now, None, size_bytes=1))
+        assert index.victim(EvictionPolicy.SIZE) == "k0"
+        assert index.victim(EvictionPolicy.LFU) == "k1"
+        assert len(index) == 2
+
+    @pytest.mark.asyncio
+    async def test_size_policy_evicts_largest(self, tmp_path):
+        async with make_cache(
+            tmp_path, max_memory_size=400, eviction_policy=EvictionPolicy.SIZE
+        ) as cache:
+            await cache.set("big", "x" * 200)
+            await cache.set("small", "x" * 10)
+            await cache.set("medium", "x" * 150)
+
+            assert set(cache._eviction.lru) == {"small", "medium"}
+            assert cache._entries["small"].size_bytes == len(pickle.dumps("x" * 10))
+
+
+class TestConcurrency:
+    """Test that bulk operations no longer re-enter a cache-wide lock."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_operations_do_not_deadlock(self, cache):
+        await cache.set("expired", 1, ttl=timedelta(seconds=-1))
+        await cache.set("ff:league:league_id:7", 2)
+        await cache.set("tagged", 3, tags=["t"])
+
+        assert await asyncio.wait_for(cache.clear_expired(), 1) == 1
+        assert await asyncio.wait_for(cache.invalidate_by_league("7"), 1) == 1
+        assert await asyncio.wait_for(cache.invalidate_by_tags(["t"]), 1) == 1
+        await asyncio.wait_for(cache._cleanup_expired(), 1)
+        assert cache._entries == {}
+
+    @pytest.mark.asyncio
+    async def test_eviction_during_set(self, tmp_path):
+        async with make_cache(tmp_path, max_memory_size=250) as cache:
+            for i in range(5):
+                assert await asyncio.wait_for(cache.set(f"key:{i}", "x" * 80), 1)
+
+            assert cache._current_memory_size <= 250
+            assert cache.stats.evictions > 0
+            assert "key:4" in cache._eviction
+            assert "key:0" not in cache._eviction
+
+            # Evicted from memory only: read back from the file level
+            assert await cache.get("key:0") == "x" * 80
+            assert cache._current_memory_size <= 250
+
+    @pytest.mark.asyncio
+    async def test_concurrent_access(self, cache):
+        await asyncio.gather(*(cache.set(f"key:{i % 10}", i) for i in range(100)))
+        values = await asyncio.gather(*(cache.get(f"key:{i}") for i in range(10)))
+        assert all(value is not None for value in values)
+        assert cache.stats.entry_count == 10
+
+
+class TestBackends:
+    """Test the shared SQLite backend and indexed invalidation."""
+
+    def test_key_facets(self, tmp_path):
+        key = make_cache(tmp_path).generate_key("matchup", league_id="nfl.l.7", week=6, year=2025)
+        assert key_facets(key) == ["league_id:nfl.l.7", "week:6", "year:2025"]
+        assert key_facets("custom:week:6") == []
+
+    @pytest.mark.asyncio
+    async def test_sqlite_backend_shared_between_managers(self, tmp_path):
+        async with make_cache(tmp_path, "sqlite") as writer, make_cache(
+            tmp_path, "sqlite"
+        ) as reader:
+            key = writer.generate_key("roster", league_id="7", week=6)
+            await writer.set(key, ["a", "b"])
+            await writer.set(writer.generate_key("roster", league_id="8", week=6), ["c"])
+            await writer.flush()
+
+            # Not in the reader's index: served from the shared database
+            assert await reader.exists(key)
+            assert await reader.get(key) == ["a", "b"]
+            assert (await reader.get_stats())["backend"] == "sqlite"
+
+            # Invalidation in one process reaches keys written by the other
+            assert await reader.invalidate_by_week(6) == 2
+            await reader.flush()
+            assert await writer._run_io(writer._backend.get, key) is None
+
+    @pytest.mark.asyncio
+    async def test_shared_entries_count_toward_memory_and_survive_eviction(self, tmp_path):
+        async with make_cache(tmp_path, "sqlite") as writer, make_cache(
+            tmp_path, "sqlite", max_memory_size=300
+        ) as reader:
+            for i in range(20):
+                await writer.set(f"key:{i}", "x" * 80)
+            await writer.flush()
+
+            for i in range(20):
+                assert await reader.get(f"key:{i}") == "x" * 80
+                assert 0 < reader._current_memory_size <= 300
+            assert reader.stats.entry_count == len(reader._eviction) < 20
+            await reader.flush()
+
+            # Memory pressure in the reader leaves the shared database alone
+            for i in range(20):
+                assert await writer._run_io(writer._backend.get, f"key:{i}") is not None
+
+            for i in range(20):
+                await reader.delete(f"key:{i}")
+            assert (reader._current_memory_size, reader.stats.entry_count) == (0, 0)
+
+    def test_sqlite_indexed_tags_and_expiry(self, tmp_path):
+        backend = SQLiteCacheBackend(tmp_path / "cache.sqlite")
+        now = datetime.utcnow()
+        backend.write_batch(
+            {
+                "live": CacheEntry("live", 1, now, now + timedelta(hours=1), tags=["a", "b"]),
+                "stale": CacheEntry("stale", 2, now, now - timedelta(seconds=1), tags=["a"]),
+            }
+        )
+
+        assert backend.keys_with_tags(["a"]) == {"live", "stale"}
+        assert backend.keys_with_tags(["a", "b"], match_all=True) == {"live"}
+        assert backend.get("stale") is None
+        assert backend.purge_expired() == 1
+        assert backend.keys_with_tags(["a"]) == {"live"}
+
+        backend.set_expiry("live", now + timedelta(days=1))
+        assert backend.get("live").expires_at == pytest.approx(now + timedelta(days=1))
+        backend.close()
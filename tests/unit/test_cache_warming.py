@@ -0,0 +1,170 @@
+"""Unit tests for predictive cache warming."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.api.yahoo_utils import RateLimiter, ResponseCache
+from src.services.cache_warming import (
+    CacheWarmer,
+    WarmSource,
+    calendar_weight,
+    endpoint_template,
+    fill_template,
+    key_family,
+)
+
+NFL_STATE = {"season": "2025", "week": 6, "season_type": "regular"}
+# Tuesday 2025-10-14 15:00 UTC = 11:00 ET
+TUESDAY = datetime(2025, 10, 14, 15, 0, tzinfo=timezone.utc)
+WAIVERS = "league/461.l.1/players;status=A;count=25"
+ROSTER = "team/461.l.1.t.3/roster;week=6"
+
+
+class Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def make_warmer(tmp_path, clock, fetch=None, limiter=None, state=NFL_STATE, **kwargs):
+    sleeper = AsyncMock()
+    sleeper.get_nfl_state.return_value = state
+    warmer = CacheWarmer(tmp_path / "patterns.json", sleeper_client=sleeper, clock=clock, **kwargs)
+    cache = ResponseCache()
+    fetch = fetch or AsyncMock(side_effect=lambda endpoint: {"endpoint": endpoint})
+    warmer.attach({"yahoo": WarmSource(cache, fetch, limiter)})
+    return warmer, cache, fetch
+
+
+async def started(warmer):
+    for _ in range(100):
+        if warmer._state_checked and not warmer._unrecorded:
+            return
+        await asyncio.sleep(0.01)
+
+
+class TestCalendar:
+    def test_key_families(self):
+        assert key_family(WAIVERS) == "waiver"
+        assert key_family(ROSTER) == "roster"
+        assert key_family("league/461.l.1/scoreboard;week=6") == "live"
+        assert key_family("projections/nfl/2025/6") == "projections"
+        assert key_family("league/461.l.1/standings") == "league"
+
+    def test_templates_follow_the_current_week(self):
+        template = endpoint_template(ROSTER, NFL_STATE)
+        assert template == "team/461.l.1.t.3/roster;week={week}"
+        assert fill_template(template, {**NFL_STATE, "week": 7}) == (
+            "team/461.l.1.t.3/roster;week=7"
+        )
+        assert endpoint_template("projections/nfl/2025/6", NFL_STATE) == (
+            "projections/nfl/{season}/{week}"
+        )
+        # Earlier weeks are not weekly habits
+        assert endpoint_template("team/x/roster;week=3", NFL_STATE) == "team/x/roster;week=3"
+        assert fill_template("team/x/roster;week={week}", {}) is None
+
+    def test_weekly_rhythm(self):
+        thursday = TUESDAY + timedelta(days=2)
+        sunday_afternoon = datetime(2025, 10, 12, 18, 0, tzinfo=timezone.utc)
+        assert calendar_weight("waiver", TUESDAY, NFL_STATE) > calendar_weight(
+            "waiver", thursday, NFL_STATE
+        )
+        assert calendar_weight("projections", thursday, NFL_STATE) > 1
+        assert calendar_weight("projections", sunday_afternoon, NFL_STATE) == 1
+        assert calendar_weight("live", TUESDAY, NFL_STATE) == 0
+        assert calendar_weight("live", sunday_afternoon, NFL_STATE) > 1
+
+
+class TestCacheWarmer:
+    @pytest.mark.asyncio
+    async def test_co_accessed_endpoints_are_prefetched(self, tmp_path):
+        clock = Clock(TUESDAY)
+        warmer, cache, fetch = make_warmer(tmp_path, clock, idle_delay=3600)
+        try:
+            for _ in range(2):
+                await cache.get(WAIVERS)
+                clock.now += timedelta(seconds=30)
+                await cache.get(ROSTER)
+                clock.now += timedelta(hours=1)
+            fetch.assert_not_called()
+
+            await cache.get(WAIVERS)
+            for _ in range(100):
+                if fetch.call_count:
+                    break
+                await asyncio.sleep(0.01)
+            fetch.assert_awaited_once_with(ROSTER)
+            assert await cache.get(ROSTER) == {"endpoint": ROSTER}
+        finally:
+            warmer.detach()
+
+    @pytest.mark.asyncio
+    async def test_plan_respects_calendar_budget_and_restarts(self, tmp_path):
+        clock = Clock(TUESDAY)
+        limiter = RateLimiter(max_requests=10)
+        warmer, cache, fetch = make_warmer(tmp_path, clock, limiter=limiter, idle_delay=0)
+        try:
+            await started(warmer)
+            await cache.get(ROSTER)
+            await cache.get(ROSTER)
+            await cache.get(WAIVERS)
+            await cache.get("league/461.l.1/scoreboard;week=6")
+            assert warmer.plan(clock.now, NFL_STATE, limit=10) == [
+                "yahoo|" + WAIVERS,
+                "yahoo|team/461.l.1.t.3/roster;week={week}",
+            ]
+
+            limiter.requests.extend([time.time()] * 6)  # 4 left, 5 reserved
+            assert await warmer.prefetch(["yahoo|" + WAIVERS]) == 0
+
+            limiter.requests.clear()
+            assert await warmer.warm_once() == 2
+            assert cache.remaining_ttl(WAIVERS) > 0
+        finally:
+            warmer.detach()
+
+        # Patterns survive a restart and replay against the next week
+        clock.now += timedelta(days=7)
+        reloaded, cache, fetch = make_warmer(
+            tmp_path, clock, state={**NFL_STATE, "week": 7}, idle_delay=0
+        )
+        try:
+            await started(reloaded)
+            assert reloaded.get_stats()["tracked_keys"] == 3
+            await reloaded.prefetch(reloaded.plan(clock.now, reloaded._nfl_state, limit=10))
+            fetch.assert_any_await("team/461.l.1.t.3/roster;week=7")
+        finally:
+            reloaded.detach()
+
+    @pytest.mark.asyncio
+    async def test_lookups_during_the_state_fetch_are_learned(self, tmp_path):
+        clock = Clock(TUESDAY)
+        warmer, cache, _ = make_warmer(tmp_path, clock)
+        release = asyncio.Event()
+
+        async def get_nfl_state():
+            await cache.get("state/nfl")  # the warmer's own lookup
+            await release.wait()
+            return NFL_STATE
+
+        warmer.sleeper.get_nfl_state.side_effect = get_nfl_state
+        try:
+            await asyncio.sleep(0)  # the warmer starts on attach
+            await cache.get(ROSTER)
+            await cache.get("state/nfl")
+            release.set()
+            await started(warmer)
+            assert set(warmer._keys) == {
+                "yahoo|team/461.l.1.t.3/roster;week={week}",
+                "yahoo|state/nfl",
+            }
+            assert warmer._keys["yahoo|state/nfl"][0] == 1.0
+        finally:
+            warmer.detach()
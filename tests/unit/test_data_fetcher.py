@@ -0,0 +1,136 @@
+"""Unit tests for the DataFetcherAgent yfpy execution layer."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.agents.data_fetcher import APIEndpoint, APIRequest, DataFetcherAgent
+
+
+@pytest.fixture
+def fetcher():
+    """DataFetcherAgent with stub settings and cache manager."""
+    settings = SimpleNamespace(
+        yahoo_api_rate_limit=100,
+        yahoo_api_rate_window_seconds=3600,
+        max_workers=4,
+        async_timeout_seconds=30,
+        yahoo_client_id="id",
+        yahoo_client_secret="secret",
+    )
+    agent = DataFetcherAgent(settings, cache_manager=MagicMock())
+    yield agent
+    agent._executor.shutdown(wait=True)
+
+
+class TestYahooExecution:
+    """Test that yfpy calls run off the event loop with per-league clients."""
+
+    @pytest.mark.asyncio
+    async def test_clients_are_scoped_per_league(self, fetcher):
+        """Each league gets its own client; the shared client is never mutated."""
+        created = []
+
+        def fake_client(league_id=None):
+            client = MagicMock()
+            client.league_id = league_id
+            created.append(league_id)
+            return client
+
+        with patch.object(fetcher, "_create_yahoo_client", side_effect=fake_client):
+            client_a = await fetcher._get_yahoo_client("111")
+            client_b = await fetcher._get_yahoo_client("222")
+            client_a_again = await fetcher._get_yahoo_client("111")
+
+        assert client_a is client_a_again
+        assert client_a is not client_b
+        assert client_a.league_id == "111"
+        assert client_b.league_id == "222"
+        assert created == ["111", "222"]
+
+    @pytest.mark.asyncio
+    async def test_blocking_calls_run_concurrently(self, fetcher):
+        """Blocking yfpy calls for different leagues overlap instead of serializing."""
+
+        def fake_client(league_id=None):
+            client = MagicMock()
+
+            def slow_players(**_kwargs):
+                time.sleep(0.2)
+                return league_id
+
+            client.get_league_players.side_effect = slow_players
+            return client
+
+        requests = [
+            APIRequest(
+                endpoint=APIEndpoint.AVAILABLE_PLAYERS,
+                params={"league_key": f"461.l.{league_id}"},
+            )
+            for league_id in ("1", "2", "3", "4")
+        ]
+
+        with patch.object(fetcher, "_create_yahoo_client", side_effect=fake_client):
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(fetcher._execute_yahoo_request(request) for request in requests)
+            )
+            elapsed = time.perf_counter() - start
+
+        assert results == ["1", "2", "3", "4"]
+        assert elapsed < 0.6
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self, fetcher):
+        """Other coroutines keep running while a yfpy call blocks."""
+
+        def fake_client(league_id=None):
+            client = MagicMock()
+            client.get_user_leagues.side_effect = lambda: time.sleep(0.2) or []
+            return client
+
+        finished = []
+
+        async def request_leagues():
+            request = APIRequest(endpoint=APIEndpoint.USER_LEAGUES, params={})
+            await fetcher._execute_yahoo_request(request)
+            finished.append("yahoo")
+
+        async def ticker():
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+            finished.append("ticker")
+
+        with patch.object(fetcher, "_create_yahoo_client", side_effect=fake_client):
+            await asyncio.gather(request_leagues(), ticker())
+
+        assert finished == ["ticker", "yahoo"]
+
+    @pytest.mark.asyncio
+    async def test_timed_out_calls_hold_their_slot_until_they_return(self, fetcher):
+        """Hung yfpy calls cap concurrency instead of silently filling the executor."""
+        release = threading.Event()
+        calls = []
+
+        def hung_call():
+            calls.append("started")
+            release.wait(5)
+            return "late"
+
+        for _ in range(4):
+            with pytest.raises(asyncio.TimeoutError):
+                await fetcher._run_yfpy(hung_call, timeout=0.05)
+        assert fetcher._yfpy_slots.locked()
+
+        # Every slot is held by a hung call: the next one times out before it runs
+        with pytest.raises(asyncio.TimeoutError):
+            await fetcher._run_yfpy(hung_call, timeout=0.05)
+        assert len(calls) == 4
+
+        release.set()
+        assert await fetcher._run_yfpy(lambda: "ok", timeout=1) == "ok"
+        assert not fetcher._yfpy_slots.locked()
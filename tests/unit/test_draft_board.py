@@ -0,0 +1,140 @@
+"""Unit tests for the vectorized draft board."""
+
+import random
+from typing import Optional
+
+import pytest
+
+from src.agents.draft_board import REPLACEMENT_RANKS, DraftBoard
+from src.models.draft import (
+    STRATEGY_WEIGHTS,
+    DraftPosition,
+    DraftState,
+    DraftStrategy,
+    DraftTier,
+    PositionalNeed,
+    RosterNeed,
+    StrategyWeights,
+)
+from src.models.player import Player, Position
+
+
+class DraftPlayer(Player):
+    projected_points: float = 0.0
+    bye_week: Optional[int] = None
+
+
+def make_pool(size, seed=3):
+    rng = random.Random(seed)
+    positions = [Position.QB, Position.RB, Position.WR, Position.TE, Position.K, Position.DEF]
+    return [
+        DraftPlayer(
+            id=str(i),
+            name=f"Player {i}",
+            position=rng.choice(positions),
+            team="BUF",
+            season=2024,
+            age=rng.choice([None, 22, 26, 29, 33]),
+            projected_points=round(rng.uniform(20, 350), 1),
+            bye_week=rng.randint(5, 14),
+        )
+        for i in range(size)
+    ]
+
+
+def draft_state(round_number=1, roster_needs=()):
+    return DraftState(
+        league_key="nfl.l.1",
+        draft_position=DraftPosition(
+            overall_pick=round_number * 12,
+            round_number=round_number,
+            pick_in_round=1,
+            picks_until_next=11,
+        ),
+        roster_needs=list(roster_needs),
+        picks_remaining=16 - round_number,
+        strategy=DraftStrategy.BALANCED,
+        draft_phase="early",
+    )
+
+
+def expected_replacement(players, position):
+    points = sorted((p.projected_points for p in players if p.position == position), reverse=True)
+    if not points:
+        return 0.0
+    return points[min(REPLACEMENT_RANKS[position], len(points) - 1)]
+
+
+def test_incremental_replacement_levels_match_a_rebuild():
+    pool = make_pool(300)
+    board = DraftBoard(pool)
+    rng = random.Random(11)
+    drafted = set()
+    for player in rng.sample(pool, 290):
+        assert board.draft(player.id)
+        drafted.add(player.id)
+        remaining = [p for p in pool if p.id not in drafted]
+        for position in Position:
+            assert board.replacement_level(position) == expected_replacement(remaining, position)
+    assert not board.draft(player.id)  # already drafted
+
+
+def test_every_available_player_is_scored_best_first():
+    pool = make_pool(450)
+    board = DraftBoard(pool)
+    needs = [
+        RosterNeed(Position.RB, PositionalNeed.CRITICAL, 0, 2, 2, bye_week_conflicts=1),
+        RosterNeed(Position.TE, PositionalNeed.SATURATED, 2, 1, 1),
+    ]
+    roster = [p.model_copy(update={"bye_week": pool[0].bye_week}) for p in pool[:2]]
+    weights = STRATEGY_WEIGHTS[DraftStrategy.BALANCED]
+    evaluations = board.evaluate(draft_state(3, needs), roster, weights)
+
+    assert len(evaluations) == 450  # no cap on the pool
+    scores = [e.overall_score for e in evaluations]
+    assert scores == sorted(scores, reverse=True)
+
+    for evaluation in evaluations[::37]:
+        player = evaluation.player
+        replacement = board.replacement_level(player.position)
+        assert evaluation.vorp_score == min(100, max(0, player.projected_points - replacement))
+        if player.position == Position.RB:
+            assert evaluation.scarcity_score == pytest.approx(100)
+            assert evaluation.need_score == 100  # 100 + 5 for the bye conflict, capped
+        elif player.position == Position.TE:
+            assert (evaluation.scarcity_score, evaluation.need_score) == (pytest.approx(12), 0)
+        else:
+            assert (evaluation.scarcity_score, evaluation.need_score) == (50, 50)
+        conflict = player.bye_week == pool[0].bye_week
+        assert evaluation.bye_week_score == (-10 if conflict else 0)
+
+    top = board.evaluate(draft_state(3, needs), roster, weights, limit=5)
+    assert [e.player.id for e in top] == [e.player.id for e in evaluations[:5]]
+
+
+def test_missing_attributes_use_defaults_and_tiers_follow_the_total():
+    player = DraftPlayer(id="1", name="A", position="QB", team="BUF", season=2024)
+    board = DraftBoard([player])  # no projection, age, bye week or years pro
+    weights = STRATEGY_WEIGHTS[DraftStrategy.BALANCED]
+    (evaluation,) = board.evaluate(draft_state(), [], weights)
+    assert (evaluation.risk_score, evaluation.upside_score) == (50, 0)
+
+    # All weight on VORP: the total is the projection over replacement
+    board.replacement[:] = 0
+    vorp_only = StrategyWeights(vorp=1.0, scarcity=0, need=0, bye_week=0, risk=0, upside=0)
+    tiers = [DraftTier.BENCH, DraftTier.FLEX, DraftTier.SOLID, DraftTier.STUD, DraftTier.ELITE]
+    for projection, tier in zip([39.9, 40, 55, 70, 85], tiers):
+        board.projection[:] = projection
+        (evaluation,) = board.evaluate(draft_state(), [], vorp_only)
+        assert (evaluation.overall_score, evaluation.tier) == (pytest.approx(projection), tier)
+
+
+def test_sync_drafts_missing_players_and_rejects_unknown_ones():
+    pool = make_pool(40)
+    board = DraftBoard(pool)
+    assert board.sync(pool[5:])
+    assert board.available.sum() == 35
+    assert all(board.draft(p.id) is False for p in pool[:5])
+
+    newcomer = DraftPlayer(id="new", name="New", position="RB", team="BUF", season=2024)
+    assert not board.sync(pool[5:] + [newcomer])
@@ -0,0 +1,175 @@
+"""Unit tests for the live draft room."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.parsers import parse_draft_rankings, parse_draft_results
+from src.services.draft_room import (
+    DraftRoomService,
+    snake_picks,
+    survival_probabilities,
+)
+
+LEAGUE = "461.l.61410"
+OUR_TEAM = f"{LEAGUE}.t.2"
+NUM_TEAMS = 4
+ROUNDS = 3
+
+
+def draft_results(made):
+    """Snake draft listing for four teams; ``made`` maps pick number to player key."""
+    entries = {}
+    for pick in range(1, NUM_TEAMS * ROUNDS + 1):
+        rnd = (pick - 1) // NUM_TEAMS + 1
+        slot = (pick - 1) % NUM_TEAMS + 1
+        team = slot if rnd % 2 else NUM_TEAMS - slot + 1
+        result = {"pick": pick, "round": rnd, "team_key": f"{LEAGUE}.t.{team}"}
+        if pick in made:
+            result["player_key"] = made[pick]
+        entries[str(pick - 1)] = {"draft_result": result}
+    entries["count"] = len(entries)
+    return {"fantasy_content": {"league": [{"league_key": LEAGUE}, {"draft_results": entries}]}}
+
+
+def rankings_page(start, count):
+    players = {}
+    for i in range(count):
+        rank = start + i + 1
+        players[str(i)] = {
+            "player": [
+                [
+                    {"player_key": f"461.p.{rank}"},
+                    {"name": {"full": f"Player {rank}"}},
+                    {"editorial_team_abbr": "BUF"},
+                    {"display_position": "RB"},
+                ],
+                {"draft_analysis": [{"average_pick": str(rank + 0.5)}, {"percent_drafted": "1"}]},
+            ]
+        }
+    players["count"] = count
+    return {"fantasy_content": {"league": [{"league_key": LEAGUE}, {"players": players}]}}
+
+
+class FakeYahoo:
+    def __init__(self):
+        self.made = {}
+        self.calls = []
+
+    async def __call__(self, endpoint, use_cache=True):
+        self.calls.append(endpoint)
+        if endpoint.endswith("/draftresults"):
+            return draft_results(self.made)
+        start = int(endpoint.split("start=")[1].split(";")[0])
+        return rankings_page(start, 25)
+
+
+def test_parsers():
+    picks = parse_draft_results(draft_results({1: "461.p.1"}))
+    assert len(picks) == 12 and picks[0]["player_key"] == "461.p.1"
+    assert picks[1] == {"pick": 2, "round": 1, "team_key": OUR_TEAM, "player_key": None}
+
+    players = parse_draft_rankings(rankings_page(25, 2), start=25)
+    assert [p["rank"] for p in players] == [26, 27]
+    assert players[0]["player_key"] == "461.p.26"
+    assert players[0]["average_draft_position"] == 26.5
+    assert players[0]["percent_drafted"] == 1.0
+
+
+def test_snake_picks():
+    assert snake_picks(2, 4, 3) == [2, 7, 10]
+
+
+def test_survival_follows_adp():
+    survival = survival_probabilities([1, 2, 3, 4, 30, 60], picks_before=3, seed=1)
+    assert survival[0] < 0.2 and survival[-1] == 1.0
+    assert survival == sorted(survival)
+    assert survival_probabilities([5, 6], 0) == [1.0, 1.0]
+    assert survival_probabilities([5, 6], 2) == [0.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_board_tracks_picks_and_answers_from_precomputed_state():
+    yahoo = FakeYahoo()
+    team_index = AsyncMock()
+    team_index.get.return_value = {"team_key": OUR_TEAM, "draft_position": 2}
+    rooms = DraftRoomService(interval=3600)
+    with (
+        patch("src.services.draft_room.yahoo_api_call", yahoo),
+        patch("src.services.draft_room.user_team_index", team_index),
+    ):
+        result = await rooms.recommend(LEAGUE, "balanced", 5)
+        assert (result["current_pick"], result["next_pick"]) == (1, 2)
+        assert not result["on_the_clock"]
+        assert result["survival_to_pick"] == 2
+        assert result["total_analyzed"] == 75  # 12 picks + margin, in pages of 25
+        top = result["recommendations"][0]
+        assert top["player"]["name"] == "Player 1"
+        assert top["survival_probability"] < result["recommendations"][4]["survival_probability"]
+        fetches = len(yahoo.calls)
+
+        # Answered from the session without touching Yahoo
+        again = await rooms.recommend(LEAGUE, "balanced", 3)
+        assert len(again["recommendations"]) == 3
+        assert len(yahoo.calls) == fetches
+
+        # Player 1 goes first overall: we are on the clock, targets are for pick 7
+        yahoo.made[1] = "461.p.1"
+        session = await rooms.session(LEAGUE)
+        assert await rooms.poll_once(session) == 1
+        result = await rooms.recommend(LEAGUE, "balanced", 5)
+        assert (result["current_pick"], result["on_the_clock"]) == (2, True)
+        assert result["survival_to_pick"] == 7
+        assert result["recommendations"][0]["player"]["name"] == "Player 2"
+        assert result["picks_made"] == 1
+        assert yahoo.calls[fetches:] == [f"league/{LEAGUE}/draftresults"]
+
+        # A commissioner undo puts the player back on the board
+        yahoo.made.clear()
+        assert await rooms.poll_once(session) == 0
+        result = await rooms.recommend(LEAGUE, "balanced", 1)
+        assert result["recommendations"][0]["player"]["name"] == "Player 1"
+
+        # Once every pick is in, callers fall back to the ranking path
+        yahoo.made.update({pick: f"461.p.{pick}" for pick in range(1, 13)})
+        await rooms.poll_once(session)
+        assert await rooms.recommend(LEAGUE, "balanced", 5) is None
+    rooms.stop()
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_no_draft_listing_means_no_session():
+    rooms = DraftRoomService()
+    yahoo = AsyncMock(return_value={"fantasy_content": {"league": [{"league_key": LEAGUE}]}})
+    with patch("src.services.draft_room.yahoo_api_call", yahoo):
+        assert await rooms.recommend(LEAGUE) is None
+        # Checked again only once the no-draft result expires
+        assert await rooms.recommend(LEAGUE) is None
+        yahoo.assert_awaited_once()
+        rooms.no_draft_ttl = 0
+        assert await rooms.recommend(LEAGUE) is None
+        assert yahoo.await_count == 2
+    assert rooms.get_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_leagues_start_independently():
+    other = "461.l.999"
+    release = asyncio.Event()
+
+    async def yahoo(endpoint, use_cache=True):
+        if other in endpoint:
+            await release.wait()
+        return {"fantasy_content": {"league": [{"league_key": LEAGUE}]}}
+
+    rooms = DraftRoomService()
+    with patch("src.services.draft_room.yahoo_api_call", yahoo):
+        slow = asyncio.create_task(rooms.recommend(other))
+        await asyncio.sleep(0)
+        # A slow draft check in one league does not hold up another
+        assert await asyncio.wait_for(rooms.recommend(LEAGUE), 1) is None
+        assert not slow.done()
+        release.set()
+        assert await slow is None
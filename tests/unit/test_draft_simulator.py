@@ -0,0 +1,142 @@
+"""Unit tests for the mock draft simulator."""
+
+import random
+from dataclasses import astuple
+from typing import Optional
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.agents import draft_simulator
+from src.agents.draft_board import POSITIONS, DraftBoard
+from src.agents.draft_evaluator import DraftEvaluatorAgent
+from src.agents.draft_simulator import (
+    MockDraftSimulator,
+    simulate_drafts,
+    snake_order,
+)
+from src.agents.worker_pool import shared_worker_pool
+from src.models.draft import STRATEGY_WEIGHTS, DraftPosition, DraftState, DraftStrategy
+from src.models.player import Player
+
+POSITION_COUNTS = {"QB": 8, "RB": 16, "WR": 18, "TE": 8, "K": 5, "DEF": 5}
+
+
+class DraftPlayer(Player):
+    projected_points: float = 0.0
+    bye_week: Optional[int] = None
+
+
+def make_pool(seed=5):
+    rng = random.Random(seed)
+    players = []
+    for position, count in POSITION_COUNTS.items():
+        for rank in range(count):
+            players.append(
+                DraftPlayer(
+                    id=f"{position}{rank}",
+                    name=f"{position} {rank}",
+                    position=position,
+                    team="BUF",
+                    season=2024,
+                    age=rng.randint(22, 33),
+                    projected_points=round(300 * 0.95**rank + rng.uniform(-20, 20), 1),
+                    bye_week=rng.randint(5, 8),
+                )
+            )
+    return players
+
+
+def test_snake_order():
+    assert snake_order(3, 3).tolist() == [0, 1, 2, 2, 1, 0, 0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_simulated_pick_scores_match_the_draft_board():
+    """Our team's vectorized scores equal DraftBoard.evaluate for the same draft state."""
+    simulator = MockDraftSimulator(make_pool(), num_teams=4, rounds=5)
+    board = DraftBoard(simulator.players)
+    pool = simulator.pool
+
+    roster = [simulator.players[i] for i in (0, 9, 10, 30)]
+    drafted = roster + [simulator.players[i] for i in (1, 2, 25, 26, 27, 50)]
+    for player in drafted:
+        board.draft(player.id)
+
+    agent = object.__new__(DraftEvaluatorAgent)
+    state = DraftState(
+        league_key="mock",
+        draft_position=DraftPosition(
+            overall_pick=11, round_number=3, pick_in_round=3, picks_until_next=2
+        ),
+        roster_needs=await agent._analyze_roster_needs(roster),
+        picks_remaining=2,
+        strategy=DraftStrategy.AGGRESSIVE,
+        draft_phase="early",
+    )
+    weights = STRATEGY_WEIGHTS[DraftStrategy.AGGRESSIVE]
+    expected = {e.player.id: e for e in board.evaluate(state, roster, weights)}
+
+    counts = np.zeros((1, len(POSITIONS)), dtype=int)
+    byes = np.zeros((1, len(POSITIONS), draft_simulator.MAX_BYE_WEEK + 1), dtype=int)
+    for player in roster:
+        row = board.index[player.id]
+        counts[0, pool["position"][row]] += 1
+        byes[0, pool["position"][row], pool["bye"][row]] += 1
+    scores = draft_simulator._our_scores(
+        pool, astuple(weights), board.available[None, :], counts, byes, round_number=3
+    )[0]
+
+    for row, player in enumerate(simulator.players):
+        if player.id in expected:
+            # The board clamps the reported overall score to 0-100
+            assert min(100, max(0, scores[row])) == pytest.approx(expected[player.id].overall_score)
+
+
+def test_simulated_drafts_fill_our_roster_reproducibly():
+    simulator = MockDraftSimulator(make_pool(), num_teams=4, rounds=12)
+    weights = astuple(STRATEGY_WEIGHTS[DraftStrategy.BALANCED])
+    first = simulate_drafts(simulator.pool, weights, 2, 4, simulator.rounds, 50, seed=7)
+    second = simulate_drafts(simulator.pool, weights, 2, 4, simulator.rounds, 50, seed=7)
+
+    assert first["counts"].sum(axis=1).tolist() == [12] * 50
+    assert np.array_equal(first["points"], second["points"])
+    # Starting lineup: QB, 2 RB, 2 WR, TE, K, DEF and a flex
+    assert (first["points"] <= first["position_points"].sum(axis=1)).all()
+    assert (first["points"] > 0).all()
+
+
+def test_pool_smaller_than_the_draft_limits_rounds():
+    simulator = MockDraftSimulator(make_pool(), num_teams=12, rounds=16)
+    assert simulator.rounds == len(simulator.players) // 12
+
+
+@pytest.mark.asyncio
+async def test_strategies_are_compared_per_draft_slot():
+    simulator = MockDraftSimulator(make_pool(), num_teams=4, rounds=10)
+    report = await simulator.compare_strategies(draft_slots=[1, 4], simulations=30, seed=1)
+
+    assert len(report["results"]) == 6
+    assert set(report["best_strategy_by_slot"]) == {1, 4}
+    result = report["results"][0]
+    assert result["points_percentiles"]["p10"] <= result["points_percentiles"]["p90"]
+    assert sum(result["positions"]["QB"]["count_distribution"].values()) == pytest.approx(1)
+    assert sum(p["mean_count"] for p in result["positions"].values()) == pytest.approx(10)
+
+
+@pytest.mark.asyncio
+async def test_strategy_simulations_reuse_the_shared_worker_pool():
+    agent = object.__new__(DraftEvaluatorAgent)
+    pool = shared_worker_pool()
+    with patch.object(pool, "run", wraps=pool.run) as run:
+        await agent.simulate_strategies(
+            make_pool(), num_teams=4, rounds=6, draft_slots=[1], simulations=10
+        )
+        executor = pool._process_executor
+        await agent.simulate_strategies(
+            make_pool(), num_teams=4, rounds=6, draft_slots=[2], simulations=10
+        )
+
+    assert run.call_count == 2 * len(DraftStrategy)
+    assert pool._process_executor is executor  # no pool started per call
@@ -0,0 +1,160 @@
+"""Unit tests for player payload field selection."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.handlers import player_handlers
+from src.handlers.player_handlers import handle_ff_get_waiver_wire
+from src.utils.field_selection import (
+    needs_enrichment,
+    parse_fields,
+    parse_output_format,
+    requests_any,
+    shape_records,
+)
+
+PLAYERS = [
+    {"name": "Player A", "position": "RB", "team": "KC", "yahoo_projection": 12.5},
+    {"name": "Player B", "position": "WR", "team": "BUF", "yahoo_projection": 9.0},
+]
+
+
+class TestFieldSelection:
+    """Test argument parsing and record shaping."""
+
+    def test_parse_fields_accepts_list_and_csv(self):
+        assert parse_fields(["name", " team ", "name"]) == ["name", "team"]
+        assert parse_fields("name, position") == ["name", "position"]
+        assert parse_fields(None) is None
+        assert parse_fields("") is None
+
+    def test_parse_output_format_defaults_to_records(self):
+        assert parse_output_format("TABLE") == "table"
+        assert parse_output_format("csv") == "records"
+        assert parse_output_format(None) == "records"
+
+    def test_needs_enrichment(self):
+        assert needs_enrichment(None)
+        assert not needs_enrichment(["name", "position", "owned_pct"])
+        assert needs_enrichment(["name", "yahoo_projection"])
+
+    def test_requests_any(self):
+        assert requests_any(None, ["expert_tier"])
+        assert requests_any(["name", "expert_tier"], ["expert_tier"])
+        assert not requests_any(["name"], ["expert_tier"])
+
+    def test_shape_records_projects_fields(self):
+        shaped = shape_records(PLAYERS, ["name", "yahoo_projection", "missing"])
+        assert shaped == [
+            {"name": "Player A", "yahoo_projection": 12.5},
+            {"name": "Player B", "yahoo_projection": 9.0},
+        ]
+
+    def test_shape_records_table(self):
+        table = shape_records(PLAYERS, ["name", "team"], "table")
+        assert table == {
+            "columns": ["name", "team"],
+            "rows": [["Player A", "KC"], ["Player B", "BUF"]],
+        }
+
+        full = shape_records(PLAYERS, output_format="table")
+        assert full["columns"] == ["name", "position", "team", "yahoo_projection"]
+        assert full["rows"][1] == ["Player B", "WR", "BUF", 9.0]
+
+
+class TestWaiverWireFieldSelection:
+    """Test that the waiver handler skips work the selected fields do not need."""
+
+    @pytest.mark.asyncio
+    async def test_basic_fields_skip_enrichment(self):
+        waiver_players = AsyncMock(
+            return_value=[
+                {"name": "Player A", "position": "RB", "team": "KC", "owned_pct": 12.0},
+                {"name": "Player B", "position": "WR", "team": "BUF", "owned_pct": 4.0},
+            ]
+        )
+        with (
+            patch.object(player_handlers, "get_waiver_wire_players", waiver_players),
+            patch("lineup_optimizer.lineup_optimizer.parse_yahoo_roster") as parse_roster,
+        ):
+            result = await handle_ff_get_waiver_wire(
+                {
+                    "league_key": "nfl.l.12345",
+                    "include_analysis": True,
+                    "fields": ["name", "owned_pct"],
+                    "output_format": "table",
+                }
+            )
+
+        parse_roster.assert_not_called()
+        assert "enhanced_players" not in result
+        assert result["players"] == {
+            "columns": ["name", "owned_pct"],
+            "rows": [["Player A", 12.0], ["Player B", 4.0]],
+        }
+
+    @pytest.mark.asyncio
+    async def test_table_output_is_ranked_like_records(self):
+        import fastmcp_server
+
+        enhanced = [
+            {"name": "Player A", "waiver_priority": 40, "trending_score": 90},
+            {"name": "Player B", "waiver_priority": 75, "trending_score": None},
+            {"name": "Player C", "waiver_priority": 60, "trending_score": 20},
+        ]
+
+        async def call_tool(_name, *, output_format, fields, **_kwargs):
+            players = shape_records([dict(p) for p in enhanced], fields, output_format)
+            return {"status": "success", "players": [], "enhanced_players": players}
+
+        for sort, expected in (
+            ("rank", ["Player B", "Player C", "Player A"]),
+            ("trending", ["Player A", "Player B", "Player C"]),
+        ):
+            results = {}
+            for output_format in ("records", "table"):
+                with patch.object(fastmcp_server, "_call_tool", side_effect=call_tool):
+                    results[output_format] = await fastmcp_server.ff_get_waiver_wire.fn(
+                        ctx=None, league_key="nfl.l.1", sort=sort, output_format=output_format
+                    )
+
+            assert [p["name"] for p in results["records"]["players"]] == expected
+            assert [row[0] for row in results["table"]["players"]["rows"]] == expected
+
+    @pytest.mark.asyncio
+    async def test_expert_advice_comes_from_the_enrichment_stage(self):
+        waiver_players = AsyncMock(
+            return_value=[
+                {"name": "Player A", "position": "RB", "team": "KC", "owned_pct": 12.0},
+                {"name": "Player B", "position": "WR", "team": "BUF", "owned_pct": 4.0},
+            ]
+        )
+
+        async def enhance(players, week=None, stages=None):
+            players[0].expert_tier = "Elite"
+            players[0].expert_confidence = 80
+            return players
+
+        with (
+            patch.object(player_handlers, "get_waiver_wire_players", waiver_players),
+            patch(
+                "lineup_optimizer.lineup_optimizer.enhance_with_external_data",
+                side_effect=enhance,
+            ) as enhance_mock,
+            patch("sleeper_api.sleeper_client.get_expert_advice") as expert_advice,
+        ):
+            result = await handle_ff_get_waiver_wire(
+                {
+                    "league_key": "nfl.l.12345",
+                    "include_analysis": True,
+                    "fields": ["name", "expert_tier", "expert_confidence"],
+                }
+            )
+
+        expert_advice.assert_not_called()
+        assert "expert_advice" in enhance_mock.call_args.kwargs["stages"]
+        assert result["enhanced_players"] == [
+            {"name": "Player A", "expert_tier": "Elite", "expert_confidence": 80},
+            {"name": "Player B", "expert_tier": "Depth", "expert_confidence": 50},
+        ]
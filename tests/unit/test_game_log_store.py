@@ -0,0 +1,95 @@
+"""Unit tests for the columnar game-log store."""
+
+import numpy as np
+import pytest
+
+from src.agents.game_log_store import GameLogStore
+from src.models.player import PlayerStats
+
+
+def games(points, targets=5):
+    return [PlayerStats(targets=targets, fantasy_points=p) for p in points]
+
+
+class TestGameLogStore:
+    """Test incremental syncing, rolling features and group-bys."""
+
+    def test_sync_appends_only_new_weeks(self):
+        store = GameLogStore()
+        assert store.sync("p1", games([10, 12, 14]), 2025) == 3
+        assert store.sync("p1", games([10, 12, 14]), 2025) == 0
+        assert store.sync("p1", games([10, 12, 14, 8]), 2025) == 1
+
+        frame = store.player_frame("p1", 2025)
+        assert list(frame.index.get_level_values("week")) == [1, 2, 3, 4]
+        assert frame["fp_l3"].iloc[-1] == pytest.approx((12 + 14 + 8) / 3)
+        assert frame["fp_l5"].iloc[-1] == pytest.approx(11.0)
+
+    def test_changed_history_replaces_rows(self):
+        store = GameLogStore()
+        store.sync("p1", games([10, 12, 14]), 2025)
+        assert store.sync("p1", games([9, 12]), 2025) == 2
+        assert list(store.player_frame("p1")["fantasy_points"]) == [9.0, 12.0]
+        assert len(store) == 2
+
+    def test_corrected_stats_with_the_same_points_replace_rows(self):
+        store = GameLogStore()
+        store.sync("p1", games([10, 12, 14]), 2025)
+        corrected = games([10, 12, 14])
+        corrected[1].targets = 9  # stat correction that leaves the points unchanged
+
+        assert store.sync("p1", corrected, 2025) == 3
+        assert list(store.player_frame("p1")["targets"]) == [5.0, 9.0, 5.0]
+
+    def test_player_slice_is_a_view_of_the_store(self):
+        store = GameLogStore()
+        store.sync("p1", games([10, 12]), 2025)
+        store.sync("p2", games([3, 4, 5]), 2025)
+
+        frame = store.player_frame("p2", 2025)
+        assert list(frame["fantasy_points"]) == [3.0, 4.0, 5.0]
+        assert np.shares_memory(frame.to_numpy(), store.frame.to_numpy())
+
+    def test_target_share_and_team_totals(self):
+        store = GameLogStore()
+        store.sync("wr1", games([10, 12], targets=6), 2025, team="KC")
+        store.sync("te1", games([5, 7], targets=2), 2025, team="KC")
+        store.sync("wr2", games([8], targets=9), 2025, team="BUF")
+
+        assert store.player_frame("wr1")["target_share"].tolist() == [0.75, 0.75]
+        assert store.player_frame("wr2")["target_share"].tolist() == [1.0]
+
+        totals = store.team_weekly_totals(2025)
+        assert totals.loc[("KC", 2025, 1), "targets"] == 8
+        assert totals.loc[("KC", 2025, 2), "fantasy_points"] == 19
+
+        summary = store.player_summary()
+        assert summary.loc["te1", "games"] == 2
+        assert summary.loc["wr1", "fp_mean"] == pytest.approx(11.0)
+
+    def test_buffered_syncs_merge_on_read(self):
+        store = GameLogStore()
+        store.sync("p1", games([10, 12]), 2025, team="KC")
+        store.sync("p1", games([10, 12, 14, 8]), 2025)  # extends the unmerged rows
+        store.sync("p2", games([3, 4]), 2025, team="KC")
+        store.sync("p2", games([5]), 2025)  # replaces them before any read
+
+        assert len(store) == 5
+        p1 = store.player_frame("p1", 2025)
+        assert p1["fp_l3"].tolist() == pytest.approx([10, 11, 12, (12 + 14 + 8) / 3])
+        assert p1["target_share"].iloc[0] == 0.5
+        assert p1["target_share"].iloc[1:].tolist() == [1.0, 1.0, 1.0]
+
+        store.sync("p1", games([10, 12, 14, 8, 20]), 2025)
+        assert store.player_frame("p1")["fp_l5"].iloc[-1] == pytest.approx(12.8)
+
+    def test_team_change_recomputes_both_teams(self):
+        store = GameLogStore()
+        store.sync("wr1", games([10], targets=6), 2025, team="KC")
+        store.sync("wr2", games([8], targets=2), 2025, team="KC")
+        store.sync("wr3", games([8], targets=4), 2025, team="BUF")
+        assert store.player_frame("wr2")["target_share"].tolist() == [0.25]
+
+        store.sync("wr1", games([10], targets=6), 2025, team="BUF")
+        assert store.player_frame("wr2")["target_share"].tolist() == [1.0]
+        assert store.player_frame("wr3")["target_share"].tolist() == [0.4]
@@ -0,0 +1,45 @@
+"""Import-time budget for the server entry points."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.utils import lazy_imports
+from src.utils.lazy_imports import HEAVY_MODULES
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def loaded_heavy_modules(module: str) -> list:
+    """Heavy packages loaded by importing ``module`` in a fresh interpreter."""
+    code = (
+        f"import json, sys, {module}; "
+        f"print(json.dumps(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", ["fantasy_football_multi_league", "fastmcp_server"])
+def test_server_import_defers_heavy_modules(module):
+    assert loaded_heavy_modules(module) == []
+
+
+def test_warm_up_skips_unavailable_modules(monkeypatch):
+    assert lazy_imports.warm_up_imports(["json", "not_a_real_module"]) == ["json"]
+
+    monkeypatch.setattr(lazy_imports, "_warmup_thread", None)
+    thread = lazy_imports.start_import_warmup(["json"])
+    assert lazy_imports.start_import_warmup(["json"]) is thread
+    thread.join(5)
+    assert not thread.is_alive()
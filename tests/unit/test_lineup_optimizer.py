@@ -1,5 +1,7 @@
 """Unit tests for lineup_optimizer.py - Lineup optimization logic."""
 
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
 from lineup_optimizer import (
@@ -8,6 +10,8 @@ from lineup_optimizer import (
     LineupOptimizer,
     MatchAnalytics,
     Player,
+    enrichment_stages_for,
+    resolve_enrichment_stages,
     _calculate_match_confidence,
     _coerce_float,
     _coerce_int,
@@ -284,6 +288,113 @@ class TestLineupOptimizer:
             assert players == []
 
 
+class TestEnrichmentStages:
+    """Test stage selection and lazy, memoized enrichment."""
+
+    def test_resolve_adds_dependencies_in_order(self):
+        """Test that dependencies are pulled in and ordered first."""
+        assert resolve_enrichment_stages(["recent_stats"]) == [
+            "sleeper_id",
+            "projection",
+            "recent_stats",
+        ]
+        assert resolve_enrichment_stages([]) == []
+        assert len(resolve_enrichment_stages()) == 5
+
+    def test_resolve_rejects_unknown_stage(self):
+        """Test that unknown stage names raise."""
+        with pytest.raises(ValueError):
+            resolve_enrichment_stages(["weather"])
+
+    def test_standard_request_skips_expert_and_stats(self):
+        """Test that a projections-only request needs only the projection chain."""
+        stages = enrichment_stages_for(
+            include_projections=True, include_external_data=False, include_analysis=False
+        )
+        assert stages == ["sleeper_id", "projection"]
+
+    def test_fields_narrow_stages(self):
+        """Test that requested fields limit the stages to those producing them."""
+        stages = enrichment_stages_for(
+            include_projections=True,
+            include_external_data=True,
+            include_analysis=True,
+            fields=["name", "trending_score"],
+        )
+        assert stages == ["sleeper_id", "trending"]
+
+    @pytest.mark.asyncio
+    async def test_enhance_runs_only_selected_stages_and_memoizes(self):
+        """Test that unselected stages make no calls and results are reused."""
+        client = MagicMock()
+        client.map_yahoo_to_sleeper = AsyncMock(return_value="4046")
+        client.get_projections = AsyncMock(
+            return_value={"4046": {"projected_stats": {"pts": 18.5}}}
+        )
+        client.get_expert_advice = AsyncMock()
+        client.get_trending_players = AsyncMock()
+
+        optimizer = LineupOptimizer()
+        players = [Player(name="Patrick Mahomes", position="QB", team="KC")]
+
+        with (
+            patch("sleeper_api.sleeper_client", client),
+            patch("sleeper_api.get_current_season", AsyncMock(return_value=2025)),
+            patch("sleeper_api.get_current_week", AsyncMock(return_value=7)),
+        ):
+            first = await optimizer.enhance_with_external_data(players, stages=["projection"])
+            second = await optimizer.enhance_with_external_data(players, stages=["projection"])
+
+        assert first[0].sleeper_id == "4046"
+        assert first[0].sleeper_projection == 18.5
+        assert second[0].sleeper_projection == 18.5
+        client.map_yahoo_to_sleeper.assert_awaited_once()
+        client.get_projections.assert_awaited_once()
+        client.get_expert_advice.assert_not_called()
+        client.get_trending_players.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_recent_stats_are_fetched_once_per_roster(self):
+        """Test that the recent_stats stage does one warehouse lookup for all players."""
+        from src.services.player_enhancement import RecentPerformance
+
+        client = MagicMock()
+        client.map_yahoo_to_sleeper = AsyncMock(side_effect=lambda name, **_: f"id-{name}")
+        recent = {
+            "id-A": RecentPerformance(
+                weeks_analyzed=2,
+                avg_points=15.0,
+                total_points=30.0,
+                weeks_data=[{"week": 6, "points": 16.0}, {"week": 5, "points": 14.0}],
+                trend="stable",
+            ),
+            "id-B": None,
+        }
+        batch = AsyncMock(return_value=recent)
+        single = AsyncMock()
+
+        optimizer = LineupOptimizer()
+        players = [
+            Player(name="A", position="RB", team="KC", bye=10),
+            Player(name="B", position="WR", team="BUF", bye=10),
+        ]
+        with (
+            patch("sleeper_api.sleeper_client", client),
+            patch("sleeper_api.get_current_season", AsyncMock(return_value=2025)),
+            patch("sleeper_api.get_current_week", AsyncMock(return_value=7)),
+            patch("src.services.player_enhancement.get_recent_stats_batch", batch),
+            patch("src.services.player_enhancement.get_recent_stats", single),
+        ):
+            enhanced = await optimizer.enhance_with_external_data(players, stages=["recent_stats"])
+            await optimizer.enhance_with_external_data(players, stages=["recent_stats"])
+
+        batch.assert_awaited_once()
+        assert sorted(batch.call_args.args[1]) == ["id-A", "id-B"]
+        single.assert_not_called()
+        assert enhanced[0].recent_performance_data.avg_points == 15.0
+        assert enhanced[1].recent_performance_data is None
+
+
 class TestBenchSlots:
     """Test bench slot definitions."""
 
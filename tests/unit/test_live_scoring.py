@@ -0,0 +1,235 @@
+"""Unit tests for the shared live scoring poller."""
+
+import asyncio
+import gc
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.parsers import parse_league_scoreboard
+from src.services.live_scoring import LiveScoringService, in_game_window
+
+LEAGUE = "461.l.61410"
+# Sunday 2025-10-12 18:00 UTC = 14:00 ET
+SUNDAY_AFTERNOON = datetime(2025, 10, 12, 18, 0, tzinfo=timezone.utc)
+NFL_STATE = {"season": "2025", "week": 6, "season_type": "regular"}
+
+
+def scoreboard_team(team_id, name, points, projected, live=None):
+    stats = {
+        "team_points": {"coverage_type": "week", "week": "6", "total": str(points)},
+        "team_projected_points": {"coverage_type": "week", "week": "6", "total": str(projected)},
+    }
+    if live is not None:
+        stats["team_live_projected_points"] = {"total": str(live)}
+    return {"team": [[{"team_key": f"{LEAGUE}.t.{team_id}"}, {"name": name}], stats]}
+
+
+def scoreboard(*matchups):
+    """Build a Yahoo scoreboard response from (team_a, team_b) pairs."""
+    entries = {
+        str(i): {
+            "matchup": {
+                "week": "6",
+                "status": "midevent",
+                "is_tied": 0,
+                "0": {"teams": {"0": team_a, "1": team_b, "count": 2}},
+            }
+        }
+        for i, (team_a, team_b) in enumerate(matchups)
+    }
+    entries["count"] = len(matchups)
+    return {
+        "fantasy_content": {
+            "league": [
+                {"league_key": LEAGUE},
+                {"scoreboard": {"week": "6", "0": {"matchups": entries}}},
+            ]
+        }
+    }
+
+
+def sleeper_stub():
+    sleeper = AsyncMock()
+    sleeper.get_nfl_state.return_value = NFL_STATE
+    return sleeper
+
+
+class TestScoreboardParsing:
+    def test_parse_league_scoreboard(self):
+        data = scoreboard(
+            (scoreboard_team(1, "Alpha", 45.2, 110.5, 104.0), scoreboard_team(2, "Beta", 60, 98.1))
+        )
+        (matchup,) = parse_league_scoreboard(data)
+
+        assert matchup["week"] == 6
+        assert matchup["status"] == "midevent"
+        assert matchup["teams"][0] == {
+            "team_key": f"{LEAGUE}.t.1",
+            "name": "Alpha",
+            "points": 45.2,
+            "projected_points": 110.5,
+            "live_projected_points": 104.0,
+        }
+        assert matchup["teams"][1]["live_projected_points"] is None
+
+    def test_game_windows(self):
+        assert in_game_window(SUNDAY_AFTERNOON, NFL_STATE)
+        assert not in_game_window(SUNDAY_AFTERNOON, {**NFL_STATE, "season_type": "off"})
+        # Wednesday afternoon, Saturday before week 15
+        assert not in_game_window(datetime(2025, 10, 8, 18, tzinfo=timezone.utc), NFL_STATE)
+        saturday = datetime(2025, 12, 20, 18, tzinfo=timezone.utc)
+        assert not in_game_window(saturday, NFL_STATE)
+        assert in_game_window(saturday, {**NFL_STATE, "week": 16})
+
+
+class TestLiveScoringService:
+    @pytest.mark.asyncio
+    async def test_one_fetch_per_poll_and_only_changed_matchups_pushed(self):
+        sleeper = sleeper_stub()
+        service = LiveScoringService(sleeper, clock=lambda: SUNDAY_AFTERNOON)
+        first = scoreboard(
+            (scoreboard_team(1, "A", 10, 100), scoreboard_team(2, "B", 12, 95)),
+            (scoreboard_team(3, "C", 20, 90), scoreboard_team(4, "D", 5, 88)),
+        )
+        second = scoreboard(
+            (scoreboard_team(1, "A", 10, 100), scoreboard_team(2, "B", 12, 95)),
+            (scoreboard_team(3, "C", 27, 90, 97.5), scoreboard_team(4, "D", 5, 88)),
+        )
+        yahoo = AsyncMock(side_effect=[first, second])
+        watchers = [AsyncMock(), AsyncMock()]
+
+        with (
+            patch("src.services.live_scoring.yahoo_api_call", yahoo),
+            patch.object(service, "_run", AsyncMock()),
+        ):
+            for watcher in watchers:
+                service.subscribe(LEAGUE, watcher)
+            assert await service.poll_once()
+            assert await service.poll_once()
+
+        assert yahoo.await_count == 2  # one scoreboard per poll, however many watchers
+        for watcher in watchers:
+            assert watcher.await_count == 2
+            league_key, changed = watcher.await_args.args
+            assert league_key == LEAGUE
+            assert [m["matchup_id"] for m in changed] == ["week6-3-4"]
+            assert changed[0]["teams"][0]["projected_final"] == 97.5
+
+        assert service.snapshot(LEAGUE)["matchups"][0]["teams"][0]["projected_final"] == 100.0
+        # Nothing reads the live week's stat dump, so polls never download it
+        sleeper.get_player_stats.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_idle_outside_game_windows(self):
+        wednesday = datetime(2025, 10, 8, 18, tzinfo=timezone.utc)
+        service = LiveScoringService(sleeper_stub(), clock=lambda: wednesday)
+        yahoo = AsyncMock()
+
+        with (
+            patch("src.services.live_scoring.yahoo_api_call", yahoo),
+            patch.object(service, "_run", AsyncMock()),
+        ):
+            service.subscribe(LEAGUE, AsyncMock())
+            assert not await service.poll_once()
+
+        yahoo.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failing_watcher_is_dropped(self):
+        service = LiveScoringService(sleeper_stub(), clock=lambda: SUNDAY_AFTERNOON)
+        yahoo = AsyncMock(
+            return_value=scoreboard((scoreboard_team(1, "A", 1, 2), scoreboard_team(2, "B", 3, 4)))
+        )
+
+        with (
+            patch("src.services.live_scoring.yahoo_api_call", yahoo),
+            patch.object(service, "_run", AsyncMock()),
+        ):
+            service.subscribe(LEAGUE, AsyncMock(side_effect=RuntimeError("session closed")))
+            await service.poll_once()
+
+        assert service.watched_leagues() == []
+
+    @pytest.mark.asyncio
+    async def test_scoreboard_reads_share_one_fetch(self):
+        service = LiveScoringService(sleeper_stub(), clock=lambda: SUNDAY_AFTERNOON)
+        yahoo = AsyncMock(
+            return_value=scoreboard((scoreboard_team(1, "A", 1, 2), scoreboard_team(2, "B", 3, 4)))
+        )
+
+        with patch("src.services.live_scoring.yahoo_api_call", yahoo):
+            boards = [await service.scoreboard(LEAGUE) for _ in range(3)]
+
+        yahoo.assert_awaited_once()
+        assert boards[0]["matchups"] == boards[2]["matchups"]
+
+    @pytest.mark.asyncio
+    async def test_leagues_refresh_independently(self):
+        service = LiveScoringService(sleeper_stub(), clock=lambda: SUNDAY_AFTERNOON)
+        board = scoreboard((scoreboard_team(1, "A", 1, 2), scoreboard_team(2, "B", 3, 4)))
+        in_flight = []
+        peak = 0
+
+        async def slow_scoreboard(endpoint, use_cache=True):
+            nonlocal peak
+            in_flight.append(endpoint)
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0.05)
+            in_flight.remove(endpoint)
+            return board
+
+        yahoo = AsyncMock(side_effect=slow_scoreboard)
+        with patch("src.services.live_scoring.yahoo_api_call", yahoo):
+            await asyncio.gather(service.scoreboard(LEAGUE), service.scoreboard("461.l.2"))
+            assert peak == 2  # neither league waited on the other
+
+            # A poll queued behind a reader's refresh of the same league does not refetch
+            service._snapshots[LEAGUE]["updated_at"] -= timedelta(seconds=service.interval)
+            await asyncio.gather(
+                service.scoreboard(LEAGUE), service._poll_league(LEAGUE, NFL_STATE)
+            )
+
+        assert yahoo.await_count == 3
+
+
+class FakeSession:
+    def __init__(self):
+        self._exit_stack = AsyncExitStack()
+        self.send_resource_updated = AsyncMock()
+
+
+class TestWatchTool:
+    """Test the per-session live score subscriptions of the MCP tool."""
+
+    @pytest.mark.asyncio
+    async def test_watches_end_when_the_session_closes(self):
+        import fastmcp_server
+
+        watch = fastmcp_server.ff_watch_live_scores.fn
+        service = LiveScoringService(sleeper_stub(), clock=lambda: SUNDAY_AFTERNOON)
+        with (
+            patch.object(fastmcp_server, "live_scores", service),
+            patch.object(service, "_run", AsyncMock()),
+        ):
+            first, second = FakeSession(), FakeSession()
+            await watch(SimpleNamespace(session=first), LEAGUE)
+            await watch(SimpleNamespace(session=first), LEAGUE)  # already watching
+            await watch(SimpleNamespace(session=second), LEAGUE)
+            assert len(service._subscribers[LEAGUE]) == 2
+
+            await service._notify(LEAGUE, [{"matchup_id": "1"}])
+            assert first.send_resource_updated.await_count == 2
+
+            # Disconnect: the session's exit stack unwinds
+            await first._exit_stack.aclose()
+            assert len(service._subscribers[LEAGUE]) == 1
+
+            # A session that is simply dropped is unsubscribed once collected
+            del second
+            gc.collect()
+            assert service.watched_leagues() == []
+            assert fastmcp_server._LIVE_WATCHES[first] == {}
@@ -0,0 +1,123 @@
+"""Unit tests for matchup_analyzer.py - precomputed matchup scoring."""
+
+import math
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from matchup_analyzer import MatchupAnalyzer
+from sleeper_api import sleeper_client
+
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF", "LB"]
+
+
+def reference_score(rankings, team, position):
+    """The per-call scoring the lookup tables replace."""
+    if team not in rankings:
+        return (50, "Unknown matchup")
+    key = {"RB": "vs_rb", "WR": "vs_wr", "TE": "vs_te"}.get(position, "vs_qb")
+    ranking = rankings[team].get(key, 16)
+    percentile = ((32 - ranking + 1) / 32) * 100
+    score = max(1, min(100, int(100 / (1 + math.exp(-0.05 * (percentile - 50))))))
+    tiers = [
+        (90, "SMASH SPOT"),
+        (80, "Elite matchup"),
+        (70, "Great matchup"),
+        (60, "Good matchup"),
+        (50, "Neutral matchup"),
+        (40, "Below average"),
+        (30, "Tough matchup"),
+        (20, "Bad matchup"),
+        (10, "Terrible matchup"),
+        (0, "AVOID - Elite defense"),
+    ]
+    label = next(label for floor, label in tiers if score >= floor)
+    return (score, f"{label} vs {team} (#{ranking}/32)")
+
+
+@pytest.fixture
+async def rankings():
+    return await sleeper_client.get_defensive_rankings()
+
+
+@pytest.mark.asyncio
+async def test_tables_match_the_sigmoid_scoring(rankings):
+    analyzer = MatchupAnalyzer()
+    # Every rank, including one missing a column, reaches every description tier
+    analyzer.defensive_rankings = {
+        **{f"T{rank}": {"vs_qb": rank, "vs_rb": rank, "vs_wr": rank} for rank in range(1, 33)},
+        **rankings,
+    }
+
+    for team in analyzer.defensive_rankings:
+        for position in POSITIONS:
+            expected = reference_score(analyzer.defensive_rankings, team, position)
+            assert analyzer.get_matchup_score(team, position) == expected
+    assert analyzer.get_matchup_score("XYZ", "QB") == (50, "Unknown matchup")
+    assert analyzer.get_matchup_score("@BAL", "WR") == reference_score(rankings, "BAL", "WR")
+
+
+@pytest.mark.asyncio
+async def test_batch_lookup_matches_single_lookups(rankings):
+    analyzer = MatchupAnalyzer()
+    assert analyzer.scores(["BAL"], ["QB"]) == [(50, "Unknown matchup")]
+
+    analyzer.defensive_rankings = rankings
+    opponents = ["BAL", "@ARI", "XYZ", "CLE", "ARI"]
+    positions = ["QB", "RB", "WR", "K", "LB"]
+    assert analyzer.scores(opponents, positions) == [
+        analyzer.get_matchup_score(opponent, position)
+        for opponent, position in zip(opponents, positions)
+    ]
+    assert analyzer.scores([], []) == []
+
+
+@pytest.mark.asyncio
+async def test_tables_are_rebuilt_only_for_new_rankings(rankings):
+    analyzer = MatchupAnalyzer()
+    fetch = AsyncMock(side_effect=lambda: {team: dict(ranks) for team, ranks in rankings.items()})
+    with patch.object(sleeper_client, "get_defensive_rankings", fetch):
+        await analyzer.load_defensive_rankings()
+        table = analyzer.score_table
+        await analyzer.load_defensive_rankings()
+        await analyzer.load_defensive_rankings(refresh=True)
+    assert fetch.await_count == 2
+    assert analyzer.score_table is table  # same rankings, same version
+
+    changed = {**rankings, "BAL": {**rankings["BAL"], "vs_qb": 32}}
+    analyzer.defensive_rankings = changed
+    assert analyzer.score_table is not table
+    assert analyzer.get_matchup_score("BAL", "QB") == reference_score(changed, "BAL", "QB")
+
+
+@pytest.mark.asyncio
+async def test_roster_matchups_use_one_batch_lookup(rankings):
+    analyzer = MatchupAnalyzer()
+    analyzer.defensive_rankings = rankings
+    roster = [
+        {"name": "A", "position": "QB", "opponent": "BAL"},
+        {"name": "B", "position": "WR", "opponent": "@ARI"},
+        {"name": "C", "position": "RB", "opponent": ""},
+    ]
+    projection = AsyncMock(return_value={"pts_ppr": 12.5})
+    with (
+        patch("sleeper_api.get_player_projection", projection),
+        patch.object(analyzer, "scores", wraps=analyzer.scores) as scores,
+    ):
+        analyses = await analyzer.analyze_roster_matchups(roster)
+
+    scores.assert_called_once()
+    by_player = {a["player"]: a for a in analyses}
+    assert set(by_player) == {"A", "B"}
+    assert [a["matchup_score"] for a in analyses] == sorted(
+        (a["matchup_score"] for a in analyses), reverse=True
+    )
+    assert (by_player["B"]["matchup_score"], by_player["B"]["matchup_description"]) == (
+        reference_score(rankings, "ARI", "WR")
+    )
+    assert by_player["B"]["opponent"] == "@ARI"
+    assert all(a["sleeper_projection"] == 12.5 for a in analyses)
+
+    matchups = analyzer.get_position_matchups("QB", {"KC": "@BAL", "NYJ": "ARI", "SF": "XYZ"})
+    assert {m["team"] for m in matchups} == {"NYJ", "KC"}
+    assert matchups[0]["score"] >= matchups[1]["score"]
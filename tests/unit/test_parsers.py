@@ -2,7 +2,11 @@
 
 import pytest
 
-from src.parsers.yahoo_parsers import parse_team_roster, parse_yahoo_free_agent_players
+from src.parsers.yahoo_parsers import (
+    parse_team_roster,
+    parse_user_team_index,
+    parse_yahoo_free_agent_players,
+)
 
 
 class TestParseTeamRoster:
@@ -277,3 +281,29 @@ class TestParseFreeAgentPlayers:
         assert len(result) == 1
         assert result[0]["owned_pct"] == 0
         assert result[0]["weekly_change"] == 0
+
+
+class TestParseUserTeamIndex:
+    """Test resolving the user's team in every league from one response."""
+
+    def test_parse_user_team_index(self, mock_yahoo_user_teams_response):
+        """Owned teams are found by login flag or by manager GUID."""
+        index = parse_user_team_index(mock_yahoo_user_teams_response)
+
+        assert set(index) == {"461.l.61410", "461.l.99999"}
+        assert index["461.l.61410"]["team_key"] == "461.l.61410.t.2"
+        assert index["461.l.61410"]["team_name"] == "My Team"
+        assert index["461.l.61410"]["manager_guid"] == "TEST_GUID_12345"
+        assert index["461.l.61410"]["game_key"] == "461"
+        assert index["461.l.99999"]["team_key"] == "461.l.99999.t.7"
+
+    def test_parse_user_team_index_unknown_guid(self, mock_yahoo_user_teams_response):
+        """Without a GUID match only explicitly owned teams are indexed."""
+        index = parse_user_team_index(mock_yahoo_user_teams_response, user_guid="SOMEONE_ELSE")
+
+        assert set(index) == {"461.l.61410"}
+
+    def test_parse_user_team_index_empty_response(self):
+        """Empty or malformed responses produce an empty index."""
+        assert parse_user_team_index({}) == {}
+        assert parse_user_team_index({"fantasy_content": {"users": []}}) == {}
@@ -0,0 +1,75 @@
+"""Unit tests for the start-up warm-up and the /health readiness route."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.services.prewarm import StartupPrewarm, prewarm_enabled, prewarm_timeout
+
+
+class TestStartupPrewarm:
+    @pytest.mark.asyncio
+    async def test_steps_run_concurrently_and_degrade(self):
+        prewarm = StartupPrewarm()
+        assert prewarm.ready  # no warm-up requested
+
+        async def slow():
+            await asyncio.sleep(0.2)
+            return {"week": 6}
+
+        async def offline():
+            raise ConnectionError("no network")
+
+        async def empty():
+            return {}
+
+        async def hangs():
+            await asyncio.sleep(60)
+
+        started = time.monotonic()
+        run = asyncio.create_task(
+            prewarm.run(
+                {"a": slow, "b": slow, "leagues": offline, "players": empty, "slow": hangs},
+                timeout=0.5,
+            )
+        )
+        await asyncio.sleep(0)
+        assert not prewarm.ready
+        assert prewarm.status()["status"] == "warming"
+
+        results = await run
+        assert time.monotonic() - started < 1.0
+        assert results == {
+            "a": "ok",
+            "b": "ok",
+            "leagues": "failed: no network",
+            "players": "empty",
+            "slow": "timeout",
+        }
+        assert prewarm.ready
+        assert prewarm.status()["prewarm_steps"] == results
+
+    def test_settings_from_environment(self, monkeypatch):
+        monkeypatch.delenv("PREWARM_ON_START", raising=False)
+        assert not prewarm_enabled()
+        monkeypatch.setenv("PREWARM_ON_START", "true")
+        monkeypatch.setenv("PREWARM_TIMEOUT", "oops")
+        assert prewarm_enabled()
+        assert prewarm_timeout() == 30.0
+
+    @pytest.mark.asyncio
+    async def test_health_route_reports_readiness(self, monkeypatch):
+        import fastmcp_server
+
+        prewarm = StartupPrewarm()
+        monkeypatch.setattr(fastmcp_server, "startup_prewarm", prewarm)
+        prewarm.state = "warming"
+        response = await fastmcp_server.health(None)
+        assert response.status_code == 503
+
+        prewarm.state = "ready"
+        response = await fastmcp_server.health(None)
+        assert response.status_code == 200
+        assert json.loads(response.body)["status"] == "ok"
@@ -0,0 +1,226 @@
+"""Unit tests for RedditSentimentAgent keyword scoring."""
+
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.agents import reddit_analyzer
+from src.agents.reddit_analyzer import (
+    KeywordMatcher,
+    RedditSentimentAgent,
+    SentimentCache,
+    SentimentModel,
+)
+
+
+@pytest.fixture
+def agent(monkeypatch, tmp_path):
+    monkeypatch.delenv("REDDIT_CLIENT_ID", raising=False)
+    cache = SentimentCache(tmp_path / "sentiment.sqlite")
+    agent = RedditSentimentAgent(SimpleNamespace(), sentiment_cache=cache)
+    yield agent
+    agent.thread_executor.shutdown(wait=False)
+    cache.close()
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_matcher_finds_overlapping_substrings(monkeypatch, use_automaton):
+    if not use_automaton:
+        monkeypatch.setattr(reddit_analyzer, "AHOCORASICK_AVAILABLE", False)
+    elif not reddit_analyzer.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick not installed")
+
+    matcher = KeywordMatcher(
+        {
+            "positive": {"start": 0.2, "must start": 0.3, "target": 0.1},
+            "negative": {"target share": 0.1, "injury": 0.1},
+            "injury": {"injury": 1.0, "IR": 1.0},
+        }
+    )
+    assert matcher.find("MUST START him despite the target share") == {
+        "start",
+        "must start",
+        "target",
+        "target share",
+    }
+    assert matcher.scan_batch(["Placed on IR with an injury", "their first game"]) == [
+        {"positive": 0.0, "negative": 0.1, "injury": 2.0},
+        {"positive": 0.0, "negative": 0.0, "injury": 0.0},
+    ]
+
+
+def test_keyword_sentiment_matches_per_keyword_scan(agent):
+    """The single-pass scan scores exactly like testing each keyword separately."""
+    strong = {"must start": 0.3, "smash play": 0.3, "league winner": 0.3, "elite": 0.3}
+    strong.update({"start": 0.2, "stud": 0.2, "locked in": 0.2})
+    strong.update({"avoid": 0.3, "bust": 0.3, "sit": 0.3, "bench": 0.2, "fade": 0.2, "risky": 0.2})
+
+    def expected(text):
+        lowered = text.lower()
+        positive = sum(strong.get(k, 0.1) for k in agent.positive_keywords if k in lowered)
+        negative = sum(strong.get(k, 0.1) for k in agent.negative_keywords if k in lowered)
+        return max(-1.0, min(1.0, positive - negative))
+
+    rng = random.Random(7)
+    words = agent.positive_keywords + agent.negative_keywords + "he is a position player".split()
+    for _ in range(200):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 25)))
+        assert agent._keyword_sentiment(text) == pytest.approx(expected(text))
+
+
+@pytest.mark.asyncio
+async def test_sentiment_data_counts_injuries_from_the_same_scan(agent):
+    reddit_data = {
+        "posts": [{"text": "Must start, smash", "score": 20, "weight": 1.0, "subreddit": "ff"}],
+        "comments": [
+            {"text": "Hamstring, he is questionable", "score": 3, "weight": 0.5, "subreddit": "ff"},
+            {"text": "Out for the year", "score": 8, "weight": 0.5, "subreddit": "nfl"},
+        ],
+    }
+    result = await agent._analyze_sentiment_data(
+        reddit_data, SentimentModel.KEYWORD_BASED, "Player"
+    )
+
+    assert result["injury_mentions"] == 2
+    assert result["sentiment_breakdown"] == {"positive": 1, "negative": 0, "neutral": 2}
+
+
+@pytest.mark.asyncio
+async def test_texts_are_scored_in_one_executor_job(agent, monkeypatch):
+    batches = []
+
+    def polarities(texts):
+        batches.append(list(texts))
+        return [0.5] * len(texts)
+
+    monkeypatch.setattr(reddit_analyzer, "TEXTBLOB_AVAILABLE", True)
+    monkeypatch.setattr(reddit_analyzer, "_textblob_polarities", polarities)
+    texts = ["Must start this week", "Avoid him", "Must start this week", "Meh"]
+
+    scores = await agent._score_texts(texts, SentimentModel.TEXTBLOB)
+    assert scores == [0.5] * 4
+    assert len(batches) == 1 and len(batches[0]) == 3  # duplicates are scored once
+
+    hybrid = await agent._score_texts(texts, SentimentModel.HYBRID)
+    assert hybrid[1] == pytest.approx(0.5 * 0.6 + agent._keyword_sentiment("Avoid him") * 0.4)
+    assert len(batches) == 2
+
+    await agent._score_texts(texts + ["Avoid him"], SentimentModel.TEXTBLOB)
+    assert len(batches) == 2  # every text already cached
+
+
+@pytest.mark.asyncio
+async def test_scores_persist_across_cache_instances(agent, tmp_path):
+    text = "Elite target share, must start"
+    expected = agent._keyword_sentiment(text)
+    assert await agent._score_texts([text], SentimentModel.KEYWORD_BASED) == [expected]
+    agent.sentiment_cache.close()
+
+    reopened = SentimentCache(tmp_path / "sentiment.sqlite")
+    scorer = f"keyword_based:0:{agent._scoring_version}"
+    assert reopened.get_many([SentimentCache.digest(text, scorer)]) == {
+        SentimentCache.digest(text, scorer): expected
+    }
+    reopened.close()
+
+
+def test_cache_drops_least_recently_used_beyond_bound(tmp_path):
+    cache = SentimentCache(tmp_path / "sentiment.sqlite", max_entries=3, trim_interval=0)
+    cache.put_many({"a": 0.1, "b": 0.2, "c": 0.3})
+    time.sleep(0.01)
+    assert cache.get_many(["a"]) == {"a": 0.1}  # a becomes most recently used
+    time.sleep(0.01)
+    cache.put_many({"d": 0.4})
+
+    assert len(cache) == 3
+    assert cache.get_many(["a", "b", "c", "d"]) == {"a": 0.1, "c": 0.3, "d": 0.4}
+    cache.close()
+
+
+def test_cache_trims_on_a_schedule(tmp_path):
+    cache = SentimentCache(tmp_path / "sentiment.sqlite", max_entries=2)
+    cache.put_many({"a": 0.1, "b": 0.2})
+    time.sleep(0.01)
+    assert cache.get_many(["a"]) == {"a": 0.1}
+    time.sleep(0.01)
+    cache.put_many({"c": 0.3})
+    assert len(cache) == 3  # within the trim interval
+
+    cache.trim()
+    assert cache.get_many(["a", "b", "c"]) == {"a": 0.1, "c": 0.3}
+    cache.close()
+
+
+class FakeComments:
+    def __init__(self, bodies, fetches):
+        self.bodies = bodies
+        self.fetches = fetches
+
+    def replace_more(self, limit=None):
+        self.fetches.append(limit)
+
+    def list(self):
+        return [SimpleNamespace(body=b, score=8, created_utc=time.time()) for b in self.bodies]
+
+
+def fake_post(post_id, title, comments, fetches, age_hours=1):
+    return SimpleNamespace(
+        id=post_id,
+        title=title,
+        selftext="",
+        score=12,
+        num_comments=len(comments),
+        url=f"https://reddit.test/{post_id}",
+        created_utc=time.time() - age_hours * 3600,
+        comments=FakeComments(comments, fetches),
+    )
+
+
+@pytest.fixture
+def fake_reddit(agent):
+    fetches, queries = [], []
+    posts = [
+        fake_post("a", "Josh Allen or Saquon Barkley this week?", ["Josh Allen, easily"], fetches),
+        fake_post("b", "Saquon Barkley is a must start", ["Barkley smash"], fetches),
+        fake_post("c", "Josh Allen film breakdown", [], fetches, age_hours=100),
+    ]
+
+    def search(query, **kwargs):
+        queries.append((query, kwargs["limit"]))
+        return iter(posts)
+
+    agent.reddit = SimpleNamespace(subreddit=lambda name: SimpleNamespace(search=search))
+    agent.api_status = reddit_analyzer.RedditAPIStatus.HEALTHY
+    agent.min_request_interval = 0
+    return SimpleNamespace(fetches=fetches, queries=queries)
+
+
+@pytest.mark.asyncio
+async def test_players_share_subreddit_searches_and_threads(agent, fake_reddit):
+    data = await agent._fetch_reddit_data_async(["Josh Allen", "Saquon Barkley"], 48, 50)
+
+    assert fake_reddit.queries == [('"Josh Allen" OR "Saquon Barkley"', 24)] * 4
+    assert len(fake_reddit.fetches) == 2  # one comment tree per recent thread
+    josh, saquon = data["Josh Allen"], data["Saquon Barkley"]
+    assert [post["url"][-1] for post in josh["posts"]] == ["a"]
+    assert [post["url"][-1] for post in saquon["posts"]] == ["a", "b"]
+    assert [comment["text"] for comment in josh["comments"]] == ["Josh Allen, easily"]
+    assert saquon["comments"] == []  # comments are attributed by name too
+    assert josh["stats"]["subreddits_searched"] == 4
+
+    await agent._fetch_reddit_data_async(["Saquon Barkley"], 48, 50)
+    assert fake_reddit.queries[-1] == ("Saquon Barkley", 12)
+    assert len(fake_reddit.fetches) == 2  # threads already fetched
+
+
+@pytest.mark.asyncio
+async def test_comparison_analyzes_every_player_in_one_pass(agent, fake_reddit):
+    comparison = await agent.compare_players_sentiment(["Josh Allen", "Saquon Barkley", "Nobody"])
+
+    assert len(fake_reddit.queries) == 4
+    analysis = comparison["analysis"]
+    assert analysis["Saquon Barkley"].posts_analyzed == 2
+    assert analysis["Nobody"].fallback_used
+    assert comparison["successful_analyses"] == 2
@@ -0,0 +1,151 @@
+"""Unit tests for the Reddit ingestion worker and the local post store."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.agents.reddit_analyzer import (
+    RedditAPIStatus,
+    RedditSentimentAgent,
+    SentimentCache,
+)
+from src.services import reddit_service
+from src.services.reddit_ingest import (
+    RedditIngestor,
+    RedditPostStore,
+    name_forms,
+    normalize_text,
+)
+
+PLAYERS = {
+    "4984": {"first_name": "Josh", "last_name": "Allen", "position": "QB", "active": True},
+    "6794": {"first_name": "A.J.", "last_name": "Brown", "position": "WR", "active": True},
+    "BUF": {"first_name": "Buffalo", "last_name": "Bills", "position": "DEF", "active": True},
+}
+
+
+class FakeSleeper:
+    def normalized_name_index(self):
+        return {"josh allen": "4984", "a j brown": "6794", "buffalo bills": "BUF"}
+
+    async def get_all_players(self):
+        return PLAYERS
+
+    async def get_player_by_name(self, name):
+        for player_id, player in PLAYERS.items():
+            if f"{player['first_name']} {player['last_name']}" == name:
+                return {**player, "sleeper_id": player_id}
+        return None
+
+
+class FakeSubreddit:
+    def __init__(self, posts, comments, reads):
+        self.posts, self.comments_list, self.reads = posts, comments, reads
+
+    def _listing(self, items):
+        for item in items:
+            self.reads.append(item.fullname)
+            yield item
+
+    def new(self, limit):
+        return self._listing(self.posts)
+
+    def comments(self, limit):
+        return self._listing(self.comments_list)
+
+
+def post(fullname, title, age_hours=1, score=20):
+    created = time.time() - age_hours * 3600
+    return SimpleNamespace(
+        fullname=fullname, title=title, selftext="", score=score, created_utc=created
+    )
+
+
+def comment(fullname, body, age_hours=1, score=8):
+    return SimpleNamespace(
+        fullname=fullname, body=body, score=score, created_utc=time.time() - age_hours * 3600
+    )
+
+
+@pytest.fixture
+def ingestor(monkeypatch, tmp_path):
+    monkeypatch.delenv("REDDIT_CLIENT_ID", raising=False)
+    cache = SentimentCache(tmp_path / "sentiment.sqlite")
+    agent = RedditSentimentAgent(SimpleNamespace(), sentiment_cache=cache)
+    agent.subreddits = [{"name": "fantasyfootball", "weight": 1.0, "priority": 1}]
+    agent.api_status = RedditAPIStatus.HEALTHY
+    feed = SimpleNamespace(posts=[], comments=[], reads=[])
+    agent.reddit = SimpleNamespace(
+        subreddit=lambda name: FakeSubreddit(feed.posts, feed.comments, feed.reads)
+    )
+    store = RedditPostStore(tmp_path / "posts.sqlite")
+    ingestor = RedditIngestor(store=store, agent=agent, sleeper_client=FakeSleeper())
+    ingestor.feed = feed
+    yield ingestor
+    store.close()
+    cache.close()
+    agent.thread_executor.shutdown(wait=False)
+
+
+def test_name_matching_uses_whole_normalized_words():
+    assert normalize_text("A.J. Brown's TD!") == " a j brown s td "
+    assert name_forms("a j brown") == ["a j brown", "aj brown"]
+    assert name_forms("josh allen") == ["josh allen"]
+
+
+@pytest.mark.asyncio
+async def test_ingestion_is_incremental_and_indexed_by_player(ingestor):
+    feed = ingestor.feed
+    feed.posts[:] = [
+        post("t3_b", "Josh Allen must start, AJ Brown elite"),
+        post("t3_a", "Buffalo Bills defense thoughts"),
+        post("t3_old", "Josh Allen last season", age_hours=500),
+    ]
+    feed.comments[:] = [comment("t1_a", "Josh Allen is questionable, ankle")]
+
+    assert not await ingestor.is_fresh()
+    # The Bills (a defense) are not indexed; t3_old is older than the backfill window
+    assert await ingestor.ingest_once() == 2
+    assert await ingestor.is_fresh()
+
+    feed.reads.clear()
+    feed.posts.insert(0, post("t3_c", "Sell Josh Allen? Bust"))
+    assert await ingestor.ingest_once() == 1
+    assert feed.reads == ["t3_c", "t3_b", "t1_a"]  # stopped at each stream's cursor
+
+    results = await ingestor.analyze_players(["Josh Allen", "A.J. Brown", "Nobody"])
+    josh = results["Josh Allen"]
+    assert (josh.posts_analyzed, josh.comments_analyzed, josh.injury_mentions) == (2, 1, 1)
+    assert josh.top_comments == [
+        {
+            "text": "Josh Allen is questionable, ankle",
+            "score": 8,
+            "subreddit": "fantasyfootball",
+        }
+    ]
+    assert results["A.J. Brown"].posts_analyzed == 1
+    assert results["Nobody"].status == "error"
+
+    series = ingestor.store.series("4984", time.time() - 3 * 3600)
+    assert sum(point["mentions"] for point in series) == 3
+
+
+@pytest.mark.asyncio
+async def test_service_answers_from_fresh_store_without_reddit(ingestor, monkeypatch):
+    ingestor.feed.posts[:] = [post("t3_a", "Josh Allen must start, smash play")]
+    await ingestor.ingest_once()
+
+    def no_reddit(name):
+        raise AssertionError("Reddit should not be called")
+
+    ingestor.agent.reddit = SimpleNamespace(subreddit=no_reddit)
+    # Freshness is tracked in memory after a pass, not read back per request
+    ingestor.store.last_ingested = lambda: pytest.fail("store read on the request path")
+    monkeypatch.setattr(reddit_service, "reddit_ingestor", ingestor)
+    monkeypatch.setattr(reddit_service, "get_reddit_agent", lambda: ingestor.agent)
+
+    result = await reddit_service.analyze_reddit_sentiment(["Josh Allen", "A.J. Brown"])
+    assert result["data_source"] == "local_store"
+    assert result["player_data"]["Josh Allen"]["posts_analyzed"] == 1
+    assert result["recommendation"]["start"] == "Josh Allen"
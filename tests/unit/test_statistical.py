@@ -0,0 +1,252 @@
+"""Unit tests for StatisticalAnalysisAgent model fitting."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.agents import statistical
+from src.agents.model_registry import ModelRegistry
+from src.agents.ros_projection import ScheduleGrid, project_rest_of_season
+from src.agents.statistical import (
+    RegressionResults,
+    StatisticalAnalysisAgent,
+    fit_regression_models,
+    score_fitted_models,
+)
+from src.agents.worker_pool import WorkerPool
+from src.models.matchup import GameEnvironment, Matchup
+from src.models.player import Player, PlayerStats, Position, Team
+
+
+def make_player(player_id: str, position: Position) -> Player:
+    return Player(
+        id=player_id, name=f"Player {player_id}", position=position, team=Team.KC, season=2025
+    )
+
+
+def make_games(count: int, base: int) -> list:
+    return [
+        PlayerStats(
+            rushing_attempts=base + week,
+            rushing_yards=4 * (base + week),
+            targets=3 + week % 4,
+            receptions=2 + week % 3,
+            receiving_yards=20 + 5 * week,
+            fantasy_points=float(base + week),
+        )
+        for week in range(count)
+    ]
+
+
+def make_matchup(week: int, home: Team, away: Team, bad_weather: bool = False) -> Matchup:
+    return Matchup(
+        id=f"2025-{week}-{away.value}-{home.value}",
+        week=week,
+        season=2025,
+        home_team=home,
+        away_team=away,
+        game_time=datetime(2025, 9, 7),
+        game_environment=GameEnvironment(weather_impact_score=8) if bad_weather else None,
+    )
+
+
+@pytest.fixture
+def agent(tmp_path):
+    """Agent whose worker pool uses threads so patched fitters are visible."""
+    pool = WorkerPool(max_workers=2, processes=False)
+    agent = StatisticalAnalysisAgent(
+        max_workers=2, model_registry=ModelRegistry(tmp_path), worker_pool=pool
+    )
+    yield agent
+    pool.shutdown()
+    agent.thread_executor.shutdown(wait=False)
+
+
+class TestModelFitting:
+    """Test the picklable fitting helpers."""
+
+    def test_fit_and_score(self):
+        """Test fitting linear and tree models then scoring them."""
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(12, 3))
+        y = X @ np.array([1.0, 2.0, -1.0]) + 5
+
+        fitted = fit_regression_models(X, y, include_trees=False)
+        assert set(fitted) == {"linear", "ridge", "elastic_net"}
+
+        fitted = fit_regression_models(X, y)
+        results = score_fitted_models(fitted, X, y)
+        assert set(results) == {
+            "linear",
+            "ridge",
+            "elastic_net",
+            "random_forest",
+            "gradient_boosting",
+        }
+        assert results["linear"].r2_score == pytest.approx(1.0)
+        assert results["random_forest"].feature_importance is not None
+        assert len(results["ridge"].predictions) == 12
+
+    @pytest.mark.asyncio
+    async def test_position_models_fitted_once_per_position(self, agent):
+        """Test that players sharing a position share one pooled fit."""
+        players = [
+            make_player("rb1", Position.RB),
+            make_player("rb2", Position.RB),
+            make_player("wr1", Position.WR),
+        ]
+        history = {
+            "rb1": make_games(6, 8),
+            "rb2": make_games(6, 12),
+            "wr1": make_games(6, 5),
+        }
+
+        with patch.object(statistical, "fit_regression_models", wraps=fit_regression_models) as fit:
+            position_models = await agent._fit_position_models(players, history)
+
+        # Positions fit concurrently, so calls arrive in either order
+        rows = sorted(call.args[0].shape[0] for call in fit.call_args_list)
+        assert rows == [6, 12]  # both RBs stacked, the lone WR on its own
+        assert set(position_models) == {Position.RB, Position.WR}
+
+        with patch.object(statistical, "fit_regression_models") as fit:
+            models = await agent._generate_projection_models(
+                players[0], history["rb1"], position_models[Position.RB]
+            )
+
+        fit.assert_not_called()
+        assert "linear" in models
+        assert len(models["linear"].predictions) == 6
+
+    @pytest.mark.asyncio
+    async def test_registered_models_reused_until_new_games(self, agent):
+        """Test that unchanged data costs only inference and appended games warm-start trees."""
+        player = make_player("rb1", Position.RB)
+        games = make_games(6, 8)
+
+        with patch.object(statistical, "fit_regression_models", wraps=fit_regression_models) as fit:
+            await agent._generate_projection_models(player, games)
+            await agent._generate_projection_models(player, games)
+            assert fit.call_count == 1
+
+            await agent._generate_projection_models(player, make_games(7, 8))
+            assert fit.call_count == 2
+            assert fit.call_args.args[3]["random_forest"].n_estimators == 100
+
+        schema = "regression/v2/4f/trees"
+        latest = agent.model_registry.latest("player:rb1", schema)
+        assert latest["models"]["random_forest"].n_estimators == 125
+
+    @pytest.mark.asyncio
+    async def test_changed_history_refits_from_scratch(self, agent):
+        """Test that trees are only warm-started when new games extend the old data."""
+        player = make_player("rb1", Position.RB)
+        await agent._generate_projection_models(player, make_games(6, 8))
+
+        with patch.object(statistical, "fit_regression_models", wraps=fit_regression_models) as fit:
+            # One more game, but the earlier games were corrected
+            await agent._generate_projection_models(player, make_games(7, 9))
+            assert fit.call_args.args[3] is None
+
+            # Fewer games than the last fit cannot extend it either
+            await agent._generate_projection_models(player, make_games(5, 9))
+            assert fit.call_args.args[3] is None
+
+        latest = agent.model_registry.latest("player:rb1", "regression/v2/4f/trees")
+        assert latest["models"]["random_forest"].n_estimators == 100
+
+
+class TestModelRegistry:
+    """Test the fitted model registry."""
+
+    def test_get_requires_matching_fingerprint(self, tmp_path):
+        registry = ModelRegistry(tmp_path)
+        X = np.arange(6.0).reshape(3, 2)
+        fingerprint = ModelRegistry.fingerprint(X)
+
+        assert registry.get("player:1", "schema", fingerprint) is None
+        registry.put("player:1", "schema", fingerprint, {"model": 1})
+
+        assert registry.get("player:1", "schema", fingerprint) == {"model": 1}
+        assert registry.get("player:1", "schema", ModelRegistry.fingerprint(X + 1)) is None
+        assert registry.latest("player:1", "schema") == {"model": 1}
+        assert registry.get_stats()["hits"] == 1
+
+    def test_entries_persist_and_memory_is_bounded(self, tmp_path):
+        registry = ModelRegistry(tmp_path, max_entries=1)
+        registry.put("player:1", "schema", "a", "first")
+        registry.put("player:2", "schema", "b", "second")
+        assert registry.get_stats()["memory_entries"] == 1
+
+        reloaded = ModelRegistry(tmp_path)
+        assert reloaded.get("player:1", "schema", "a") == "first"
+        assert reloaded.get("player:2", "schema", "b") == "second"
+
+        reloaded.clear()
+        assert ModelRegistry(tmp_path).latest("player:1", "schema") is None
+
+
+class TestRosProjection:
+    """Test the batch rest-of-season projection engine."""
+
+    def test_difficulty_computed_once_per_defense_position_week(self, agent):
+        players = [make_player("rb1", Position.RB), make_player("rb2", Position.RB)]
+        week_1 = make_matchup(1, Team.KC, Team.BUF)
+        schedules = {"rb1": [week_1, make_matchup(2, Team.DEN, Team.KC)], "rb2": [week_1]}
+
+        with patch.object(
+            agent, "_calculate_matchup_difficulty", wraps=agent._calculate_matchup_difficulty
+        ) as difficulty:
+            grid = ScheduleGrid.build(players, schedules, difficulty)
+
+        assert difficulty.call_count == 2
+        assert grid.mask.tolist() == [[True, True], [True, False]]
+        assert grid.difficulty.tolist() == [[5.0, 5.5], [5.0, 5.0]]
+
+    def test_matches_per_game_projection(self, agent):
+        """Test totals/variance against the per-matchup formula for one player."""
+        player = make_player("wr1", Position.WR)
+        schedule = [
+            make_matchup(1, Team.KC, Team.BUF),
+            make_matchup(2, Team.DEN, Team.KC, bad_weather=True),
+        ]
+        models = {
+            "linear": RegressionResults("linear", 0.5, 4.0, 2.0, predictions=np.array([9.0, 12.0])),
+            "ridge": RegressionResults("ridge", 0.25, 16.0, 4.0, predictions=np.array([6.0])),
+        }
+
+        projection = agent._project_ros(
+            [player], {player.id: []}, {player.id: schedule}, {player.id: models}
+        )[player.id]
+
+        base = (12.0 * 0.5 + 6.0 * 0.25) / 0.75
+        weekly = [base, base * (1.0 - 1.5 * 0.1)]
+        assert projection.weekly_projections == pytest.approx(weekly)
+        assert projection.projected_value == pytest.approx(sum(weekly))
+        assert projection.variance == pytest.approx(np.var(weekly) + 3.0**2)
+        assert projection.lower_bound < projection.projected_value < projection.upper_bound
+
+    def test_players_without_games_or_models(self):
+        grid = ScheduleGrid(["a", "b"], np.array([[7.0], [5.0]]), np.array([[True], [False]]))
+        ros = project_rest_of_season(
+            grid, np.array([10.0, 10.0]), np.array([False, True]), np.array([25.0, 25.0])
+        )
+
+        assert ros.total.tolist() == [10.0, 0.0]  # no matchup adjustment without models
+        assert ros.variance.tolist() == [25.0, 100.0]
+        assert ros.lower_bound[1] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_waiver_value_ranks_pool_in_one_batch(self, agent):
+        players = [make_player(f"rb{i}", Position.RB) for i in range(4)]
+        history = {player.id: make_games(6, 4 * i) for i, player in enumerate(players)}
+        schedules = {player.id: [make_matchup(10, Team.KC, Team.BUF)] for player in players}
+
+        with patch.object(agent, "_project_ros", wraps=agent._project_ros) as project:
+            analyses = await agent.analyze_waiver_value(players, history, schedules, {})
+
+        project.assert_called_once()
+        assert [a.player_id for a in analyses] == ["rb3", "rb2", "rb1", "rb0"]
+        assert analyses[0].projected_ros_value > analyses[-1].projected_ros_value
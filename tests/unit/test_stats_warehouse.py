@@ -0,0 +1,70 @@
+"""Unit tests for the local weekly stats warehouse."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services.player_enhancement import get_recent_stats, get_recent_stats_batch
+from src.services.stats_warehouse import StatsWarehouse
+
+WEEKLY_STATS = {
+    4: {"p1": {"pts_ppr": 10.0}, "p2": {"pts_ppr": 3.0}},
+    5: {"p1": {"pts_ppr": 14.0}, "p2": {"pts": 5.0}},
+    6: {"p1": {"pts_ppr": 20.0}, "p3": {"pts_ppr": "n/a"}},
+}
+
+
+def sleeper_stub():
+    sleeper = AsyncMock()
+    sleeper.get_player_stats.side_effect = lambda season, week: WEEKLY_STATS.get(week, {})
+    return sleeper
+
+
+class TestStatsWarehouse:
+    """Test week ingestion, refresh rules and batch lookups."""
+
+    @pytest.mark.asyncio
+    async def test_each_week_ingested_once_for_all_players(self, tmp_path):
+        warehouse = StatsWarehouse(tmp_path / "stats.sqlite")
+        sleeper = sleeper_stub()
+
+        recent = await warehouse.recent_stats(["p1", "p2", "p3"], 2025, 7, 3, sleeper)
+        await warehouse.recent_stats(["p1"], 2025, 7, 3, sleeper)
+
+        assert sleeper.get_player_stats.await_count == 3
+        assert [row["week"] for row in recent["p1"]] == [6, 5, 4]
+        assert [row["points"] for row in recent["p2"]] == [5.0, 3.0]
+        assert "p3" not in recent  # non-numeric points are skipped
+
+    @pytest.mark.asyncio
+    async def test_completed_weeks_persist_and_live_week_refreshes(self, tmp_path):
+        path = tmp_path / "stats.sqlite"
+        await StatsWarehouse(path).recent_stats(["p1"], 2025, 6, 2, sleeper_stub())
+
+        sleeper = sleeper_stub()
+        reopened = StatsWarehouse(path, live_ttl=0)
+        recent = await reopened.recent_stats(["p1"], 2025, 6, 2, sleeper)
+        assert [row["points"] for row in recent["p1"]] == [14.0, 10.0]
+        sleeper.get_player_stats.assert_not_awaited()
+
+        # Week 6 is in progress: stored, but re-fetched once its TTL has passed
+        await reopened.ensure_weeks(sleeper, 2025, [6], current_week=6)
+        await reopened.ensure_weeks(sleeper, 2025, [6], current_week=6)
+        assert sleeper.get_player_stats.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_recent_stats_helpers_use_warehouse(self, tmp_path):
+        warehouse = StatsWarehouse(tmp_path / "stats.sqlite")
+        sleeper = sleeper_stub()
+
+        batch = await get_recent_stats_batch(
+            sleeper, ["p1", "p2", "p9"], 2025, 7, warehouse=warehouse
+        )
+        assert batch["p1"].weeks_analyzed == 3
+        assert batch["p1"].total_points == 44.0
+        assert batch["p1"].trend == "improving"
+        assert batch["p9"] is None
+
+        single = await get_recent_stats(sleeper, "p2", 2025, 7, warehouse=warehouse)
+        assert single.avg_points == 4.0
+        assert sleeper.get_player_stats.await_count == 3
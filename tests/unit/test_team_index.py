@@ -0,0 +1,96 @@
+"""Unit tests for the persistent user team index."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services.team_index import UserTeamIndex
+
+
+class TestUserTeamIndex:
+    """Test bulk resolution, persistence, and season invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_single_request_resolves_all_leagues(
+        self, tmp_path, mock_yahoo_user_teams_response
+    ):
+        """One bulk request serves lookups for every league."""
+        mock_call = AsyncMock(return_value=mock_yahoo_user_teams_response)
+        index = UserTeamIndex(tmp_path / "index.json")
+
+        with patch("src.services.team_index.yahoo_api_call", mock_call):
+            first = await index.get("461.l.61410")
+            second = await index.get("461.l.99999")
+
+        assert first["team_key"] == "461.l.61410.t.2"
+        assert second["team_key"] == "461.l.99999.t.7"
+        mock_call.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_index_persists_across_instances(
+        self, tmp_path, mock_yahoo_user_teams_response
+    ):
+        """A restarted process answers from disk without calling Yahoo."""
+        path = tmp_path / "index.json"
+        with patch(
+            "src.services.team_index.yahoo_api_call",
+            AsyncMock(return_value=mock_yahoo_user_teams_response),
+        ):
+            await UserTeamIndex(path).get("461.l.61410")
+
+        mock_call = AsyncMock()
+        with patch("src.services.team_index.yahoo_api_call", mock_call):
+            team = await UserTeamIndex(path).get("461.l.61410")
+
+        assert team["team_key"] == "461.l.61410.t.2"
+        mock_call.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_league_refreshes_once(self, tmp_path, mock_yahoo_user_teams_response):
+        """Misses trigger at most one bulk refresh per process."""
+        mock_call = AsyncMock(return_value=mock_yahoo_user_teams_response)
+        index = UserTeamIndex(tmp_path / "index.json")
+
+        with patch("src.services.team_index.yahoo_api_call", mock_call):
+            assert await index.get("461.l.00000") is None
+            assert await index.get("461.l.00001") is None
+
+        mock_call.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_season_change_drops_old_entries(
+        self, tmp_path, mock_yahoo_user_teams_response
+    ):
+        """Entries from a previous season's game key are discarded on refresh."""
+        path = tmp_path / "index.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "game_key": "449",
+                    "teams": {"449.l.123": {"team_key": "449.l.123.t.4", "game_key": "449"}},
+                }
+            )
+        )
+        index = UserTeamIndex(path)
+
+        with patch(
+            "src.services.team_index.yahoo_api_call",
+            AsyncMock(return_value=mock_yahoo_user_teams_response),
+        ):
+            assert (await index.get("449.l.123"))["team_key"] == "449.l.123.t.4"
+            await index.get("461.l.61410")
+
+        stored = json.loads(path.read_text())
+        assert stored["game_key"] == "461"
+        assert "449.l.123" not in stored["teams"]
+        assert "461.l.61410" in stored["teams"]
+
+    def test_record_persists_fallback_lookups(self, tmp_path):
+        """Teams resolved per league are stored for later lookups."""
+        path = tmp_path / "index.json"
+        UserTeamIndex(path).record("461.l.5", {"team_key": "461.l.5.t.1", "team_name": "X"})
+
+        stored = json.loads(path.read_text())
+        assert stored["teams"]["461.l.5"]["team_key"] == "461.l.5.t.1"
+        assert stored["teams"]["461.l.5"]["game_key"] == "461"
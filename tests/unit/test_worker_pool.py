@@ -0,0 +1,60 @@
+"""Unit tests for the shared CPU worker pool."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from src.agents.worker_pool import WorkerPool, shared_worker_pool
+
+
+def square(value):
+    return value * value
+
+
+def crash_in_worker(value):
+    """Kill the worker process, but succeed when run in the parent (thread fallback)."""
+    if os.getpid() != value:
+        os._exit(1)
+    return "survived"
+
+
+@pytest.fixture
+def pool():
+    pool = WorkerPool(max_workers=2, max_restarts=1)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_work_runs_in_one_long_lived_process_pool(pool):
+    assert await pool.run(square, 3) == 9
+    executor = pool._process_executor
+    assert isinstance(executor, ProcessPoolExecutor)
+    assert await pool.run(square, 4) == 16
+    assert pool._process_executor is executor
+    assert shared_worker_pool() is shared_worker_pool()
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_is_replaced_then_abandoned(pool):
+    parent = os.getpid()
+
+    assert await pool.run(crash_in_worker, parent) == "survived"
+    assert pool.restarts == 1
+    assert pool.uses_processes  # the next call gets a fresh pool
+    assert await pool.run(square, 5) == 25
+
+    assert await pool.run(crash_in_worker, parent) == "survived"
+    assert not pool.uses_processes  # kept dying: threads from now on
+    assert pool._process_executor is None
+    assert await pool.run(square, 6) == 36
+
+
+@pytest.mark.asyncio
+async def test_pool_that_cannot_start_workers_uses_threads(pool):
+    with patch.object(ProcessPoolExecutor, "submit", side_effect=OSError("no fork")):
+        assert await pool.run(square, 7) == 49
+    assert not pool.uses_processes
+    assert await pool.run(square, 8) == 64